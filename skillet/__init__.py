@@ -21,6 +21,7 @@ _LAZY_IMPORTS: dict[str, str] = {
     "evaluate": "skillet.eval",
     "EvaluateResult": "skillet.eval",
     "IterationResult": "skillet.eval",
+    "JudgeTiers": "skillet.eval",
     "PerEvalMetric": "skillet.eval",
     "generate_evals": "skillet.generate",
     "load_evals": "skillet.evals",
@@ -34,6 +35,7 @@ __all__ = [
     "EvalValidationError",
     "EvaluateResult",
     "IterationResult",
+    "JudgeTiers",
     "PerEvalMetric",
     "SkillError",
     "SkilletError",
@@ -1,6 +1,18 @@
 """Agent-under-test CLI runners."""
 
+from .agent_scheduler import AgentScheduler
+from .get_scheduler import get_scheduler
+from .parse_limits import parse_limits
 from .query_structured_via_agent import query_structured_via_agent
 from .run_agent import run_agent
+from .types import Budget, Role
 
-__all__ = ["query_structured_via_agent", "run_agent"]
+__all__ = [
+    "AgentScheduler",
+    "Budget",
+    "Role",
+    "get_scheduler",
+    "parse_limits",
+    "query_structured_via_agent",
+    "run_agent",
+]
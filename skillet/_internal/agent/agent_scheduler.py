@@ -0,0 +1,255 @@
+"""Concurrency and rate budgets for agent CLI calls."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from skillet.agent import Agent
+
+from .parse_limits import LimitKey
+from .types import Budget, Role
+
+logger = logging.getLogger(__name__)
+
+
+def _label(key: LimitKey) -> str:
+    agent, role = key
+    return ".".join(part.value for part in (agent, role) if part is not None)
+
+
+class _Gate:
+    """One budget: a concurrency limit plus a token bucket refilled at ``per_minute``.
+
+    The bucket holds up to ``burst`` tokens and starts full. State is
+    guarded by a thread lock and waiters are woken on their own loop, so
+    one gate can be shared by calls on different event loops.
+    """
+
+    def __init__(self, label: str, budget: Budget) -> None:
+        self.label = label
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._rate_waiting = 0
+        self._tokens = float(self._capacity)
+        self._refilled = time.monotonic()
+        self.acquired = 0
+        self.peak_waiting = 0
+        self.total_wait = 0.0
+
+    @property
+    def _capacity(self) -> int:
+        return self.budget.burst or 1
+
+    def update(self, budget: Budget) -> None:
+        """Apply new limits, keeping the calls in flight and the queue.
+
+        A raised concurrency limit admits waiters at once; a lowered one
+        lets in-flight calls finish and admits no one until they are below
+        it. The bucket keeps its tokens, capped at the new capacity.
+        """
+        with self._lock:
+            self.budget = budget
+            self._tokens = min(self._tokens, float(self._capacity))
+            limit = budget.max_concurrent
+            while self._waiters and (limit is None or self._in_flight < limit):
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    self._in_flight += 1
+                    waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+
+    def reset_stats(self) -> None:
+        """Start counting calls, waits and queue depth afresh."""
+        with self._lock:
+            self.acquired = 0
+            self.peak_waiting = self.waiting
+            self.total_wait = 0.0
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters) + self._rate_waiting
+
+    def _note_waiting(self) -> None:
+        depth = self.waiting
+        self.peak_waiting = max(self.peak_waiting, depth)
+        logger.debug("Waiting for %s budget (queue depth %d)", self.label, depth)
+
+    async def acquire(self) -> None:
+        start = time.monotonic()
+        await self._acquire_slot()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self.release()
+            raise
+        with self._lock:
+            self.acquired += 1
+            self.total_wait += time.monotonic() - start
+
+    async def _acquire_slot(self) -> None:
+        limit = self.budget.max_concurrent
+        if limit is None:
+            with self._lock:
+                self._in_flight += 1
+            return
+        with self._lock:
+            if self._in_flight < limit and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self._note_waiting()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # Already picked by release(). If the slot landed before the
+            # cancellation, pass it on; otherwise _wake() will.
+            if not waiter.cancelled():
+                self.release()
+            raise
+
+    async def _acquire_token(self) -> None:
+        per_minute = self.budget.per_minute
+        if per_minute is None:
+            return
+        rate = per_minute / 60
+        counted = False
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(
+                        float(self._capacity), self._tokens + (now - self._refilled) * rate
+                    )
+                    self._refilled = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    delay = (1 - self._tokens) / rate
+                    if not counted:
+                        counted = True
+                        self._rate_waiting += 1
+                        self._note_waiting()
+                await asyncio.sleep(delay)
+        finally:
+            if counted:
+                with self._lock:
+                    self._rate_waiting -= 1
+
+    def release(self) -> None:
+        with self._lock:
+            limit = self.budget.max_concurrent
+            # Over a lowered limit, the slot is retired rather than passed on
+            while self._waiters and (limit is None or self._in_flight <= limit):
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    # Hand the slot straight to the next waiter, on its own loop.
+                    waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+                    return
+            self._in_flight -= 1
+
+    def _wake(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            # Cancelled after being picked; give the slot to someone else.
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrent": self.budget.max_concurrent,
+                "per_minute": self.budget.per_minute,
+                "burst": self._capacity,
+                "in_flight": self._in_flight,
+                "waiting": self.waiting,
+                "peak_waiting": self.peak_waiting,
+                "acquired": self.acquired,
+                "total_wait_seconds": round(self.total_wait, 3),
+            }
+
+
+class AgentScheduler:
+    """Gate agent CLI calls behind per-agent and per-role budgets.
+
+    A call for ``(agent, role)`` must pass every budget that applies to it:
+    the agent's own (``claude``), the role's across agents (``judge``) and
+    the pair's (``claude.judge``). Budgets are taken in that fixed order,
+    so callers never deadlock on each other. Calls with no applicable
+    budget run straight through.
+    """
+
+    def __init__(self, limits: dict[LimitKey, Budget] | None = None) -> None:
+        self._gates: dict[LimitKey, _Gate] = {}
+        self.configure(limits or {})
+
+    def configure(self, limits: dict[LimitKey, Budget]) -> None:
+        """Set or override budgets, merging field by field with existing ones.
+
+        An existing budget is updated in place, so calls already holding or
+        waiting for it keep their places.
+        """
+        for key, budget in limits.items():
+            existing = self._gates.get(key)
+            if existing is not None:
+                existing.update(existing.budget.merge(budget))
+            else:
+                self._gates[key] = _Gate(_label(key), budget)
+
+    def set_limits(self, limits: dict[LimitKey, Budget]) -> None:
+        """Make ``limits`` the only budgets, for a new run, and restart their stats.
+
+        Unlike :meth:`configure` nothing is merged, so budgets set for an
+        earlier run in the same process do not carry over. Budgets kept
+        are updated in place; dropped ones stop gating new calls, and calls
+        holding them release them as usual.
+        """
+        for key in self._gates.keys() - limits.keys():
+            del self._gates[key]
+        for key, budget in limits.items():
+            existing = self._gates.get(key)
+            if existing is not None:
+                existing.update(budget)
+                existing.reset_stats()
+            else:
+                self._gates[key] = _Gate(_label(key), budget)
+
+    def reset(self) -> None:
+        """Drop every budget."""
+        self._gates.clear()
+
+    @asynccontextmanager
+    async def slot(self, agent: Agent, role: Role) -> AsyncIterator[None]:
+        """Hold a place in every budget that applies to ``(agent, role)``."""
+        gates = [
+            gate
+            for key in ((agent, None), (None, role), (agent, role))
+            if (gate := self._gates.get(key)) is not None
+        ]
+        held: list[_Gate] = []
+        try:
+            for gate in gates:
+                await gate.acquire()
+                held.append(gate)
+            yield
+        finally:
+            for gate in reversed(held):
+                gate.release()
+
+    def queue_depths(self) -> dict[str, int]:
+        """Calls currently waiting on each budget, keyed by label."""
+        return {gate.label: gate.waiting for gate in self._gates.values()}
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Limits, in-flight and waiting counts, peak queue depth and total wait per budget."""
+        return {gate.label: gate.stats() for gate in self._gates.values()}
@@ -0,0 +1,281 @@
+"""Tests for AgentScheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from skillet.agent import Agent
+
+from .agent_scheduler import AgentScheduler
+from .types import Budget, Role
+
+
+async def _hold(scheduler: AgentScheduler, agent: Agent, role: Role, peak: list[int], seconds=0.02):
+    async with scheduler.slot(agent, role):
+        peak.append(1)
+        await asyncio.sleep(seconds)
+        peak.append(-1)
+
+
+def _max_in_flight(events: list[int]) -> int:
+    current = highest = 0
+    for e in events:
+        current += e
+        highest = max(highest, current)
+    return highest
+
+
+def describe_AgentScheduler():
+    @pytest.mark.asyncio
+    async def it_runs_unbudgeted_calls_straight_through():
+        scheduler = AgentScheduler()
+        events: list[int] = []
+
+        await asyncio.gather(*(_hold(scheduler, Agent.CLAUDE, Role.RUN, events) for _ in range(5)))
+
+        assert _max_in_flight(events) == 5
+        assert scheduler.stats() == {}
+
+    @pytest.mark.asyncio
+    async def it_caps_concurrent_calls_per_role():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=2)})
+        events: list[int] = []
+
+        await asyncio.gather(
+            *(_hold(scheduler, Agent.CLAUDE, Role.JUDGE, events) for _ in range(6))
+        )
+
+        assert _max_in_flight(events) == 2
+        stats = scheduler.stats()["judge"]
+        assert stats["acquired"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["peak_waiting"] == 4
+
+    @pytest.mark.asyncio
+    async def it_keeps_roles_independent():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=1)})
+        judges: list[int] = []
+        runs: list[int] = []
+
+        await asyncio.gather(
+            *(_hold(scheduler, Agent.CLAUDE, Role.JUDGE, judges) for _ in range(3)),
+            *(_hold(scheduler, Agent.CLAUDE, Role.RUN, runs) for _ in range(3)),
+        )
+
+        assert _max_in_flight(judges) == 1
+        assert _max_in_flight(runs) == 3
+
+    @pytest.mark.asyncio
+    async def it_applies_agent_and_pair_budgets_together():
+        scheduler = AgentScheduler(
+            {
+                (Agent.CODEX, None): Budget(max_concurrent=3),
+                (Agent.CODEX, Role.RUN): Budget(max_concurrent=1),
+            }
+        )
+        codex_runs: list[int] = []
+        codex_all: list[int] = []
+        claude: list[int] = []
+
+        async def codex_run():
+            async with scheduler.slot(Agent.CODEX, Role.RUN):
+                codex_all.append(1)
+                codex_runs.append(1)
+                await asyncio.sleep(0.02)
+                codex_runs.append(-1)
+                codex_all.append(-1)
+
+        await asyncio.gather(
+            *(codex_run() for _ in range(3)),
+            *(_hold(scheduler, Agent.CODEX, Role.JUDGE, codex_all) for _ in range(4)),
+            *(_hold(scheduler, Agent.CLAUDE, Role.RUN, claude) for _ in range(4)),
+        )
+
+        assert _max_in_flight(codex_runs) == 1
+        assert _max_in_flight(codex_all) <= 3
+        assert _max_in_flight(claude) == 4
+
+    @pytest.mark.asyncio
+    async def it_spaces_calls_to_the_rate_limit():
+        # 1200/min = one call every 50ms after the first.
+        scheduler = AgentScheduler({(Agent.CLAUDE, None): Budget(per_minute=1200)})
+        starts: list[float] = []
+
+        async def call():
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(call() for _ in range(3)))
+
+        assert starts[2] - starts[0] >= 0.09
+        assert scheduler.stats()["claude"]["peak_waiting"] >= 1
+
+    @pytest.mark.asyncio
+    async def it_starts_a_burst_of_calls_back_to_back():
+        # 1200/min with burst=3: three calls at once, then one every 50ms.
+        scheduler = AgentScheduler({(Agent.CLAUDE, None): Budget(per_minute=1200, burst=3)})
+        starts: list[float] = []
+
+        async def call():
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(call() for _ in range(4)))
+
+        assert starts[2] - starts[0] < 0.03
+        assert starts[3] - starts[0] >= 0.04
+
+    @pytest.mark.asyncio
+    async def it_reports_queue_depths_while_calls_wait():
+        scheduler = AgentScheduler({(None, Role.RUN): Budget(max_concurrent=1)})
+        release = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                await release.wait()
+
+        tasks = [asyncio.create_task(blocker()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert scheduler.queue_depths() == {"run": 2}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.queue_depths() == {"run": 0}
+
+    @pytest.mark.asyncio
+    async def it_frees_the_slot_when_a_waiter_is_cancelled():
+        scheduler = AgentScheduler({(None, Role.RUN): Budget(max_concurrent=1)})
+        release = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                await release.wait()
+
+        holder = asyncio.create_task(blocker())
+        waiter = asyncio.create_task(blocker())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        release.set()
+        await holder
+
+        async with asyncio.timeout(1):
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                pass
+        assert scheduler.stats()["run"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def it_releases_the_slot_when_the_call_raises():
+        scheduler = AgentScheduler({(None, Role.RUN): Budget(max_concurrent=1)})
+
+        with pytest.raises(RuntimeError):
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                raise RuntimeError("boom")
+
+        assert scheduler.stats()["run"]["in_flight"] == 0
+
+    def it_merges_reconfigured_budgets():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=2)})
+
+        scheduler.configure({(None, Role.JUDGE): Budget(per_minute=30)})
+
+        stats = scheduler.stats()["judge"]
+        assert stats["max_concurrent"] == 2
+        assert stats["per_minute"] == 30
+
+    @pytest.mark.asyncio
+    async def it_keeps_calls_in_flight_and_waiting_when_reconfigured():
+        scheduler = AgentScheduler({(None, Role.RUN): Budget(max_concurrent=1)})
+        release = asyncio.Event()
+        events: list[int] = []
+
+        async def blocker():
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                events.append(1)
+                await release.wait()
+                events.append(-1)
+
+        tasks = [asyncio.create_task(blocker()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        scheduler.configure({(None, Role.RUN): Budget(max_concurrent=2)})
+        await asyncio.sleep(0.01)
+
+        stats = scheduler.stats()["run"]
+        assert stats["in_flight"] == 2
+        assert stats["waiting"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert _max_in_flight(events) == 2
+        assert scheduler.stats()["run"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def it_admits_no_one_until_calls_drop_below_a_lowered_limit():
+        scheduler = AgentScheduler({(None, Role.RUN): Budget(max_concurrent=2)})
+        releases = [asyncio.Event() for _ in range(3)]
+
+        async def blocker(release: asyncio.Event):
+            async with scheduler.slot(Agent.CLAUDE, Role.RUN):
+                await release.wait()
+
+        tasks = [asyncio.create_task(blocker(r)) for r in releases]
+        await asyncio.sleep(0.01)
+        scheduler.configure({(None, Role.RUN): Budget(max_concurrent=1)})
+
+        releases[0].set()
+        await asyncio.sleep(0.01)
+        assert scheduler.stats()["run"]["in_flight"] == 1
+        assert scheduler.stats()["run"]["waiting"] == 1
+
+        releases[1].set()
+        await asyncio.sleep(0.01)
+        assert scheduler.stats()["run"]["waiting"] == 0
+
+        releases[2].set()
+        await asyncio.gather(*tasks)
+        assert scheduler.stats()["run"]["in_flight"] == 0
+
+    def it_replaces_every_budget_when_limits_are_set():
+        scheduler = AgentScheduler(
+            {
+                (None, Role.JUDGE): Budget(max_concurrent=2),
+                (Agent.CLAUDE, None): Budget(per_minute=60),
+            }
+        )
+
+        scheduler.set_limits({(None, Role.JUDGE): Budget(per_minute=30)})
+
+        stats = scheduler.stats()
+        assert set(stats) == {"judge"}
+        assert stats["judge"]["max_concurrent"] is None
+        assert stats["judge"]["per_minute"] == 30
+
+    @pytest.mark.asyncio
+    async def it_restarts_stats_when_limits_are_set():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=2)})
+        async with scheduler.slot(Agent.CLAUDE, Role.JUDGE):
+            pass
+
+        scheduler.set_limits({(None, Role.JUDGE): Budget(max_concurrent=2)})
+
+        assert scheduler.stats()["judge"]["acquired"] == 0
+
+    def it_labels_budgets_by_agent_and_role():
+        scheduler = AgentScheduler(
+            {
+                (Agent.CLAUDE, None): Budget(max_concurrent=1),
+                (None, Role.JUDGE): Budget(max_concurrent=1),
+                (Agent.CODEX, Role.RUN): Budget(max_concurrent=1),
+            }
+        )
+
+        assert set(scheduler.queue_depths()) == {"claude", "judge", "codex.run"}
+
+    def it_resets_to_no_budgets():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=2)})
+
+        scheduler.reset()
+
+        assert scheduler.stats() == {}
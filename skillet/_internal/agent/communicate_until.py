@@ -0,0 +1,51 @@
+"""Read a subprocess's output, killing it once a stdout line says to stop."""
+
+import asyncio
+import contextlib
+import os
+import signal
+from asyncio.subprocess import Process
+from collections.abc import Callable
+
+
+def _kill_group(proc: Process) -> None:
+    """Kill ``proc`` and whatever it spawned (tool subprocesses hold our pipes open)."""
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(proc.pid, signal.SIGKILL)
+
+
+async def communicate_until(
+    proc: Process, stop: Callable[[str], bool]
+) -> tuple[bytes, bytes, bool]:
+    """Like ``proc.communicate()``, but kill ``proc`` once ``stop(line)`` is true.
+
+    Stdout is read as it arrives and each complete line is passed to
+    ``stop``; stderr is drained alongside so neither pipe fills up. On a stop
+    the process group is killed (start ``proc`` with
+    ``start_new_session=True``), so the output read so far is the partial
+    transcript. Returns ``(stdout, stderr, stopped)``.
+    """
+    assert proc.stdout is not None and proc.stderr is not None
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    chunks: list[bytes] = []
+    # Pieces of the line still being read; only new chunks are searched for
+    # newlines, so a long line costs time linear in its length
+    pending: list[bytes] = []
+    stopped = False
+    try:
+        while not stopped and (chunk := await proc.stdout.read(65536)):
+            chunks.append(chunk)
+            if b"\n" not in chunk:
+                pending.append(chunk)
+                continue
+            head, *lines, tail = chunk.split(b"\n")
+            lines.insert(0, b"".join([*pending, head]))
+            pending = [tail]
+            stopped = any(stop(line.decode(errors="replace")) for line in lines)
+        if stopped:
+            _kill_group(proc)
+        await proc.wait()
+        stderr = await stderr_task
+    finally:
+        stderr_task.cancel()
+    return b"".join(chunks), stderr, stopped
@@ -0,0 +1,70 @@
+"""Tests for communicate_until."""
+
+import sys
+import time
+from asyncio import create_subprocess_exec
+from asyncio.subprocess import PIPE
+
+import pytest
+
+from skillet._internal.agent.communicate_until import communicate_until
+
+
+async def _spawn(script: str):
+    return await create_subprocess_exec(
+        sys.executable, "-c", script, stdout=PIPE, stderr=PIPE, start_new_session=True
+    )
+
+
+def describe_communicate_until():
+    @pytest.mark.asyncio
+    async def it_reads_everything_when_never_stopped():
+        proc = await _spawn("import sys; print('a'); print('b'); print('err', file=sys.stderr)")
+
+        stdout, stderr, stopped = await communicate_until(proc, lambda _line: False)
+
+        assert stdout == b"a\nb\n"
+        assert stderr == b"err\n"
+        assert stopped is False
+        assert proc.returncode == 0
+
+    @pytest.mark.asyncio
+    async def it_kills_the_process_group_at_the_stop_line():
+        # The child inherits stdout, as a tool subprocess of the agent CLI would
+        proc = await _spawn(
+            "import subprocess, sys, time\n"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+            "print('first', flush=True)\n"
+            "print('STOP', flush=True)\n"
+            "time.sleep(30)\n"
+            "print('never')\n"
+        )
+        seen: list[str] = []
+
+        start = time.monotonic()
+        stdout, _, stopped = await communicate_until(
+            proc, lambda line: seen.append(line) or line == "STOP"
+        )
+
+        assert time.monotonic() - start < 10
+        assert stopped is True
+        assert seen == ["first", "STOP"]
+        assert b"never" not in stdout
+        assert proc.returncode != 0
+
+    @pytest.mark.asyncio
+    async def it_reassembles_lines_split_across_reads():
+        proc = await _spawn(
+            "import sys, time\n"
+            "for _ in range(4):\n"
+            "    sys.stdout.write('x' * 50000); sys.stdout.flush(); time.sleep(0.01)\n"
+            "print('', flush=True)\n"
+            "print('a\\nb', flush=True)\n"
+        )
+        seen: list[str] = []
+
+        stdout, _, stopped = await communicate_until(proc, lambda line: seen.append(line) or False)
+
+        assert stopped is False
+        assert seen == ["x" * 200000, "a", "b"]
+        assert stdout == b"x" * 200000 + b"\na\nb\n"
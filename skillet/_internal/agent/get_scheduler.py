@@ -0,0 +1,23 @@
+"""The process-wide agent scheduler."""
+
+import functools
+import shlex
+
+from skillet import config
+
+from .agent_scheduler import AgentScheduler
+from .parse_limits import parse_limits
+
+
+@functools.cache
+def get_scheduler() -> AgentScheduler:
+    """Return the shared scheduler, seeded from ``SKILLET_LIMITS``.
+
+    ``SKILLET_LIMITS`` holds whitespace-separated specs in the format of
+    :func:`parse_limits`, e.g. ``"judge=2 claude=60/m"``. The scheduler
+    lives for the whole process, so each CLI command replaces its budgets
+    with ``SKILLET_LIMITS`` plus its ``--limit`` flags
+    (:meth:`AgentScheduler.set_limits`) rather than merging into the last
+    command's.
+    """
+    return AgentScheduler(parse_limits(shlex.split(config.LIMITS)))
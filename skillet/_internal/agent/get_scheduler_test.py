@@ -0,0 +1,30 @@
+"""Tests for get_scheduler."""
+
+from unittest.mock import patch
+
+import pytest
+
+from .get_scheduler import get_scheduler
+
+
+@pytest.fixture(autouse=True)
+def fresh_scheduler():
+    get_scheduler.cache_clear()
+    yield
+    get_scheduler.cache_clear()
+
+
+def describe_get_scheduler():
+    def it_returns_one_shared_scheduler():
+        assert get_scheduler() is get_scheduler()
+
+    def it_seeds_budgets_from_config():
+        with patch("skillet.config.LIMITS", "judge=2 claude=60/m"):
+            stats = get_scheduler().stats()
+
+        assert stats["judge"]["max_concurrent"] == 2
+        assert stats["claude"]["per_minute"] == 60
+
+    def it_has_no_budgets_by_default():
+        with patch("skillet.config.LIMITS", ""):
+            assert get_scheduler().stats() == {}
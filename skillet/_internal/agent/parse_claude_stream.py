@@ -1,7 +1,10 @@
 """Parse a single turn of `claude -p --output-format stream-json` output."""
+# skillet: allow-multiple-public-callables
 
 import json
 
+from skillet._internal.sdk.usage import Usage
+
 
 def _decode_line(line: str) -> dict | None:
     """Decode one stream-json line into a dict, or None if blank/malformed."""
@@ -26,8 +29,39 @@ def _collect_assistant_blocks(event: dict, text_parts: list[str], tool_calls: li
             tool_calls.append({"name": block.get("name"), "input": block.get("input")})
 
 
-def parse_claude_stream(stdout: str) -> tuple[str, list[dict], str | None]:
-    """Parse one turn of Claude CLI stream-json into text, tool calls, and session id.
+def _number(value: object) -> float | None:
+    """``value`` if the CLI reported a number there, else ``None``."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _result_usage(event: dict) -> Usage:
+    """Tokens, cost and duration from a ``result`` event."""
+    raw = event.get("usage")
+    raw = raw if isinstance(raw, dict) else {}
+    duration = _number(event.get("duration_ms"))
+    return Usage(
+        input_tokens=int(_number(raw.get("input_tokens")) or 0),
+        output_tokens=int(_number(raw.get("output_tokens")) or 0),
+        cache_read_tokens=int(_number(raw.get("cache_read_input_tokens")) or 0),
+        cache_write_tokens=int(_number(raw.get("cache_creation_input_tokens")) or 0),
+        cost_usd=_number(event.get("total_cost_usd")),
+        duration_ms=int(duration) if duration is not None else None,
+    )
+
+
+def claude_line_tool_calls(line: str) -> list[dict]:
+    """Tool calls in one stream-json line, to react to them while the CLI runs."""
+    event = _decode_line(line)
+    tool_calls: list[dict] = []
+    if event is not None and event.get("type") == "assistant":
+        _collect_assistant_blocks(event, [], tool_calls)
+    return tool_calls
+
+
+def parse_claude_stream(stdout: str) -> tuple[str, list[dict], str | None, Usage | None]:
+    """Parse one turn of Claude CLI stream-json into text, tool calls, session id and usage.
 
     The CLI emits one JSON object per line. The shapes we care about:
 
@@ -36,15 +70,20 @@ def parse_claude_stream(stdout: str) -> tuple[str, list[dict], str | None]:
     - ``{"type": "assistant", "message": {"content": [...]}}`` — assistant turns whose
       content blocks are ``{"type": "text", "text": ...}`` or
       ``{"type": "tool_use", "name": ..., "input": ...}``.
-    - ``{"type": "result", "result": ...}`` — the final result text, used as a fallback
-      when no assistant text block was emitted.
+    - ``{"type": "result", "result": ..., "usage": {...}, "total_cost_usd": ...,
+      "duration_ms": ...}`` — the final result text, used as a fallback when no
+      assistant text block was emitted, and what the turn used. ``usage`` holds
+      ``input_tokens``, ``output_tokens``, ``cache_read_input_tokens`` and
+      ``cache_creation_input_tokens``.
 
-    Malformed lines are skipped. Returns ``(text, tool_calls, session_id)``.
+    Malformed lines are skipped. Returns ``(text, tool_calls, session_id, usage)``;
+    ``usage`` is ``None`` without a ``result`` event (a killed turn).
     """
     text_parts: list[str] = []
     tool_calls: list[dict] = []
     session_id: str | None = None
     result_text: str | None = None
+    usage: Usage | None = None
 
     for line in stdout.splitlines():
         event = _decode_line(line)
@@ -61,9 +100,10 @@ def parse_claude_stream(stdout: str) -> tuple[str, list[dict], str | None]:
             result = event.get("result")
             if isinstance(result, str):
                 result_text = result
+            usage = _result_usage(event)
 
     text = "".join(text_parts).strip()
     if not text and result_text:
         text = result_text.strip()
 
-    return text, tool_calls, session_id
+    return text, tool_calls, session_id, usage
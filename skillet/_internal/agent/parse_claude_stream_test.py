@@ -2,7 +2,11 @@
 
 import json
 
-from skillet._internal.agent.parse_claude_stream import parse_claude_stream
+from skillet._internal.agent.parse_claude_stream import (
+    claude_line_tool_calls,
+    parse_claude_stream,
+)
+from skillet._internal.sdk import Usage
 
 
 def _line(obj: dict) -> str:
@@ -26,7 +30,7 @@ def describe_parse_claude_stream():
             ]
         )
 
-        text, tool_calls, session_id = parse_claude_stream(stdout)
+        text, tool_calls, session_id, _ = parse_claude_stream(stdout)
 
         assert text == "hello world"
         assert tool_calls == []
@@ -50,7 +54,7 @@ def describe_parse_claude_stream():
             ]
         )
 
-        text, tool_calls, _ = parse_claude_stream(stdout)
+        text, tool_calls, _, _ = parse_claude_stream(stdout)
 
         assert text == "done"
         assert tool_calls == [{"name": "Skill", "input": {"skill": "x"}}]
@@ -63,7 +67,7 @@ def describe_parse_claude_stream():
             ]
         )
 
-        text, tool_calls, _ = parse_claude_stream(stdout)
+        text, tool_calls, _, _ = parse_claude_stream(stdout)
 
         assert text == "final answer"
         assert tool_calls == []
@@ -73,7 +77,7 @@ def describe_parse_claude_stream():
             {"type": "assistant", "message": {"content": [{"type": "text", "text": "hi"}]}}
         )
 
-        _, _, session_id = parse_claude_stream(stdout)
+        _, _, session_id, _ = parse_claude_stream(stdout)
 
         assert session_id is None
 
@@ -91,7 +95,7 @@ def describe_parse_claude_stream():
             ]
         )
 
-        text, _, _ = parse_claude_stream(stdout)
+        text, _, _, _ = parse_claude_stream(stdout)
 
         assert text == "ok"
 
@@ -113,6 +117,63 @@ def describe_parse_claude_stream():
             ]
         )
 
-        text, _, _ = parse_claude_stream(stdout)
+        text, _, _, _ = parse_claude_stream(stdout)
 
         assert text == "foo bar"
+
+    def it_reads_usage_cost_and_duration_from_the_result():
+        stdout = _line(
+            {
+                "type": "result",
+                "result": "ok",
+                "total_cost_usd": 0.0123,
+                "duration_ms": 4500,
+                "usage": {
+                    "input_tokens": 10,
+                    "output_tokens": 20,
+                    "cache_read_input_tokens": 300,
+                    "cache_creation_input_tokens": 40,
+                },
+            }
+        )
+
+        _, _, _, usage = parse_claude_stream(stdout)
+
+        assert usage == Usage(
+            input_tokens=10,
+            output_tokens=20,
+            cache_read_tokens=300,
+            cache_write_tokens=40,
+            cost_usd=0.0123,
+            duration_ms=4500,
+        )
+
+    def it_has_no_usage_without_a_result():
+        stdout = _line(
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "hi"}]}}
+        )
+
+        _, _, _, usage = parse_claude_stream(stdout)
+
+        assert usage is None
+
+
+def describe_claude_line_tool_calls():
+    def it_returns_the_tool_calls_of_an_assistant_line():
+        line = _line(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "text", "text": "running it"},
+                        {"type": "tool_use", "name": "Bash", "input": {"command": "ls"}},
+                    ]
+                },
+            }
+        )
+
+        assert claude_line_tool_calls(line) == [{"name": "Bash", "input": {"command": "ls"}}]
+
+    def it_ignores_other_and_malformed_lines():
+        assert claude_line_tool_calls(_line({"type": "result", "result": "done"})) == []
+        assert claude_line_tool_calls('{"type": "assist') == []
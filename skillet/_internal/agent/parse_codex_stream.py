@@ -1,7 +1,10 @@
 """Parse a single turn of `codex exec --json` JSONL output."""
+# skillet: allow-multiple-public-callables
 
 import json
 
+from skillet._internal.sdk.usage import Usage
+
 # Item types that represent a tool action (vs. text/reasoning/planning items).
 _TOOL_ITEM_TYPES = frozenset({"command_execution", "file_change", "mcp_tool_call", "web_search"})
 
@@ -54,8 +57,42 @@ def _extract_error(event: dict) -> str | None:
     return None
 
 
-def parse_codex_stream(stdout: str) -> tuple[str, list[dict], str | None, str | None]:
-    """Parse one turn of ``codex exec --json`` into text, tool calls, id, and error.
+def _count(raw: dict, key: str) -> int:
+    value = raw.get(key)
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def _turn_usage(event: dict) -> Usage | None:
+    """Tokens from a ``turn.completed`` event, or ``None`` for any other event.
+
+    Codex counts cached input within ``input_tokens``; it is split out into
+    ``cache_read_tokens`` so the fields mean the same as claude's.
+    """
+    if event.get("type") != "turn.completed":
+        return None
+    raw = event.get("usage")
+    raw = raw if isinstance(raw, dict) else {}
+    cached = _count(raw, "cached_input_tokens")
+    return Usage(
+        input_tokens=max(_count(raw, "input_tokens") - cached, 0),
+        output_tokens=_count(raw, "output_tokens"),
+        cache_read_tokens=cached,
+    )
+
+
+def codex_line_tool_calls(line: str) -> list[dict]:
+    """Tool calls completed in one JSONL line, to react to them while the CLI runs."""
+    event = _decode_line(line)
+    if event is None:
+        return []
+    _, tool_call = _parse_completed_item(event)
+    return [tool_call] if tool_call is not None else []
+
+
+def parse_codex_stream(
+    stdout: str,
+) -> tuple[str, list[dict], str | None, str | None, Usage | None]:
+    """Parse one turn of ``codex exec --json`` into text, tool calls, id, error and usage.
 
     The CLI emits one JSON object per line. The shapes we care about:
 
@@ -68,13 +105,17 @@ def parse_codex_stream(stdout: str) -> tuple[str, list[dict], str | None, str |
       ignored.
     - ``{"type": "turn.failed", "error": {"message": ...}}`` or a top-level
       ``{"type": "error", "message": ...}`` — a hard failure for the turn.
+    - ``{"type": "turn.completed", "usage": {"input_tokens": ...,
+      "cached_input_tokens": ..., "output_tokens": ...}}`` — what the turn used.
 
-    Malformed lines are skipped. Returns ``(text, tool_calls, thread_id, error)``.
+    Malformed lines are skipped. Returns ``(text, tool_calls, thread_id, error,
+    usage)``; ``usage`` is ``None`` without a ``turn.completed`` event.
     """
     text = ""
     tool_calls: list[dict] = []
     thread_id: str | None = None
     error: str | None = None
+    usage: Usage | None = None
 
     for line in stdout.splitlines():
         event = _decode_line(line)
@@ -88,5 +129,7 @@ def parse_codex_stream(stdout: str) -> tuple[str, list[dict], str | None, str |
         if tool_call is not None:
             tool_calls.append(tool_call)
         error = _extract_error(event) or error
+        if (turn_usage := _turn_usage(event)) is not None:
+            usage = turn_usage if usage is None else usage + turn_usage
 
-    return text, tool_calls, thread_id, error
+    return text, tool_calls, thread_id, error, usage
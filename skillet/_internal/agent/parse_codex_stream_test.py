@@ -2,7 +2,11 @@
 
 import json
 
-from skillet._internal.agent.parse_codex_stream import parse_codex_stream
+from skillet._internal.agent.parse_codex_stream import (
+    codex_line_tool_calls,
+    parse_codex_stream,
+)
+from skillet._internal.sdk import Usage
 
 
 def _line(obj: dict) -> str:
@@ -33,7 +37,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        text, tool_calls, thread_id, error = parse_codex_stream(stdout)
+        text, tool_calls, thread_id, error, _usage = parse_codex_stream(stdout)
 
         assert text == "final answer"
         assert tool_calls == []
@@ -66,7 +70,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        text, tool_calls, _thread_id, _error = parse_codex_stream(stdout)
+        text, tool_calls, _thread_id, _error, _usage = parse_codex_stream(stdout)
 
         assert text == "done"
         assert tool_calls == [
@@ -121,7 +125,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        _text, tool_calls, _thread_id, _error = parse_codex_stream(stdout)
+        _text, tool_calls, _thread_id, _error, _usage = parse_codex_stream(stdout)
 
         names = [c["name"] for c in tool_calls]
         assert names == ["mcp_tool_call", "web_search", "file_change"]
@@ -161,7 +165,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        text, tool_calls, _thread_id, _error = parse_codex_stream(stdout)
+        text, tool_calls, _thread_id, _error, _usage = parse_codex_stream(stdout)
 
         assert text == "answer"
         assert tool_calls == []
@@ -179,7 +183,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        text, _tool_calls, _thread_id, error = parse_codex_stream(stdout)
+        text, _tool_calls, _thread_id, error, _usage = parse_codex_stream(stdout)
 
         assert text == ""
         assert error == "model 'gpt-5.3-codex' is not supported"
@@ -187,7 +191,7 @@ def describe_parse_codex_stream():
     def it_captures_top_level_error():
         stdout = _line({"type": "error", "message": "stream broke"})
 
-        _text, _tool_calls, _thread_id, error = parse_codex_stream(stdout)
+        _text, _tool_calls, _thread_id, error, _usage = parse_codex_stream(stdout)
 
         assert error == "stream broke"
 
@@ -201,7 +205,7 @@ def describe_parse_codex_stream():
             ]
         )
 
-        text, tool_calls, _thread_id, error = parse_codex_stream(stdout)
+        text, tool_calls, _thread_id, error, _usage = parse_codex_stream(stdout)
 
         assert text == "ok"
         assert tool_calls == []
@@ -210,9 +214,54 @@ def describe_parse_codex_stream():
     def it_returns_empty_when_no_agent_message():
         stdout = _line({"type": "thread.started", "thread_id": "t-4"})
 
-        text, tool_calls, thread_id, error = parse_codex_stream(stdout)
+        text, tool_calls, thread_id, error, _usage = parse_codex_stream(stdout)
 
         assert text == ""
         assert tool_calls == []
         assert thread_id == "t-4"
         assert error is None
+
+    def it_sums_turn_usage_with_cached_input_split_out():
+        stdout = "\n".join(
+            [
+                _line(
+                    {
+                        "type": "turn.completed",
+                        "usage": {
+                            "input_tokens": 100,
+                            "cached_input_tokens": 60,
+                            "output_tokens": 7,
+                        },
+                    }
+                ),
+                _line({"type": "turn.completed", "usage": {"input_tokens": 5}}),
+            ]
+        )
+
+        *_, usage = parse_codex_stream(stdout)
+
+        assert usage == Usage(input_tokens=45, output_tokens=7, cache_read_tokens=60)
+
+    def it_has_no_usage_without_a_completed_turn():
+        *_, usage = parse_codex_stream(_line({"type": "thread.started", "thread_id": "t"}))
+
+        assert usage is None
+
+
+def describe_codex_line_tool_calls():
+    def it_returns_a_completed_tool_item():
+        line = _line(
+            {
+                "type": "item.completed",
+                "item": {"id": "c1", "type": "command_execution", "command": "ls"},
+            }
+        )
+
+        assert codex_line_tool_calls(line) == [
+            {"name": "command_execution", "input": {"command": "ls"}}
+        ]
+
+    def it_ignores_messages_and_malformed_lines():
+        message = {"type": "item.completed", "item": {"type": "agent_message", "text": "hi"}}
+        assert codex_line_tool_calls(_line(message)) == []
+        assert codex_line_tool_calls('{"type": "item.comp') == []
@@ -0,0 +1,72 @@
+"""Parse ``KEY=SPEC`` limit strings into scheduler budgets."""
+
+from skillet.agent import Agent
+
+from .types import Budget, Role
+
+type LimitKey = tuple[Agent | None, Role | None]
+
+
+def _parse_key(key: str) -> LimitKey:
+    agent_name, dot, role_name = key.partition(".")
+    agents = {a.value for a in Agent}
+    roles = {r.value for r in Role}
+    if not dot and agent_name in agents:
+        return Agent(agent_name), None
+    if not dot and agent_name in roles:
+        return None, Role(agent_name)
+    if dot and agent_name in agents and role_name in roles:
+        return Agent(agent_name), Role(role_name)
+    raise ValueError(f"Unknown limit target {key!r}: expected an agent, a role or agent.role")
+
+
+def _parse_spec(key: str, spec: str) -> Budget:
+    max_concurrent: int | None = None
+    per_minute: float | None = None
+    burst: int | None = None
+    for part in spec.split(","):
+        part = part.strip()
+        try:
+            if part.endswith("/m"):
+                per_minute = float(part[:-2])
+                valid = per_minute > 0
+            elif part.startswith("burst="):
+                burst = int(part.removeprefix("burst="))
+                valid = burst > 0
+            else:
+                max_concurrent = int(part)
+                valid = max_concurrent > 0
+        except ValueError:
+            valid = False
+        if not valid:
+            raise ValueError(
+                f"Invalid limit {key}={spec!r}: expected N (concurrent calls), "
+                "N/m (calls per minute) and/or burst=N (calls started back to back), "
+                "e.g. 2,30/m,burst=5"
+            )
+    return Budget(max_concurrent=max_concurrent, per_minute=per_minute, burst=burst)
+
+
+def parse_limits(specs: list[str]) -> dict[LimitKey, Budget]:
+    """Parse limit specs such as ``judge=2``, ``claude=60/m`` or ``codex.run=4,30/m``.
+
+    The key names an agent (all of its calls), a role (``run``, ``judge``,
+    ``summarize`` or ``generate`` across agents) or ``agent.role``. The value
+    caps concurrent calls (``N``), calls started per minute (``N/m``) or
+    both; ``burst=N`` lets up to N calls start at once before the rate
+    spaces them out (default 1). Later specs for the same key override
+    earlier ones field by field.
+
+    Raises:
+        ValueError: If a spec is malformed or names an unknown agent or role.
+    """
+    limits: dict[LimitKey, Budget] = {}
+    for raw in specs:
+        key, sep, spec = raw.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"Invalid limit {raw!r}: expected KEY=SPEC, e.g. judge=2")
+        target = _parse_key(key)
+        budget = _parse_spec(key, spec)
+        limits[target] = limits[target].merge(budget) if target in limits else budget
+    return limits
@@ -0,0 +1,58 @@
+"""Tests for parse_limits."""
+
+import pytest
+
+from skillet.agent import Agent
+
+from .parse_limits import parse_limits
+from .types import Budget, Role
+
+
+def describe_parse_limits():
+    def it_parses_a_role_concurrency_limit():
+        assert parse_limits(["judge=2"]) == {(None, Role.JUDGE): Budget(max_concurrent=2)}
+
+    def it_parses_an_agent_rate_limit():
+        assert parse_limits(["claude=60/m"]) == {(Agent.CLAUDE, None): Budget(per_minute=60)}
+
+    def it_parses_an_agent_role_pair_with_both_limits():
+        assert parse_limits(["codex.run=4,30/m"]) == {
+            (Agent.CODEX, Role.RUN): Budget(max_concurrent=4, per_minute=30)
+        }
+
+    def it_parses_a_burst_alongside_a_rate():
+        assert parse_limits(["claude=60/m,burst=5"]) == {
+            (Agent.CLAUDE, None): Budget(per_minute=60, burst=5)
+        }
+
+    def it_merges_repeated_keys_field_by_field():
+        assert parse_limits(["judge=2", "judge=10/m"]) == {
+            (None, Role.JUDGE): Budget(max_concurrent=2, per_minute=10)
+        }
+
+    def it_returns_nothing_for_no_specs():
+        assert parse_limits([]) == {}
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "judge",
+            "=2",
+            "judge=",
+            "judge=0",
+            "judge=-1",
+            "judge=x",
+            "judge=0/m",
+            "judge=2,x/m",
+            "judge=burst=0",
+            "judge=burst=x",
+        ],
+    )
+    def it_rejects_malformed_specs(spec):
+        with pytest.raises(ValueError, match="Invalid limit"):
+            parse_limits([spec])
+
+    @pytest.mark.parametrize("spec", ["gemini=2", "review=2", "claude.review=2", "judge.claude=2"])
+    def it_rejects_unknown_targets(spec):
+        with pytest.raises(ValueError, match="Unknown limit target"):
+            parse_limits([spec])
@@ -15,6 +15,7 @@ from pydantic import BaseModel, ValidationError
 from skillet.agent import Agent
 
 from .run_agent import run_agent
+from .types import Role
 
 # Matches a fenced block (```json ... ``` or ``` ... ```), capturing its body.
 _FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
@@ -94,13 +95,16 @@ def _parse[T: BaseModel](text: str, model: type[T]) -> T:
         raise ValueError(f"Agent reply did not match the {model.__name__} schema: {e}") from e
 
 
-async def query_structured_via_agent[T: BaseModel](prompt: str, model: type[T], agent: Agent) -> T:
+async def query_structured_via_agent[T: BaseModel](
+    prompt: str, model: type[T], agent: Agent, *, role: Role = Role.RUN
+) -> T:
     """Run ``prompt`` through ``agent`` and parse its reply as ``model``.
 
     The agent is asked for a JSON object matching ``model``'s schema. If the
     first reply cannot be parsed, it is retried once with a stricter
     instruction. Errors from the CLI itself (e.g. a missing executable)
-    propagate immediately rather than being retried.
+    propagate immediately rather than being retried. ``role`` selects the
+    scheduler budget the call is charged to.
 
     Raises:
         ValueError: If no valid ``model`` can be parsed after the retry.
@@ -110,7 +114,7 @@ async def query_structured_via_agent[T: BaseModel](prompt: str, model: type[T],
 
     for attempt in range(_MAX_ATTEMPTS):
         full_prompt = base_prompt if attempt == 0 else base_prompt + _RETRY_SUFFIX
-        result = await run_agent(agent, [full_prompt], allowed_tools=[])
+        result = await run_agent(agent, [full_prompt], allowed_tools=[], role=role)
         try:
             return _parse(result.text, model)
         except ValueError as e:
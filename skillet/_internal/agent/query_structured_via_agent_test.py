@@ -9,6 +9,7 @@ from skillet._internal.sdk.query_result import QueryResult
 from skillet.agent import Agent
 
 from .query_structured_via_agent import query_structured_via_agent
+from .types import Role
 
 
 class Sample(BaseModel):
@@ -23,7 +24,9 @@ class _StubRunAgent:
         self._replies = list(replies)
         self.calls: list[dict] = []
 
-    async def __call__(self, agent, prompts, *, allowed_tools=None, cwd=None, env=None):
+    async def __call__(
+        self, agent, prompts, *, allowed_tools=None, cwd=None, env=None, role=Role.RUN
+    ):
         self.calls.append(
             {
                 "agent": agent,
@@ -31,6 +34,7 @@ class _StubRunAgent:
                 "allowed_tools": allowed_tools,
                 "cwd": cwd,
                 "env": env,
+                "role": role,
             }
         )
         return QueryResult(text=self._replies.pop(0))
@@ -125,3 +129,19 @@ def describe_query_structured_via_agent():
         stub = _StubRunAgent("[1, 2, 3]", "[4, 5]")
         with _patch_run_agent(stub), pytest.raises(ValueError):
             await query_structured_via_agent("p", Sample, Agent.CODEX)
+
+    @pytest.mark.asyncio
+    async def it_runs_under_the_run_role_by_default():
+        stub = _StubRunAgent('{"name": "x", "value": 1}')
+        with _patch_run_agent(stub):
+            await query_structured_via_agent("p", Sample, Agent.CLAUDE)
+
+        assert stub.calls[0]["role"] is Role.RUN
+
+    @pytest.mark.asyncio
+    async def it_passes_the_role_through():
+        stub = _StubRunAgent("garbage", '{"name": "x", "value": 1}')
+        with _patch_run_agent(stub):
+            await query_structured_via_agent("p", Sample, Agent.CLAUDE, role=Role.SUMMARIZE)
+
+        assert [c["role"] for c in stub.calls] == [Role.SUMMARIZE, Role.SUMMARIZE]
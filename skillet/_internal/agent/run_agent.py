@@ -1,19 +1,27 @@
 """Dispatch a prompt to the selected agent's CLI runner."""
 
+from collections.abc import Callable
+
 from skillet._internal.sdk.query_result import QueryResult
 from skillet.agent import Agent
 
+from .get_scheduler import get_scheduler
 from .run_claude_cli import run_claude_cli
 from .run_codex_cli import run_codex_cli
+from .types import Role
 
 
-async def run_agent(
+async def run_agent(  # noqa: PLR0913
     agent: Agent,
     prompts: list[str],
     *,
     allowed_tools: list[str] | None = None,
     cwd: str | None = None,
     env: dict[str, str] | None = None,
+    role: Role = Role.RUN,
+    stop_on_tool: Callable[[dict], bool] | None = None,
+    model: str | None = None,
+    resume: str | None = None,
 ) -> QueryResult:
     """Run ``prompts`` through the CLI of the selected ``agent``.
 
@@ -23,9 +31,33 @@ async def run_agent(
         allowed_tools: Tools to pre-approve.
         cwd: Working directory for the CLI (the eval sandbox).
         env: Environment for the subprocess (e.g. an isolated ``HOME``).
+        role: What the call is for. The call waits for the scheduler's
+            budgets for this agent and role before the CLI starts.
+        stop_on_tool: Kill the CLI at the first tool call this returns true
+            for, returning the partial transcript (``stopped_early``).
+        model: Model to run instead of the CLI's default.
+        resume: Session (codex: thread) to continue instead of starting a
+            new one, from an earlier result's ``session_id``.
     """
-    if agent is Agent.CLAUDE:
-        return await run_claude_cli(prompts, allowed_tools=allowed_tools, cwd=cwd, env=env)
-    if agent is Agent.CODEX:
-        return await run_codex_cli(prompts, allowed_tools=allowed_tools, cwd=cwd, env=env)
+    async with get_scheduler().slot(agent, role):
+        if agent is Agent.CLAUDE:
+            return await run_claude_cli(
+                prompts,
+                allowed_tools=allowed_tools,
+                cwd=cwd,
+                env=env,
+                stop_on_tool=stop_on_tool,
+                model=model,
+                resume=resume,
+            )
+        if agent is Agent.CODEX:
+            return await run_codex_cli(
+                prompts,
+                allowed_tools=allowed_tools,
+                cwd=cwd,
+                env=env,
+                stop_on_tool=stop_on_tool,
+                model=model,
+                resume=resume,
+            )
     raise ValueError(f"Unknown agent: {agent!r}")  # pragma: no cover
@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from skillet._internal.agent.agent_scheduler import AgentScheduler
 from skillet._internal.agent.run_agent import run_agent
+from skillet._internal.agent.types import Budget, Role
 from skillet._internal.sdk.query_result import QueryResult
 from skillet.agent import Agent
 
@@ -19,12 +21,23 @@ def describe_run_agent():
 
         with patch("skillet._internal.agent.run_agent.run_claude_cli", runner):
             result = await run_agent(
-                Agent.CLAUDE, ["prompt"], allowed_tools=["Skill"], cwd="/s", env={"HOME": "/h"}
+                Agent.CLAUDE,
+                ["prompt"],
+                allowed_tools=["Skill"],
+                cwd="/s",
+                env={"HOME": "/h"},
+                stop_on_tool=None,
             )
 
         assert result is expected
         runner.assert_awaited_once_with(
-            ["prompt"], allowed_tools=["Skill"], cwd="/s", env={"HOME": "/h"}
+            ["prompt"],
+            allowed_tools=["Skill"],
+            cwd="/s",
+            env={"HOME": "/h"},
+            stop_on_tool=None,
+            model=None,
+            resume=None,
         )
 
     @pytest.mark.asyncio
@@ -34,10 +47,41 @@ def describe_run_agent():
 
         with patch("skillet._internal.agent.run_agent.run_codex_cli", runner):
             result = await run_agent(
-                Agent.CODEX, ["prompt"], allowed_tools=["Skill"], cwd="/s", env={"HOME": "/h"}
+                Agent.CODEX,
+                ["prompt"],
+                allowed_tools=["Skill"],
+                cwd="/s",
+                env={"HOME": "/h"},
+                stop_on_tool=None,
             )
 
         assert result is expected
         runner.assert_awaited_once_with(
-            ["prompt"], allowed_tools=["Skill"], cwd="/s", env={"HOME": "/h"}
+            ["prompt"],
+            allowed_tools=["Skill"],
+            cwd="/s",
+            env={"HOME": "/h"},
+            stop_on_tool=None,
+            model=None,
+            resume=None,
         )
+
+    @pytest.mark.asyncio
+    async def it_waits_for_the_scheduler_budget_of_its_role():
+        scheduler = AgentScheduler({(None, Role.JUDGE): Budget(max_concurrent=1)})
+        depths = []
+
+        async def runner(*_args, **_kwargs):
+            depths.append(scheduler.stats()["judge"]["in_flight"])
+            return QueryResult(text="hi", tool_calls=[])
+
+        with (
+            patch("skillet._internal.agent.run_agent.get_scheduler", return_value=scheduler),
+            patch("skillet._internal.agent.run_agent.run_claude_cli", runner),
+        ):
+            await run_agent(Agent.CLAUDE, ["p"], role=Role.JUDGE)
+            await run_agent(Agent.CLAUDE, ["p"])
+
+        # The judge call held the judge budget; the run call bypassed it.
+        assert depths == [1, 0]
+        assert scheduler.stats()["judge"]["acquired"] == 1
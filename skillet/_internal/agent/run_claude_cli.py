@@ -2,11 +2,14 @@
 
 from asyncio import create_subprocess_exec
 from asyncio.subprocess import PIPE
+from collections.abc import Callable
 from shutil import which
 
 from skillet._internal.sdk.query_result import QueryResult
+from skillet._internal.sdk.usage import Usage
 
-from .parse_claude_stream import parse_claude_stream
+from .communicate_until import communicate_until
+from .parse_claude_stream import claude_line_tool_calls, parse_claude_stream
 
 # Headless `-p` runs cannot answer interactive permission prompts, so tools are
 # pre-approved. Evals already run in an isolated, throwaway HOME.
@@ -21,12 +24,37 @@ _BASE_CMD = [
 ]
 
 
+def _command(
+    prompt: str,
+    *,
+    model: str | None,
+    allowed_tools: list[str] | None,
+    session_id: str | None,
+    fork: bool = False,
+) -> list[str]:
+    """The CLI invocation for one turn, resuming (or forking) ``session_id`` when there is one."""
+    cmd = list(_BASE_CMD)
+    if model:
+        cmd += ["--model", model]
+    if allowed_tools:
+        cmd += ["--allowedTools", *allowed_tools]
+    if session_id:
+        cmd += ["--resume", session_id]
+        if fork:
+            cmd.append("--fork-session")
+    cmd.append(prompt)
+    return cmd
+
+
 async def run_claude_cli(
     prompts: list[str],
     *,
     allowed_tools: list[str] | None = None,
     cwd: str | None = None,
     env: dict[str, str] | None = None,
+    stop_on_tool: Callable[[dict], bool] | None = None,
+    model: str | None = None,
+    resume: str | None = None,
 ) -> QueryResult:
     """Drive the `claude` CLI as the agent under test and return its response.
 
@@ -39,6 +67,14 @@ async def run_claude_cli(
         allowed_tools: Tools to pre-approve (passed to ``--allowedTools``).
         cwd: Working directory for the CLI (the eval sandbox).
         env: Environment for the subprocess (e.g. an isolated ``HOME``).
+        stop_on_tool: Called with each tool call as the CLI streams it; the
+            first one it returns true for kills the CLI before the tool runs,
+            skips any remaining turns and returns the partial transcript with
+            ``stopped_early`` set.
+        model: Model to run instead of the CLI's default (passed to ``--model``).
+        resume: Session to continue from instead of starting a new one. The
+            first turn forks it (``--fork-session``), so the session itself is
+            left as it was and can be continued again.
 
     Raises:
         RuntimeError: If the `claude` CLI is missing from PATH, or a turn exits
@@ -50,30 +86,40 @@ async def run_claude_cli(
             "evals with --agent claude."
         )
 
-    session_id: str | None = None
+    session_id = resume
     response_text = ""
     all_tool_calls: list[dict] = []
-
-    for prompt in prompts:
-        cmd = list(_BASE_CMD)
-        if allowed_tools:
-            cmd += ["--allowedTools", *allowed_tools]
-        if session_id:
-            cmd += ["--resume", session_id]
-        cmd.append(prompt)
-
+    usage: Usage | None = None
+    stopped = False
+
+    for turn, prompt in enumerate(prompts):
+        cmd = _command(
+            prompt,
+            model=model,
+            allowed_tools=allowed_tools,
+            session_id=session_id,
+            fork=turn == 0 and resume is not None,
+        )
         proc = await create_subprocess_exec(
             *cmd,
             cwd=cwd,
             env=env,
             stdout=PIPE,
             stderr=PIPE,
+            start_new_session=stop_on_tool is not None,
         )
-        stdout, stderr = await proc.communicate()
+        if stop_on_tool is None:
+            stdout, stderr = await proc.communicate()
+        else:
+            stdout, stderr, stopped = await communicate_until(
+                proc, lambda line: any(map(stop_on_tool, claude_line_tool_calls(line)))
+            )
 
-        text, tool_calls, turn_session_id = parse_claude_stream(stdout.decode())
+        text, tool_calls, turn_session_id, turn_usage = parse_claude_stream(
+            stdout.decode(errors="replace")
+        )
 
-        if proc.returncode != 0 and not text:
+        if proc.returncode != 0 and not text and not stopped:
             err = stderr.decode().strip()
             raise RuntimeError(
                 f"claude exited with code {proc.returncode}" + (f": {err}" if err else "")
@@ -83,5 +129,15 @@ async def run_claude_cli(
             session_id = turn_session_id
         response_text = text
         all_tool_calls.extend(tool_calls)
-
-    return QueryResult(text=response_text, tool_calls=all_tool_calls)
+        if turn_usage is not None:
+            usage = turn_usage if usage is None else usage + turn_usage
+        if stopped:
+            break
+
+    return QueryResult(
+        text=response_text,
+        tool_calls=all_tool_calls,
+        stopped_early=stopped,
+        usage=usage,
+        session_id=session_id,
+    )
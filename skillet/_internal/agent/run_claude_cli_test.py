@@ -84,6 +84,22 @@ def describe_run_claude_cli():
         assert "Bash" in cmd
         assert cmd[-1] == "hi"
 
+    @pytest.mark.asyncio
+    async def it_passes_the_model():
+        from skillet._internal.agent.run_claude_cli import run_claude_cli
+
+        proc = _FakeProc(_stream("ok", session_id="s1"))
+        exec_mock = AsyncMock(return_value=cast("object", proc))
+
+        with (
+            patch("skillet._internal.agent.run_claude_cli.which", return_value="/usr/bin/claude"),
+            patch("skillet._internal.agent.run_claude_cli.create_subprocess_exec", exec_mock),
+        ):
+            await run_claude_cli(["hi"], model="haiku")
+
+        cmd = exec_mock.call_args.args
+        assert cmd[cmd.index("--model") + 1] == "haiku"
+
     @pytest.mark.asyncio
     async def it_resumes_session_on_subsequent_turns():
         from skillet._internal.agent.run_claude_cli import run_claude_cli
@@ -107,6 +123,30 @@ def describe_run_claude_cli():
         assert "sess-abc" in second_cmd
         assert result.text == "turn2"
 
+    @pytest.mark.asyncio
+    async def it_forks_a_session_it_is_asked_to_resume():
+        from skillet._internal.agent.run_claude_cli import run_claude_cli
+
+        procs = [
+            _FakeProc(_stream("turn3", session_id="fork-1")),
+            _FakeProc(_stream("turn4", session_id="fork-1")),
+        ]
+        exec_mock = AsyncMock(side_effect=[cast("object", p) for p in procs])
+
+        with (
+            patch("skillet._internal.agent.run_claude_cli.which", return_value="/usr/bin/claude"),
+            patch("skillet._internal.agent.run_claude_cli.create_subprocess_exec", exec_mock),
+        ):
+            result = await run_claude_cli(["three", "four"], resume="sess-abc")
+
+        first_cmd = exec_mock.call_args_list[0].args
+        second_cmd = exec_mock.call_args_list[1].args
+        assert first_cmd[first_cmd.index("--resume") + 1] == "sess-abc"
+        assert "--fork-session" in first_cmd
+        assert second_cmd[second_cmd.index("--resume") + 1] == "fork-1"
+        assert "--fork-session" not in second_cmd
+        assert result.session_id == "fork-1"
+
     @pytest.mark.asyncio
     async def it_passes_cwd_and_env_to_subprocess():
         from skillet._internal.agent.run_claude_cli import run_claude_cli
@@ -136,3 +176,57 @@ def describe_run_claude_cli():
             pytest.raises(RuntimeError, match=r"exited with code 1.*boom"),
         ):
             await run_claude_cli(["hi"])
+
+    @pytest.mark.asyncio
+    async def it_stops_at_a_rejected_tool_call_and_skips_later_turns():
+        from skillet._internal.agent.run_claude_cli import run_claude_cli
+
+        proc = _FakeProc(b"", returncode=-9)
+        exec_mock = AsyncMock(return_value=cast("object", proc))
+        partial = _stream(session_id="s1", tool="Bash")
+        until_mock = AsyncMock(return_value=(partial, b"", True))
+
+        with (
+            patch("skillet._internal.agent.run_claude_cli.which", return_value="/usr/bin/claude"),
+            patch("skillet._internal.agent.run_claude_cli.create_subprocess_exec", exec_mock),
+            patch("skillet._internal.agent.run_claude_cli.communicate_until", until_mock),
+        ):
+            result = await run_claude_cli(
+                ["one", "two"], stop_on_tool=lambda call: call["name"] == "Bash"
+            )
+
+        assert result.stopped_early is True
+        assert result.tool_calls == [{"name": "Bash", "input": {}}]
+        exec_mock.assert_awaited_once()
+        assert exec_mock.call_args.kwargs["start_new_session"] is True
+        stop = until_mock.call_args.args[1]
+        assert stop(_stream(tool="Bash").decode()) is True
+        assert stop(_stream(tool="Read").decode()) is False
+
+    @pytest.mark.asyncio
+    async def it_sums_usage_across_turns():
+        from skillet._internal.agent.run_claude_cli import run_claude_cli
+        from skillet._internal.sdk import Usage
+
+        def turn(text: str, cost: float) -> bytes:
+            result = {
+                "type": "result",
+                "result": text,
+                "total_cost_usd": cost,
+                "duration_ms": 1000,
+                "usage": {"input_tokens": 5, "output_tokens": 10},
+            }
+            return _stream(text, session_id="s") + b"\n" + json.dumps(result).encode()
+
+        procs = [_FakeProc(turn("one", 0.25)), _FakeProc(turn("two", 0.5))]
+        exec_mock = AsyncMock(side_effect=[cast("object", p) for p in procs])
+
+        with (
+            patch("skillet._internal.agent.run_claude_cli.which", return_value="/usr/bin/claude"),
+            patch("skillet._internal.agent.run_claude_cli.create_subprocess_exec", exec_mock),
+        ):
+            result = await run_claude_cli(["one", "two"])
+
+        assert result.usage == Usage(
+            input_tokens=10, output_tokens=20, cost_usd=0.75, duration_ms=2000
+        )
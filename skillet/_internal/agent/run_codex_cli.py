@@ -2,11 +2,14 @@
 
 from asyncio import create_subprocess_exec
 from asyncio.subprocess import DEVNULL, PIPE
+from collections.abc import Callable
 from shutil import which
 
 from skillet._internal.sdk.query_result import QueryResult
+from skillet._internal.sdk.usage import Usage
 
-from .parse_codex_stream import parse_codex_stream
+from .communicate_until import communicate_until
+from .parse_codex_stream import codex_line_tool_calls, parse_codex_stream
 
 # Flags shared by the initial `exec` and subsequent `exec resume` turns.
 _BASE_FLAGS = ["--json", "--skip-git-repo-check"]
@@ -16,12 +19,25 @@ _BASE_FLAGS = ["--json", "--skip-git-repo-check"]
 _SANDBOX_MODE = "workspace-write"
 
 
+def _start_flags(cwd: str | None, model: str | None) -> list[str]:
+    """Flags for the turn that starts a thread; resumed turns inherit them."""
+    flags = [*_BASE_FLAGS, "-s", _SANDBOX_MODE]
+    if cwd:
+        flags += ["-C", cwd]
+    if model:
+        flags += ["-m", model]
+    return flags
+
+
 async def run_codex_cli(
     prompts: list[str],
     *,
     allowed_tools: list[str] | None = None,  # noqa: ARG001 - codex has no per-tool allowlist
     cwd: str | None = None,
     env: dict[str, str] | None = None,
+    stop_on_tool: Callable[[dict], bool] | None = None,
+    model: str | None = None,
+    resume: str | None = None,
 ) -> QueryResult:
     """Drive the `codex` CLI as the agent under test and return its response.
 
@@ -33,6 +49,18 @@ async def run_codex_cli(
     but ignored: codex controls tool access via its sandbox mode, not a per-tool
     allowlist.
 
+    ``stop_on_tool`` is called with each tool call as the CLI streams it
+    (codex reports a tool item once it completes); the first one it returns
+    true for kills the CLI, skips any remaining turns and returns the
+    partial transcript with ``stopped_early`` set.
+
+    ``model`` runs a model other than the CLI's default (passed to ``-m``
+    when the thread starts; resumed turns continue on it).
+
+    ``resume`` continues an existing thread (``exec resume``) instead of
+    starting one. Codex appends to the thread, so a caller branching one
+    thread several ways gives each branch its own copy of ``HOME``.
+
     Raises:
         RuntimeError: If the `codex` CLI is missing from PATH, a turn reports a
             failure (``turn.failed``/``error``), or a turn exits non-zero without
@@ -43,18 +71,18 @@ async def run_codex_cli(
             "The 'codex' CLI was not found on PATH. Install Codex to run evals with --agent codex."
         )
 
-    thread_id: str | None = None
+    thread_id = resume
     response_text = ""
     all_tool_calls: list[dict] = []
+    usage: Usage | None = None
+    stopped = False
 
     for prompt in prompts:
         cmd = ["codex", "exec"]
         if thread_id:
             cmd += ["resume", thread_id, *_BASE_FLAGS]
         else:
-            cmd += [*_BASE_FLAGS, "-s", _SANDBOX_MODE]
-            if cwd:
-                cmd += ["-C", cwd]
+            cmd += _start_flags(cwd, model)
         cmd.append(prompt)
 
         proc = await create_subprocess_exec(
@@ -64,15 +92,23 @@ async def run_codex_cli(
             stdin=DEVNULL,
             stdout=PIPE,
             stderr=PIPE,
+            start_new_session=stop_on_tool is not None,
         )
-        stdout, stderr = await proc.communicate()
+        if stop_on_tool is None:
+            stdout, stderr = await proc.communicate()
+        else:
+            stdout, stderr, stopped = await communicate_until(
+                proc, lambda line: any(map(stop_on_tool, codex_line_tool_calls(line)))
+            )
 
-        text, tool_calls, turn_thread_id, error = parse_codex_stream(stdout.decode())
+        text, tool_calls, turn_thread_id, error, turn_usage = parse_codex_stream(
+            stdout.decode(errors="replace")
+        )
 
         if error:
             raise RuntimeError(f"codex turn failed: {error}")
 
-        if proc.returncode != 0 and not text:
+        if proc.returncode != 0 and not text and not stopped:
             err = stderr.decode().strip()
             raise RuntimeError(
                 f"codex exited with code {proc.returncode}" + (f": {err}" if err else "")
@@ -82,5 +118,15 @@ async def run_codex_cli(
             thread_id = turn_thread_id
         response_text = text
         all_tool_calls.extend(tool_calls)
-
-    return QueryResult(text=response_text, tool_calls=all_tool_calls)
+        if turn_usage is not None:
+            usage = turn_usage if usage is None else usage + turn_usage
+        if stopped:
+            break
+
+    return QueryResult(
+        text=response_text,
+        tool_calls=all_tool_calls,
+        stopped_early=stopped,
+        usage=usage,
+        session_id=thread_id,
+    )
@@ -119,6 +119,27 @@ def describe_run_codex_cli():
         cmd = exec_mock.call_args.args
         assert "-C" not in cmd
 
+    @pytest.mark.asyncio
+    async def it_passes_the_model_when_the_thread_starts():
+        from skillet._internal.agent.run_codex_cli import run_codex_cli
+
+        procs = [
+            _FakeProc(_stream("turn1", thread_id="sess-abc")),
+            _FakeProc(_stream("turn2")),
+        ]
+        exec_mock = AsyncMock(side_effect=[cast("object", p) for p in procs])
+
+        with (
+            patch("skillet._internal.agent.run_codex_cli.which", return_value="/usr/bin/codex"),
+            patch("skillet._internal.agent.run_codex_cli.create_subprocess_exec", exec_mock),
+        ):
+            await run_codex_cli(["one", "two"], model="gpt-5-mini")
+
+        first_cmd = exec_mock.call_args_list[0].args
+        second_cmd = exec_mock.call_args_list[1].args
+        assert first_cmd[first_cmd.index("-m") + 1] == "gpt-5-mini"
+        assert "-m" not in second_cmd
+
     @pytest.mark.asyncio
     async def it_resumes_session_on_subsequent_turns():
         from skillet._internal.agent.run_codex_cli import run_codex_cli
@@ -144,6 +165,24 @@ def describe_run_codex_cli():
         assert "--json" in second_cmd
         assert result.text == "turn2"
 
+    @pytest.mark.asyncio
+    async def it_continues_a_thread_it_is_asked_to_resume():
+        from skillet._internal.agent.run_codex_cli import run_codex_cli
+
+        proc = _FakeProc(_stream("turn3"))
+        exec_mock = AsyncMock(return_value=cast("object", proc))
+
+        with (
+            patch("skillet._internal.agent.run_codex_cli.which", return_value="/usr/bin/codex"),
+            patch("skillet._internal.agent.run_codex_cli.create_subprocess_exec", exec_mock),
+        ):
+            result = await run_codex_cli(["three"], resume="sess-abc", model="gpt-5-mini")
+
+        cmd = exec_mock.call_args.args
+        assert cmd[1:4] == ("exec", "resume", "sess-abc")
+        assert "-m" not in cmd
+        assert result.session_id == "sess-abc"
+
     @pytest.mark.asyncio
     async def it_passes_cwd_and_env_and_devnull_stdin_to_subprocess():
         from asyncio.subprocess import DEVNULL
@@ -190,3 +229,51 @@ def describe_run_codex_cli():
             pytest.raises(RuntimeError, match=r"codex exited with code 1.*boom"),
         ):
             await run_codex_cli(["hi"])
+
+    @pytest.mark.asyncio
+    async def it_stops_at_a_rejected_tool_call():
+        from skillet._internal.agent.run_codex_cli import run_codex_cli
+
+        proc = _FakeProc(b"", returncode=-9)
+        exec_mock = AsyncMock(return_value=cast("object", proc))
+        partial = _stream(thread_id="t1", tool="command_execution")
+        until_mock = AsyncMock(return_value=(partial, b"", True))
+
+        with (
+            patch("skillet._internal.agent.run_codex_cli.which", return_value="/usr/bin/codex"),
+            patch("skillet._internal.agent.run_codex_cli.create_subprocess_exec", exec_mock),
+            patch("skillet._internal.agent.run_codex_cli.communicate_until", until_mock),
+        ):
+            result = await run_codex_cli(
+                ["one", "two"], stop_on_tool=lambda call: call["name"] == "command_execution"
+            )
+
+        assert result.stopped_early is True
+        assert [c["name"] for c in result.tool_calls] == ["command_execution"]
+        exec_mock.assert_awaited_once()
+        stop = until_mock.call_args.args[1]
+        assert stop(_stream(tool="command_execution").decode()) is True
+        assert stop(_stream(text="done").decode()) is False
+
+    @pytest.mark.asyncio
+    async def it_sums_usage_across_turns():
+        from skillet._internal.agent.run_codex_cli import run_codex_cli
+        from skillet._internal.sdk import Usage
+
+        completed = json.dumps(
+            {"type": "turn.completed", "usage": {"input_tokens": 8, "output_tokens": 3}}
+        ).encode()
+        procs = [
+            _FakeProc(_stream("turn1", thread_id="t") + b"\n" + completed),
+            _FakeProc(_stream("turn2") + b"\n" + completed),
+        ]
+        exec_mock = AsyncMock(side_effect=[cast("object", p) for p in procs])
+
+        with (
+            patch("skillet._internal.agent.run_codex_cli.which", return_value="/usr/bin/codex"),
+            patch("skillet._internal.agent.run_codex_cli.create_subprocess_exec", exec_mock),
+        ):
+            result = await run_codex_cli(["one", "two"])
+
+        assert result.usage == Usage(input_tokens=16, output_tokens=6)
+        assert result.usage.cost_usd is None
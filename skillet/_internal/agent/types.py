@@ -0,0 +1,39 @@
+"""Types for scheduling agent CLI calls."""
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class Role(StrEnum):
+    """What an agent call is for, so each kind can be budgeted separately."""
+
+    RUN = "run"
+    JUDGE = "judge"
+    SUMMARIZE = "summarize"
+    GENERATE = "generate"
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Limits on agent calls sharing one budget.
+
+    Attributes:
+        max_concurrent: Calls allowed in flight at once (``None`` = unlimited).
+        per_minute: Calls allowed to start per minute (``None`` = unlimited).
+        burst: Calls allowed to start back to back, before ``per_minute``
+            spaces them out: the token bucket's capacity (``None`` = 1).
+    """
+
+    max_concurrent: int | None = None
+    per_minute: float | None = None
+    burst: int | None = None
+
+    def merge(self, other: "Budget") -> "Budget":
+        """Overlay ``other``'s set limits on this budget."""
+        return Budget(
+            max_concurrent=other.max_concurrent
+            if other.max_concurrent is not None
+            else self.max_concurrent,
+            per_minute=other.per_minute if other.per_minute is not None else self.per_minute,
+            burst=other.burst if other.burst is not None else self.burst,
+        )
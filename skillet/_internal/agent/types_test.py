@@ -0,0 +1,18 @@
+"""Tests for agent scheduling types."""
+
+from .types import Budget, Role
+
+
+def describe_Role():
+    def it_has_one_value_per_kind_of_call():
+        assert [r.value for r in Role] == ["run", "judge", "summarize", "generate"]
+
+
+def describe_Budget():
+    def it_is_unlimited_by_default():
+        assert Budget() == Budget(max_concurrent=None, per_minute=None)
+
+    def it_overlays_only_the_fields_that_are_set():
+        merged = Budget(max_concurrent=2, per_minute=10).merge(Budget(per_minute=30))
+
+        assert merged == Budget(max_concurrent=2, per_minute=30)
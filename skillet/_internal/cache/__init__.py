@@ -1,18 +1,47 @@
 """Caching for eval results."""
 
-from .build_iteration_cache import INFRA_FAILURE_KEY, build_iteration_cache
+from .build_grade_cache import build_grade_cache
+from .build_iteration_cache import INFRA_FAILURE_KEY, STOPPED_EARLY_KEY, build_iteration_cache
 from .eval_cache_key import eval_cache_key
+from .find_stale_entries import find_stale_entries
 from .hash_content import hash_content
 from .hash_directory import hash_directory
 from .hash_file import hash_file
+from .lm_response_cache import LMResponseCache
+from .mark_used import mark_used
 from .normalize_cache_name import normalize_cache_name
+from .read_cache_files import read_cache_files
+from .read_eval_latencies import read_eval_latencies
+from .read_eval_outcomes import read_eval_outcomes
+from .remove_entries import remove_entries
+from .response_cache_key import response_cache_key
+from .scan_cache import scan_cache
+from .score_memo import ScoreMemo
+from .select_lru_entries import select_lru_entries
+from .setup_snapshots import SetupSnapshots
+from .types import CacheEntry
 
 __all__ = [
     "INFRA_FAILURE_KEY",
+    "STOPPED_EARLY_KEY",
+    "CacheEntry",
+    "LMResponseCache",
+    "ScoreMemo",
+    "SetupSnapshots",
+    "build_grade_cache",
     "build_iteration_cache",
     "eval_cache_key",
+    "find_stale_entries",
     "hash_content",
     "hash_directory",
     "hash_file",
+    "mark_used",
     "normalize_cache_name",
+    "read_cache_files",
+    "read_eval_latencies",
+    "read_eval_outcomes",
+    "remove_entries",
+    "response_cache_key",
+    "scan_cache",
+    "select_lru_entries",
 ]
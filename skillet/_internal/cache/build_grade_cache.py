@@ -0,0 +1,31 @@
+"""Build the cachetta cache for grades of one cached agent response."""
+
+import json
+from pathlib import Path
+
+from cachetta import Cachetta
+
+from .build_iteration_cache import _CACHE_DURATION
+from .hash_content import hash_content
+
+
+def build_grade_cache(response_path: Path) -> Cachetta:
+    """Return a cache for grades of the response stored at ``response_path`` (the grading layer).
+
+    Grades sit in a ``grades/`` directory beside the response, keyed by the
+    grading criteria and a digest of the graded response and tool calls::
+
+        <response-dir>/grades/<grading-key>-<response-digest>.cache
+
+    The wrapped function is called as ``fn(payload, grading_key)``, where
+    ``payload`` is the response-layer payload. Editing an eval's criteria
+    changes ``grading_key`` only, so its cached responses are re-graded
+    without re-running the agent.
+    """
+    grades_dir = response_path.parent / "grades"
+
+    def path(payload: dict, grading_key: str) -> Path:
+        graded = json.dumps([payload["response"], payload.get("tool_calls")], default=str)
+        return grades_dir / f"{grading_key}-{hash_content(graded)}.cache"
+
+    return Cachetta(path=path, duration=_CACHE_DURATION)
@@ -0,0 +1,39 @@
+"""Tests for build_grade_cache."""
+
+from datetime import timedelta
+from pathlib import Path
+
+from skillet._internal.cache import build_grade_cache
+
+RESPONSE = Path("/cache/my-evals/001-abc/claude/baseline/iter-1.cache")
+
+
+def _payload(response: str = "hi", tool_calls: list | None = None) -> dict:
+    return {"iteration": 1, "response": response, "tool_calls": tool_calls or []}
+
+
+def describe_build_grade_cache():
+    def it_stores_grades_beside_the_response():
+        path = build_grade_cache(RESPONSE)._get_path(_payload(), "crit")
+
+        assert path.parent == RESPONSE.parent / "grades"
+        assert path.name.startswith("crit-")
+
+    def it_keys_by_criteria_and_response():
+        cache = build_grade_cache(RESPONSE)
+        base = cache._get_path(_payload(), "crit")
+
+        assert cache._get_path(_payload(), "other") != base
+        assert cache._get_path(_payload("bye"), "crit") != base
+        assert cache._get_path(_payload(tool_calls=[{"name": "Bash"}]), "crit") != base
+
+    def it_shares_grades_across_iterations_with_the_same_response():
+        first = build_grade_cache(RESPONSE)._get_path(_payload(), "crit")
+        second = build_grade_cache(RESPONSE.with_name("iter-2.cache"))._get_path(
+            {**_payload(), "iteration": 2}, "crit"
+        )
+
+        assert first == second
+
+    def it_uses_a_long_duration():
+        assert build_grade_cache(RESPONSE).duration > timedelta(days=365)
@@ -1,5 +1,6 @@
 """Build the cachetta cache for a single eval run's iteration results."""
 
+import json
 from datetime import timedelta
 from pathlib import Path
 
@@ -7,9 +8,10 @@ from cachetta import Cachetta
 
 from skillet.agent import Agent
 
-from .eval_cache_key import eval_cache_key
+from .hash_content import hash_content
 from .hash_directory import hash_directory
 from .normalize_cache_name import normalize_cache_name
+from .response_cache_key import response_cache_key
 
 # Eval results do not expire on their own: a changed eval or skill produces a
 # new cache key, so a stale key is simply never read again. Until cachetta
@@ -21,27 +23,44 @@ _CACHE_DURATION = timedelta(days=36500)
 # the cache so only genuine eval outcomes are persisted.
 INFRA_FAILURE_KEY = "infra_failure"
 
+# Runs killed mid-stream (--fail-fast-assertions) carry this key. Their partial
+# transcripts are graded but not cached: the response layer is keyed without the
+# assertions that stopped them, so no later run may reuse one.
+STOPPED_EARLY_KEY = "stopped_early"
+
 
 def _is_cacheable(payload: dict) -> bool:
-    """Cache real eval outcomes; skip infra failures (setup failure, exceptions)."""
-    return not payload.get(INFRA_FAILURE_KEY, False)
+    """Cache complete eval outcomes; skip infra failures and runs stopped early."""
+    return not payload.get(INFRA_FAILURE_KEY, False) and not payload.get(STOPPED_EARLY_KEY, False)
 
 
 def build_iteration_cache(
-    cache_root: Path, name: str, skill_path: Path | None, agent: Agent
+    cache_root: Path,
+    name: str,
+    skill_path: Path | None,
+    agent: Agent,
 ) -> Cachetta:
-    """Return a cache for one eval run's iteration results.
+    """Return a cache for one eval run's agent responses (the response layer).
 
-    The cache is keyed by eval (filename + content hash), agent, and iteration
-    under a per-run directory, mirroring the previous on-disk layout::
+    The cache is keyed by eval (filename + hash of prompt, setup and teardown,
+    see :func:`response_cache_key`), agent, allowed tools and iteration under
+    a per-run directory::
 
         <cache_root>/<name>/<eval-key>/<agent>/baseline/iter-<n>.cache
         <cache_root>/<name>/<eval-key>/<agent>/skills/<skill-hash>/iter-<n>.cache
 
+    An explicit ``allowed_tools`` list adds its hash to the file name
+    (``iter-<n>-<tools-hash>.cache``). Grades of each response are cached
+    next to it by :func:`build_grade_cache`, so grading criteria are not part
+    of this key.
+
     The agent is part of the key so ``claude`` and ``codex`` runs never collide.
     ``name``, ``skill_path``, and ``agent`` are fixed for a single run, so they
-    (and the skill hash) are resolved once here; only the eval key and iteration
-    vary per task and are read from the wrapped function's ``task`` argument.
+    (and the skill hash) are resolved once here; the eval key, tools and
+    iteration vary per call and are read from the wrapped function's
+    ``(task, skill_path, allowed_tools)`` arguments.
+    ``hash_directory`` memoizes by path, so a skill rewritten in place must
+    be given a new path (tune writes each candidate to its own directory).
     """
     name_dir = cache_root / normalize_cache_name(name)
     if skill_path is None:
@@ -49,8 +68,15 @@ def build_iteration_cache(
     else:
         skill_subdir = Path("skills") / hash_directory(skill_path)
 
-    def path(task: dict, *_: object) -> Path:
-        eval_key = eval_cache_key(task["eval_source"], task["eval_content"])
-        return name_dir / eval_key / agent.value / skill_subdir / f"iter-{task['iteration']}.cache"
+    def path(
+        task: dict, _skill_path: object = None, allowed_tools: list[str] | None = None
+    ) -> Path:
+        eval_key = response_cache_key(
+            task["eval_source"], task["prompt"], task.get("setup"), task.get("teardown")
+        )
+        filename = f"iter-{task['iteration']}"
+        if allowed_tools is not None:
+            filename += f"-{hash_content(json.dumps(sorted(allowed_tools)))}"
+        return name_dir / eval_key / agent.value / skill_subdir / f"{filename}.cache"
 
     return Cachetta(path=path, condition=_is_cacheable, duration=_CACHE_DURATION)
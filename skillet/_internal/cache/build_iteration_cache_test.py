@@ -12,11 +12,13 @@ from skillet.agent import Agent
 def describe_build_iteration_cache():
     """Tests for the eval iteration cache builder."""
 
-    def _task(iteration=1, eval_source="001.yaml", eval_content="content"):
+    def _task(iteration=1, eval_source="001.yaml", **fields):
         return {
             "iteration": iteration,
             "eval_source": eval_source,
-            "eval_content": eval_content,
+            "prompt": "prompt",
+            "expected": "expected",
+            **fields,
         }
 
     def it_builds_baseline_path_without_skill():
@@ -69,6 +71,32 @@ def describe_build_iteration_cache():
         assert same != other_iter
         assert same != other_eval
 
+    def it_keys_path_by_what_the_agent_run_depends_on():
+        cache = build_iteration_cache(Path("/cache"), "my-evals", None, Agent.CLAUDE)
+        base = cache._get_path(_task())
+
+        assert cache._get_path(_task(prompt="other")) != base
+        assert cache._get_path(_task(setup="mkdir x")) != base
+        assert cache._get_path(_task(teardown="rm -r x")) != base
+
+    def it_ignores_grading_criteria():
+        cache = build_iteration_cache(Path("/cache"), "my-evals", None, Agent.CLAUDE)
+        base = cache._get_path(_task())
+
+        assert cache._get_path(_task(expected="other", name="renamed")) == base
+        assert cache._get_path(_task(assertions=[{"type": "contains", "value": "x"}])) == base
+
+    def it_keys_path_by_allowed_tools():
+        cache = build_iteration_cache(Path("/cache"), "my-evals", None, Agent.CLAUDE)
+
+        default = cache._get_path(_task(), None, None)
+        bash = cache._get_path(_task(), None, ["Bash"])
+
+        assert default.name == "iter-1.cache"
+        assert bash.name.startswith("iter-1-")
+        assert bash != cache._get_path(_task(), None, ["Read"])
+        assert bash == cache._get_path(_task(), None, ["Bash"])
+
     def it_keys_path_by_agent():
         claude = build_iteration_cache(Path("/cache"), "my-evals", None, Agent.CLAUDE)
         codex = build_iteration_cache(Path("/cache"), "my-evals", None, Agent.CODEX)
@@ -0,0 +1,55 @@
+"""Find cached responses and grades for evals or skills that no longer exist."""
+
+from .normalize_cache_name import normalize_cache_name
+from .response_cache_key import response_cache_key
+from .types import CacheEntry
+
+
+def _is_stale(
+    entry: CacheEntry,
+    live_keys: dict[str, str],
+    skill_hashes: set[str] | None,
+    grading_keys: dict[str, str] | None,
+) -> bool:
+    if entry.eval_key not in live_keys:
+        return True
+    if skill_hashes is not None and entry.skill is not None and entry.skill not in skill_hashes:
+        return True
+    return (
+        entry.kind == "grade"
+        and grading_keys is not None
+        and entry.grading_key != grading_keys.get(live_keys[entry.eval_key])
+    )
+
+
+def find_stale_entries(
+    entries: list[CacheEntry],
+    name: str,
+    evals: list[dict],
+    *,
+    skill_hashes: set[str] | None = None,
+    grading_keys: dict[str, str] | None = None,
+) -> list[CacheEntry]:
+    """Return ``name``'s cached responses and grades that can never be read again.
+
+    A response (and its grades) is stale when its eval key matches none of
+    ``evals`` (the eval's prompt or scripts changed, or it was deleted). When
+    ``skill_hashes`` is given, skill entries whose hash is not in it are
+    stale too; baseline entries are always kept. When ``grading_keys`` maps
+    eval sources to their current grading key, grades under any other
+    criteria are stale. Entries of other eval sets, tune score memos and the
+    LM cache are left alone.
+    """
+    cache_name = normalize_cache_name(name)
+    # response key -> eval source
+    live_keys = {}
+    for e in evals:
+        key = response_cache_key(e["_source"], e["prompt"], e.get("setup"), e.get("teardown"))
+        live_keys[key] = e["_source"]
+    return [
+        entry
+        for entry in entries
+        if entry.kind in ("iteration", "grade")
+        and entry.name == cache_name
+        and _is_stale(entry, live_keys, skill_hashes, grading_keys)
+    ]
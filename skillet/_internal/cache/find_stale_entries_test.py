@@ -0,0 +1,71 @@
+"""Tests for find_stale_entries."""
+
+from pathlib import Path
+
+from skillet._internal.cache import CacheEntry, find_stale_entries, response_cache_key
+
+EVALS = [{"_source": "001.yaml", "prompt": "hi", "expected": "ok"}]
+LIVE = response_cache_key("001.yaml", "hi")
+
+
+def _iteration(eval_key: str, skill: str | None = None, name: str = "my-evals") -> CacheEntry:
+    return CacheEntry(Path("x"), 1, 0.0, "iteration", name, eval_key, "claude", skill)
+
+
+def _grade(eval_key: str, grading_key: str, skill: str | None = None) -> CacheEntry:
+    return CacheEntry(
+        Path("g"), 1, 0.0, "grade", "my-evals", eval_key, "claude", skill, grading_key
+    )
+
+
+def describe_find_stale_entries():
+    def it_flags_iterations_of_evals_that_no_longer_exist():
+        live, gone = _iteration(LIVE), _iteration("001-oldhash")
+
+        assert find_stale_entries([live, gone], "my-evals", EVALS) == [gone]
+
+    def it_flags_old_skill_hashes_when_given():
+        current, old, baseline = _iteration(LIVE, "new"), _iteration(LIVE, "old"), _iteration(LIVE)
+
+        stale = find_stale_entries(
+            [current, old, baseline], "my-evals", EVALS, skill_hashes={"new"}
+        )
+
+        assert stale == [old]
+
+    def it_keeps_responses_when_only_grading_criteria_change():
+        edited = [{**EVALS[0], "expected": "something else"}]
+
+        assert find_stale_entries([_iteration(LIVE)], "my-evals", edited) == []
+
+    def it_flags_grades_under_old_criteria_when_given():
+        current, old = _grade(LIVE, "new"), _grade(LIVE, "old")
+
+        stale = find_stale_entries(
+            [current, old], "my-evals", EVALS, grading_keys={"001.yaml": "new"}
+        )
+
+        assert stale == [old]
+
+    def it_flags_grades_of_responses_that_are_gone():
+        gone = _grade("001-oldhash", "crit")
+
+        assert find_stale_entries([gone], "my-evals", EVALS) == [gone]
+
+    def it_keeps_every_skill_hash_without_skill_hashes():
+        entry = _iteration(LIVE, "any")
+
+        assert find_stale_entries([entry], "my-evals", EVALS) == []
+
+    def it_leaves_other_sets_and_kinds_alone():
+        other_set = _iteration("001-oldhash", name="other")
+        scores = CacheEntry(Path("s"), 1, 0.0, "scores", name="my-evals")
+        lm = CacheEntry(Path("l"), 1, 0.0, "lm")
+
+        assert find_stale_entries([other_set, scores, lm], "my-evals", EVALS) == []
+
+    def it_normalizes_path_names(tmp_path: Path):
+        (tmp_path / "my-evals").mkdir()
+        gone = _iteration("001-oldhash", name="my-evals")
+
+        assert find_stale_entries([gone], str(tmp_path / "my-evals"), EVALS) == [gone]
@@ -0,0 +1,67 @@
+"""Size-bounded on-disk cache of LM response text."""
+
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .hash_content import hash_content
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class LMResponseCache:
+    """Map an LM request (model, prompt, options) to the text it returned.
+
+    One JSON file per request under ``directory``, named by a hash of the
+    request. Reads bump the file's mtime, and every write evicts the least
+    recently used files until the directory fits in ``max_bytes``. Writes
+    land via rename and eviction tolerates files vanishing underneath it,
+    so several processes can share the directory.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, request: dict[str, Any]) -> Path:
+        key = hash_content(json.dumps(request, sort_keys=True, default=str))
+        return self.directory / f"{key}.json"
+
+    def get(self, request: dict[str, Any]) -> str | None:
+        """Return the cached response for ``request``, or None on a miss."""
+        path = self._path(request)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        response = entry.get("response") if isinstance(entry, dict) else None
+        return response if isinstance(response, str) else None
+
+    def put(self, request: dict[str, Any], response: str) -> None:
+        """Store ``response`` for ``request``, then evict down to ``max_bytes``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"request": request, "response": response}, f, default=str)
+        Path(tmp).replace(self._path(request))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            with contextlib.suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,53 @@
+"""Tests for cache/lm_response_cache module."""
+
+import os
+
+from skillet._internal.cache.lm_response_cache import LMResponseCache
+
+REQUEST = {"model": "m", "prompt": "Question", "kwargs": {}}
+
+
+def describe_LMResponseCache():
+    def it_misses_when_empty(tmp_path):
+        assert LMResponseCache(tmp_path).get(REQUEST) is None
+
+    def it_returns_stored_responses(tmp_path):
+        cache = LMResponseCache(tmp_path)
+        cache.put(REQUEST, "Answer")
+
+        assert cache.get(REQUEST) == "Answer"
+        assert cache.get({**REQUEST, "prompt": "Other"}) is None
+
+    def it_ignores_kwarg_order(tmp_path):
+        cache = LMResponseCache(tmp_path)
+        cache.put({"a": 1, "b": 2}, "Answer")
+
+        assert cache.get({"b": 2, "a": 1}) == "Answer"
+
+    def it_treats_corrupt_entries_as_misses(tmp_path):
+        cache = LMResponseCache(tmp_path)
+        cache.put(REQUEST, "Answer")
+        next(tmp_path.glob("*.json")).write_text("{not json")
+
+        assert cache.get(REQUEST) is None
+
+    def it_evicts_least_recently_used_past_max_bytes(tmp_path):
+        cache = LMResponseCache(tmp_path, max_bytes=10_000)
+        cache.put({"n": 0}, "x" * 4000)
+        cache.put({"n": 1}, "x" * 4000)
+        # Age both, then touch 0 so 1 is the least recently used
+        for path in tmp_path.glob("*.json"):
+            os.utime(path, (1, 1))
+        assert cache.get({"n": 0}) is not None
+
+        cache.put({"n": 2}, "x" * 4000)
+
+        assert cache.get({"n": 0}) is not None
+        assert cache.get({"n": 1}) is None
+        assert cache.get({"n": 2}) is not None
+
+    def it_leaves_no_temp_files(tmp_path):
+        cache = LMResponseCache(tmp_path)
+        cache.put(REQUEST, "Answer")
+
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
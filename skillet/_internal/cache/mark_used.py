@@ -0,0 +1,18 @@
+"""Record a cache hit for LRU eviction."""
+
+import contextlib
+import os
+
+from cachetta import Cachetta
+
+
+def mark_used(cache: Cachetta, *args: object) -> None:
+    """Bump the entry's mtime so ``skillet cache prune`` evicts least recently used first.
+
+    ``args`` resolve the entry's path like the wrapped function's arguments.
+    A cache without a path function, or an entry that is already gone, is
+    left alone.
+    """
+    if callable(cache.path):
+        with contextlib.suppress(OSError):
+            os.utime(cache.path(*args))
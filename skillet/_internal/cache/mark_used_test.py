@@ -0,0 +1,24 @@
+"""Tests for mark_used."""
+
+import os
+from pathlib import Path
+
+from cachetta import Cachetta
+
+from skillet._internal.cache import mark_used
+
+
+def describe_mark_used():
+    def it_touches_the_entry_for_the_arguments(tmp_path: Path):
+        entry = tmp_path / "a.cache"
+        entry.write_text("x")
+        os.utime(entry, (1_000_000, 1_000_000))
+
+        mark_used(Cachetta(path=lambda name: tmp_path / f"{name}.cache"), "a")
+
+        assert entry.stat().st_mtime > 1_000_000
+
+    def it_ignores_a_missing_entry(tmp_path: Path):
+        mark_used(Cachetta(path=lambda name: tmp_path / f"{name}.cache"), "gone")
+
+        assert not (tmp_path / "gone.cache").exists()
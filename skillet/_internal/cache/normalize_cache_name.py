@@ -2,8 +2,23 @@
 
 from pathlib import Path
 
+from skillet.errors import EvalError
+
+# Top-level cache directories shared by every eval set
+RESERVED_CACHE_NAMES = frozenset({"lm", "setup-snapshots"})
+
 
 def normalize_cache_name(name: str) -> str:
-    """Normalize name to cache key: if path exists, use directory name."""
+    """Normalize name to cache key: if path exists, use directory name.
+
+    Raises:
+        EvalError: If the name is one of the cache's own top-level
+            directories, which an eval set's entries would be mixed into.
+    """
     name_path = Path(name)
-    return name_path.resolve().name if name_path.exists() else name
+    normalized = name_path.resolve().name if name_path.exists() else name
+    if normalized in RESERVED_CACHE_NAMES:
+        raise EvalError(
+            f"Eval set name {normalized!r} is reserved for skillet's own cache; rename it"
+        )
+    return normalized
@@ -3,7 +3,10 @@
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from skillet._internal.cache import normalize_cache_name
+from skillet.errors import EvalError
 
 
 def describe_normalize_cache_name():
@@ -15,3 +18,15 @@ def describe_normalize_cache_name():
         with tempfile.TemporaryDirectory() as tmpdir:
             result = normalize_cache_name(tmpdir)
             assert result == Path(tmpdir).name
+
+    @pytest.mark.parametrize("name", ["lm", "setup-snapshots"])
+    def it_rejects_names_reserved_for_shared_caches(name):
+        with pytest.raises(EvalError, match="reserved"):
+            normalize_cache_name(name)
+
+    def it_rejects_a_directory_with_a_reserved_name(tmp_path):
+        evals_dir = tmp_path / "lm"
+        evals_dir.mkdir()
+
+        with pytest.raises(EvalError, match="reserved"):
+            normalize_cache_name(str(evals_dir))
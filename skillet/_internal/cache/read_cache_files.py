@@ -0,0 +1,29 @@
+"""Read many cache files at once."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from cachetta import Cachetta, read_cache
+
+from .build_iteration_cache import _CACHE_DURATION
+
+_WORKERS = 16
+
+
+def _read(path: Path) -> Any:
+    with read_cache(Cachetta(path=path, duration=_CACHE_DURATION)) as payload:
+        return payload
+
+
+def read_cache_files(paths: list[Path]) -> list[Any]:
+    """Return the payload stored at each of ``paths``, or ``None`` where there is none.
+
+    Reads run on a small thread pool, so thousands of entries load in
+    seconds. Missing and unreadable files read as ``None``. Nothing is
+    written and no entry's last-used time changes.
+    """
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(_WORKERS, len(paths))) as pool:
+        return list(pool.map(_read, paths))
@@ -0,0 +1,33 @@
+"""Tests for read_cache_files."""
+
+from pathlib import Path
+
+from cachetta import Cachetta, write_cache
+
+from skillet._internal.cache import read_cache_files
+
+
+def _store(path: Path, payload: dict) -> Path:
+    write_cache(Cachetta(path=path), payload)
+    return path
+
+
+def describe_read_cache_files():
+    def it_reads_payloads_in_order(tmp_path: Path):
+        paths = [_store(tmp_path / f"{i}.cache", {"i": i}) for i in range(20)]
+
+        assert read_cache_files(paths) == [{"i": i} for i in range(20)]
+
+    def it_reads_missing_and_corrupt_files_as_none(tmp_path: Path):
+        good = _store(tmp_path / "good.cache", {"ok": True})
+        corrupt = tmp_path / "corrupt.cache"
+        corrupt.write_bytes(b"not a pickle")
+
+        assert read_cache_files([tmp_path / "gone.cache", good, corrupt]) == [
+            None,
+            {"ok": True},
+            None,
+        ]
+
+    def it_handles_no_paths():
+        assert read_cache_files([]) == []
@@ -0,0 +1,40 @@
+"""Read historical run latencies for evals from the iteration cache."""
+
+from pathlib import Path
+
+from cachetta import Cachetta, read_cache
+
+from skillet.agent import Agent
+
+from .build_iteration_cache import _CACHE_DURATION
+from .normalize_cache_name import normalize_cache_name
+from .response_cache_key import response_cache_key
+
+
+def read_eval_latencies(
+    cache_root: Path, name: str, evals: list[dict], agent: Agent
+) -> dict[str, float]:
+    """Return ``{eval_source: mean seconds}`` over every timed cached iteration of each eval.
+
+    Pooled across the baseline and every skill hash cached for ``agent``, like
+    :func:`read_eval_outcomes`. Evals with no timed iteration (never run, or
+    cached before durations were recorded) are left out.
+    """
+    name_dir = cache_root / normalize_cache_name(name)
+    latencies: dict[str, float] = {}
+    for eval_data in evals:
+        eval_key = response_cache_key(
+            eval_data["_source"],
+            eval_data["prompt"],
+            eval_data.get("setup"),
+            eval_data.get("teardown"),
+        )
+        durations = []
+        for cache_file in sorted((name_dir / eval_key / agent.value).rglob("iter-*.cache")):
+            reader = Cachetta(path=cache_file, duration=_CACHE_DURATION)
+            with read_cache(reader) as payload:
+                if isinstance(payload, dict) and isinstance(payload.get("duration"), int | float):
+                    durations.append(float(payload["duration"]))
+        if durations:
+            latencies[eval_data["_source"]] = sum(durations) / len(durations)
+    return latencies
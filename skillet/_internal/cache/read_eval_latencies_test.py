@@ -0,0 +1,64 @@
+"""Tests for read_eval_latencies."""
+
+from pathlib import Path
+
+from cachetta import write_cache
+
+from skillet._internal.cache import build_iteration_cache, read_eval_latencies
+from skillet.agent import Agent
+
+
+def _eval(source: str, prompt: str = "prompt") -> dict:
+    return {"_source": source, "_content": prompt, "prompt": prompt}
+
+
+def _store(cache_root: Path, skill: Path | None, source: str, iteration: int, duration=None):
+    cache = build_iteration_cache(cache_root, "my-evals", skill, Agent.CLAUDE)
+    task = {"eval_source": source, "prompt": "prompt", "iteration": iteration}
+    payload = {"iteration": iteration, "response": "ok"}
+    if duration is not None:
+        payload["duration"] = duration
+    write_cache(cache, payload, task)
+
+
+def describe_read_eval_latencies():
+    def it_omits_evals_without_history(tmp_path: Path):
+        assert read_eval_latencies(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE) == {}
+
+    def it_averages_timed_iterations(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, 10.0)
+        _store(tmp_path, None, "a.yaml", 2, 20.0)
+
+        latencies = read_eval_latencies(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert latencies == {"a.yaml": 15.0}
+
+    def it_pools_baseline_and_skill_runs(tmp_path: Path):
+        skill = tmp_path / "skill"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text("instructions")
+        _store(tmp_path, None, "a.yaml", 1, 4.0)
+        _store(tmp_path, skill, "a.yaml", 1, 8.0)
+
+        latencies = read_eval_latencies(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert latencies == {"a.yaml": 6.0}
+
+    def it_skips_iterations_cached_without_a_duration(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1)
+        _store(tmp_path, None, "a.yaml", 2, 9.0)
+
+        latencies = read_eval_latencies(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert latencies == {"a.yaml": 9.0}
+
+    def it_keeps_agents_separate(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, 9.0)
+
+        assert read_eval_latencies(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CODEX) == {}
+
+    def it_keeps_latencies_when_only_grading_criteria_change(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, 9.0)
+        edited = {**_eval("a.yaml"), "expected": "something else"}
+
+        assert read_eval_latencies(tmp_path, "my-evals", [edited], Agent.CLAUDE) == {"a.yaml": 9.0}
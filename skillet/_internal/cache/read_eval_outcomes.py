@@ -0,0 +1,43 @@
+"""Read historical pass/fail outcomes for evals from the iteration cache."""
+
+from pathlib import Path
+
+from cachetta import Cachetta, read_cache
+
+from skillet.agent import Agent
+
+from .build_iteration_cache import _CACHE_DURATION
+from .normalize_cache_name import normalize_cache_name
+from .response_cache_key import response_cache_key
+
+
+def read_eval_outcomes(
+    cache_root: Path, name: str, evals: list[dict], agent: Agent
+) -> dict[str, tuple[int, int]]:
+    """Return ``{eval_source: (passes, runs)}`` over every cached grade of each eval.
+
+    Outcomes are pooled across the baseline and every skill hash cached for
+    ``agent`` (the layout written by :func:`build_iteration_cache` and
+    :func:`build_grade_cache`), so an eval's history survives skill edits and
+    edits to its grading criteria. An eval whose prompt or scripts changed
+    has a new response key and therefore starts with no history. Unreadable
+    entries are skipped.
+    """
+    name_dir = cache_root / normalize_cache_name(name)
+    outcomes: dict[str, tuple[int, int]] = {}
+    for eval_data in evals:
+        eval_key = response_cache_key(
+            eval_data["_source"],
+            eval_data["prompt"],
+            eval_data.get("setup"),
+            eval_data.get("teardown"),
+        )
+        passes = runs = 0
+        for cache_file in sorted((name_dir / eval_key / agent.value).rglob("grades/*.cache")):
+            reader = Cachetta(path=cache_file, duration=_CACHE_DURATION)
+            with read_cache(reader) as payload:
+                if isinstance(payload, dict) and "pass" in payload:
+                    runs += 1
+                    passes += bool(payload["pass"])
+        outcomes[eval_data["_source"]] = (passes, runs)
+    return outcomes
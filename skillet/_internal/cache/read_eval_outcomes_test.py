@@ -0,0 +1,78 @@
+"""Tests for read_eval_outcomes."""
+
+from pathlib import Path
+
+from cachetta import write_cache
+
+from skillet._internal.cache import build_grade_cache, build_iteration_cache, read_eval_outcomes
+from skillet.agent import Agent
+
+
+def _eval(source: str, prompt: str = "prompt") -> dict:
+    return {"_source": source, "_content": prompt, "prompt": prompt}
+
+
+def _store(
+    cache_root: Path,
+    skill: Path | None,
+    source: str,
+    iteration: int,
+    passed: bool,
+    criteria: str = "crit",
+):
+    cache = build_iteration_cache(cache_root, "my-evals", skill, Agent.CLAUDE)
+    task = {"eval_source": source, "prompt": "prompt", "iteration": iteration}
+    payload = {"iteration": iteration, "response": f"response {iteration}"}
+    write_cache(cache, payload, task)
+    grades = build_grade_cache(cache._get_path(task))
+    write_cache(grades, {"pass": passed, "reasoning": ""}, payload, criteria)
+
+
+def describe_read_eval_outcomes():
+    def it_returns_zero_runs_without_history(tmp_path: Path):
+        outcomes = read_eval_outcomes(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+        assert outcomes == {"a.yaml": (0, 0)}
+
+    def it_counts_cached_passes_and_runs(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, True)
+        _store(tmp_path, None, "a.yaml", 2, False)
+        _store(tmp_path, None, "a.yaml", 3, True)
+
+        outcomes = read_eval_outcomes(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert outcomes["a.yaml"] == (2, 3)
+
+    def it_pools_baseline_and_skill_runs(tmp_path: Path):
+        skill = tmp_path / "skill"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text("instructions")
+        _store(tmp_path, None, "a.yaml", 1, False)
+        _store(tmp_path, skill, "a.yaml", 1, True)
+
+        outcomes = read_eval_outcomes(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert outcomes["a.yaml"] == (1, 2)
+
+    def it_keeps_agents_separate(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, True)
+
+        outcomes = read_eval_outcomes(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CODEX)
+
+        assert outcomes["a.yaml"] == (0, 0)
+
+    def it_ignores_history_of_edited_prompts(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, True)
+
+        outcomes = read_eval_outcomes(
+            tmp_path, "my-evals", [_eval("a.yaml", "edited")], Agent.CLAUDE
+        )
+
+        assert outcomes["a.yaml"] == (0, 0)
+
+    def it_pools_grades_across_grading_criteria(tmp_path: Path):
+        _store(tmp_path, None, "a.yaml", 1, True, criteria="old")
+        _store(tmp_path, None, "a.yaml", 1, False, criteria="new")
+
+        outcomes = read_eval_outcomes(tmp_path, "my-evals", [_eval("a.yaml")], Agent.CLAUDE)
+
+        assert outcomes["a.yaml"] == (1, 2)
@@ -0,0 +1,23 @@
+"""Delete cache entries without disturbing evals that are running."""
+
+from .types import CacheEntry
+
+
+def remove_entries(entries: list[CacheEntry]) -> tuple[int, int]:
+    """Delete ``entries``' files and return ``(files removed, bytes freed)``.
+
+    Only files are unlinked, never directories. A running eval may already
+    have created a directory and will write into it again without
+    re-checking that it exists. Files that are already gone are skipped.
+    An eval reading a file while it is removed sees a cache miss and
+    re-runs that iteration.
+    """
+    removed = freed = 0
+    for entry in entries:
+        try:
+            entry.path.unlink()
+        except OSError:
+            continue
+        removed += 1
+        freed += entry.size
+    return removed, freed
@@ -0,0 +1,29 @@
+"""Tests for remove_entries."""
+
+from pathlib import Path
+
+from skillet._internal.cache import CacheEntry, remove_entries
+
+
+def describe_remove_entries():
+    def it_unlinks_files_and_reports_bytes_freed(tmp_path: Path):
+        f = tmp_path / "a" / "iter-1.cache"
+        f.parent.mkdir()
+        f.write_text("abc")
+
+        assert remove_entries([CacheEntry(f, 3, 0.0, "iteration")]) == (1, 3)
+        assert not f.exists()
+
+    def it_leaves_directories_in_place(tmp_path: Path):
+        f = tmp_path / "a" / "iter-1.cache"
+        f.parent.mkdir()
+        f.write_text("abc")
+
+        remove_entries([CacheEntry(f, 3, 0.0, "iteration")])
+
+        assert f.parent.is_dir()
+
+    def it_skips_files_already_gone(tmp_path: Path):
+        gone = CacheEntry(tmp_path / "gone.cache", 5, 0.0, "iteration")
+
+        assert remove_entries([gone]) == (0, 0)
@@ -0,0 +1,23 @@
+"""Generate cache keys for agent responses."""
+
+import json
+
+from .hash_content import hash_content
+
+
+def response_cache_key(
+    eval_source: str,
+    prompt: str | list[str],
+    setup: str | None = None,
+    teardown: str | None = None,
+) -> str:
+    """Return the response-layer key for an eval: ``<filename>-<hash>``.
+
+    Only what the agent run depends on is hashed (the prompt and the
+    setup/teardown scripts), so editing ``expected``, ``assertions`` or
+    ``name`` keeps the cached response and only re-grades it.
+    """
+    content = json.dumps({"prompt": prompt, "setup": setup, "teardown": teardown}, sort_keys=True)
+    # Remove .yaml extension for cleaner key
+    name = eval_source.replace(".yaml", "")
+    return f"{name}-{hash_content(content)}"
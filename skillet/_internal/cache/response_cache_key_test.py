@@ -0,0 +1,18 @@
+"""Tests for response_cache_key."""
+
+from skillet._internal.cache import response_cache_key
+
+
+def describe_response_cache_key():
+    def it_prefixes_the_filename_without_extension():
+        assert response_cache_key("001.yaml", "hi").startswith("001-")
+
+    def it_keys_by_prompt_and_scripts():
+        base = response_cache_key("001.yaml", "hi")
+
+        assert response_cache_key("001.yaml", "bye") != base
+        assert response_cache_key("001.yaml", "hi", setup="mkdir x") != base
+        assert response_cache_key("001.yaml", "hi", teardown="rm -r x") != base
+
+    def it_distinguishes_multi_turn_prompts():
+        assert response_cache_key("001.yaml", ["a", "b"]) != response_cache_key("001.yaml", ["a b"])
@@ -0,0 +1,86 @@
+"""Walk the cache directory once, classifying every file."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from skillet.agent import Agent
+
+from .types import CacheEntry
+
+_AGENTS = {a.value for a in Agent}
+
+
+def _walk(directory: str) -> Iterator[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk(entry.path)
+        elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(".tmp"):
+            # .tmp files are writes in flight; they are renamed into place
+            yield entry
+
+
+def _classify_run(
+    parts: tuple[str, ...], path: Path, size: int, last_used: float
+) -> CacheEntry | None:
+    """Classify files under ``<name>/<eval-key...>/<agent>/``, or return ``None``."""
+    # <agent>/baseline/iter-N.cache
+    # <agent>/skills/<hash>/iter-N.cache
+    # ... and grades/<grading-key>-<digest>.cache in place of iter-N.cache
+    for i in range(2, len(parts) - 1):
+        if parts[i] not in _AGENTS:
+            continue
+        variant = parts[i + 1 :]
+        if variant[0] == "baseline":
+            skill, rest = None, variant[1:]
+        elif variant[0] == "skills" and variant[2:]:
+            skill, rest = variant[1], variant[2:]
+        else:
+            continue
+        fields = {"name": parts[0], "eval_key": "/".join(parts[1:i]), "agent": parts[i]}
+        if rest == (path.name,) and path.name.startswith("iter-"):
+            return CacheEntry(path, size, last_used, "iteration", skill=skill, **fields)
+        if rest == ("grades", path.name):
+            grading_key = path.stem.partition("-")[0]
+            return CacheEntry(
+                path, size, last_used, "grade", skill=skill, grading_key=grading_key, **fields
+            )
+    return None
+
+
+def _classify(parts: tuple[str, ...], path: Path, size: int, last_used: float) -> CacheEntry:
+    if parts[0] == "lm":
+        return CacheEntry(path, size, last_used, "lm")
+    if parts[0] == "setup-snapshots":
+        return CacheEntry(path, size, last_used, "snapshot")
+    name = parts[0]
+    if len(parts) > 1 and parts[1] == "tune-scores":
+        return CacheEntry(path, size, last_used, "scores", name=name)
+    if path.suffix == ".cache" and (entry := _classify_run(parts, path, size, last_used)):
+        return entry
+    return CacheEntry(path, size, last_used, "other", name=name)
+
+
+def scan_cache(cache_root: Path) -> list[CacheEntry]:
+    """Return every file under ``cache_root`` with its size, last use and place in the layout.
+
+    One ``scandir`` walk with a single ``stat`` per file, so it stays fast on
+    large caches. In-flight writes (``.tmp``) and files that vanish mid-walk
+    (a concurrent eval or prune) are skipped.
+    """
+    entries = []
+    for dir_entry in _walk(str(cache_root)):
+        try:
+            stat = dir_entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        path = Path(dir_entry.path)
+        parts = path.relative_to(cache_root).parts
+        last_used = max(stat.st_mtime, stat.st_atime)
+        entries.append(_classify(parts, path, stat.st_size, last_used))
+    return entries
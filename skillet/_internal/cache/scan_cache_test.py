@@ -0,0 +1,81 @@
+"""Tests for scan_cache."""
+
+from pathlib import Path
+
+from skillet._internal.cache import scan_cache
+
+
+def _write(path: Path, content: str = "x") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def describe_scan_cache():
+    def it_classifies_baseline_and_skill_iterations(tmp_path: Path):
+        _write(tmp_path / "my-evals" / "001-abc" / "claude" / "baseline" / "iter-1.cache", "ab")
+        _write(tmp_path / "my-evals" / "001-abc" / "claude" / "skills" / "f00" / "iter-2.cache")
+
+        by_skill = {e.skill: e for e in scan_cache(tmp_path)}
+
+        baseline = by_skill[None]
+        assert baseline.kind == "iteration"
+        assert (baseline.name, baseline.eval_key, baseline.agent) == (
+            "my-evals",
+            "001-abc",
+            "claude",
+        )
+        assert baseline.size == 2
+        assert by_skill["f00"].eval_key == "001-abc"
+
+    def it_classifies_grades_beside_responses(tmp_path: Path):
+        run = tmp_path / "my-evals" / "001-abc" / "claude"
+        _write(run / "baseline" / "grades" / "crit-d1.cache")
+        _write(run / "skills" / "f00" / "grades" / "crit-d2.cache")
+
+        grades = sorted(scan_cache(tmp_path), key=lambda e: str(e.skill))
+
+        assert [e.kind for e in grades] == ["grade", "grade"]
+        assert [e.skill for e in grades] == [None, "f00"]
+        assert {e.grading_key for e in grades} == {"crit"}
+        assert {e.eval_key for e in grades} == {"001-abc"}
+
+    def it_keeps_subdirectories_in_the_eval_key(tmp_path: Path):
+        _write(tmp_path / "set" / "group" / "001-abc" / "codex" / "baseline" / "iter-1.cache")
+
+        (entry,) = scan_cache(tmp_path)
+
+        assert entry.eval_key == "group/001-abc"
+        assert entry.agent == "codex"
+
+    def it_classifies_score_memos_and_lm_responses(tmp_path: Path):
+        _write(tmp_path / "set" / "tune-scores" / "abc.json")
+        _write(tmp_path / "lm" / "def.json")
+
+        kinds = {e.kind: e for e in scan_cache(tmp_path)}
+
+        assert kinds["scores"].name == "set"
+        assert kinds["lm"].name is None
+
+    def it_classifies_setup_snapshots(tmp_path: Path):
+        _write(tmp_path / "setup-snapshots" / "abc.tar")
+
+        (entry,) = scan_cache(tmp_path)
+
+        assert (entry.kind, entry.name) == ("snapshot", None)
+
+    def it_marks_unknown_files_as_other(tmp_path: Path):
+        _write(tmp_path / "set" / "stray.txt")
+
+        (entry,) = scan_cache(tmp_path)
+
+        assert entry.kind == "other"
+        assert entry.name == "set"
+
+    def it_skips_writes_in_flight(tmp_path: Path):
+        _write(tmp_path / "set" / "001-abc" / "claude" / "baseline" / "tmpx1.tmp")
+
+        assert scan_cache(tmp_path) == []
+
+    def it_returns_nothing_for_a_missing_cache(tmp_path: Path):
+        assert scan_cache(tmp_path / "nope") == []
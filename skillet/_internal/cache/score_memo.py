@@ -0,0 +1,59 @@
+"""Persistent memo of tune candidate scores, shared across tune sessions."""
+
+from pathlib import Path
+
+from cachetta import Cachetta, read_cache, write_cache
+
+from skillet.agent import Agent
+
+from .build_iteration_cache import _CACHE_DURATION
+from .eval_cache_key import eval_cache_key
+from .hash_content import hash_content
+from .normalize_cache_name import normalize_cache_name
+
+
+class ScoreMemo:
+    """Map a candidate skill's content to the pass rate it scored.
+
+    Entries live under ``<cache_root>/<name>/tune-scores/<agent>/<suite-key>/``,
+    one file per candidate content hash. The suite key hashes every eval's
+    cache key plus the sample count, so scores are only ever compared against
+    runs of the same evals at the same sampling — an edited eval starts a
+    fresh memo.
+    """
+
+    def __init__(
+        self, cache_root: Path, name: str, evals: list[dict], agent: Agent, samples: int
+    ) -> None:
+        eval_keys = sorted(eval_cache_key(e["_source"], e["_content"]) for e in evals)
+        suite_key = hash_content("\n".join([*eval_keys, f"samples={samples}"]))
+        self.directory = (
+            cache_root / normalize_cache_name(name) / "tune-scores" / agent.value / suite_key
+        )
+
+    def _cache(self, skill_content: str) -> Cachetta:
+        path = self.directory / f"{hash_content(skill_content)}.cache"
+        return Cachetta(path=path, duration=_CACHE_DURATION)
+
+    def put(self, skill_content: str, pass_rate: float) -> None:
+        """Record the pass rate ``skill_content`` scored."""
+        entry = {"skill_content": skill_content, "pass_rate": pass_rate}
+        write_cache(self._cache(skill_content), entry)
+
+    def history(self) -> list[dict]:
+        """Return every memoized candidate as ``{instruction, score}``, oldest first.
+
+        ``score`` is normalized to 0-1, the shape the proposer's instruction
+        history uses. Unreadable entries are skipped.
+        """
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        files = sorted(self.directory.glob("*.cache"), key=lambda f: f.stat().st_mtime)
+        for cache_file in files:
+            with read_cache(Cachetta(path=cache_file, duration=_CACHE_DURATION)) as entry:
+                if isinstance(entry, dict) and "skill_content" in entry:
+                    entries.append(
+                        {"instruction": entry["skill_content"], "score": entry["pass_rate"] / 100}
+                    )
+        return entries
@@ -0,0 +1,45 @@
+"""Tests for ScoreMemo."""
+
+import os
+from pathlib import Path
+
+from skillet._internal.cache import ScoreMemo, hash_content
+from skillet.agent import Agent
+
+_EVALS = [{"_source": "a.yaml", "_content": "content"}]
+
+
+def describe_ScoreMemo():
+    def it_starts_empty(tmp_path: Path):
+        assert ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1).history() == []
+
+    def it_persists_scores_across_instances(tmp_path: Path):
+        ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1).put("skill v1", 50.0)
+
+        history = ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1).history()
+
+        assert history == [{"instruction": "skill v1", "score": 0.5}]
+
+    def it_keeps_one_entry_per_candidate(tmp_path: Path):
+        memo = ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1)
+        memo.put("skill v1", 50.0)
+        memo.put("skill v1", 100.0)
+
+        assert memo.history() == [{"instruction": "skill v1", "score": 1.0}]
+
+    def it_orders_history_oldest_first(tmp_path: Path):
+        memo = ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1)
+        memo.put("new", 100.0)
+        memo.put("old", 0.0)
+        os.utime(memo.directory / f"{hash_content('old')}.cache", (1, 1))
+        os.utime(memo.directory / f"{hash_content('new')}.cache", (2, 2))
+
+        assert [h["instruction"] for h in memo.history()] == ["old", "new"]
+
+    def it_separates_suites_samples_and_agents(tmp_path: Path):
+        ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 1).put("skill", 50.0)
+
+        edited = [{"_source": "a.yaml", "_content": "edited"}]
+        assert ScoreMemo(tmp_path, "evals", edited, Agent.CLAUDE, 1).history() == []
+        assert ScoreMemo(tmp_path, "evals", _EVALS, Agent.CLAUDE, 3).history() == []
+        assert ScoreMemo(tmp_path, "evals", _EVALS, Agent.CODEX, 1).history() == []
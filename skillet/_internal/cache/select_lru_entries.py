@@ -0,0 +1,15 @@
+"""Choose least-recently-used cache entries to evict under a size cap."""
+
+from .types import CacheEntry
+
+
+def select_lru_entries(entries: list[CacheEntry], max_bytes: int) -> list[CacheEntry]:
+    """Return the least recently used entries to remove so the rest fit in ``max_bytes``."""
+    total = sum(entry.size for entry in entries)
+    evicted = []
+    for entry in sorted(entries, key=lambda e: e.last_used):
+        if total <= max_bytes:
+            break
+        evicted.append(entry)
+        total -= entry.size
+    return evicted
@@ -0,0 +1,24 @@
+"""Tests for select_lru_entries."""
+
+from pathlib import Path
+
+from skillet._internal.cache import CacheEntry, select_lru_entries
+
+
+def _entry(name: str, size: int, last_used: float) -> CacheEntry:
+    return CacheEntry(Path(name), size, last_used, "lm")
+
+
+def describe_select_lru_entries():
+    def it_evicts_oldest_first_until_under_the_cap():
+        old, mid, new = _entry("old", 10, 1), _entry("mid", 10, 2), _entry("new", 10, 3)
+
+        assert select_lru_entries([new, old, mid], 15) == [old, mid]
+
+    def it_evicts_nothing_when_already_under_the_cap():
+        assert select_lru_entries([_entry("a", 10, 1)], 10) == []
+
+    def it_can_evict_everything():
+        entries = [_entry("a", 10, 1), _entry("b", 10, 2)]
+
+        assert select_lru_entries(entries, 0) == entries
@@ -0,0 +1,144 @@
+"""Snapshots of what eval setup scripts leave behind, restored in place of re-running them."""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import stat
+import tarfile
+import tempfile
+from pathlib import Path
+
+from .hash_content import hash_content
+
+# What identifies a path's content without reading it: type plus size and
+# mtime for files, the target for symlinks
+type _Fingerprint = tuple[str | int, ...]
+
+_DELETED = "deleted.json"
+
+
+def _scan(root: str) -> dict[str, _Fingerprint]:
+    """Fingerprint every path under ``root``, keyed by its path relative to ``root``."""
+    state: dict[str, _Fingerprint] = {}
+    for dirpath, dirnames, filenames in Path(root).walk():
+        for name in dirnames + filenames:
+            path = dirpath / name
+            st = path.lstat()
+            rel = str(path.relative_to(root))
+            if stat.S_ISLNK(st.st_mode):
+                state[rel] = ("link", str(path.readlink()))
+            elif stat.S_ISDIR(st.st_mode):
+                # A directory's mtime moves with its children; those are compared instead
+                state[rel] = ("dir",)
+            else:
+                state[rel] = ("file", st.st_size, st.st_mtime_ns)
+    return state
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class _Snapshot:
+    """One iteration's view of a snapshot: restore it, or save what setup just did."""
+
+    def __init__(self, path: Path, roots: dict[str, str], before: dict, *, read: bool) -> None:
+        self.path = path
+        self.roots = roots
+        self.before = before
+        self.read = read
+
+    def restore(self) -> bool:
+        """Replay the snapshot onto the roots; ``False`` when there is none to replay."""
+        if not self.read:
+            return False
+        try:
+            tar = tarfile.open(self.path)  # noqa: SIM115
+        except (OSError, tarfile.TarError):
+            return False
+        with tar:
+            deleted: dict[str, list[str]] = {}
+            for member in tar:
+                if member.name == _DELETED:
+                    deleted = json.load(tar.extractfile(member))  # type: ignore[arg-type]
+                    continue
+                name, _, rel = member.name.partition("/")
+                target = Path(self.roots[name]) / rel
+                if target.is_symlink() or (
+                    target.exists() and not (member.isdir() and target.is_dir())
+                ):
+                    _remove(target)
+                tar.extract(member.replace(name=rel), self.roots[name], filter="tar")
+        for name, rels in deleted.items():
+            for rel in sorted(rels, reverse=True):
+                _remove(Path(self.roots[name]) / rel)
+        with contextlib.suppress(OSError):
+            os.utime(self.path)
+        return True
+
+    def save(self) -> None:
+        """Store every path setup created, changed or deleted under the roots."""
+        deleted: dict[str, list[str]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, tarfile.open(fileobj=f, mode="w") as tar:
+                for name, root in self.roots.items():
+                    before = self.before[name]
+                    after = _scan(root)
+                    for rel in sorted(rel for rel, fp in after.items() if before.get(rel) != fp):
+                        tar.add(Path(root) / rel, f"{name}/{rel}", recursive=False)
+                    deleted[name] = sorted(before.keys() - after.keys())
+                data = json.dumps(deleted).encode()
+                info = tarfile.TarInfo(_DELETED)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+            Path(tmp).replace(self.path)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+
+class SetupSnapshots:
+    """Capture the files an eval's setup script writes, and replay them instead of re-running it.
+
+    A snapshot is keyed by the setup script and the state of each root
+    (the isolated HOME, plus the project clone the script runs in under
+    ``sandbox``) just before setup: every path's type, size and mtime. The first run
+    with a given key runs setup and stores what it created, changed or
+    deleted as ``<cache_root>/setup-snapshots/<key>.tar``; later runs with
+    the same key unpack that tarball instead. Only the difference is
+    stored, so credentials copied into the HOME and untouched project files
+    stay out of the cache.
+
+    The tarball is unpacked, not hardlinked: a restored file is a private
+    copy that the agent can write without corrupting the snapshot.
+
+    Setups whose result varies between runs, that write outside the roots,
+    or that embed the absolute HOME or project path in what they write
+    should opt out with ``setup_snapshot: false``.
+
+    With ``read=False`` snapshots are saved but never restored, so setup
+    always runs (``skip_cache``).
+    """
+
+    def __init__(self, cache_root: Path, *, read: bool = True) -> None:
+        self.directory = cache_root / "setup-snapshots"
+        self.read = read
+
+    def prepare(self, setup: str, roots: dict[str, str]) -> _Snapshot:
+        """Fingerprint ``roots`` (name to directory) before ``setup`` runs in them."""
+        before = {name: _scan(root) for name, root in roots.items()}
+        key = hash_content(
+            json.dumps(
+                {
+                    "setup": setup,
+                    "roots": {name: sorted(state.items()) for name, state in before.items()},
+                }
+            )
+        )
+        return _Snapshot(self.directory / f"{key}.tar", roots, before, read=self.read)
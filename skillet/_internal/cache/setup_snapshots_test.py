@@ -0,0 +1,80 @@
+"""Tests for SetupSnapshots."""
+
+import os
+import tarfile
+from pathlib import Path
+
+from skillet._internal.cache import SetupSnapshots
+
+
+def _roots(tmp_path: Path, name: str) -> dict[str, str]:
+    home = tmp_path / name / "home"
+    project = tmp_path / name / "project"
+    (home / ".claude").mkdir(parents=True)
+    (home / ".claude" / "settings.json").write_text("{}")
+    project.mkdir()
+    (project / "keep.txt").write_text("keep")
+    (project / "stale.txt").write_text("stale")
+    # The same mtimes in every copy, as copy2 preserves them
+    for path in (home / ".claude" / "settings.json", project / "keep.txt", project / "stale.txt"):
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    return {"home": str(home), "project": str(project)}
+
+
+def _setup(roots: dict[str, str]) -> None:
+    home, project = Path(roots["home"]), Path(roots["project"])
+    (home / ".cache" / "tool").mkdir(parents=True)
+    (home / ".cache" / "tool" / "index").write_text("built")
+    (project / "keep.txt").write_text("edited")
+    (project / "stale.txt").unlink()
+    (project / "current").symlink_to("keep.txt")
+
+
+def describe_setup_snapshots():
+    def it_replays_what_setup_did_onto_a_fresh_copy(tmp_path: Path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        first = _roots(tmp_path, "first")
+        snapshot = snapshots.prepare("build", first)
+        assert snapshot.restore() is False
+        _setup(first)
+        snapshot.save()
+
+        second = _roots(tmp_path, "second")
+        assert snapshots.prepare("build", second).restore() is True
+
+        home, project = Path(second["home"]), Path(second["project"])
+        assert (home / ".cache" / "tool" / "index").read_text() == "built"
+        assert (project / "keep.txt").read_text() == "edited"
+        assert not (project / "stale.txt").exists()
+        assert (project / "current").readlink() == Path("keep.txt")
+
+    def it_stores_only_what_setup_changed(tmp_path: Path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        roots = _roots(tmp_path, "first")
+        snapshot = snapshots.prepare("build", roots)
+        _setup(roots)
+        snapshot.save()
+
+        with tarfile.open(snapshot.path) as tar:
+            names = set(tar.getnames())
+        assert "home/.claude/settings.json" not in names
+        assert {"home/.cache/tool/index", "project/keep.txt"} <= names
+
+    def it_keys_by_script_and_starting_state(tmp_path: Path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        roots = _roots(tmp_path, "first")
+        key = snapshots.prepare("build", roots).path
+
+        assert snapshots.prepare("build", _roots(tmp_path, "second")).path == key
+        assert snapshots.prepare("other", roots).path != key
+        (Path(roots["project"]) / "new.txt").write_text("new")
+        assert snapshots.prepare("build", roots).path != key
+
+    def it_never_restores_without_read(tmp_path: Path):
+        roots = _roots(tmp_path, "first")
+        snapshot = SetupSnapshots(tmp_path / "cache").prepare("build", roots)
+        _setup(roots)
+        snapshot.save()
+
+        unread = SetupSnapshots(tmp_path / "cache", read=False)
+        assert unread.prepare("build", _roots(tmp_path, "second")).restore() is False
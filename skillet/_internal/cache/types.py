@@ -0,0 +1,34 @@
+"""Types describing what is stored in the cache directory."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One file in the cache, classified by where it sits in the layout.
+
+    Attributes:
+        path: The file.
+        size: Size in bytes.
+        last_used: Unix time of the last read or write (the later of mtime and atime).
+        kind: ``iteration`` (an agent response), ``grade`` (a grade of one),
+            ``scores`` (tune score memo), ``lm`` (LM response cache),
+            ``snapshot`` (a setup script's snapshot) or ``other``.
+        name: The eval set directory it belongs to, if any.
+        eval_key: For iterations and grades, the eval's ``response_cache_key``.
+        agent: For iterations and grades, the agent that ran it.
+        skill: For iterations and grades, the skill content hash, or ``None``
+            for baseline.
+        grading_key: For grades, the criteria they were graded under.
+    """
+
+    path: Path
+    size: int
+    last_used: float
+    kind: str
+    name: str | None = None
+    eval_key: str | None = None
+    agent: str | None = None
+    skill: str | None = None
+    grading_key: str | None = None
@@ -0,0 +1,40 @@
+"""Tests for cache types."""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from skillet._internal.cache import CacheEntry
+
+
+def describe_CacheEntry():
+    def it_constructs_with_required_fields():
+        entry = CacheEntry(path=Path("lm/ab/abcd.json"), size=10, last_used=1.0, kind="lm")
+
+        assert entry.path == Path("lm/ab/abcd.json")
+        assert entry.size == 10
+        assert entry.last_used == 1.0
+        assert entry.kind == "lm"
+
+    def it_defaults_layout_fields_to_none():
+        entry = CacheEntry(path=Path("x"), size=0, last_used=0.0, kind="other")
+
+        assert entry.name is None
+        assert entry.eval_key is None
+        assert entry.agent is None
+        assert entry.skill is None
+        assert entry.grading_key is None
+
+    def it_is_frozen():
+        entry = CacheEntry(path=Path("x"), size=0, last_used=0.0, kind="other")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.size = 1  # type: ignore[misc]
+
+    def it_compares_and_hashes_by_value():
+        a = CacheEntry(Path("x"), 1, 2.0, "iteration", name="evals", agent="claude")
+        b = CacheEntry(Path("x"), 1, 2.0, "iteration", name="evals", agent="claude")
+
+        assert a == b
+        assert len({a, b}) == 1
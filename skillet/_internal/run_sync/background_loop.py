@@ -0,0 +1,26 @@
+"""Long-lived event loop shared by every run_sync caller."""
+
+import asyncio
+import functools
+import threading
+
+_LOCK = threading.Lock()
+
+
+@functools.cache
+def _start_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="skillet-run-sync", daemon=True).start()
+    return loop
+
+
+def background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use.
+
+    The loop runs forever on a daemon thread. Submitting to it costs one
+    thread-safe handoff instead of a new thread and event loop per call,
+    and coroutines from many threads (e.g. parallel optimizer trials)
+    interleave on it concurrently.
+    """
+    with _LOCK:
+        return _start_loop()
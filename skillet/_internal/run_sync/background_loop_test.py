@@ -0,0 +1,21 @@
+"""Tests for run_sync/background_loop module."""
+
+import asyncio
+
+from skillet._internal.run_sync.background_loop import background_loop
+
+
+def describe_background_loop():
+    def it_returns_the_same_running_loop():
+        loop = background_loop()
+
+        assert loop is background_loop()
+        assert loop.is_running()
+
+    def it_runs_submitted_coroutines():
+        async def sample_coro():
+            return "done"
+
+        future = asyncio.run_coroutine_threadsafe(sample_coro(), background_loop())
+
+        assert future.result(timeout=5) == "done"
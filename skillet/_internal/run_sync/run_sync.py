@@ -5,22 +5,28 @@ import concurrent.futures
 from collections.abc import Coroutine
 from typing import Any
 
+from .background_loop import background_loop
 from .has_running_loop import has_running_loop
 
 
 def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
     """Run an async coroutine synchronously, even from within an async context.
 
-    This function safely bridges async code to sync code by detecting whether
-    we're already inside an async event loop. If so, it runs the coroutine
-    in a separate thread with its own event loop to avoid the
-    "RuntimeError: This event loop is already running" error.
+    The coroutine is submitted to a long-lived background event loop (see
+    ``background_loop``) and this thread blocks on its result, so it works
+    whether or not the caller already has a running loop, without paying
+    for a fresh thread and ``asyncio.run`` on every call. The caller's
+    contextvars carry over to the coroutine.
+
+    A coroutine already running *on* the background loop that calls back
+    into sync code which calls ``run_sync`` would deadlock waiting on its
+    own loop; that case gets a one-off thread with its own event loop.
     """
-    if has_running_loop():
-        # Already in async context - run in separate thread with its own event loop
+    loop = background_loop()
+    if has_running_loop() and asyncio.get_running_loop() is loop:
+        # Already on the shared loop - run in a separate thread with its own loop
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
             future = pool.submit(asyncio.run, coro)  # type: ignore[arg-type]
             return future.result()  # type: ignore[return-value]
-    else:
-        # No running loop - safe to use asyncio.run()
-        return asyncio.run(coro)
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
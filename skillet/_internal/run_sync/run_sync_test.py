@@ -1,6 +1,9 @@
 """Tests for run_sync/run_sync module."""
 
 import asyncio
+import concurrent.futures
+import contextvars
+import threading
 
 import pytest
 
@@ -64,3 +67,53 @@ def describe_run_sync():
 
         result = run_sync(void_coro())
         assert result is None
+
+    def it_reuses_one_background_loop_across_calls():
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_sync(current_loop())
+        second = run_sync(current_loop())
+
+        assert first is second
+        assert first.is_running()
+
+    def it_does_not_start_a_thread_per_call():
+        async def sample_coro():
+            return 1
+
+        run_sync(sample_coro())
+        before = threading.active_count()
+        for _ in range(20):
+            run_sync(sample_coro())
+
+        assert threading.active_count() == before
+
+    def it_carries_contextvars_to_the_coroutine():
+        var = contextvars.ContextVar("var", default="unset")
+        var.set("caller")
+
+        async def read_var():
+            return var.get()
+
+        assert run_sync(read_var()) == "caller"
+
+    def it_accepts_concurrent_callers_from_many_threads():
+        async def slow(value):
+            await asyncio.sleep(0.05)
+            return value
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: run_sync(slow(i)), range(8)))
+
+        assert results == list(range(8))
+
+    def it_falls_back_when_called_from_the_background_loop():
+        async def inner():
+            return "nested"
+
+        async def outer():
+            # Sync code reached from a coroutine on the shared loop
+            return run_sync(inner())
+
+        assert run_sync(outer()) == "nested"
@@ -2,9 +2,11 @@
 
 from .query_result import QueryResult
 from .query_structured import StructuredOutputError, query_structured
+from .usage import Usage
 
 __all__ = [
     "QueryResult",
     "StructuredOutputError",
+    "Usage",
     "query_structured",
 ]
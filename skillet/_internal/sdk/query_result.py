@@ -2,10 +2,22 @@
 
 from dataclasses import dataclass, field
 
+from .usage import Usage
+
 
 @dataclass
 class QueryResult:
-    """Result from a query with both text and tool calls."""
+    """Result from a query with both text and tool calls.
+
+    ``stopped_early`` marks a run killed mid-stream (see ``run_agent``'s
+    ``stop_on_tool``): ``text`` and ``tool_calls`` are the partial transcript.
+    ``usage`` sums what the CLI reported for each turn, or is ``None`` when
+    no turn reported any (a killed turn reports nothing). ``session_id`` is
+    the session (codex: thread) the conversation can be resumed from.
+    """
 
     text: str
     tool_calls: list[dict] = field(default_factory=list)
+    stopped_early: bool = False
+    usage: Usage | None = None
+    session_id: str | None = None
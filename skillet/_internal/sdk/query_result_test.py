@@ -1,5 +1,6 @@
 """Tests for QueryResult dataclass."""
 
+from skillet._internal.sdk import Usage
 from skillet._internal.sdk.query_result import QueryResult
 
 
@@ -32,3 +33,7 @@ def describe_QueryResult():
         ]
         result = QueryResult(text="done", tool_calls=tool_calls)
         assert len(result.tool_calls) == 3
+
+    def it_has_no_usage_by_default():
+        assert QueryResult(text="test").usage is None
+        assert QueryResult(text="test", usage=Usage(output_tokens=3)).usage.output_tokens == 3
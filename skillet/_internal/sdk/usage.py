@@ -0,0 +1,56 @@
+"""Usage dataclass for the tokens and cost of agent runs."""
+
+from dataclasses import dataclass
+
+
+def _add_optional[T: (int, float)](a: T | None, b: T | None) -> T | None:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
+
+@dataclass(frozen=True)
+class Usage:
+    """Tokens, cost and time an agent CLI reported for one or more turns.
+
+    Usages add up field by field, so a run's usage is the sum of its turns'
+    and an eval's the sum of its runs'. ``cost_usd`` and ``duration_ms`` are
+    ``None`` when no turn reported them (codex reports neither).
+
+    Attributes:
+        input_tokens: Input tokens not served from the prompt cache.
+        output_tokens: Output tokens, reasoning included.
+        cache_read_tokens: Input tokens read from the prompt cache.
+        cache_write_tokens: Input tokens written to the prompt cache.
+        cost_usd: Cost in US dollars, as reported by the CLI.
+        duration_ms: Time the CLI reported spending, in milliseconds.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float | None = None
+    duration_ms: int | None = None
+
+    @property
+    def total_tokens(self) -> int:
+        """Every input and output token, cached or not."""
+        return (
+            self.input_tokens
+            + self.output_tokens
+            + self.cache_read_tokens
+            + self.cache_write_tokens
+        )
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+            cost_usd=_add_optional(self.cost_usd, other.cost_usd),
+            duration_ms=_add_optional(self.duration_ms, other.duration_ms),
+        )
@@ -0,0 +1,22 @@
+"""Tests for Usage dataclass."""
+
+from skillet._internal.sdk import Usage
+
+
+def describe_Usage():
+    def it_totals_every_token():
+        usage = Usage(input_tokens=1, output_tokens=2, cache_read_tokens=3, cache_write_tokens=4)
+        assert usage.total_tokens == 10
+
+    def it_adds_field_by_field():
+        total = Usage(input_tokens=1, output_tokens=2, cost_usd=0.5, duration_ms=100) + Usage(
+            input_tokens=10, cache_read_tokens=5, cost_usd=0.25, duration_ms=50
+        )
+        assert total == Usage(
+            input_tokens=11, output_tokens=2, cache_read_tokens=5, cost_usd=0.75, duration_ms=150
+        )
+
+    def it_keeps_cost_unknown_only_when_no_side_reported_it():
+        assert (Usage() + Usage()).cost_usd is None
+        assert (Usage() + Usage(cost_usd=0.1)).cost_usd == 0.1
+        assert (Usage(duration_ms=5) + Usage()).duration_ms == 5
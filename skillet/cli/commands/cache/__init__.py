@@ -0,0 +1,7 @@
+"""Cache command module."""
+
+from .gc import cache_gc_command
+from .prune import cache_prune_command
+from .stats import cache_stats_command
+
+__all__ = ["cache_gc_command", "cache_prune_command", "cache_stats_command"]
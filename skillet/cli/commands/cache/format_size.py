@@ -0,0 +1,16 @@
+"""Render byte counts for humans."""
+
+_UNITS = ["B", "KB", "MB", "GB", "TB"]
+_STEP = 1024
+
+
+def format_size(size: int) -> str:
+    """Format ``size`` bytes as e.g. ``512 B``, ``1.5 MB``."""
+    if size < _STEP:
+        return f"{size} B"
+    value = float(size)
+    for unit in _UNITS[1:]:
+        value /= _STEP
+        if value < _STEP or unit == _UNITS[-1]:
+            return f"{value:.1f} {unit}"
+    raise AssertionError("unreachable")  # pragma: no cover
@@ -0,0 +1,15 @@
+"""Tests for format_size."""
+
+from skillet.cli.commands.cache.format_size import format_size
+
+
+def describe_format_size():
+    def it_shows_small_sizes_in_bytes():
+        assert format_size(512) == "512 B"
+
+    def it_scales_to_the_largest_fitting_unit():
+        assert format_size(1536) == "1.5 KB"
+        assert format_size(3 * 1024**3) == "3.0 GB"
+
+    def it_caps_at_terabytes():
+        assert format_size(2048 * 1024**4) == "2048.0 TB"
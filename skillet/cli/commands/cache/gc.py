@@ -0,0 +1,53 @@
+"""CLI handler for ``skillet cache gc``."""
+
+from pathlib import Path
+
+from skillet import config
+from skillet._internal.cache import find_stale_entries, hash_directory, remove_entries, scan_cache
+from skillet.cli import console
+from skillet.eval.judge import grading_key
+from skillet.evals import load_evals
+
+from .format_size import format_size
+
+
+def cache_gc_command(
+    name: str,
+    *,
+    skill_paths: list[Path] | None = None,
+    dry_run: bool = False,
+    skillet_dir: Path | None = None,
+) -> None:
+    """Delete ``name``'s cached responses and grades that nothing will read again.
+
+    Responses are keyed by a hash of each eval's prompt and scripts, so
+    editing those (or deleting the eval) strands its entries; grades are
+    also keyed by the eval's grading criteria, so grades under old criteria
+    are removed as well. Grades made with a fast judge (``--fast-judge``)
+    count as old criteria here; the next tiered run judges those again.
+    With ``skill_paths``, skill entries are kept only for those skills'
+    current hashes; baseline entries are always kept.
+    ``dry_run`` reports without deleting.
+    """
+    cache_root = skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR
+    evals = load_evals(name, skillet_dir=skillet_dir)
+    skill_hashes = {hash_directory(p) for p in skill_paths} if skill_paths else None
+
+    grading_keys = {
+        e["_source"]: grading_key(e["expected"], e.get("assertions"), gate=e.get("gate"))
+        for e in evals
+    }
+
+    stale = find_stale_entries(
+        scan_cache(cache_root),
+        name,
+        evals,
+        skill_hashes=skill_hashes,
+        grading_keys=grading_keys,
+    )
+    size = sum(e.size for e in stale)
+    if dry_run:
+        console.print(f"Would remove {len(stale)} stale entries ({format_size(size)})")
+        return
+    removed, freed = remove_entries(stale)
+    console.print(f"Removed {removed} stale entries ({format_size(freed)})")
@@ -0,0 +1,81 @@
+"""Tests for the cache gc handler."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillet._internal.cache import hash_directory, response_cache_key
+from skillet.cli.commands.cache import cache_gc_command
+from skillet.eval.judge import grading_key
+
+CONTENT = 'name: 001.yaml\ntimestamp: "2025-01-01T00:00:00Z"\nprompt: hi\nexpected: ok\n'
+KEY = response_cache_key("001.yaml", "hi")
+
+
+def _iteration(cache: Path, eval_key: str, *variant: str) -> Path:
+    path = cache / "my-evals" / eval_key / "claude" / Path(*variant) / "iter-1.cache"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+    return path
+
+
+@pytest.fixture
+def skillet_dir(tmp_path: Path) -> Path:
+    evals = tmp_path / "evals" / "my-evals"
+    evals.mkdir(parents=True)
+    (evals / "001.yaml").write_text(CONTENT)
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def quiet_console():
+    with patch("skillet.cli.commands.cache.gc.console") as mock_console:
+        yield mock_console
+
+
+def describe_cache_gc_command():
+    def it_removes_iterations_of_edited_evals(skillet_dir: Path):
+        cache = skillet_dir / "cache"
+        live = _iteration(cache, KEY, "baseline")
+        stale = _iteration(cache, "001-oldhash", "baseline")
+
+        cache_gc_command("my-evals", skillet_dir=skillet_dir)
+
+        assert live.exists()
+        assert not stale.exists()
+        assert stale.parent.is_dir()
+
+    def it_removes_old_skill_versions_when_given_skills(skillet_dir: Path, tmp_path: Path):
+        skill = tmp_path / "skill"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text("# Skill")
+        cache = skillet_dir / "cache"
+        current = _iteration(cache, KEY, "skills", hash_directory(skill))
+        old = _iteration(cache, KEY, "skills", "oldskill")
+
+        cache_gc_command("my-evals", skill_paths=[skill], skillet_dir=skillet_dir)
+
+        assert current.exists()
+        assert not old.exists()
+
+    def it_removes_grades_under_old_criteria(skillet_dir: Path):
+        grades = skillet_dir / "cache" / "my-evals" / KEY / "claude" / "baseline" / "grades"
+        grades.mkdir(parents=True)
+        current = grades / f"{grading_key('ok')}-d1.cache"
+        old = grades / "oldcriteria-d1.cache"
+        current.write_text("x")
+        old.write_text("x")
+
+        cache_gc_command("my-evals", skillet_dir=skillet_dir)
+
+        assert current.exists()
+        assert not old.exists()
+
+    def it_only_reports_on_dry_run(skillet_dir: Path, quiet_console):
+        stale = _iteration(skillet_dir / "cache", "001-oldhash", "baseline")
+
+        cache_gc_command("my-evals", dry_run=True, skillet_dir=skillet_dir)
+
+        assert stale.exists()
+        assert "Would remove 1 stale entries" in str(quiet_console.print.call_args)
@@ -0,0 +1,51 @@
+"""CLI handler for ``skillet cache prune``."""
+
+import re
+from pathlib import Path
+
+from skillet import config
+from skillet._internal.cache import remove_entries, scan_cache, select_lru_entries
+from skillet.cli import console
+
+from .format_size import format_size
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$", re.IGNORECASE)
+_MULTIPLIERS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def _parse_size(text: str) -> int:
+    """Parse ``500MB``, ``2G``, ``1.5GB`` or a plain byte count."""
+    match = _SIZE_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid size {text!r}: expected e.g. 500MB or 2GB")
+    return int(float(match.group(1)) * _MULTIPLIERS[match.group(2).upper()])
+
+
+def cache_prune_command(
+    max_size: str, *, dry_run: bool = False, skillet_dir: Path | None = None
+) -> None:
+    """Evict least recently used cache entries until the cache fits in ``max_size``.
+
+    Every kind of entry is considered: eval iterations (a cache hit counts as
+    a use), tune score memos, LM responses and setup snapshots. ``dry_run``
+    reports without deleting.
+
+    Raises:
+        ValueError: If ``max_size`` is not a size like ``500MB``.
+    """
+    max_bytes = _parse_size(max_size)
+    cache_root = skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR
+    entries = scan_cache(cache_root)
+    evicted = select_lru_entries(entries, max_bytes)
+    total = sum(e.size for e in entries)
+    size = sum(e.size for e in evicted)
+    if dry_run:
+        console.print(
+            f"Would remove {len(evicted)} entries ({format_size(size)}), "
+            f"leaving {format_size(total - size)}"
+        )
+        return
+    removed, freed = remove_entries(evicted)
+    console.print(
+        f"Removed {removed} entries ({format_size(freed)}), leaving {format_size(total - freed)}"
+    )
@@ -0,0 +1,60 @@
+"""Tests for the cache prune handler."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillet.cli.commands.cache import cache_prune_command
+
+
+def _file(path: Path, size: int, age: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (1_000_000 - age, 1_000_000 - age))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def quiet_console():
+    with patch("skillet.cli.commands.cache.prune.console") as mock_console:
+        yield mock_console
+
+
+def describe_cache_prune_command():
+    def it_evicts_least_recently_used_entries_first(tmp_path: Path):
+        cache = tmp_path / "cache"
+        old = _file(cache / "lm" / "old.json", 600, age=300)
+        mid = _file(cache / "set" / "k" / "claude" / "baseline" / "iter-1.cache", 600, age=200)
+        new = _file(cache / "set" / "tune-scores" / "s.json", 600, age=100)
+
+        cache_prune_command("1KB", skillet_dir=tmp_path)
+
+        assert not old.exists()
+        assert not mid.exists()
+        assert new.exists()
+
+    def it_only_reports_on_dry_run(tmp_path: Path, quiet_console):
+        old = _file(tmp_path / "cache" / "lm" / "old.json", 2048, age=1)
+
+        cache_prune_command("1K", dry_run=True, skillet_dir=tmp_path)
+
+        assert old.exists()
+        assert "Would remove 1 entries (2.0 KB)" in str(quiet_console.print.call_args)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("0", 0), ("500B", 500), ("2k", 2048), ("1.5MB", 1536 * 1024), ("1 G", 1024**3)],
+    )
+    def it_accepts_common_size_spellings(tmp_path: Path, quiet_console, text, expected):
+        _file(tmp_path / "cache" / "lm" / "a.json", 1, age=1)
+
+        cache_prune_command(text, dry_run=True, skillet_dir=tmp_path)
+
+        leaving = 0 if expected == 0 else 1
+        assert f"leaving {leaving} B" in str(quiet_console.print.call_args)
+
+    def it_rejects_unparseable_sizes(tmp_path: Path):
+        with pytest.raises(ValueError, match="Invalid size"):
+            cache_prune_command("lots", skillet_dir=tmp_path)
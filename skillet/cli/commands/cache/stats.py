@@ -0,0 +1,77 @@
+"""CLI handler for ``skillet cache stats``."""
+
+from datetime import datetime
+from pathlib import Path
+
+from rich.table import Table
+
+from skillet import config
+from skillet._internal.cache import CacheEntry, normalize_cache_name, scan_cache
+from skillet.cli import console
+
+from .format_size import format_size
+
+# Entries shared by every eval set, each summarized on its own row
+_SHARED = {"lm": "LM responses", "snapshot": "Setup snapshots"}
+
+
+def _last_used(entries: list[CacheEntry]) -> str:
+    if not entries:
+        return "-"
+    return datetime.fromtimestamp(max(e.last_used for e in entries)).strftime("%Y-%m-%d %H:%M")
+
+
+def cache_stats_command(name: str | None = None, *, skillet_dir: Path | None = None) -> None:
+    """Print cache size and contents per eval set, or for one set when ``name`` is given.
+
+    For each eval set: cached iterations (agent responses), grades, distinct
+    evals and skill versions (baseline counts as none), bytes on disk and
+    when an entry was last used.
+    Tune score memos, the LM response cache and setup snapshots are
+    summarized separately.
+    """
+    cache_root = skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR
+    entries = scan_cache(cache_root)
+    if name is not None:
+        entries = [e for e in entries if e.name == normalize_cache_name(name)]
+
+    by_name: dict[str, list[CacheEntry]] = {}
+    for entry in entries:
+        if entry.kind not in _SHARED and entry.name is not None:
+            by_name.setdefault(entry.name, []).append(entry)
+
+    table = Table(title=f"Cache: {cache_root}", title_justify="left")
+    table.add_column("Eval set", style="cyan")
+    table.add_column("Iterations", justify="right")
+    table.add_column("Grades", justify="right")
+    table.add_column("Evals", justify="right")
+    table.add_column("Skill versions", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used")
+    for set_name in sorted(by_name):
+        group = by_name[set_name]
+        iterations = [e for e in group if e.kind == "iteration"]
+        table.add_row(
+            set_name,
+            str(len(iterations)),
+            str(sum(e.kind == "grade" for e in group)),
+            str(len({e.eval_key for e in iterations})),
+            str(len({e.skill for e in iterations if e.skill is not None})),
+            format_size(sum(e.size for e in group)),
+            _last_used(group),
+        )
+    for kind, label in _SHARED.items():
+        shared = [e for e in entries if e.kind == kind]
+        if shared:
+            table.add_row(
+                f"[dim]({label})[/dim]",
+                str(len(shared)),
+                "",
+                "",
+                "",
+                format_size(sum(e.size for e in shared)),
+                _last_used(shared),
+            )
+
+    console.print(table)
+    console.print(f"Total: {format_size(sum(e.size for e in entries))} in {len(entries)} files")
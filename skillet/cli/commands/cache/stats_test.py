@@ -0,0 +1,60 @@
+"""Tests for the cache stats handler."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from skillet.cli.commands.cache import cache_stats_command
+
+
+def _file(path: Path, size: int = 10) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+@pytest.fixture
+def output():
+    console = Console(record=True, width=200)
+    with patch("skillet.cli.commands.cache.stats.console", console):
+        yield console
+
+
+def describe_cache_stats_command():
+    def it_summarizes_each_eval_set(tmp_path: Path, output: Console):
+        cache = tmp_path / "cache"
+        _file(cache / "set-a" / "001-x" / "claude" / "baseline" / "iter-1.cache")
+        _file(cache / "set-a" / "001-x" / "claude" / "skills" / "h1" / "iter-1.cache")
+        _file(cache / "set-a" / "002-y" / "claude" / "skills" / "h2" / "iter-1.cache")
+        _file(cache / "set-a" / "001-x" / "claude" / "baseline" / "grades" / "c-d.cache")
+        _file(cache / "set-b" / "001-z" / "codex" / "baseline" / "iter-1.cache")
+        _file(cache / "lm" / "r.json", 100)
+        _file(cache / "setup-snapshots" / "s.tar", 20)
+
+        cache_stats_command(skillet_dir=tmp_path)
+
+        text = output.export_text()
+        lines = text.splitlines()
+        set_a = next(line for line in lines if "set-a" in line)
+        assert [cell.strip() for cell in set_a.split("│")][2:6] == ["3", "1", "2", "2"]
+        assert any("set-b" in line for line in lines)
+        assert any("LM responses" in line for line in lines)
+        assert any("Setup snapshots" in line for line in lines)
+        assert "Total: 170 B in 7 files" in text
+
+    def it_filters_to_one_set(tmp_path: Path, output: Console):
+        _file(tmp_path / "cache" / "set-a" / "k" / "claude" / "baseline" / "iter-1.cache")
+        _file(tmp_path / "cache" / "set-b" / "k" / "claude" / "baseline" / "iter-1.cache")
+
+        cache_stats_command("set-a", skillet_dir=tmp_path)
+
+        text = output.export_text()
+        assert "set-a" in text
+        assert "set-b" not in text
+        assert "Total: 10 B in 1 files" in text
+
+    def it_handles_an_empty_cache(tmp_path: Path, output: Console):
+        cache_stats_command(skillet_dir=tmp_path)
+
+        assert "Total: 0 B in 0 files" in output.export_text()
@@ -1,6 +1,8 @@
 """Eval command module."""
 
+from .compare import compare_command
 from .eval import eval_command
 from .summarize import summarize_responses
+from .watch import watch_command
 
-__all__ = ["eval_command", "summarize_responses"]
+__all__ = ["compare_command", "eval_command", "summarize_responses", "watch_command"]
@@ -0,0 +1,192 @@
+"""CLI handler for comparative eval runs (several agents and/or baseline vs skill)."""
+
+from pathlib import Path
+
+from rich.table import Table
+
+from skillet import config
+from skillet.agent import Agent
+from skillet.cli import console
+from skillet.cli.display import LiveDisplay
+from skillet.eval import JudgeTiers
+from skillet.eval.compare import CompareResult, Variant, compare
+
+from ...display.format_shared import format_shared
+from ...display.format_usage import format_usage
+from ...display.get_rate_color import get_rate_color
+from .get_scripts_from_evals import get_scripts_from_evals
+from .prompt_for_script_confirmation import prompt_for_script_confirmation
+
+
+def _format_delta(delta: float) -> str:
+    if delta > 0:
+        return f"[green]+{delta:.0f}[/green]"
+    if delta < 0:
+        return f"[red]{delta:.0f}[/red]"
+    return "[dim]0[/dim]"
+
+
+def _print_comparison(result: CompareResult) -> None:
+    """Print per-eval pass rates side by side, with deltas against the first variant."""
+    labels = [v.label for v in result.variants]
+    table = Table(show_edge=False, pad_edge=False)
+    table.add_column("Eval", style="cyan")
+    for label in labels:
+        table.add_column(label, justify="right")
+    for label in labels[1:]:
+        table.add_column(f"Δ {label}", justify="right")
+
+    rates = [
+        {m.eval_source: m.c / m.n * 100 for m in r.per_eval_metrics if m.n} for r in result.results
+    ]
+    deltas = {(d.variant, d.eval_source): d.delta for d in result.deltas}
+    for source in result.results[0].selected_evals:
+        cells = []
+        for arm_rates in rates:
+            rate = arm_rates.get(source)
+            color = get_rate_color(rate) if rate is not None else "dim"
+            cells.append(f"[{color}]{rate:.0f}%[/{color}]" if rate is not None else "-")
+        for label in labels[1:]:
+            delta = deltas.get((label, source))
+            cells.append(_format_delta(delta) if delta is not None else "-")
+        table.add_row(source, *cells)
+
+    overall = [
+        f"[{get_rate_color(r.pass_rate)}]{r.pass_rate:.0f}%[/{get_rate_color(r.pass_rate)}]"
+        for r in result.results
+    ]
+    mean_deltas = [_format_delta(result.mean_delta(label)) for label in labels[1:]]
+    table.add_section()
+    table.add_row("[bold]Overall[/bold]", *overall, *mean_deltas)
+    if all(r.suite_pass_rate is not None for r in result.results):
+        estimates = [
+            f"[{get_rate_color(rate)}]{rate:.0f}%[/{get_rate_color(rate)}]"
+            for rate in (r.suite_pass_rate or 0.0 for r in result.results)
+        ]
+        table.add_row("[dim]Suite (est.)[/dim]", *estimates, *([""] * len(mean_deltas)))
+    console.print(table)
+
+
+async def compare_command(  # noqa: PLR0913
+    name: str,
+    *,
+    agents: list[Agent],
+    skill_path: Path | None = None,
+    compare_baseline: bool = False,
+    samples: int = 3,
+    max_evals: int | None = None,
+    budget: int | None = None,
+    seed: int | None = None,
+    allowed_tools: list[str] | None = None,
+    parallel: int = 3,
+    skip_cache: bool = False,
+    trust: bool = False,
+    skillet_dir: Path | None = None,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
+) -> CompareResult | None:
+    """Run every agent (and, with ``compare_baseline``, baseline and skill) in one pass.
+
+    Variants are ordered agent by agent, baseline before skill; the first is
+    the reference the deltas are measured against. ``max_cost`` and
+    ``max_tokens`` cap the fresh runs of all variants together; each
+    variant's spend is printed. ``share_runs`` lets evals with identical
+    runs share one response within each variant.
+    """
+    from skillet.evals import load_evals
+    from skillet.evals.select import select_evals
+
+    skill_paths: list[Path | None] = [None, skill_path] if compare_baseline else [skill_path]
+    variants = [Variant(agent, path) for agent in agents for path in skill_paths]
+
+    console.print()
+    console.print("[bold]Eval Comparison[/bold]")
+    if skill_path:
+        console.print(f"Skill: [cyan]{skill_path}[/cyan]")
+    console.print(f"Variants: {', '.join(f'[cyan]{v.label}[/cyan]' for v in variants)}")
+
+    evals = load_evals(name, skillet_dir=skillet_dir)
+    total_evals = len(evals)
+    evals = select_evals(
+        evals,
+        name,
+        agent=variants[0].agent,
+        cache_root=skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR,
+        max_evals=max_evals,
+        budget=budget,
+        seed=seed,
+    )
+
+    scripts = get_scripts_from_evals(evals)
+    if scripts and not trust and not prompt_for_script_confirmation(scripts):
+        console.print("[yellow]Aborted.[/yellow]")
+        return None
+
+    tasks = [
+        {
+            "eval_idx": eval_idx,
+            "eval_source": eval_data["_source"],
+            "iteration": i + 1,
+            "variant": variant.label,
+        }
+        for eval_idx, eval_data in enumerate(evals)
+        for i in range(samples)
+        for variant in variants
+    ]
+    display = LiveDisplay(tasks)
+    await display.start()
+
+    async def on_status(task: dict, state: str, result: dict | None):
+        await display.update(task, state, result)
+
+    try:
+        result = await compare(
+            name,
+            variants,
+            samples=samples,
+            seed=seed,
+            allowed_tools=allowed_tools,
+            parallel=parallel,
+            on_status=on_status,
+            skip_cache=skip_cache,
+            evals_list=evals,
+            skillet_dir=skillet_dir,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=share_runs,
+        )
+    finally:
+        await display.stop()
+
+    sampled = len(evals)
+    console.print(
+        f"Evals: {sampled}" + (f" [dim](of {total_evals})[/dim]" if sampled < total_evals else "")
+    )
+    console.print(f"Samples: {samples} per eval, per variant")
+    console.print(f"Parallel: {parallel} per agent")
+    cached = sum(r.cached_count for r in result.results)
+    if cached:
+        fresh = sum(r.fresh_count for r in result.results)
+        console.print(f"Cache: [blue]{cached} cached[/blue], {fresh} fresh")
+    shared = format_shared(
+        sum(r.shared_count for r in result.results), sum(r.shared_turns for r in result.results)
+    )
+    if shared:
+        console.print(f"Shared: [blue]{shared}[/blue]")
+    for variant, arm in zip(result.variants, result.results, strict=True):
+        if arm.usage is not None:
+            console.print(f"Usage ({variant.label}): {format_usage(arm.usage)}")
+    skipped = sum(r.skipped_count for r in result.results)
+    if skipped:
+        console.print(f"Skipped: [yellow]{skipped} runs not started, usage cap reached[/yellow]")
+    console.print()
+
+    _print_comparison(result)
+    return result
@@ -0,0 +1,125 @@
+"""Tests for compare_command function."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skillet.agent import Agent
+from skillet.cli.commands.eval.compare import compare_command
+from skillet.eval.compare import CompareResult, PairedDelta, Variant
+from skillet.eval.evaluate.result import EvaluateResult, PerEvalMetric
+
+_CMD = "skillet.cli.commands.eval.compare"
+
+
+def _evaluate_result(c: int) -> EvaluateResult:
+    return EvaluateResult(
+        results=[],
+        tasks=[],
+        pass_rate=c / 2 * 100,
+        total_runs=2,
+        total_pass=c,
+        cached_count=1,
+        fresh_count=1,
+        total_evals=1,
+        sampled_evals=1,
+        per_eval_metrics=[PerEvalMetric("test.yaml", None, None, k=2, n=2, c=c)],
+        selected_evals=["test.yaml"],
+    )
+
+
+def describe_compare_command():
+    @pytest.fixture(autouse=True)
+    def mock_console():
+        with patch(f"{_CMD}.console") as mock:
+            yield mock
+
+    @pytest.fixture(autouse=True)
+    def mock_load_evals():
+        with patch("skillet.evals.load_evals") as mock:
+            mock.return_value = [{"_source": "test.yaml"}]
+            yield mock
+
+    @pytest.fixture(autouse=True)
+    def mock_live_display():
+        with patch(f"{_CMD}.LiveDisplay") as mock_cls:
+            mock_display = MagicMock()
+            mock_display.start = AsyncMock()
+            mock_display.stop = AsyncMock()
+            mock_cls.return_value = mock_display
+            yield mock_cls
+
+    @pytest.fixture(autouse=True)
+    def mock_compare():
+        with patch(f"{_CMD}.compare", new_callable=AsyncMock) as mock:
+
+            async def run(_name, variants, **_kwargs):
+                labels = [v.label for v in variants]
+                return CompareResult(
+                    variants=variants,
+                    results=[_evaluate_result(i % 3) for i in range(len(variants))],
+                    deltas=[
+                        PairedDelta("test.yaml", labels[0], label, 0.0, i % 3 * 50.0)
+                        for i, label in enumerate(labels[1:], start=1)
+                    ],
+                )
+
+            mock.side_effect = run
+            yield mock
+
+    @pytest.mark.asyncio
+    async def it_runs_one_variant_per_agent(mock_compare):
+        await compare_command("evals", agents=[Agent.CLAUDE, Agent.CODEX], samples=2)
+
+        variants = mock_compare.call_args[0][1]
+        assert variants == [Variant(Agent.CLAUDE), Variant(Agent.CODEX)]
+        assert mock_compare.call_args[1]["samples"] == 2
+
+    @pytest.mark.asyncio
+    async def it_puts_baseline_before_skill_for_each_agent(mock_compare):
+        skill = Path("skill")
+        await compare_command(
+            "evals", agents=[Agent.CLAUDE, Agent.CODEX], skill_path=skill, compare_baseline=True
+        )
+
+        assert [v.label for v in mock_compare.call_args[0][1]] == [
+            "claude/baseline",
+            "claude/skill",
+            "codex/baseline",
+            "codex/skill",
+        ]
+
+    @pytest.mark.asyncio
+    async def it_shows_every_variant_in_the_live_display(mock_live_display):
+        await compare_command("evals", agents=[Agent.CLAUDE, Agent.CODEX], samples=2)
+
+        tasks = mock_live_display.call_args[0][0]
+        assert len(tasks) == 4
+        assert {t["variant"] for t in tasks} == {"claude/baseline", "codex/baseline"}
+
+    @pytest.mark.asyncio
+    async def it_passes_the_selected_evals_once(mock_compare, mock_load_evals):
+        await compare_command("evals", agents=[Agent.CLAUDE, Agent.CODEX])
+
+        mock_load_evals.assert_called_once()
+        assert mock_compare.call_args[1]["evals_list"] == [{"_source": "test.yaml"}]
+        assert "max_evals" not in mock_compare.call_args[1]
+
+    @pytest.mark.asyncio
+    async def it_returns_the_comparison():
+        result = await compare_command("evals", agents=[Agent.CLAUDE, Agent.CODEX])
+
+        assert result is not None
+        assert result.mean_delta("codex/baseline") == 50.0
+
+    @pytest.mark.asyncio
+    async def it_aborts_when_scripts_are_declined(mock_compare):
+        with (
+            patch(f"{_CMD}.get_scripts_from_evals", return_value=["setup.sh"]),
+            patch(f"{_CMD}.prompt_for_script_confirmation", return_value=False),
+        ):
+            result = await compare_command("evals", agents=[Agent.CLAUDE, Agent.CODEX])
+
+        assert result is None
+        mock_compare.assert_not_called()
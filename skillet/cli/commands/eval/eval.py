@@ -3,12 +3,15 @@
 import logging
 from pathlib import Path
 
+from skillet import config
 from skillet.agent import Agent
 from skillet.cli import console
 from skillet.cli.display import LiveDisplay
-from skillet.eval import evaluate
+from skillet.eval import JudgeTiers, evaluate
 from skillet.eval.evaluate.result import EvaluateResult
 
+from ...display.format_shared import format_shared
+from ...display.format_usage import format_usage
 from ...display.get_rate_color import get_rate_color
 from .get_scripts_from_evals import get_scripts_from_evals
 from .prompt_for_script_confirmation import prompt_for_script_confirmation
@@ -31,6 +34,83 @@ def _print_per_eval_metrics(eval_result: EvaluateResult, samples: int) -> None:
         console.print(f"  {m.eval_source}: pass@{k} {pak_str}, pass^{k} {ppk_str}")
 
 
+def _print_tier_stats(eval_result: EvaluateResult) -> None:
+    """Print how many fresh grades each judging tier tried and decided, and how fast."""
+    if not eval_result.tier_stats:
+        return
+    console.print("Judging tiers: [dim](fresh grades)[/dim]")
+    for s in eval_result.tier_stats:
+        console.print(
+            f"  {s.tier}: {s.decided}/{s.ran} decided, [dim]{s.mean_seconds:.2f}s avg[/dim]"
+        )
+
+
+def _print_usage(eval_result: EvaluateResult) -> None:
+    """Print what the fresh runs spent, the costliest evals and runs skipped by a cap."""
+    if eval_result.usage is not None:
+        console.print(f"Usage: {format_usage(eval_result.usage)} [dim](fresh runs)[/dim]")
+    metered = [(m.eval_source, m.usage) for m in eval_result.per_eval_metrics if m.usage]
+    if len(metered) > 1:
+        metered.sort(key=lambda pair: (pair[1].cost_usd or 0, pair[1].total_tokens), reverse=True)
+        costliest = ", ".join(f"{source} ({format_usage(usage)})" for source, usage in metered[:3])
+        console.print(f"  [dim]Costliest: {costliest}[/dim]")
+    if eval_result.skipped_count:
+        console.print(
+            f"Skipped: [yellow]{eval_result.skipped_count} runs not started, "
+            "usage cap reached[/yellow]"
+        )
+
+
+def _print_pass_rate(eval_result: EvaluateResult) -> None:
+    """Print the overall pass rate, and the suite estimate for a ``--budget`` subset."""
+    rate_color = get_rate_color(eval_result.pass_rate)
+    console.print(
+        f"Overall pass rate: [{rate_color}]{eval_result.pass_rate:.0f}%[/{rate_color}] "
+        f"({eval_result.total_pass}/{eval_result.total_runs})"
+    )
+    if eval_result.suite_pass_rate is not None:
+        suite_color = get_rate_color(eval_result.suite_pass_rate)
+        console.print(
+            f"Estimated suite pass rate: [{suite_color}]{eval_result.suite_pass_rate:.0f}%"
+            f"[/{suite_color}] [dim](each eval weighted by the evals it stands for)[/dim]"
+        )
+
+
+def _print_eval_count(sampled: int, total: int, budget: int | None, seed: int | None) -> None:
+    """Print how many evals ran and, if a subset, how it was chosen."""
+    if sampled >= total:
+        console.print(f"Evals: {sampled}")
+        return
+    how = "budget subset of" if budget is not None else "sampled from"
+    seeded = f", seed {seed}" if budget is None and seed is not None else ""
+    console.print(f"Evals: {sampled} [dim]({how} {total}{seeded})[/dim]")
+
+
+def _print_header(
+    skill_path: Path | None, agent: Agent, *, cached_only: bool, regrade: bool
+) -> None:
+    """Print what is being evaluated, and how when nothing is run."""
+    console.print()
+    if skill_path:
+        console.print("[bold]Eval Results (with skill)[/bold]")
+        console.print(f"Skill: [cyan]{skill_path}[/cyan]")
+    else:
+        console.print("[bold]Eval Results (baseline, no skill)[/bold]")
+    console.print(f"Agent: [cyan]{agent.value}[/cyan]")
+    if regrade:
+        console.print("[dim]Regrading cached responses with the current criteria[/dim]")
+    elif cached_only:
+        console.print("[dim]Reporting from cache only[/dim]")
+
+
+def _print_missing(missing_count: int, *, regrade: bool) -> None:
+    """Print how many iterations a cache-only run could not find."""
+    if not missing_count:
+        return
+    hint = "" if regrade else "; `skillet regrade` grades responses under new criteria"
+    console.print(f"Missing: [dim]{missing_count} iterations not in the cache{hint}[/dim]")
+
+
 async def eval_command(  # noqa: PLR0913
     name: str,
     skill_path: Path | None = None,
@@ -44,32 +124,54 @@ async def eval_command(  # noqa: PLR0913
     skillet_dir: Path | None = None,
     *,
     agent: Agent,
+    budget: int | None = None,
+    seed: int | None = None,
+    cached_only: bool = False,
+    regrade: bool = False,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
 ):
     """Run eval command with display.
 
     ``skillet_dir`` is the root holding ``evals/`` and ``cache/``; it falls back
     to the configured ``SKILLET_DIR`` when ``None``.
+
+    ``cached_only`` reports from the cache and ``regrade`` re-grades cached
+    responses (see :func:`evaluate`); neither runs the agent under test or
+    any setup/teardown script, so there is nothing to confirm.
+
+    ``judge_tiers`` tries a fast judge before the full one; how each judging
+    tier fared is printed with the stats.
+
+    ``max_cost`` and ``max_tokens`` stop starting runs once the fresh runs
+    have spent that much; what they spent is printed with the stats.
+    ``share_runs`` lets evals with identical runs share one response; how
+    many were shared is printed with the cache stats.
     """
     from skillet.evals import load_evals
+    from skillet.evals.select import select_evals
 
-    # Print header
-    console.print()
-    if skill_path:
-        console.print("[bold]Eval Results (with skill)[/bold]")
-        console.print(f"Skill: [cyan]{skill_path}[/cyan]")
-    else:
-        console.print("[bold]Eval Results (baseline, no skill)[/bold]")
-    console.print(f"Agent: [cyan]{agent.value}[/cyan]")
+    _print_header(skill_path, agent, cached_only=cached_only, regrade=regrade)
 
     # Load evals first to build the task list for display
     evals = load_evals(name, skillet_dir=skillet_dir)
-    if max_evals and max_evals < len(evals):
-        import random
-
-        evals = random.sample(evals, max_evals)
+    total_evals = len(evals)
+    evals = select_evals(
+        evals,
+        name,
+        agent=agent,
+        cache_root=skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR,
+        max_evals=max_evals,
+        budget=budget,
+        seed=seed,
+    )
 
     # Check for scripts and prompt if needed
-    scripts = get_scripts_from_evals(evals)
+    scripts = [] if cached_only or regrade else get_scripts_from_evals(evals)
     if scripts and not trust and not prompt_for_script_confirmation(scripts):
         console.print("[yellow]Aborted.[/yellow]")
         return
@@ -107,22 +209,29 @@ async def eval_command(  # noqa: PLR0913
             evals_list=evals,
             skillet_dir=skillet_dir,
             agent=agent,
+            seed=seed,
+            cached_only=cached_only,
+            regrade=regrade,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=share_runs,
         )
     finally:
         await display.stop()
 
     # Print results info
-    if max_evals and eval_result.sampled_evals < eval_result.total_evals:
-        console.print(
-            f"Evals: {eval_result.sampled_evals} "
-            f"[dim](sampled from {eval_result.total_evals})[/dim]"
-        )
-    else:
-        console.print(f"Evals: {eval_result.sampled_evals}")
+    _print_eval_count(eval_result.sampled_evals, total_evals, budget, seed)
     console.print(f"Samples: {samples} per eval")
     console.print(f"Parallel: {parallel}")
     console.print(f"Tools: {', '.join(allowed_tools) if allowed_tools else 'all'}")
     console.print(f"Total runs: {eval_result.total_runs}")
+    _print_missing(eval_result.missing_count, regrade=regrade)
+    stopped = sum(1 for r in eval_result.results if r.stopped_early)
+    if stopped:
+        console.print(f"Stopped early: [dim]{stopped} runs failed an assertion mid-run[/dim]")
     console.print()
 
     # Show final status
@@ -135,12 +244,13 @@ async def eval_command(  # noqa: PLR0913
             f"Cache: [blue]{eval_result.cached_count} cached[/blue], "
             f"{eval_result.fresh_count} fresh"
         )
+    shared = format_shared(eval_result.shared_count, eval_result.shared_turns)
+    if shared:
+        console.print(f"Shared: [blue]{shared}[/blue]")
+    _print_tier_stats(eval_result)
+    _print_usage(eval_result)
 
-    rate_color = get_rate_color(eval_result.pass_rate)
-    console.print(
-        f"Overall pass rate: [{rate_color}]{eval_result.pass_rate:.0f}%[/{rate_color}] "
-        f"({eval_result.total_pass}/{eval_result.total_runs})"
-    )
+    _print_pass_rate(eval_result)
 
     _print_per_eval_metrics(eval_result, samples)
 
@@ -5,9 +5,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from skillet._internal.sdk import Usage
 from skillet.agent import Agent
 from skillet.cli.commands.eval.eval import eval_command
-from skillet.eval.evaluate.result import EvaluateResult, IterationResult
+from skillet.eval.evaluate.result import EvaluateResult, IterationResult, PerEvalMetric, TierStats
+from skillet.eval.judge import JudgeTiers
 
 
 def describe_eval_command():
@@ -177,3 +179,122 @@ def describe_eval_command():
         """Skips summarize_responses when no_summary=True."""
         await eval_command("my-evals", no_summary=True, agent=Agent.CLAUDE)
         mock_summarize.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_runs_a_budget_subset(mock_load_evals, mock_evaluate, mock_console):
+        evals = [{"_source": f"{i}.yaml", "prompt": f"p{i}"} for i in range(5)]
+        mock_load_evals.return_value = evals
+        mock_evaluate.return_value.sampled_evals = 2
+        with patch("skillet.evals.select.select_evals") as mock_select:
+            mock_select.return_value = evals[:2]
+
+            await eval_command("my-evals", agent=Agent.CLAUDE, budget=2)
+
+        assert mock_select.call_args.kwargs["budget"] == 2
+        assert mock_evaluate.call_args.kwargs["evals_list"] == evals[:2]
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "budget subset of 5" in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_the_estimated_suite_pass_rate(mock_evaluate, mock_console):
+        mock_evaluate.return_value.suite_pass_rate = 82.0
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, budget=1)
+
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "Estimated suite pass rate: [yellow]82%" in printed
+
+    @pytest.mark.asyncio
+    async def it_samples_once_with_the_seed(mock_load_evals, mock_evaluate, mock_console):
+        evals = [{"_source": f"{i}.yaml", "prompt": f"p{i}"} for i in range(5)]
+        mock_load_evals.return_value = evals
+        mock_evaluate.return_value.sampled_evals = 2
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, max_evals=2, seed=42)
+
+        kwargs = mock_evaluate.call_args.kwargs
+        assert len(kwargs["evals_list"]) == 2
+        assert kwargs["seed"] == 42
+        assert "max_evals" not in kwargs
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "sampled from 5, seed 42" in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_from_cache_without_confirming_scripts(
+        mock_get_scripts, mock_evaluate, mock_console
+    ):
+        mock_get_scripts.return_value = [("test.yaml", "setup", "echo test")]
+        mock_evaluate.return_value.missing_count = 2
+        with patch("skillet.cli.commands.eval.eval.prompt_for_script_confirmation") as mock_prompt:
+            await eval_command("my-evals", agent=Agent.CLAUDE, cached_only=True)
+
+        mock_prompt.assert_not_called()
+        assert mock_evaluate.call_args.kwargs["cached_only"] is True
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "2 iterations not in the cache" in printed
+        assert "skillet regrade" in printed
+
+    @pytest.mark.asyncio
+    async def it_regrades_cached_responses(mock_evaluate, mock_console):
+        mock_evaluate.return_value.missing_count = 1
+        await eval_command("my-evals", agent=Agent.CLAUDE, regrade=True)
+
+        assert mock_evaluate.call_args.kwargs["regrade"] is True
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "Regrading cached responses" in printed
+        assert "skillet regrade" not in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_runs_stopped_early(mock_evaluate, mock_console):
+        mock_evaluate.return_value.results[1].stopped_early = True
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, fail_fast_assertions=True)
+
+        assert mock_evaluate.call_args.kwargs["fail_fast_assertions"] is True
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "Stopped early: [dim]1 runs" in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_the_judging_tiers(mock_evaluate, mock_console):
+        mock_evaluate.return_value.tier_stats = [
+            TierStats(tier="fast", ran=3, decided=2, mean_seconds=1.25),
+            TierStats(tier="full", ran=1, decided=1, mean_seconds=4.0),
+        ]
+        tiers = JudgeTiers("haiku")
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, judge_tiers=tiers)
+
+        assert mock_evaluate.call_args.kwargs["judge_tiers"] is tiers
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "fast: 2/3 decided, [dim]1.25s avg" in printed
+        assert "full: 1/1 decided" in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_usage_the_costliest_evals_and_skipped_runs(mock_evaluate, mock_console):
+        result = mock_evaluate.return_value
+        result.usage = Usage(input_tokens=1000, output_tokens=234, cost_usd=0.5)
+        result.skipped_count = 4
+        result.per_eval_metrics = [
+            PerEvalMetric("cheap.yaml", None, None, 1, 1, 1, usage=Usage(output_tokens=10)),
+            PerEvalMetric("dear.yaml", None, None, 1, 1, 1, usage=Usage(cost_usd=0.4)),
+        ]
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, max_cost=1.0, max_tokens=5000)
+
+        assert mock_evaluate.call_args.kwargs["max_cost"] == 1.0
+        assert mock_evaluate.call_args.kwargs["max_tokens"] == 5000
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "Usage: 1,234 tokens, $0.5000" in printed
+        assert "Costliest: dear.yaml (0 tokens, $0.4000), cheap.yaml (10 tokens)" in printed
+        assert "Skipped: [yellow]4 runs not started" in printed
+
+    @pytest.mark.asyncio
+    async def it_reports_shared_runs(mock_evaluate, mock_console):
+        mock_evaluate.return_value.shared_count = 3
+        mock_evaluate.return_value.shared_turns = 8
+
+        await eval_command("my-evals", agent=Agent.CLAUDE, share_runs=False)
+
+        assert mock_evaluate.call_args.kwargs["share_runs"] is False
+        printed = " ".join(str(c) for c in mock_console.print.call_args_list)
+        assert "Shared: [blue]3 responses reused, 8 turns from shared conversation" in printed
@@ -0,0 +1,22 @@
+"""Fingerprint files on disk so a watcher can tell when they change."""
+
+from pathlib import Path
+
+
+def snapshot_files(paths: list[Path]) -> dict[str, tuple[int, int]]:
+    """Return ``{path: (mtime_ns, size)}`` for every file at or under ``paths``.
+
+    Missing paths are skipped, so deleting or recreating a file shows up as
+    a changed snapshot rather than an error.
+    """
+    snapshot: dict[str, tuple[int, int]] = {}
+    for root in paths:
+        files = [root] if root.is_file() else sorted(root.rglob("*")) if root.is_dir() else []
+        for f in files:
+            try:
+                stat = f.stat()
+            except OSError:
+                continue
+            if f.is_file():
+                snapshot[str(f)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
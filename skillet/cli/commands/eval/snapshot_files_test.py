@@ -0,0 +1,35 @@
+"""Tests for snapshot_files."""
+
+from pathlib import Path
+
+from skillet.cli.commands.eval.snapshot_files import snapshot_files
+
+
+def describe_snapshot_files():
+    def it_fingerprints_files_under_directories(tmp_path: Path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.yaml").write_text("a")
+        (tmp_path / "sub" / "b.yaml").write_text("bb")
+
+        snapshot = snapshot_files([tmp_path])
+
+        assert set(snapshot) == {str(tmp_path / "a.yaml"), str(tmp_path / "sub" / "b.yaml")}
+        assert snapshot[str(tmp_path / "sub" / "b.yaml")][1] == 2
+
+    def it_accepts_single_files(tmp_path: Path):
+        f = tmp_path / "one.yaml"
+        f.write_text("x")
+
+        assert list(snapshot_files([f])) == [str(f)]
+
+    def it_skips_missing_paths(tmp_path: Path):
+        assert snapshot_files([tmp_path / "gone"]) == {}
+
+    def it_changes_when_a_file_is_edited(tmp_path: Path):
+        f = tmp_path / "a.yaml"
+        f.write_text("before")
+        before = snapshot_files([tmp_path])
+
+        f.write_text("after, longer")
+
+        assert snapshot_files([tmp_path]) != before
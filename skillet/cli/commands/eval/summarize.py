@@ -4,7 +4,7 @@ from pathlib import Path
 
 import yaml
 
-from skillet._internal.agent import query_structured_via_agent
+from skillet._internal.agent import Role, query_structured_via_agent
 from skillet._internal.text import summarize_failure_for_eval
 from skillet.agent import Agent
 from skillet.eval.evaluate.result import IterationResult
@@ -22,5 +22,5 @@ async def summarize_responses(results: list[IterationResult], agent: Agent) -> s
 
     prompt = load_prompt(SUMMARIZE_PROMPT, responses_yaml=responses_yaml)
 
-    result = await query_structured_via_agent(prompt, Summary, agent)
+    result = await query_structured_via_agent(prompt, Summary, agent, role=Role.SUMMARIZE)
     return "\n".join(f"- {bullet}" for bullet in result.bullets)
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from skillet._internal.agent import Role
 from skillet.agent import Agent
 from skillet.cli.commands.eval.models import Summary
 from skillet.cli.commands.eval.summarize import summarize_responses
@@ -89,6 +90,7 @@ def describe_summarize_responses():
 
         call_args = mock_query.call_args
         assert call_args[0][2] is Agent.CODEX
+        assert call_args[1]["role"] is Role.SUMMARIZE
 
     @pytest.mark.asyncio
     async def it_handles_empty_results(mock_query):
@@ -0,0 +1,216 @@
+"""CLI handler for ``skillet eval --watch``."""
+
+import asyncio
+from pathlib import Path
+
+import yaml
+
+from skillet import config
+from skillet._internal.cache import hash_directory
+from skillet.agent import Agent
+from skillet.cli import console
+from skillet.cli.display import LiveDisplay
+from skillet.errors import EvalError
+from skillet.eval import JudgeTiers, evaluate
+from skillet.evals import load_evals
+
+from ...display.get_rate_color import get_rate_color
+from .get_scripts_from_evals import get_scripts_from_evals
+from .prompt_for_script_confirmation import prompt_for_script_confirmation
+from .snapshot_files import snapshot_files
+
+
+def _eval_root(name: str, skillet_dir: Path | None) -> Path:
+    """Where ``load_evals(name)`` reads from: the file or directory to watch."""
+    name_path = Path(name)
+    if name_path.exists():
+        return name_path
+    root = skillet_dir if skillet_dir is not None else config.SKILLET_DIR
+    return root / "evals" / name
+
+
+def _display_tasks(evals: list[dict], samples: int) -> list[dict]:
+    return [
+        {"eval_idx": eval_idx, "eval_source": eval_data["_source"], "iteration": i + 1}
+        for eval_idx, eval_data in enumerate(evals)
+        for i in range(samples)
+    ]
+
+
+def _skill_hash(skill_path: Path | None) -> str | None:
+    """Hash the skill as it is on disk now (``hash_directory`` memoizes by path)."""
+    if skill_path is None:
+        return None
+    hash_directory.cache_clear()
+    return hash_directory(skill_path)
+
+
+def _untrusted(evals: list[dict], confirmed: set[tuple[str, str, str]]) -> set[str]:
+    """Sources of evals whose setup/teardown scripts were not confirmed at startup."""
+    return {
+        source
+        for source, kind, script in get_scripts_from_evals(evals)
+        if (source, kind, script) not in confirmed
+    }
+
+
+def _affected(
+    evals: list[dict], contents: dict[str, str], *, skill_changed: bool
+) -> tuple[list[dict], str]:
+    """The evals to re-run, and why: all of them for a skill change, else the edited or new ones."""
+    if skill_changed:
+        return evals, "Skill changed"
+    affected = [e for e in evals if contents.get(e["_source"]) != e["_content"]]
+    return affected, f"{len(affected)} eval(s) changed"
+
+
+class _Session:
+    """State carried between runs of one watch session."""
+
+    def __init__(
+        self, display: LiveDisplay, evals: list[dict], skill_path: Path | None, **run_kwargs
+    ):
+        self.display = display
+        self.evals = evals
+        self.contents = {e["_source"]: e["_content"] for e in evals}
+        self.skill_path = skill_path
+        self.skill_hash = _skill_hash(skill_path)
+        self.run_kwargs = run_kwargs
+
+    async def run(self, affected: list[dict], reason: str, *, skip_cache: bool = False) -> None:
+        """Evaluate ``affected``, routing status to their rows in the full display."""
+        index = {e["_source"]: i for i, e in enumerate(self.evals)}
+
+        async def on_status(task: dict, state: str, result: dict | None):
+            await self.display.update(
+                {**task, "eval_idx": index[task["eval_source"]]}, state, result
+            )
+
+        result = await evaluate(
+            skill_path=self.skill_path,
+            on_status=on_status,
+            skip_cache=skip_cache,
+            evals_list=affected,
+            **self.run_kwargs,
+        )
+        color = get_rate_color(result.pass_rate)
+        self.display.log(
+            f"[bold]{reason}[/bold]: {len(affected)} evals, "
+            f"[{color}]{result.pass_rate:.0f}%[/{color}] "
+            f"({result.total_pass}/{result.total_runs}), {result.cached_count} cached"
+        )
+
+    async def reload(self, evals: list[dict], samples: int) -> None:
+        """Adopt the evals now on disk and re-run whatever the change affected."""
+        new_hash = _skill_hash(self.skill_path)
+        affected, reason = _affected(
+            evals, self.contents, skill_changed=new_hash != self.skill_hash
+        )
+        self.skill_hash = new_hash
+        self.evals = evals
+        self.contents = {e["_source"]: e["_content"] for e in evals}
+
+        tasks = _display_tasks(evals, samples)
+        await self.display.set_tasks(tasks)
+        if not affected:
+            return
+        sources = {e["_source"] for e in affected}
+        for task in tasks:
+            if task["eval_source"] in sources:
+                await self.display.update(task, "pending")
+        await self.run(affected, reason)
+
+
+async def watch_command(  # noqa: PLR0913
+    name: str,
+    skill_path: Path | None = None,
+    *,
+    agent: Agent,
+    samples: int = 3,
+    allowed_tools: list[str] | None = None,
+    parallel: int = 3,
+    skip_cache: bool = False,
+    trust: bool = False,
+    skillet_dir: Path | None = None,
+    poll_interval: float = 1.0,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
+) -> None:
+    """Run the evals, then re-run the affected ones whenever the skill or an eval changes.
+
+    The eval files and the skill directory are polled every ``poll_interval``
+    seconds. Cache keys are content hashes, so a change only misses the cache
+    where it has to: a skill edit gives the skill a new hash and re-runs every
+    eval, while an eval edit gives only that eval a new key (or, when only its
+    grading criteria changed, just re-grades its cached responses). Added evals run,
+    removed ones leave the display. One live display stays open throughout;
+    each run's outcome is printed above it. Stop with Ctrl-C.
+
+    Without ``trust``, an eval whose setup/teardown scripts change after the
+    startup confirmation is skipped rather than run unreviewed.
+    ``max_cost`` and ``max_tokens`` cap each run separately.
+    """
+    console.print()
+    console.print(f"[bold]Watching evals ({'with skill' if skill_path else 'baseline'})[/bold]")
+    console.print(f"Agent: [cyan]{agent.value}[/cyan]")
+
+    evals = load_evals(name, skillet_dir=skillet_dir)
+    scripts = get_scripts_from_evals(evals)
+    if scripts and not trust and not prompt_for_script_confirmation(scripts):
+        console.print("[yellow]Aborted.[/yellow]")
+        return
+    confirmed = set(scripts)
+    watched = [_eval_root(name, skillet_dir), *([skill_path] if skill_path else [])]
+
+    display = LiveDisplay(_display_tasks(evals, samples))
+    await display.start()
+    try:
+        session = _Session(
+            display,
+            evals,
+            skill_path,
+            name=name,
+            samples=samples,
+            allowed_tools=allowed_tools,
+            parallel=parallel,
+            skillet_dir=skillet_dir,
+            agent=agent,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=share_runs,
+        )
+        await session.run(evals, "Initial run", skip_cache=skip_cache)
+        snapshot = snapshot_files(watched)
+        display.log(f"[dim]Watching {', '.join(map(str, watched))} (Ctrl-C to stop)[/dim]")
+
+        while True:
+            await asyncio.sleep(poll_interval)
+            current = snapshot_files(watched)
+            if current == snapshot:
+                continue
+            snapshot = current
+
+            try:
+                loaded = load_evals(name, skillet_dir=skillet_dir)
+            except (EvalError, yaml.YAMLError) as e:
+                # Likely a half-saved file; the next save triggers another poll
+                display.log(f"[red]Error:[/red] {e}")
+                continue
+
+            untrusted = set() if trust else _untrusted(loaded, confirmed)
+            if untrusted:
+                display.log(
+                    f"[yellow]Skipping {', '.join(sorted(untrusted))}: new setup/teardown "
+                    "scripts (restart with --trust to run them)[/yellow]"
+                )
+            await session.reload([e for e in loaded if e["_source"] not in untrusted], samples)
+    finally:
+        await display.stop()
+        display.finalize()
@@ -0,0 +1,204 @@
+"""Tests for the eval --watch handler."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skillet.agent import Agent
+from skillet.cli.commands.eval.watch import watch_command
+from skillet.eval.evaluate.result import EvaluateResult
+
+_WATCH = "skillet.cli.commands.eval.watch"
+
+
+class _Stop(Exception):
+    """Ends the watch loop from the fake sleep."""
+
+
+def _write_eval(directory: Path, name: str, prompt: str, **extra: str) -> None:
+    lines = [
+        f"name: {name}",
+        'timestamp: "2025-01-01T00:00:00Z"',
+        f"prompt: {prompt}",
+        "expected: something",
+    ]
+    lines += [f"{key}: {value}" for key, value in extra.items()]
+    (directory / name).write_text("\n".join(lines) + "\n")
+
+
+def _result() -> EvaluateResult:
+    return EvaluateResult(
+        results=[],
+        tasks=[],
+        pass_rate=100.0,
+        total_runs=1,
+        total_pass=1,
+        cached_count=0,
+        fresh_count=1,
+        sampled_evals=1,
+        total_evals=1,
+        per_eval_metrics=[],
+    )
+
+
+def _edits(*steps):
+    """Fake asyncio.sleep: apply one edit per poll, then stop the loop."""
+    remaining = list(steps)
+
+    async def sleep(_seconds):
+        if not remaining:
+            raise _Stop
+        remaining.pop(0)()
+
+    return sleep
+
+
+@pytest.fixture
+def evals_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "evals"
+    directory.mkdir()
+    _write_eval(directory, "a.yaml", "first")
+    _write_eval(directory, "b.yaml", "second")
+    return directory
+
+
+@pytest.fixture
+def skill_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "skill"
+    directory.mkdir()
+    (directory / "SKILL.md").write_text("v1")
+    return directory
+
+
+@pytest.fixture(autouse=True)
+def mock_evaluate():
+    with patch(f"{_WATCH}.evaluate", new_callable=AsyncMock, return_value=_result()) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def mock_display():
+    display = MagicMock()
+    display.start = AsyncMock()
+    display.stop = AsyncMock()
+    display.update = AsyncMock()
+    display.set_tasks = AsyncMock()
+    with patch(f"{_WATCH}.LiveDisplay", return_value=display):
+        yield display
+
+
+async def _watch(evals_dir: Path, skill_dir: Path | None, *steps, trust: bool = True):
+    with patch(f"{_WATCH}.asyncio.sleep", side_effect=_edits(*steps)), pytest.raises(_Stop):
+        await watch_command(str(evals_dir), skill_dir, agent=Agent.CLAUDE, samples=1, trust=trust)
+
+
+def _sources(call) -> list[str]:
+    return [e["_source"] for e in call.kwargs["evals_list"]]
+
+
+def _bump(path: Path, text: str):
+    """Rewrite ``path``; the size change makes the edit visible regardless of mtime resolution."""
+    return lambda: path.write_text(text)
+
+
+def describe_watch_command():
+    @pytest.mark.asyncio
+    async def it_runs_every_eval_first(evals_dir, skill_dir, mock_evaluate, mock_display):
+        await _watch(evals_dir, skill_dir)
+
+        assert [_sources(c) for c in mock_evaluate.call_args_list] == [["a.yaml", "b.yaml"]]
+        mock_display.start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def it_reruns_only_an_edited_eval(evals_dir, skill_dir, mock_evaluate):
+        await _watch(
+            evals_dir,
+            skill_dir,
+            lambda: _write_eval(evals_dir, "b.yaml", "second, reworded"),
+        )
+
+        assert _sources(mock_evaluate.call_args_list[-1]) == ["b.yaml"]
+
+    @pytest.mark.asyncio
+    async def it_reruns_everything_when_the_skill_changes(evals_dir, skill_dir, mock_evaluate):
+        await _watch(evals_dir, skill_dir, _bump(skill_dir / "SKILL.md", "version two"))
+
+        assert len(mock_evaluate.call_args_list) == 2
+        assert _sources(mock_evaluate.call_args_list[-1]) == ["a.yaml", "b.yaml"]
+
+    @pytest.mark.asyncio
+    async def it_runs_added_evals(evals_dir, skill_dir, mock_evaluate, mock_display):
+        await _watch(evals_dir, skill_dir, lambda: _write_eval(evals_dir, "c.yaml", "third"))
+
+        assert _sources(mock_evaluate.call_args_list[-1]) == ["c.yaml"]
+        tasks = mock_display.set_tasks.call_args.args[0]
+        assert [t["eval_source"] for t in tasks] == ["a.yaml", "b.yaml", "c.yaml"]
+
+    @pytest.mark.asyncio
+    async def it_does_nothing_while_files_are_unchanged(evals_dir, skill_dir, mock_evaluate):
+        await _watch(evals_dir, skill_dir, lambda: None, lambda: None)
+
+        assert len(mock_evaluate.call_args_list) == 1
+
+    @pytest.mark.asyncio
+    async def it_routes_status_to_the_evals_row_in_the_full_display(
+        evals_dir, skill_dir, mock_evaluate, mock_display
+    ):
+        await _watch(
+            evals_dir, skill_dir, lambda: _write_eval(evals_dir, "b.yaml", "second, reworded")
+        )
+
+        on_status = mock_evaluate.call_args.kwargs["on_status"]
+        # evaluate() numbers the one re-run eval 0; the display row is 1
+        await on_status({"eval_idx": 0, "eval_source": "b.yaml", "iteration": 1}, "running", None)
+        assert mock_display.update.call_args.args[0]["eval_idx"] == 1
+
+    @pytest.mark.asyncio
+    async def it_keeps_watching_after_an_invalid_eval(
+        evals_dir, skill_dir, mock_evaluate, mock_display
+    ):
+        await _watch(
+            evals_dir,
+            skill_dir,
+            lambda: (evals_dir / "b.yaml").write_text("prompt: [unclosed\n"),
+            lambda: _write_eval(evals_dir, "b.yaml", "second, fixed"),
+        )
+
+        logged = " ".join(c.args[0] for c in mock_display.log.call_args_list)
+        assert "Error" in logged
+        assert _sources(mock_evaluate.call_args_list[-1]) == ["b.yaml"]
+
+    @pytest.mark.asyncio
+    async def it_skips_evals_with_new_scripts_without_trust(
+        evals_dir, skill_dir, mock_evaluate, mock_display
+    ):
+        await _watch(
+            evals_dir,
+            skill_dir,
+            lambda: _write_eval(evals_dir, "b.yaml", "second", setup="echo hi"),
+            trust=False,
+        )
+
+        assert len(mock_evaluate.call_args_list) == 1
+        logged = " ".join(c.args[0] for c in mock_display.log.call_args_list)
+        assert "b.yaml" in logged and "--trust" in logged
+
+    @pytest.mark.asyncio
+    async def it_stops_and_finalizes_the_display_on_exit(evals_dir, skill_dir, mock_display):
+        await _watch(evals_dir, skill_dir)
+
+        mock_display.stop.assert_awaited_once()
+        mock_display.finalize.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_aborts_when_scripts_are_not_confirmed(
+        evals_dir, skill_dir, mock_evaluate, mock_display
+    ):
+        _write_eval(evals_dir, "a.yaml", "first", setup="echo hi")
+
+        with patch(f"{_WATCH}.prompt_for_script_confirmation", return_value=False):
+            await watch_command(str(evals_dir), skill_dir, agent=Agent.CLAUDE, samples=1)
+
+        mock_evaluate.assert_not_called()
+        mock_display.start.assert_not_called()
@@ -8,7 +8,8 @@ from rich.table import Table
 from skillet.agent import Agent
 from skillet.cli import console
 from skillet.generate import generate_evals
-from skillet.generate.types import EvalDomain
+from skillet.generate.dedupe import DEFAULT_DEDUPE_THRESHOLD
+from skillet.generate.types import EvalDomain, GenerateResult
 
 
 def _parse_domains(raw: list[str] | None) -> list[EvalDomain] | None:
@@ -27,6 +28,18 @@ def _parse_domains(raw: list[str] | None) -> list[EvalDomain] | None:
     return domains
 
 
+def _print_duplicates(result: GenerateResult) -> None:
+    """List candidates dropped as near-duplicates of existing evals."""
+    if not result.duplicates:
+        return
+    console.print()
+    console.print(f"[yellow]Skipped {len(result.duplicates)} near-duplicate candidates:[/yellow]")
+    for dup in result.duplicates:
+        console.print(
+            f"  {dup.candidate.name} [dim]~ {dup.duplicate_of} ({dup.similarity:.0%})[/dim]"
+        )
+
+
 async def generate_evals_command(
     skill_path: Path,
     *,
@@ -34,6 +47,7 @@ async def generate_evals_command(
     output_dir: Path | None = None,
     max_per_category: int = 5,
     domain: list[str] | None = None,
+    dedupe_threshold: float | None = DEFAULT_DEDUPE_THRESHOLD,
 ) -> None:
     """Run generate-evals with progress spinner."""
     skill_path = Path(skill_path).expanduser().resolve()
@@ -56,6 +70,7 @@ async def generate_evals_command(
             output_dir=output_dir,
             max_per_category=max_per_category,
             domains=domains,
+            dedupe_threshold=dedupe_threshold,
         )
 
     # Display analysis summary
@@ -78,6 +93,8 @@ async def generate_evals_command(
         table.add_row(c.name, c.category, domain_str, c.source)
     console.print(table)
 
+    _print_duplicates(result)
+
     # Show output location
     if output_dir:
         console.print()
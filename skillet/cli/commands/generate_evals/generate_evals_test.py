@@ -7,7 +7,7 @@ import pytest
 from rich.console import Console
 
 from skillet.agent import Agent
-from skillet.generate.types import CandidateEval, GenerateResult
+from skillet.generate.types import CandidateEval, DuplicateCandidate, GenerateResult
 
 from .generate_evals import generate_evals_command
 
@@ -65,3 +65,32 @@ def describe_generate_evals_command():
         await generate_evals_command(skill_path, agent=Agent.CODEX)
 
         assert mock_generate.call_args.kwargs["agent"] is Agent.CODEX
+
+    @pytest.mark.asyncio
+    async def it_passes_dedupe_threshold(tmp_path: Path, mock_generate):
+        skill_path = tmp_path / "SKILL.md"
+        skill_path.write_text("# Skill")
+
+        await generate_evals_command(skill_path, agent=Agent.CLAUDE, dedupe_threshold=None)
+
+        assert mock_generate.call_args.kwargs["dedupe_threshold"] is None
+
+    @pytest.mark.asyncio
+    async def it_lists_skipped_duplicates(tmp_path: Path, mock_generate):
+        skill_path = tmp_path / "SKILL.md"
+        skill_path.write_text("# Skill")
+        result = _make_result(skill_path)
+        result.duplicates = [
+            DuplicateCandidate(
+                candidate=result.candidates[0], duplicate_of="existing.yaml", similarity=0.93
+            )
+        ]
+        mock_generate.return_value = result
+        buffer = Console(record=True, width=200)
+
+        with patch(f"{_MODULE}.console", buffer):
+            await generate_evals_command(skill_path, agent=Agent.CLAUDE)
+
+        output = buffer.export_text()
+        assert "Skipped 1 near-duplicate candidates" in output
+        assert "existing.yaml (93%)" in output
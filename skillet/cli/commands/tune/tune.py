@@ -15,7 +15,30 @@ from .output_path import get_default_output_path
 from .print_result import print_tune_result
 
 
-async def tune_command(  # noqa: C901 - complexity from inline display callbacks
+def _print_header(
+    name: str,
+    skill_path: Path,
+    eval_count: int,
+    target_pass_rate: float,
+    max_rounds: int,
+    candidates: int,
+    beam_width: int,
+) -> None:
+    """Print the tune run's settings panel."""
+    header = (
+        f"[bold]Tuning:[/bold] {name}\n"
+        f"[bold]Skill:[/bold] [cyan]{skill_path}[/cyan]\n"
+        f"[bold]Evals:[/bold] {eval_count}\n"
+        f"[bold]Target:[/bold] {target_pass_rate:.0f}% pass rate\n"
+        f"[bold]Max rounds:[/bold] {max_rounds}"
+    )
+    if candidates > 1:
+        header += f"\n[bold]Beam:[/bold] {candidates} candidates, keep {beam_width}"
+    console.print()
+    console.print(Panel.fit(header, title="Skill Tuner"))
+
+
+async def tune_command(  # noqa: C901, PLR0913 - complexity from inline display callbacks
     name: str,
     skill_path: Path,
     max_rounds: int = 5,
@@ -23,6 +46,12 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
     samples: int = 1,
     parallel: int = 3,
     output_path: Path | None = None,
+    *,
+    skip_cache: bool = False,
+    candidates: int = 1,
+    beam_width: int = 1,
+    minibatch: int = 0,
+    rejection_confidence: float = 0.95,
 ) -> TuneResult:
     """Run tune command with display.
 
@@ -33,7 +62,13 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
         target_pass_rate: Target pass rate percentage
         samples: Number of samples per eval
         parallel: Number of parallel workers
-        output_path: Optional path to save results JSON (defaults to ~/.skillet/tunes/)
+        output_path: Optional path to save results JSON (defaults to ~/.skillet/tunes/);
+            full per-round results stream to the same path with a ``.jsonl`` suffix
+        skip_cache: Re-run every candidate instead of reusing cached results
+        candidates: Candidate instructions evaluated per round (beam mode when > 1)
+        beam_width: Best candidates kept as parents for the next round
+        minibatch: Evals to race each proposed candidate on first (0 disables racing)
+        rejection_confidence: Confidence required to reject a candidate after its minibatch
 
     Returns:
         TuneResult with all iterations
@@ -43,18 +78,11 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
     # Default output path if not provided
     if output_path is None:
         output_path = get_default_output_path(name)
+    # Streamed as rounds finish, so an interrupted tune keeps its progress
+    round_log = output_path.with_suffix(".jsonl")
 
-    # Print header
-    console.print()
-    console.print(
-        Panel.fit(
-            f"[bold]Tuning:[/bold] {name}\n"
-            f"[bold]Skill:[/bold] [cyan]{skill_path}[/cyan]\n"
-            f"[bold]Evals:[/bold] {len(evals)}\n"
-            f"[bold]Target:[/bold] {target_pass_rate:.0f}% pass rate\n"
-            f"[bold]Max rounds:[/bold] {max_rounds}",
-            title="Skill Tuner",
-        )
+    _print_header(
+        name, skill_path, len(evals), target_pass_rate, max_rounds, candidates, beam_width
     )
 
     # Track display state
@@ -66,17 +94,21 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
         console.rule(f"[bold]Round {round_num}/{total_rounds}[/bold]")
         console.print()
 
-        # Build full task list upfront for display
+        # Build full task list upfront for display. Round 1 scores only the
+        # original skill; later beam rounds score every candidate at once.
+        round_candidates = 1 if round_num == 1 else candidates
         tasks = []
-        for eval_idx, eval_data in enumerate(evals):
-            for i in range(samples):
-                tasks.append(
-                    {
+        for candidate in range(round_candidates):
+            for eval_idx, eval_data in enumerate(evals):
+                for i in range(samples):
+                    task = {
                         "eval_idx": eval_idx,
                         "eval_source": eval_data["_source"],
                         "iteration": i + 1,
                     }
-                )
+                    if candidates > 1:
+                        task["candidate"] = candidate
+                    tasks.append(task)
 
         display = LiveDisplay(tasks)
         await display.start()
@@ -115,6 +147,11 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
         target_pass_rate=target_pass_rate,
         samples=samples,
         parallel=parallel,
+        skip_cache=skip_cache,
+        candidates=candidates,
+        beam_width=beam_width,
+        minibatch=minibatch,
+        rejection_confidence=rejection_confidence,
     )
     callbacks = TuneCallbacks(
         on_round_start=on_round_start,
@@ -130,6 +167,7 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
         config=config,
         callbacks=callbacks,
         evals_list=evals,
+        round_log=round_log,
     )
 
     print_tune_result(result)
@@ -137,5 +175,6 @@ async def tune_command(  # noqa: C901 - complexity from inline display callbacks
     # Save results (always saves, either to provided path or default)
     result.save(output_path)
     console.print(f"\n[dim]Results saved to:[/dim] {output_path}")
+    console.print(f"[dim]Round log:[/dim] {round_log}")
 
     return result
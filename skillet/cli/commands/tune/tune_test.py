@@ -116,6 +116,7 @@ def describe_tune_command():
             target_pass_rate=90.0,
             samples=3,
             parallel=5,
+            skip_cache=True,
         )
         mock_tune.assert_called_once()
         call_args = mock_tune.call_args
@@ -127,6 +128,7 @@ def describe_tune_command():
         assert config.target_pass_rate == 90.0
         assert config.samples == 3
         assert config.parallel == 5
+        assert config.skip_cache is True
         # Callbacks are passed as a dataclass
         assert "callbacks" in call_args[1]
 
@@ -142,6 +144,12 @@ def describe_tune_command():
         await tune_command("my-evals", Path("/path/to/skill.md"))
         mock_tune_result.save.assert_called_once_with(Path("/tmp/output.json"))
 
+    @pytest.mark.asyncio
+    async def it_streams_rounds_next_to_the_output(mock_tune):
+        await tune_command("my-evals", Path("/skill.md"), output_path=Path("/custom/run.json"))
+
+        assert mock_tune.call_args[1]["round_log"] == Path("/custom/run.jsonl")
+
     @pytest.mark.asyncio
     async def it_uses_custom_output_path(mock_tune_result):
         """Uses custom output path when provided."""
@@ -161,3 +169,34 @@ def describe_tune_command():
         """Returns the TuneResult from tune function."""
         result = await tune_command("my-evals", Path("/path/to/skill.md"))
         assert result == mock_tune_result
+
+    @pytest.mark.asyncio
+    async def it_passes_beam_settings(mock_tune):
+        await tune_command("my-evals", Path("/skill.md"), candidates=4, beam_width=2)
+
+        config = mock_tune.call_args[1]["config"]
+        assert config.candidates == 4
+        assert config.beam_width == 2
+
+    @pytest.mark.asyncio
+    async def it_passes_racing_settings(mock_tune):
+        await tune_command("my-evals", Path("/skill.md"), minibatch=5, rejection_confidence=0.9)
+
+        config = mock_tune.call_args[1]["config"]
+        assert config.minibatch == 5
+        assert config.rejection_confidence == 0.9
+
+    @pytest.mark.asyncio
+    async def it_displays_every_candidate_in_beam_rounds(mock_tune, mock_live_display):
+        await tune_command("my-evals", Path("/skill.md"), samples=2, candidates=3)
+        on_round_start = mock_tune.call_args[1]["callbacks"].on_round_start
+
+        with patch("skillet.cli.commands.tune.tune.LiveDisplay") as mock_cls:
+            mock_cls.return_value = mock_live_display
+            await on_round_start(1, 5)
+            await on_round_start(2, 5)
+
+        first, second = (c.args[0] for c in mock_cls.call_args_list)
+        assert len(first) == 2
+        assert len(second) == 6
+        assert {t["candidate"] for t in second} == {0, 1, 2}
@@ -1,5 +1,6 @@
 """Display components for CLI."""
 
 from .live import LiveDisplay
+from .print_limit_stats import print_limit_stats
 
-__all__ = ["LiveDisplay"]
+__all__ = ["LiveDisplay", "print_limit_stats"]
@@ -0,0 +1,11 @@
+"""Format what evals shared of their agent runs for display."""
+
+
+def format_shared(shared_count: int, shared_turns: int) -> str | None:
+    """``3 responses reused, 8 turns from shared conversation prefixes``, or ``None``."""
+    parts = []
+    if shared_count:
+        parts.append(f"{shared_count} responses reused")
+    if shared_turns:
+        parts.append(f"{shared_turns} turns from shared conversation prefixes")
+    return ", ".join(parts) or None
@@ -0,0 +1,16 @@
+"""Tests for format_shared."""
+
+from skillet.cli.display.format_shared import format_shared
+
+
+def describe_format_shared():
+    def it_lists_reused_responses_and_turns():
+        assert format_shared(3, 8) == (
+            "3 responses reused, 8 turns from shared conversation prefixes"
+        )
+
+    def it_leaves_out_what_was_not_shared():
+        assert format_shared(0, 2) == "2 turns from shared conversation prefixes"
+
+    def it_returns_none_when_nothing_was_shared():
+        assert format_shared(0, 0) is None
@@ -0,0 +1,11 @@
+"""Format agent usage for display."""
+
+from skillet._internal.sdk import Usage
+
+
+def format_usage(usage: Usage) -> str:
+    """``12,345 tokens, $0.4200``; the cost is left out when none was reported."""
+    text = f"{usage.total_tokens:,} tokens"
+    if usage.cost_usd is not None:
+        text += f", ${usage.cost_usd:.4f}"
+    return text
@@ -0,0 +1,13 @@
+"""Tests for format_usage."""
+
+from skillet._internal.sdk import Usage
+from skillet.cli.display.format_usage import format_usage
+
+
+def describe_format_usage():
+    def it_shows_tokens_and_cost():
+        usage = Usage(input_tokens=12_000, output_tokens=345, cost_usd=0.42)
+        assert format_usage(usage) == "12,345 tokens, $0.4200"
+
+    def it_leaves_out_an_unreported_cost():
+        assert format_usage(Usage(output_tokens=7)) == "7 tokens"
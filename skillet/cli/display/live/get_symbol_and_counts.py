@@ -1,6 +1,6 @@
 """Resolve an iteration's state to a display symbol and pass/done flags."""
 
-from .status_symbols import CACHED, FAIL, PASS, PENDING, RUNNING
+from .status_symbols import CACHED, FAIL, MISSING, PASS, PENDING, RUNNING
 
 
 def get_symbol_and_counts(it: dict) -> tuple[str, bool, bool]:
@@ -10,6 +10,9 @@ def get_symbol_and_counts(it: dict) -> tuple[str, bool, bool]:
         return PENDING, False, False
     if state == "running":
         return RUNNING, False, False
+    if state == "missing":
+        # Not in the cache (cache-only runs): finished, with no result
+        return MISSING, False, True
     # cached or done
     passed = it["result"] and it["result"].get("pass")
     if state == "cached":
@@ -3,7 +3,7 @@
 import pytest
 
 from .get_symbol_and_counts import get_symbol_and_counts
-from .status_symbols import CACHED, FAIL, PASS, PENDING, RUNNING
+from .status_symbols import CACHED, FAIL, MISSING, PASS, PENDING, RUNNING
 
 
 @pytest.mark.parametrize(
@@ -16,6 +16,7 @@ from .status_symbols import CACHED, FAIL, PASS, PENDING, RUNNING
         ("done", {"pass": True}, PASS, True, True),
         ("done", {"pass": False}, FAIL, False, True),
         ("done", None, FAIL, None, True),  # None result -> passed is None (falsy)
+        ("missing", None, MISSING, False, True),
     ],
     ids=[
         "pending",
@@ -25,6 +26,7 @@ from .status_symbols import CACHED, FAIL, PASS, PENDING, RUNNING
         "done_pass",
         "done_fail",
         "done_none_result",
+        "missing",
     ],
 )
 def test_get_symbol_and_counts(state, result, expected_symbol, expected_passed, expected_done):
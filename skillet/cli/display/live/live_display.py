@@ -10,7 +10,7 @@ from ..get_rate_color import get_rate_color
 from .get_symbol_and_counts import get_symbol_and_counts
 from .group_tasks_by_eval import group_tasks_by_eval
 from .make_task_key import make_task_key
-from .status_symbols import FAIL, PASS, PENDING
+from .status_symbols import FAIL, MISSING, PASS, PENDING
 
 console = Console()
 
@@ -36,7 +36,7 @@ class LiveDisplay:
 
     def _count_by_status(self) -> dict[str, int]:
         """Count samples by status category."""
-        counts = {"pass": 0, "fail": 0, "running": 0, "cached": 0, "pending": 0}
+        counts = {"pass": 0, "fail": 0, "running": 0, "cached": 0, "pending": 0, "missing": 0}
         for s in self.status.values():
             state = s["state"]
             if state == "pending":
@@ -45,6 +45,8 @@ class LiveDisplay:
                 counts["running"] += 1
             elif state == "cached":
                 counts["cached"] += 1
+            elif state == "missing":
+                counts["missing"] += 1
             else:
                 result = s["result"]
                 if isinstance(result, dict) and result.get("pass"):
@@ -66,6 +68,8 @@ class LiveDisplay:
             parts.append(f"[yellow]◐ {counts['running']}[/yellow]")
         if counts["pending"]:
             parts.append(f"[dim]○ {counts['pending']}[/dim]")
+        if counts["missing"]:
+            parts.append(f"[dim]- {counts['missing']} missing[/dim]")
         return "  ".join(parts)
 
     def _build_compact_table(self) -> Table:
@@ -102,8 +106,9 @@ class LiveDisplay:
                     done_count += 1
 
             row_content = " ".join(symbols)
-            if done_count == len(iterations) and done_count > 0:
-                pct = pass_count / len(iterations) * 100
+            graded = sum(1 for it in iterations if it["state"] != "missing")
+            if done_count == len(iterations) and graded > 0:
+                pct = pass_count / graded * 100
                 pct_color = get_rate_color(pct)
                 row_content += f" [{pct_color}]({pct:.0f}%)[/{pct_color}]"
 
@@ -129,6 +134,32 @@ class LiveDisplay:
             if self.live:
                 self.live.update(self._build_table())
 
+    async def set_tasks(self, tasks: list[dict]):
+        """Replace the task list, e.g. after evals were added, removed or edited.
+
+        Tasks matching an existing one by eval source and iteration keep its
+        status; new tasks start pending.
+        """
+        async with self.lock:
+            previous = {
+                (t["eval_source"], t["iteration"]): self.status[make_task_key(t)]
+                for t in self.tasks
+            }
+            self.tasks = tasks
+            self.status = {
+                make_task_key(t): previous.get(
+                    (t["eval_source"], t["iteration"]), {"state": "pending", "result": None}
+                )
+                for t in tasks
+            }
+            self._eval_count = len({t["eval_idx"] for t in tasks})
+            if self.live:
+                self.live.update(self._build_table())
+
+    def log(self, message: str):
+        """Print a line above the live table without disturbing it."""
+        console.print(message)
+
     def finalize(self):
         """Print final state with pass rates."""
         if self._should_compact():
@@ -149,10 +180,13 @@ class LiveDisplay:
                         pass_count += 1
                     else:
                         symbols.append(FAIL)
+                elif it["state"] == "missing":
+                    symbols.append(MISSING)
                 else:
                     symbols.append(PENDING)
 
-            pct = pass_count / len(iterations) * 100 if iterations else 0
+            graded = sum(1 for it in iterations if it["state"] != "missing")
+            pct = pass_count / graded * 100 if graded else 0
             pct_color = get_rate_color(pct)
             console.print(
                 f"  [cyan]{eval_item['source']}[/cyan]: {' '.join(symbols)} "
@@ -50,6 +50,34 @@ def describe_LiveDisplay():
         table = display._build_table()
         assert table.row_count == 2
 
+    @pytest.mark.asyncio
+    async def it_keeps_status_by_eval_source_when_tasks_are_replaced():
+        tasks = [
+            {"eval_idx": 0, "iteration": 1, "eval_source": "a.yaml"},
+            {"eval_idx": 1, "iteration": 1, "eval_source": "b.yaml"},
+        ]
+        display = LiveDisplay(tasks)
+        await display.update(tasks[1], "done", {"pass": True})
+
+        # a.yaml removed, c.yaml added: b.yaml moves to row 0 and keeps its result
+        await display.set_tasks(
+            [
+                {"eval_idx": 0, "iteration": 1, "eval_source": "b.yaml"},
+                {"eval_idx": 1, "iteration": 1, "eval_source": "c.yaml"},
+            ]
+        )
+
+        assert display.status == {
+            "0:1": {"state": "done", "result": {"pass": True}},
+            "1:1": {"state": "pending", "result": None},
+        }
+        assert display._build_table().row_count == 2
+
+    def it_logs_through_its_console(capsys):
+        LiveDisplay([]).log("Skill changed: 2 evals")
+
+        assert "Skill changed: 2 evals" in capsys.readouterr().out
+
     @pytest.mark.asyncio
     async def it_updates_task_status():
         tasks = [{"eval_idx": 0, "iteration": 0, "eval_source": "test.yaml"}]
@@ -164,6 +192,22 @@ def describe_LiveDisplay():
         assert "100%" in captured.out
         mock_get_rate_color.assert_called_with(100.0)
 
+    @patch("skillet.cli.display.live.live_display.get_rate_color", return_value="green")
+    def it_finalize_rates_only_iterations_found_in_the_cache(mock_get_rate_color, capsys):
+        tasks = [
+            {"eval_idx": 0, "iteration": 0, "eval_source": "partial.yaml"},
+            {"eval_idx": 0, "iteration": 1, "eval_source": "partial.yaml"},
+        ]
+        display = LiveDisplay(tasks)
+
+        display.status["0:0"] = {"state": "cached", "result": {"pass": True}}
+        display.status["0:1"] = {"state": "missing", "result": None}
+
+        display.finalize()
+        captured = capsys.readouterr()
+        assert "100%" in captured.out
+        mock_get_rate_color.assert_called_with(100.0)
+
     @patch("skillet.cli.display.live.live_display.get_rate_color", return_value="red")
     def it_finalize_handles_pending_tasks(mock_get_rate_color, capsys):
         tasks = [
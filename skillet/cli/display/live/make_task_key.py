@@ -2,5 +2,15 @@
 
 
 def make_task_key(task: dict) -> str:
-    """Build the status-dict key for a task."""
-    return f"{task['eval_idx']}:{task['iteration']}"
+    """Build the status-dict key for a task.
+
+    Tune's beam mode runs several candidates over the same evals at once and
+    tags their tasks with ``candidate``; a comparative eval tags them with
+    ``variant``. Either then prefixes the key.
+    """
+    key = f"{task['eval_idx']}:{task['iteration']}"
+    if "candidate" in task:
+        return f"{task['candidate']}/{key}"
+    if "variant" in task:
+        return f"{task['variant']}/{key}"
+    return key
@@ -9,3 +9,10 @@ def describe_make_task_key():
 
     def it_handles_large_indices():
         assert make_task_key({"eval_idx": 42, "iteration": 99}) == "42:99"
+
+    def it_prefixes_the_candidate_when_present():
+        assert make_task_key({"eval_idx": 1, "iteration": 2, "candidate": 3}) == "3/1:2"
+
+    def it_prefixes_the_variant_when_present():
+        task = {"eval_idx": 1, "iteration": 2, "variant": "codex/skill"}
+        assert make_task_key(task) == "codex/skill/1:2"
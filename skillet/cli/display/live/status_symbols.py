@@ -5,3 +5,4 @@ CACHED = "[blue]●[/blue]"
 RUNNING = "[yellow]◐[/yellow]"
 PASS = "[green]✓[/green]"
 FAIL = "[red]✗[/red]"
+MISSING = "[dim]-[/dim]"
@@ -0,0 +1,29 @@
+"""Print how agent calls queued on their budgets."""
+
+from typing import Any
+
+from skillet.cli import console
+
+
+def _describe_limit(stats: dict[str, Any]) -> str:
+    parts = []
+    if stats["max_concurrent"] is not None:
+        parts.append(f"{stats['max_concurrent']} at once")
+    if stats["per_minute"] is not None:
+        parts.append(f"{stats['per_minute']:g}/min")
+        if stats["burst"] > 1:
+            parts.append(f"bursts of {stats['burst']}")
+    return ", ".join(parts)
+
+
+def print_limit_stats(stats: dict[str, dict[str, Any]]) -> None:
+    """Print one line per budget: its limits, calls, peak queue depth and total wait."""
+    if not stats:
+        return
+    console.print()
+    console.print("[bold]Agent budgets[/bold]")
+    for label, s in stats.items():
+        console.print(
+            f"  {label} [dim]({_describe_limit(s)})[/dim]: {s['acquired']} calls, "
+            f"peak queue {s['peak_waiting']}, waited {s['total_wait_seconds']:.1f}s"
+        )
@@ -0,0 +1,44 @@
+"""Tests for print_limit_stats."""
+
+from unittest.mock import patch
+
+from skillet.cli.display.print_limit_stats import print_limit_stats
+
+
+def _stats(**overrides):
+    return {
+        "max_concurrent": 2,
+        "per_minute": None,
+        "burst": 1,
+        "in_flight": 0,
+        "waiting": 0,
+        "peak_waiting": 3,
+        "acquired": 12,
+        "total_wait_seconds": 4.25,
+    } | overrides
+
+
+def describe_print_limit_stats():
+    def it_prints_nothing_without_budgets():
+        with patch("skillet.cli.display.print_limit_stats.console") as console:
+            print_limit_stats({})
+
+        console.print.assert_not_called()
+
+    def it_prints_one_line_per_budget():
+        with patch("skillet.cli.display.print_limit_stats.console") as console:
+            print_limit_stats(
+                {
+                    "judge": _stats(),
+                    "claude": _stats(max_concurrent=None, per_minute=60, burst=10),
+                }
+            )
+
+        lines = [c.args[0] for c in console.print.call_args_list if c.args]
+        assert any(
+            "judge" in line and "2 at once" in line and "peak queue 3" in line for line in lines
+        )
+        assert any(
+            "claude" in line and "60/min, bursts of 10" in line and "waited 4.2s" in line
+            for line in lines
+        )
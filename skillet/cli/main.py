@@ -2,11 +2,15 @@
 # skillet: allow-multiple-public-callables
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 from cyclopts import App, Parameter
 
 from skillet.agent import Agent
+from skillet.config import DEFAULT_DEDUPE_THRESHOLD
+
+if TYPE_CHECKING:
+    from skillet.eval import JudgeTiers
 
 app = App(
     name="skillet",
@@ -14,19 +18,81 @@ app = App(
 )
 
 
+def _configure_limits(limit: list[str] | None) -> None:
+    """Apply ``SKILLET_LIMITS`` and ``--limit`` budgets, exiting 2 if either is invalid.
+
+    They replace whatever budgets an earlier command in this process set.
+    """
+    import shlex
+
+    from skillet import config
+    from skillet._internal.agent import get_scheduler, parse_limits
+    from skillet.cli import console
+
+    try:
+        specs = [*shlex.split(config.LIMITS), *(limit or [])]
+        get_scheduler().set_limits(parse_limits(specs))
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise SystemExit(2) from None
+
+
+def _judge_tiers(fast_judge: str | None, escalate_below: float) -> "JudgeTiers | None":
+    """Build the judging tiers for ``--fast-judge``, exiting 2 on a bad threshold."""
+    from skillet.cli import console
+    from skillet.eval import JudgeTiers
+
+    if not 0 <= escalate_below <= 1:
+        console.print("[red]Error:[/red] --escalate-below must be between 0 and 1")
+        raise SystemExit(2)
+    return JudgeTiers(fast_judge, escalate_below) if fast_judge else None
+
+
+def _check_subset(budget: int | None, max_evals: int | None) -> None:
+    """Exit 2 if ``--budget`` is below 1 or combined with ``--max-evals``."""
+    from skillet.cli import console
+
+    if budget is not None and max_evals is not None:
+        console.print("[red]Error:[/red] --budget and --max-evals cannot be combined")
+        raise SystemExit(2)
+    if budget is not None and budget < 1:
+        console.print("[red]Error:[/red] --budget must be at least 1")
+        raise SystemExit(2)
+
+
+def _print_limit_stats() -> None:
+    from skillet._internal.agent import get_scheduler
+    from skillet.cli.display import print_limit_stats
+
+    print_limit_stats(get_scheduler().stats())
+
+
 @app.command
 async def eval(  # noqa: PLR0913
     name: str,
     skill: Annotated[Path | None, Parameter(name="skill")] = None,
     *,
-    agent: Annotated[Agent, Parameter(name=["--agent"])],
+    agent: Annotated[list[Agent], Parameter(name=["--agent"])],
+    compare_baseline: Annotated[bool, Parameter(name=["--compare-baseline"])] = False,
     samples: Annotated[int, Parameter(name=["--samples", "-s"])] = 3,
     max_evals: Annotated[int | None, Parameter(name=["--max-evals", "-m"])] = None,
+    budget: Annotated[int | None, Parameter(name=["--budget"])] = None,
+    seed: Annotated[int | None, Parameter(name=["--seed"])] = None,
     tools: Annotated[str | None, Parameter(name=["--tools"])] = None,
     parallel: Annotated[int, Parameter(name=["--parallel", "-p"])] = 3,
     skip_cache: Annotated[bool, Parameter(name=["--skip-cache"])] = False,
     trust: Annotated[bool, Parameter(name=["--trust"])] = False,
     no_summary: Annotated[bool, Parameter(name=["--no-summary"])] = False,
+    limit: Annotated[list[str] | None, Parameter(name=["--limit"])] = None,
+    watch: Annotated[bool, Parameter(name=["--watch"])] = False,
+    cached_only: Annotated[bool, Parameter(name=["--cached-only"])] = False,
+    fail_fast_assertions: Annotated[bool, Parameter(name=["--fail-fast-assertions"])] = False,
+    fast_judge: Annotated[str | None, Parameter(name=["--fast-judge"])] = None,
+    escalate_below: Annotated[float, Parameter(name=["--escalate-below"])] = 0.8,
+    sandbox: Annotated[bool, Parameter(name=["--sandbox"])] = False,
+    max_cost: Annotated[float | None, Parameter(name=["--max-cost"])] = None,
+    max_tokens: Annotated[int | None, Parameter(name=["--max-tokens"])] = None,
+    no_share_runs: Annotated[bool, Parameter(name=["--no-share-runs"])] = False,
 ):
     """Evaluate a coding agent against captured evals.
 
@@ -39,11 +105,74 @@ async def eval(  # noqa: PLR0913
     the skill and judges the result, each through its own CLI. The flag is
     required; there is no default and skillet never silently falls back.
 
-    Results are cached by eval content hash, agent, and skill content hash.
+    Repeat --agent (e.g. --agent claude --agent codex) and/or add
+    --compare-baseline (with SKILL) to compare variants in one run: evals are
+    loaded once, every variant's runs are scheduled together (-p applies per
+    agent), and the results are shown side by side with per-eval deltas
+    against the first variant.
+
+    Responses are cached by prompt and setup, agent, skill content hash and
+    --tools; grades are cached beside them by the eval's grading criteria, so
+    editing only assertions or expected re-grades without re-running the agent.
+
+    --cached-only reports from the cache alone: nothing is run, and iterations
+    with no cached response show as missing. Cached responses whose grade is
+    stale are skipped too; `skillet regrade` grades them.
+
+    --fail-fast-assertions kills a run as soon as the agent calls a tool one
+    of the eval's tool_not_called assertions forbids, and grades the partial
+    transcript. Such runs fail anyway, so negative evals stop paying for the
+    rest of the session. Stopped runs are not cached.
+
+    --fast-judge MODEL has the judge try a cheaper model first (passed to the
+    judge CLI's --model). Its verdict stands when it is at least
+    --escalate-below confident (default 0.8); otherwise the default judge
+    decides. Evals with a gate check those assertions before any judge. The
+    run reports how many grades each tier decided and how long it took.
+
+    --sandbox runs every iteration in its own clone of the project (the
+    directory holding SKILL's .claude or .codex), so agents that write files
+    can run at a high -p without racing. Setup and teardown run against the
+    clone. Files are reflinked where the filesystem supports it and copied
+    otherwise; set SKILLET_WORKSPACE_DIR to a directory on the project's
+    filesystem for reflinks. Clones are deleted in the background.
+
+    --max-cost USD and --max-tokens N cap what fresh runs may spend, as the
+    agent CLI reports it: once either is reached no new run starts, and the
+    runs left are reported as skipped. Runs already going finish. Codex
+    reports no cost, so only --max-tokens caps it. The tokens and cost of
+    the fresh runs, and the costliest evals, are printed after the run.
+
+    Evals with the same prompt, setup and teardown share their agent runs:
+    the agent runs once per sample and each eval grades that response with
+    its own expected or assertions. The run reports how many responses were
+    shared. --no-share-runs gives every eval its own runs.
+
+    --limit KEY=SPEC budgets agent calls on top of -p. KEY is an agent
+    (claude), a role (run, judge, summarize) or both (claude.judge); SPEC is
+    N calls at once, N/m calls started per minute, or both (2,30/m). Repeat
+    it for several budgets; SKILLET_LIMITS sets defaults the same way
+    (space-separated). Budgets that queued are reported after the run.
+
+    --budget N runs a stable, representative subset of at most N evals instead
+    of a random one: evals are clustered by prompt similarity so every topic is
+    covered, and within each cluster evals whose cached outcomes vary are
+    preferred over ones that always pass or always fail. Same suite and cache,
+    same subset. It replaces random sampling, so it cannot be combined with -m.
+
+    -m draws its sample proportionally from each _meta category (or, without
+    one, each subdirectory). --seed makes the draw reproducible, so re-runs
+    pick the same evals and hit the same cache entries.
 
     Without SKILL: measures baseline performance (no skill active)
     With SKILL: measures performance with the skill loaded
 
+    --watch keeps running: after the first run it polls the eval files and
+    SKILL once a second and re-runs only what a change affects. A skill edit
+    re-runs every eval; an eval edit re-runs that eval. The live display stays
+    open across runs; stop with Ctrl-C. It cannot be combined with
+    --compare-baseline, a repeated --agent, -m or --budget.
+
     SECURITY: Evals may contain setup/teardown scripts that execute shell commands.
     You will be prompted before running evals with scripts. Use --trust to skip
     the prompt (for automation or when you've reviewed the scripts).
@@ -54,14 +183,100 @@ async def eval(  # noqa: PLR0913
         skillet eval ./evals/my-skill/001.yaml skill/ --agent claude  # single file
         skillet eval browser-fallback --agent claude -s 5          # 5 samples per eval
         skillet eval my-skill --agent claude -m 5 -s 1             # 5 random evals, 1 sample each
+        skillet eval my-skill --agent claude -m 5 --seed 42        # same 5 evals every run
+        skillet eval my-skill --agent claude --budget 10           # 10 representative evals
         skillet eval my-skill --agent claude -p 5                  # 5 parallel workers
+        skillet eval my-skill --agent claude --limit judge=2       # at most 2 judges at once
+        skillet eval my-skill --agent claude --limit claude=60/m   # 60 claude calls a minute
         skillet eval my-skill --agent claude --skip-cache          # ignore cached results
         skillet eval my-skill --agent claude --trust               # skip script confirmation
         skillet eval my-skill --agent claude --no-summary          # skip failure summary
+        skillet eval my-skill skill/ --agent claude --watch        # re-run on every edit
+        skillet eval my-skill skill/ --agent claude --cached-only  # report without running
+        skillet eval my-skill --agent claude --fail-fast-assertions  # stop doomed runs early
+        skillet eval my-skill --agent claude --fast-judge haiku    # cheap judge first
+        skillet eval my-skill skill/ --agent claude --sandbox -p 10  # a project clone per run
+        skillet eval my-skill --agent claude --max-cost 5          # stop starting runs at $5
+        skillet eval my-skill --agent claude --agent codex         # claude vs codex
+        skillet eval my-skill skill/ --agent claude --compare-baseline  # baseline vs skill
     """
-    from skillet.cli.commands.eval import eval_command
+    from skillet.cli import console
+    from skillet.cli.commands.eval import compare_command, eval_command, watch_command
 
+    _check_subset(budget, max_evals)
+    if compare_baseline and skill is None:
+        console.print("[red]Error:[/red] --compare-baseline needs a SKILL to compare against")
+        raise SystemExit(2)
+    if len(set(agent)) != len(agent):
+        console.print("[red]Error:[/red] each --agent may only be given once")
+        raise SystemExit(2)
+
+    if watch and (
+        len(agent) > 1 or compare_baseline or max_evals is not None or budget is not None
+    ):
+        console.print(
+            "[red]Error:[/red] --watch runs one agent over every eval; drop "
+            "--compare-baseline, extra --agent flags, --max-evals and --budget"
+        )
+        raise SystemExit(2)
+    if cached_only and (watch or skip_cache or len(agent) > 1 or compare_baseline):
+        console.print(
+            "[red]Error:[/red] --cached-only reports one agent from the cache; drop "
+            "--watch, --skip-cache, --compare-baseline and extra --agent flags"
+        )
+        raise SystemExit(2)
+    if fast_judge and len(agent) > 1:
+        console.print("[red]Error:[/red] --fast-judge names one agent's model; give one --agent")
+        raise SystemExit(2)
+    if (max_cost is not None and max_cost <= 0) or (max_tokens is not None and max_tokens <= 0):
+        console.print("[red]Error:[/red] --max-cost and --max-tokens must be positive")
+        raise SystemExit(2)
+
+    judge_tiers = _judge_tiers(fast_judge, escalate_below)
+    _configure_limits(limit)
     allowed_tools = [t.strip() for t in tools.split(",")] if tools else None
+    if watch:
+        await watch_command(
+            name,
+            skill,
+            agent=agent[0],
+            samples=samples,
+            allowed_tools=allowed_tools,
+            parallel=parallel,
+            skip_cache=skip_cache,
+            trust=trust,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=not no_share_runs,
+        )
+        return
+    if len(agent) > 1 or compare_baseline:
+        await compare_command(
+            name,
+            agents=agent,
+            skill_path=skill,
+            compare_baseline=compare_baseline,
+            samples=samples,
+            max_evals=max_evals,
+            budget=budget,
+            seed=seed,
+            allowed_tools=allowed_tools,
+            parallel=parallel,
+            skip_cache=skip_cache,
+            trust=trust,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=not no_share_runs,
+        )
+        _print_limit_stats()
+        return
+
     await eval_command(
         name,
         skill_path=skill,
@@ -72,12 +287,70 @@ async def eval(  # noqa: PLR0913
         skip_cache=skip_cache,
         trust=trust,
         no_summary=no_summary,
+        agent=agent[0],
+        budget=budget,
+        seed=seed,
+        cached_only=cached_only,
+        fail_fast_assertions=fail_fast_assertions,
+        judge_tiers=judge_tiers,
+        sandbox=sandbox,
+        max_cost=max_cost,
+        max_tokens=max_tokens,
+        share_runs=not no_share_runs,
+    )
+    _print_limit_stats()
+
+
+@app.command
+async def regrade(  # noqa: PLR0913
+    name: str,
+    skill: Annotated[Path | None, Parameter(name="skill")] = None,
+    *,
+    agent: Annotated[Agent, Parameter(name=["--agent"])],
+    samples: Annotated[int, Parameter(name=["--samples", "-s"])] = 3,
+    tools: Annotated[str | None, Parameter(name=["--tools"])] = None,
+    parallel: Annotated[int, Parameter(name=["--parallel", "-p"])] = 3,
+    skip_cache: Annotated[bool, Parameter(name=["--skip-cache"])] = False,
+    limit: Annotated[list[str] | None, Parameter(name=["--limit"])] = None,
+    fast_judge: Annotated[str | None, Parameter(name=["--fast-judge"])] = None,
+    escalate_below: Annotated[float, Parameter(name=["--escalate-below"])] = 0.8,
+):
+    """Grade cached responses against the evals' current criteria.
+
+    Takes the same NAME, SKILL, --agent, -s and --tools as `skillet eval` and
+    reads the responses that run cached, without running the agent or any
+    setup/teardown script. Each response is graded with the eval's current
+    assertions, or its expected behavior and the judge prompt; a grade already
+    cached for those criteria is reused unless --skip-cache is given. Only
+    judges are called, -p at a time. Iterations with no cached response show
+    as missing. --fast-judge and --escalate-below tier the judge as in
+    `skillet eval`.
+
+    Examples:
+        skillet regrade my-skill skill/ --agent claude        # after editing assertions
+        skillet regrade my-skill --agent claude -s 5          # baseline, 5 samples
+        skillet regrade my-skill skill/ --agent claude --skip-cache  # re-judge everything
+    """
+    from skillet.cli.commands.eval import eval_command
+
+    judge_tiers = _judge_tiers(fast_judge, escalate_below)
+    _configure_limits(limit)
+    await eval_command(
+        name,
+        skill_path=skill,
+        samples=samples,
+        allowed_tools=[t.strip() for t in tools.split(",")] if tools else None,
+        parallel=parallel,
+        skip_cache=skip_cache,
         agent=agent,
+        regrade=True,
+        judge_tiers=judge_tiers,
     )
+    _print_limit_stats()
 
 
 @app.command
-async def tune(
+async def tune(  # noqa: PLR0913
     name: str,
     skill: Path,
     *,
@@ -86,6 +359,12 @@ async def tune(
     samples: Annotated[int, Parameter(name=["--samples", "-s"])] = 1,
     parallel: Annotated[int, Parameter(name=["--parallel", "-p"])] = 3,
     output: Annotated[Path | None, Parameter(name=["--output", "-o"])] = None,
+    skip_cache: Annotated[bool, Parameter(name=["--skip-cache"])] = False,
+    candidates: Annotated[int, Parameter(name=["--candidates"])] = 1,
+    beam_width: Annotated[int, Parameter(name=["--beam-width"])] = 1,
+    minibatch: Annotated[int, Parameter(name=["--minibatch"])] = 0,
+    rejection_confidence: Annotated[float, Parameter(name=["--rejection-confidence"])] = 0.95,
+    limit: Annotated[list[str] | None, Parameter(name=["--limit"])] = None,
 ):
     """Iteratively tune a skill until evals pass.
 
@@ -96,6 +375,25 @@ async def tune(
     All iterations are also saved in the output JSON.
 
     Results are saved to ~/.skillet/tunes/{eval_name}/{timestamp}.json by default.
+    Each round's full eval results (responses, tool calls) are appended to a
+    .jsonl log beside it as the round finishes, so an interrupted tune keeps
+    its progress.
+
+    Each candidate is evaluated through the eval cache, keyed by its content
+    hash, so a candidate seen before (this session or an earlier one) is not
+    re-run. Scores from earlier sessions also inform the proposer. Use
+    --skip-cache to re-run every candidate.
+
+    --candidates K turns each round into a beam search: K candidates are
+    proposed from the --beam-width best seen so far and evaluated concurrently,
+    sharing the -p budget. The results JSON records the whole search tree.
+
+    --minibatch N races each proposed candidate on N evals first. A candidate
+    that cannot beat the best so far (Hoeffding bound at
+    --rejection-confidence, default 0.95) is rejected there; of the rest, the
+    better half is scored on the remaining evals.
+
+    --limit KEY=SPEC budgets agent calls as for `skillet eval`.
 
     Examples:
         skillet tune browser-fallback ~/.claude/skills/browser-fallback
@@ -103,9 +401,13 @@ async def tune(
         skillet tune browser-fallback ~/.claude/skills/browser-fallback -r 10
         skillet tune browser-fallback ~/.claude/skills/browser-fallback -s 3
         skillet tune browser-fallback skill/ -o custom_output.json
+        skillet tune browser-fallback skill/ --skip-cache
+        skillet tune browser-fallback skill/ --candidates 4 --beam-width 2
+        skillet tune browser-fallback skill/ --candidates 4 --minibatch 5
     """
     from skillet.cli.commands.tune import tune_command
 
+    _configure_limits(limit)
     await tune_command(
         name,
         skill,
@@ -114,7 +416,13 @@ async def tune(
         samples=samples,
         parallel=parallel,
         output_path=output,
+        skip_cache=skip_cache,
+        candidates=candidates,
+        beam_width=beam_width,
+        minibatch=minibatch,
+        rejection_confidence=rejection_confidence,
     )
+    _print_limit_stats()
 
 
 @app.command
@@ -180,6 +488,11 @@ async def generate_evals_cmd(
     output: Annotated[Path | None, Parameter(name=["--output", "-o"])] = None,
     max_per_category: Annotated[int, Parameter(name=["--max"])] = 5,
     domain: Annotated[list[str] | None, Parameter(name=["--domain", "-d"])] = None,
+    dedupe_threshold: Annotated[
+        float, Parameter(name=["--dedupe-threshold"])
+    ] = DEFAULT_DEDUPE_THRESHOLD,
+    no_dedupe: Annotated[bool, Parameter(name=["--no-dedupe"])] = False,
+    limit: Annotated[list[str] | None, Parameter(name=["--limit"])] = None,
 ):
     """Generate candidate evals from a SKILL.md.
 
@@ -187,22 +500,106 @@ async def generate_evals_cmd(
     candidates, each through its own CLI. The flag is required; there is no
     default and skillet never silently falls back.
 
+    Candidates whose prompt is a near-duplicate of an eval already in the
+    output directory (or of another candidate) are skipped. Similarity is
+    estimated locally with MinHash; tune the cutoff with --dedupe-threshold
+    or disable the check with --no-dedupe.
+
+    --limit KEY=SPEC budgets agent calls as for `skillet eval` (e.g.
+    --limit generate=10/m).
+
     Examples:
         skillet generate-evals path/to/SKILL.md --agent claude
         skillet generate-evals path/to/SKILL.md --agent codex --domain triggering
         skillet generate-evals path/to/SKILL.md --agent claude -d triggering -d functional
+        skillet generate-evals path/to/SKILL.md --agent claude --dedupe-threshold 0.9
     """
     from skillet.cli.commands.generate_evals import generate_evals_command
 
+    _configure_limits(limit)
     await generate_evals_command(
         skill,
         agent=agent,
         output_dir=output,
         max_per_category=max_per_category,
         domain=domain,
+        dedupe_threshold=None if no_dedupe else dedupe_threshold,
     )
 
 
+cache_app = App(name="cache", help="Inspect and clean the eval cache.")
+app.command(cache_app)
+
+
+@cache_app.command
+def stats(name: str | None = None):
+    """Show cache size and contents per eval set.
+
+    For each eval set: cached iterations, distinct evals, skill versions, size
+    on disk and when an entry was last used. Pass NAME for one set only.
+
+    Examples:
+        skillet cache stats
+        skillet cache stats my-skill
+    """
+    from skillet.cli.commands.cache import cache_stats_command
+
+    cache_stats_command(name)
+
+
+@cache_app.command
+def gc(
+    name: str,
+    *,
+    skill: Annotated[list[Path] | None, Parameter(name=["--skill"])] = None,
+    dry_run: Annotated[bool, Parameter(name=["--dry-run"])] = False,
+):
+    """Remove cached runs of evals (and skills) that no longer exist.
+
+    Cache entries are keyed by each eval's content hash, so editing or
+    deleting an eval strands its old entries. gc loads NAME's evals and
+    deletes entries matching none of them. With --skill (repeatable), skill
+    entries are also kept only for those skills' current content; baseline
+    entries are always kept.
+
+    Safe to run while evals are running: only files are deleted, and an eval
+    that loses an entry mid-read simply re-runs it.
+
+    Examples:
+        skillet cache gc my-skill
+        skillet cache gc my-skill --skill ~/.claude/skills/my-skill
+        skillet cache gc my-skill --dry-run
+    """
+    from skillet.cli.commands.cache import cache_gc_command
+
+    cache_gc_command(name, skill_paths=skill, dry_run=dry_run)
+
+
+@cache_app.command
+def prune(
+    *,
+    max_size: Annotated[str, Parameter(name=["--max-size"])],
+    dry_run: Annotated[bool, Parameter(name=["--dry-run"])] = False,
+):
+    """Evict least recently used cache entries until the cache fits in --max-size.
+
+    Eval results, tune score memos and LM responses are all considered; a
+    cache hit counts as a use. Safe to run while evals are running.
+
+    Examples:
+        skillet cache prune --max-size 500MB
+        skillet cache prune --max-size 2GB --dry-run
+    """
+    from skillet.cli import console
+    from skillet.cli.commands.cache import cache_prune_command
+
+    try:
+        cache_prune_command(max_size, dry_run=dry_run)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise SystemExit(2) from None
+
+
 def main():
     """Entry point for the CLI."""
     app()
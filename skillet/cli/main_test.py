@@ -7,8 +7,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from skillet._internal.agent import AgentScheduler
 from skillet.agent import Agent
-from skillet.cli.main import app, create, eval, main, tune
+from skillet.cli.main import app, create, eval, gc, main, prune, regrade, stats, tune
+from skillet.eval import JudgeTiers
 
 
 def describe_app():
@@ -17,6 +19,19 @@ def describe_app():
     def it_has_name():
         assert app.name == ("skillet",)
 
+    def it_defers_command_imports_until_a_command_runs():
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import skillet.cli.main, sys; "
+                "print(sorted({'pydantic', 'skillet.generate'} & sys.modules.keys()))",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.stdout.strip() == "[]", result.stderr
+
     def it_has_registered_commands():
         # Check that commands are registered
         assert hasattr(app, "_registered_commands")
@@ -39,7 +54,7 @@ def describe_eval_command():
             "skillet.cli.commands.eval.eval_command",
             new_callable=AsyncMock,
         ) as mock_cmd:
-            await eval("my-evals", agent=Agent.CLAUDE)
+            await eval("my-evals", agent=[Agent.CLAUDE])
 
             mock_cmd.assert_called_once()
             call_kwargs = mock_cmd.call_args[1]
@@ -54,11 +69,289 @@ def describe_eval_command():
             "skillet.cli.commands.eval.eval_command",
             new_callable=AsyncMock,
         ) as mock_cmd:
-            await eval("my-evals", tools="Read,Write,Bash", agent=Agent.CLAUDE)
+            await eval("my-evals", tools="Read,Write,Bash", agent=[Agent.CLAUDE])
 
             call_kwargs = mock_cmd.call_args[1]
             assert call_kwargs["allowed_tools"] == ["Read", "Write", "Bash"]
 
+    @pytest.mark.asyncio
+    async def it_passes_budget():
+        with patch(
+            "skillet.cli.commands.eval.eval_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            await eval("my-evals", budget=10, agent=[Agent.CLAUDE])
+
+            assert mock_cmd.call_args[1]["budget"] == 10
+
+    @pytest.mark.asyncio
+    async def it_passes_seed():
+        with patch(
+            "skillet.cli.commands.eval.eval_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            await eval("my-evals", max_evals=5, seed=42, agent=[Agent.CLAUDE])
+
+            assert mock_cmd.call_args[1]["seed"] == 42
+
+    @pytest.mark.asyncio
+    async def it_rejects_budget_with_max_evals():
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", budget=10, max_evals=5, agent=[Agent.CLAUDE])
+
+        assert exc_info.value.code == 2
+        mock_cmd.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("budget", [0, -3])
+    async def it_rejects_a_budget_below_one(budget):
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", budget=budget, agent=[Agent.CLAUDE])
+
+        assert exc_info.value.code == 2
+        mock_cmd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_compares_when_several_agents_are_given():
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_eval,
+            patch("skillet.cli.commands.eval.compare_command", new_callable=AsyncMock) as mock_cmp,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE, Agent.CODEX], samples=2)
+
+        mock_eval.assert_not_called()
+        assert mock_cmp.call_args[1]["agents"] == [Agent.CLAUDE, Agent.CODEX]
+        assert mock_cmp.call_args[1]["samples"] == 2
+        assert mock_cmp.call_args[1]["compare_baseline"] is False
+
+    @pytest.mark.asyncio
+    async def it_compares_baseline_against_the_skill():
+        with patch("skillet.cli.commands.eval.compare_command", new_callable=AsyncMock) as mock_cmp:
+            await eval("my-evals", Path("skill/"), agent=[Agent.CLAUDE], compare_baseline=True)
+
+        assert mock_cmp.call_args[1]["skill_path"] == Path("skill/")
+        assert mock_cmp.call_args[1]["compare_baseline"] is True
+
+    @pytest.mark.asyncio
+    async def it_rejects_compare_baseline_without_a_skill():
+        with (
+            patch("skillet.cli.commands.eval.compare_command", new_callable=AsyncMock) as mock_cmp,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], compare_baseline=True)
+
+        assert exc_info.value.code == 2
+        mock_cmp.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_applies_limit_budgets_before_running():
+        scheduler = AgentScheduler()
+        with (
+            patch("skillet._internal.agent.get_scheduler", return_value=scheduler),
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock),
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], limit=["judge=2", "claude=30/m"])
+
+        assert scheduler.stats()["judge"]["max_concurrent"] == 2
+        assert scheduler.stats()["claude"]["per_minute"] == 30
+
+    @pytest.mark.asyncio
+    async def it_drops_limits_set_by_an_earlier_command():
+        scheduler = AgentScheduler()
+        with (
+            patch("skillet._internal.agent.get_scheduler", return_value=scheduler),
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock),
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], limit=["judge=2", "claude=30/m"])
+            await eval("my-evals", agent=[Agent.CLAUDE], limit=["judge=10/m"])
+
+        stats = scheduler.stats()
+        assert set(stats) == {"judge"}
+        assert stats["judge"]["max_concurrent"] is None
+        assert stats["judge"]["per_minute"] == 10
+
+    @pytest.mark.asyncio
+    async def it_rejects_an_invalid_limit():
+        with (
+            patch("skillet._internal.agent.get_scheduler", return_value=AgentScheduler()),
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], limit=["judge=lots"])
+
+        assert exc_info.value.code == 2
+        mock_cmd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_watches_when_asked():
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_eval,
+            patch("skillet.cli.commands.eval.watch_command", new_callable=AsyncMock) as mock_watch,
+        ):
+            await eval("my-evals", Path("skill/"), agent=[Agent.CLAUDE], watch=True, samples=1)
+
+        mock_eval.assert_not_called()
+        assert mock_watch.call_args[0] == ("my-evals", Path("skill/"))
+        assert mock_watch.call_args[1]["agent"] is Agent.CLAUDE
+        assert mock_watch.call_args[1]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def it_rejects_watch_with_a_subset():
+        with (
+            patch("skillet.cli.commands.eval.watch_command", new_callable=AsyncMock) as mock_watch,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], watch=True, max_evals=3)
+
+        assert exc_info.value.code == 2
+        mock_watch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_rejects_watch_with_a_budget():
+        with (
+            patch("skillet.cli.commands.eval.watch_command", new_callable=AsyncMock) as mock_watch,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], watch=True, budget=3)
+
+        assert exc_info.value.code == 2
+        mock_watch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_rejects_repeated_agents():
+        with (
+            patch("skillet.cli.commands.eval.compare_command", new_callable=AsyncMock) as mock_cmp,
+            pytest.raises(SystemExit),
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE, Agent.CLAUDE])
+
+        mock_cmp.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_reports_from_cache_only():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE], cached_only=True)
+
+        assert mock_cmd.call_args[1]["cached_only"] is True
+
+    @pytest.mark.asyncio
+    async def it_passes_fail_fast_assertions_through():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE], fail_fast_assertions=True)
+
+        assert mock_cmd.call_args[1]["fail_fast_assertions"] is True
+
+    @pytest.mark.asyncio
+    async def it_tiers_the_judge_with_a_fast_model():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE], fast_judge="haiku", escalate_below=0.6)
+
+        assert mock_cmd.call_args[1]["judge_tiers"] == JudgeTiers("haiku", 0.6)
+
+    @pytest.mark.asyncio
+    async def it_passes_sandbox_through():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", Path("skill/"), agent=[Agent.CLAUDE], sandbox=True)
+
+        assert mock_cmd.call_args[1]["sandbox"] is True
+
+    @pytest.mark.asyncio
+    async def it_passes_usage_caps_through():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE], max_cost=2.5, max_tokens=1000)
+
+        assert mock_cmd.call_args[1]["max_cost"] == 2.5
+        assert mock_cmd.call_args[1]["max_tokens"] == 1000
+
+    @pytest.mark.asyncio
+    async def it_shares_runs_unless_told_not_to():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE])
+            await eval("my-evals", agent=[Agent.CLAUDE], no_share_runs=True)
+
+        assert [c[1]["share_runs"] for c in mock_cmd.call_args_list] == [True, False]
+
+    @pytest.mark.asyncio
+    async def it_rejects_a_non_positive_usage_cap():
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], max_tokens=0)
+
+        assert exc_info.value.code == 2
+        mock_cmd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_judges_untiered_by_default():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await eval("my-evals", agent=[Agent.CLAUDE])
+
+        assert mock_cmd.call_args[1]["judge_tiers"] is None
+
+    @pytest.mark.asyncio
+    async def it_rejects_an_escalation_threshold_out_of_range():
+        with (
+            patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], fast_judge="haiku", escalate_below=2)
+
+        assert exc_info.value.code == 2
+        mock_cmd.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_rejects_a_fast_judge_with_several_agents():
+        with (
+            patch("skillet.cli.commands.eval.compare_command", new_callable=AsyncMock) as mock_cmp,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE, Agent.CODEX], fast_judge="haiku")
+
+        assert exc_info.value.code == 2
+        mock_cmp.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def it_rejects_cached_only_with_watch():
+        with (
+            patch("skillet.cli.commands.eval.watch_command", new_callable=AsyncMock) as mock_watch,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            await eval("my-evals", agent=[Agent.CLAUDE], cached_only=True, watch=True)
+
+        assert exc_info.value.code == 2
+        mock_watch.assert_not_called()
+
+
+def describe_regrade_command():
+    """Tests for regrade CLI command."""
+
+    @pytest.mark.asyncio
+    async def it_regrades_through_eval_command():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await regrade("my-evals", Path("skill/"), agent=Agent.CODEX, tools="Read, Bash")
+
+        assert mock_cmd.call_args[0] == ("my-evals",)
+        kwargs = mock_cmd.call_args[1]
+        assert kwargs["skill_path"] == Path("skill/")
+        assert kwargs["agent"] is Agent.CODEX
+        assert kwargs["allowed_tools"] == ["Read", "Bash"]
+        assert kwargs["regrade"] is True
+        assert kwargs["judge_tiers"] is None
+
+    @pytest.mark.asyncio
+    async def it_regrades_with_a_fast_judge():
+        with patch("skillet.cli.commands.eval.eval_command", new_callable=AsyncMock) as mock_cmd:
+            await regrade("my-evals", agent=Agent.CLAUDE, fast_judge="haiku")
+
+        assert mock_cmd.call_args[1]["judge_tiers"] == JudgeTiers("haiku")
+
 
 def describe_tune_command():
     """Tests for tune CLI command."""
@@ -75,6 +368,39 @@ def describe_tune_command():
             call_kwargs = mock_cmd.call_args[1]
             assert call_kwargs["max_rounds"] == 5
             assert call_kwargs["target_pass_rate"] == 100.0
+            assert call_kwargs["skip_cache"] is False
+
+    @pytest.mark.asyncio
+    async def it_passes_skip_cache():
+        with patch(
+            "skillet.cli.commands.tune.tune_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            await tune("my-evals", Path("/skill"), skip_cache=True)
+
+            assert mock_cmd.call_args[1]["skip_cache"] is True
+
+    @pytest.mark.asyncio
+    async def it_passes_beam_settings():
+        with patch(
+            "skillet.cli.commands.tune.tune_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            await tune("my-evals", Path("/skill"), candidates=4, beam_width=2)
+
+            assert mock_cmd.call_args[1]["candidates"] == 4
+            assert mock_cmd.call_args[1]["beam_width"] == 2
+
+    @pytest.mark.asyncio
+    async def it_passes_racing_settings():
+        with patch(
+            "skillet.cli.commands.tune.tune_command",
+            new_callable=AsyncMock,
+        ) as mock_cmd:
+            await tune("my-evals", Path("/skill"), minibatch=5, rejection_confidence=0.9)
+
+            assert mock_cmd.call_args[1]["minibatch"] == 5
+            assert mock_cmd.call_args[1]["rejection_confidence"] == 0.9
 
 
 def describe_create_command():
@@ -95,6 +421,34 @@ def describe_create_command():
             assert "skills" in str(call_kwargs["output_dir"])
 
 
+def describe_cache_commands():
+    """Tests for the cache sub-commands."""
+
+    def it_shows_stats():
+        with patch("skillet.cli.commands.cache.cache_stats_command") as mock_cmd:
+            stats("my-evals")
+
+            mock_cmd.assert_called_once_with("my-evals")
+
+    def it_passes_gc_options():
+        with patch("skillet.cli.commands.cache.cache_gc_command") as mock_cmd:
+            gc("my-evals", skill=[Path("skill")], dry_run=True)
+
+            mock_cmd.assert_called_once_with("my-evals", skill_paths=[Path("skill")], dry_run=True)
+
+    def it_rejects_an_invalid_prune_size():
+        with pytest.raises(SystemExit) as exc:
+            prune(max_size="lots")
+
+        assert exc.value.code == 2
+
+    def it_parses_cache_commands_from_argv():
+        with patch("skillet.cli.commands.cache.cache_prune_command") as mock_cmd:
+            app(["cache", "prune", "--max-size", "1GB", "--dry-run"], result_action="return_value")
+
+            mock_cmd.assert_called_once_with("1GB", dry_run=True)
+
+
 def _get_param_line(help_text: str, long_flag: str) -> str:
     """Extract the parameter table line for a given long flag from help output."""
     for line in help_text.splitlines():
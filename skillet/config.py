@@ -7,3 +7,18 @@ CACHE_DIR = SKILLET_DIR / "cache"
 # Default tools to allow when evaluating with a skill
 # SlashCommand is needed to recognize /command syntax in prompts
 DEFAULT_SKILL_TOOLS = ["Skill", "SlashCommand", "Bash", "Read", "Write", "WebFetch"]
+
+# Estimated Jaccard similarity (over character shingles) at or above which a
+# generated eval is considered a re-phrasing of an eval we already have.
+# Kept here so the CLI can show the default without importing skillet.generate
+DEFAULT_DEDUPE_THRESHOLD = 0.8
+
+# Where `--sandbox` clones project directories; reflinks need the project's filesystem
+_workspace_dir = os.environ.get("SKILLET_WORKSPACE_DIR")
+WORKSPACE_DIR = Path(_workspace_dir) if _workspace_dir else None
+
+# Agent call budgets, e.g. "judge=2 claude=60/m codex.run=4" (see `--limit`)
+LIMITS = os.environ.get("SKILLET_LIMITS", "")
+
+# Default for SkilletMIPRO(trial_parallelism=...): optuna trials scored at once
+TRIAL_PARALLELISM = os.environ.get("SKILLET_TRIAL_PARALLELISM", "")
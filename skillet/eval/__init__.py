@@ -1,17 +1,35 @@
 """Evaluation functionality."""
 
-from .evaluate import EvaluateResult, IterationResult, PerEvalMetric, evaluate, run_single_eval
+from .compare import CompareResult, PairedDelta, Variant, compare
+from .evaluate import (
+    EvaluateResult,
+    IterationResult,
+    PerEvalMetric,
+    TierStats,
+    Usage,
+    evaluate,
+    run_single_eval,
+)
 from .isolated_home import isolated_home
-from .judge import judge_response, run_assertions
+from .isolated_workspace import isolated_workspace
+from .judge import JudgeTiers, judge_response, run_assertions
 from .run_prompt import run_prompt
 from .run_script import run_script
 
 __all__ = [
+    "CompareResult",
     "EvaluateResult",
     "IterationResult",
+    "JudgeTiers",
+    "PairedDelta",
     "PerEvalMetric",
+    "TierStats",
+    "Usage",
+    "Variant",
+    "compare",
     "evaluate",
     "isolated_home",
+    "isolated_workspace",
     "judge_response",
     "run_assertions",
     "run_prompt",
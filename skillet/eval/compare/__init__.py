@@ -0,0 +1,6 @@
+"""Side-by-side evaluation of several agents or skill variants."""
+
+from .compare import compare
+from .result import CompareResult, PairedDelta, Variant
+
+__all__ = ["CompareResult", "PairedDelta", "Variant", "compare"]
@@ -0,0 +1,122 @@
+"""Run several agents or skill variants over one eval set in a single pass."""
+
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from skillet import config
+from skillet.evals import load_evals
+from skillet.evals.select import select_evals
+
+from ..evaluate.build_tasks import build_tasks
+from ..evaluate.run_tasks import run_tasks
+from ..evaluate.summarize_results import summarize_results
+from ..judge import JudgeTiers
+from .result import CompareResult, PairedDelta, Variant
+
+
+async def compare(  # noqa: PLR0913
+    name: str,
+    variants: list[Variant],
+    *,
+    samples: int = 3,
+    max_evals: int | None = None,
+    budget: int | None = None,
+    seed: int | None = None,
+    allowed_tools: list[str] | None = None,
+    parallel: int = 3,
+    on_status: Callable[[dict, str, dict | None], Awaitable[None]] | None = None,
+    skip_cache: bool = False,
+    evals_list: list[dict] | None = None,
+    skillet_dir: Path | None = None,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
+) -> CompareResult:
+    """Evaluate every variant against the same evals and pair their outcomes.
+
+    Evals are loaded and selected once (selection history comes from the first
+    variant's agent), then every (variant, eval, sample) task is scheduled
+    together, interleaved across variants so all of them progress at once.
+    ``parallel`` caps concurrent runs per agent: variants sharing an agent
+    share its limit, different agents run side by side. Each variant keeps its
+    own iteration cache, exactly as a separate ``evaluate()`` would.
+
+    Tasks are tagged with their variant's ``label``. Per-eval pass rates of
+    each later variant are paired against the first one.
+    ``fail_fast_assertions`` stops runs early, ``judge_tiers`` tries a fast
+    judge first and ``sandbox`` clones the project per run, as in
+    :func:`evaluate`. Setup snapshots are shared by every variant.
+    ``max_cost`` and ``max_tokens`` cap the fresh runs of all variants
+    together. With ``share_runs``, evals with identical runs share one
+    response, and multi-turn evals their opening turns, within each
+    variant, as in :func:`evaluate`.
+    """
+    labels = [v.label for v in variants]
+    if not variants or len(set(labels)) != len(labels):
+        raise ValueError(f"compare() needs distinct variants, got {labels}")
+
+    if evals_list is None:
+        evals_list = load_evals(name, skillet_dir=skillet_dir)
+    total_evals = len(evals_list)
+
+    cache_root = skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR
+    evals_list = select_evals(
+        evals_list,
+        name,
+        agent=variants[0].agent,
+        cache_root=cache_root,
+        max_evals=max_evals,
+        budget=budget,
+        seed=seed,
+    )
+
+    base_tasks = build_tasks(evals_list, samples)
+    arm_tasks = [[{**t, "variant": v.label} for t in base_tasks] for v in variants]
+    by_arm = await run_tasks(
+        [(v.skill_path, v.agent, tasks) for v, tasks in zip(variants, arm_tasks, strict=True)],
+        name,
+        evals_list,
+        cache_root=cache_root,
+        allowed_tools=allowed_tools,
+        parallel=parallel,
+        on_status=on_status,
+        skip_cache=skip_cache,
+        fail_fast_assertions=fail_fast_assertions,
+        judge_tiers=judge_tiers,
+        sandbox=sandbox,
+        max_cost=max_cost,
+        max_tokens=max_tokens,
+        share_runs=share_runs,
+    )
+
+    results = [
+        summarize_results(
+            [r for r in by_arm[arm] if r is not None],
+            arm_tasks[arm],
+            samples=samples,
+            evals_list=evals_list,
+            total_evals=total_evals,
+            seed=seed,
+            skipped_count=sum(r is None for r in by_arm[arm]),
+        )
+        for arm in range(len(variants))
+    ]
+
+    reference = {m.eval_source: m for m in results[0].per_eval_metrics}
+    deltas = [
+        PairedDelta(
+            eval_source=m.eval_source,
+            reference=labels[0],
+            variant=labels[arm],
+            reference_pass_rate=reference[m.eval_source].c / reference[m.eval_source].n * 100,
+            variant_pass_rate=m.c / m.n * 100,
+        )
+        for arm in range(1, len(variants))
+        for m in results[arm].per_eval_metrics
+        if m.n and reference.get(m.eval_source) and reference[m.eval_source].n
+    ]
+
+    return CompareResult(variants=list(variants), results=results, deltas=deltas)
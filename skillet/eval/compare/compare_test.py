@@ -0,0 +1,166 @@
+"""Tests for the compare function."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from skillet.agent import Agent
+from skillet.eval.compare import Variant, compare
+
+_RUN = "skillet.eval.evaluate.run_tasks"
+
+EVALS = [
+    {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
+    {"prompt": "p2", "expected": "e2", "_source": "2.md", "_content": "c2"},
+]
+
+CLAUDE = Variant(Agent.CLAUDE)
+CODEX = Variant(Agent.CODEX)
+CLAUDE_SKILL = Variant(Agent.CLAUDE, Path("skill"))
+
+
+def _runner(passes: dict[tuple[str, str], bool], log: list | None = None):
+    """Fake run_single_eval: pass/fail by (agent, eval source), recording call order."""
+
+    async def run(task, skill_path, _tools, _cache, _on_status, _skip, *, agent, **_kw):
+        if log is not None:
+            log.append((task["variant"], task["eval_idx"], task["iteration"]))
+        await asyncio.sleep(0)
+        return {
+            **task,
+            "pass": passes.get(
+                (f"{agent.value}/{'skill' if skill_path else 'baseline'}", task["eval_source"]),
+                False,
+            ),
+            "response": "r",
+            "cached": False,
+        }
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def mock_build_iteration_cache():
+    with patch(f"{_RUN}.build_iteration_cache") as mock:
+        mock.side_effect = lambda *_args: MagicMock()
+        yield mock
+
+
+def describe_compare():
+    @pytest.mark.asyncio
+    async def it_returns_one_result_per_variant():
+        passes = {("claude/baseline", "1.md"): True, ("codex/baseline", "2.md"): True}
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner(passes)):
+            result = await compare("evals", [CLAUDE, CODEX], samples=2, evals_list=EVALS)
+
+        assert [r.pass_rate for r in result.results] == [50.0, 50.0]
+        assert [r.total_runs for r in result.results] == [4, 4]
+        assert {t["variant"] for t in result.results[1].tasks} == {"codex/baseline"}
+
+    @pytest.mark.asyncio
+    async def it_pairs_per_eval_deltas_against_the_first_variant():
+        passes = {("claude/baseline", "1.md"): True, ("claude/skill", "2.md"): True}
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner(passes)):
+            result = await compare("evals", [CLAUDE, CLAUDE_SKILL], samples=1, evals_list=EVALS)
+
+        deltas = {d.eval_source: d.delta for d in result.deltas}
+        assert deltas == {"1.md": -100.0, "2.md": 100.0}
+        assert {d.reference for d in result.deltas} == {"claude/baseline"}
+        assert result.mean_delta("claude/skill") == 0.0
+
+    @pytest.mark.asyncio
+    async def it_interleaves_variants_in_one_schedule():
+        log = []
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner({}, log)):
+            await compare("evals", [CLAUDE, CLAUDE_SKILL], samples=1, evals_list=EVALS)
+
+        assert log == [
+            ("claude/baseline", 0, 1),
+            ("claude/skill", 0, 1),
+            ("claude/baseline", 1, 1),
+            ("claude/skill", 1, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def it_starts_the_slowest_evals_first():
+        log = []
+        evals = [
+            *EVALS,
+            {"prompt": ["a", "b", "c"], "expected": "e3", "_source": "3.md", "_content": "c3"},
+        ]
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner({}, log)):
+            await compare("evals", [CLAUDE, CODEX], samples=1, evals_list=evals, parallel=1)
+
+        # The three-turn eval leads each agent's queue
+        assert [entry for entry in log if entry[1] == 2] == [
+            ("claude/baseline", 2, 1),
+            ("codex/baseline", 2, 1),
+        ]
+        assert log[0][1] == 2
+
+    @pytest.mark.asyncio
+    async def it_limits_concurrency_per_agent():
+        running = {Agent.CLAUDE: 0, Agent.CODEX: 0}
+        peak = {Agent.CLAUDE: 0, Agent.CODEX: 0}
+
+        async def run(task, _skill, _tools, _cache, _on_status, _skip, *, agent, **_kw):
+            running[agent] += 1
+            peak[agent] = max(peak[agent], running[agent])
+            await asyncio.sleep(0.01)
+            running[agent] -= 1
+            return {**task, "pass": True, "response": "r"}
+
+        with patch(f"{_RUN}.run_single_eval", side_effect=run):
+            await compare(
+                "evals", [CLAUDE, CLAUDE_SKILL, CODEX], samples=3, parallel=2, evals_list=EVALS
+            )
+
+        assert peak == {Agent.CLAUDE: 2, Agent.CODEX: 2}
+
+    @pytest.mark.asyncio
+    async def it_shares_identical_runs_within_each_variant_only():
+        evals = [{**e, "prompt": "same"} for e in EVALS]
+        log = []
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner({}, log)) as mock_run:
+            await compare("evals", [CLAUDE, CLAUDE_SKILL], samples=1, evals_list=evals, parallel=1)
+
+        # Each variant's two evals run back to back, against that variant's memo
+        assert log == [
+            ("claude/baseline", 0, 1),
+            ("claude/baseline", 1, 1),
+            ("claude/skill", 0, 1),
+            ("claude/skill", 1, 1),
+        ]
+        memos = [c.kwargs["shared_runs"] for c in mock_run.call_args_list]
+        assert memos[0] is memos[1]
+        assert memos[1] is not memos[2]
+
+    @pytest.mark.asyncio
+    async def it_builds_a_cache_per_variant(mock_build_iteration_cache, tmp_path):
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner({})):
+            await compare(
+                "evals", [CLAUDE, CLAUDE_SKILL], samples=1, evals_list=EVALS, skillet_dir=tmp_path
+            )
+
+        calls = [c.args for c in mock_build_iteration_cache.call_args_list]
+        assert calls == [
+            (tmp_path / "cache", "evals", None, Agent.CLAUDE),
+            (tmp_path / "cache", "evals", Path("skill"), Agent.CLAUDE),
+        ]
+
+    @pytest.mark.asyncio
+    async def it_selects_evals_once_for_every_variant():
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner({})):
+            result = await compare(
+                "evals", [CLAUDE, CODEX], samples=1, max_evals=1, seed=3, evals_list=EVALS
+            )
+
+        assert result.results[0].selected_evals == result.results[1].selected_evals
+        assert len(result.results[0].selected_evals) == 1
+
+    @pytest.mark.asyncio
+    async def it_rejects_duplicate_variants():
+        with pytest.raises(ValueError, match="distinct variants"):
+            await compare("evals", [CLAUDE, Variant(Agent.CLAUDE)], evals_list=EVALS)
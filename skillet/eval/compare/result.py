@@ -0,0 +1,71 @@
+"""Compare result data structures."""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from skillet.agent import Agent
+
+from ..evaluate.result import EvaluateResult
+
+
+@dataclass(frozen=True)
+class Variant:
+    """One arm of a comparison: an agent, with or without a skill loaded."""
+
+    agent: Agent
+    skill_path: Path | None = None
+
+    @property
+    def label(self) -> str:
+        """Short name for tables and task keys, e.g. ``claude/skill``."""
+        return f"{self.agent.value}/{'skill' if self.skill_path else 'baseline'}"
+
+
+@dataclass
+class PairedDelta:
+    """One eval's pass rate under a variant, paired with the reference variant."""
+
+    eval_source: str
+    reference: str
+    variant: str
+    reference_pass_rate: float
+    variant_pass_rate: float
+
+    @property
+    def delta(self) -> float:
+        """Variant minus reference, in percentage points."""
+        return self.variant_pass_rate - self.reference_pass_rate
+
+
+@dataclass
+class CompareResult:
+    """Side-by-side results of several variants over the same evals.
+
+    ``results[i]`` is the :class:`EvaluateResult` for ``variants[i]``; the
+    first variant is the reference every ``PairedDelta`` is measured against.
+    """
+
+    variants: list[Variant]
+    results: list[EvaluateResult]
+    deltas: list[PairedDelta]
+
+    def mean_delta(self, label: str) -> float:
+        """Average per-eval delta of the variant labelled ``label``."""
+        deltas = [d.delta for d in self.deltas if d.variant == label]
+        return sum(deltas) / len(deltas) if deltas else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "variants": [
+                {
+                    "label": v.label,
+                    "agent": v.agent.value,
+                    "skill_path": str(v.skill_path) if v.skill_path else None,
+                }
+                for v in self.variants
+            ],
+            "results": [r.to_dict() for r in self.results],
+            "deltas": [{**asdict(d), "delta": d.delta} for d in self.deltas],
+        }
@@ -0,0 +1,35 @@
+"""Tests for compare result data structures."""
+
+from pathlib import Path
+
+from skillet.agent import Agent
+from skillet.eval.compare.result import CompareResult, PairedDelta, Variant
+
+
+def describe_Variant():
+    def it_labels_baseline_and_skill_runs():
+        assert Variant(Agent.CLAUDE).label == "claude/baseline"
+        assert Variant(Agent.CODEX, Path("skill")).label == "codex/skill"
+
+
+def describe_CompareResult():
+    def _result() -> CompareResult:
+        return CompareResult(
+            variants=[Variant(Agent.CLAUDE), Variant(Agent.CODEX)],
+            results=[],
+            deltas=[
+                PairedDelta("1.md", "claude/baseline", "codex/baseline", 50.0, 100.0),
+                PairedDelta("2.md", "claude/baseline", "codex/baseline", 100.0, 50.0),
+                PairedDelta("3.md", "claude/baseline", "codex/baseline", 0.0, 30.0),
+            ],
+        )
+
+    def it_averages_deltas_per_variant():
+        assert _result().mean_delta("codex/baseline") == 10.0
+        assert _result().mean_delta("unknown") == 0.0
+
+    def it_serializes_variants_and_deltas():
+        d = _result().to_dict()
+
+        assert d["variants"][1] == {"label": "codex/baseline", "agent": "codex", "skill_path": None}
+        assert d["deltas"][0]["delta"] == 50.0
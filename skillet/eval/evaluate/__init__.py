@@ -1,13 +1,17 @@
 """Evaluation orchestration."""
 
+from skillet._internal.sdk import Usage
+
 from .evaluate import evaluate
-from .result import EvaluateResult, IterationResult, PerEvalMetric
+from .result import EvaluateResult, IterationResult, PerEvalMetric, TierStats
 from .run_single_eval import run_single_eval
 
 __all__ = [
     "EvaluateResult",
     "IterationResult",
     "PerEvalMetric",
+    "TierStats",
+    "Usage",
     "evaluate",
     "run_single_eval",
 ]
@@ -0,0 +1,41 @@
+"""Expand evals into per-sample tasks."""
+
+from .compile_plans import compile_plans
+
+
+def build_tasks(evals_list: list[dict], samples: int) -> list[dict]:
+    """Return one task per (eval, sample), in eval order.
+
+    Each task carries what ``run_single_eval`` needs: the eval's identity and
+    content, prompt, expected behavior, any setup, teardown, assertions or
+    gate the eval declares (with their compiled plans), and its
+    ``setup_snapshot`` opt-out. The prompt and scripts key the cached
+    response; the expected behavior, assertions and gate key its grade.
+    """
+    tasks = []
+    for eval_idx, eval_data in enumerate(evals_list):
+        plans = compile_plans(eval_data)
+        for i in range(samples):
+            task = {
+                "eval_idx": eval_idx,
+                "eval_source": eval_data["_source"],
+                "eval_content": eval_data["_content"],
+                "iteration": i + 1,
+                "total_iterations": samples,
+                "prompt": eval_data["prompt"],
+                "expected": eval_data["expected"],
+            }
+            # Include setup/teardown if present in the eval
+            if eval_data.get("setup"):
+                task["setup"] = eval_data["setup"]
+            if eval_data.get("teardown"):
+                task["teardown"] = eval_data["teardown"]
+            if eval_data.get("setup_snapshot") is False:
+                task["setup_snapshot"] = False
+            if eval_data.get("assertions"):
+                task["assertions"] = eval_data["assertions"]
+            if eval_data.get("gate"):
+                task["gate"] = eval_data["gate"]
+            task.update(plans)
+            tasks.append(task)
+    return tasks
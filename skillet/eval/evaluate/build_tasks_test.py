@@ -0,0 +1,85 @@
+"""Tests for evaluate/build_tasks module."""
+
+from skillet.eval.evaluate.build_tasks import build_tasks
+from skillet.eval.judge.run_assertions import AssertionPlan
+
+
+def describe_build_tasks():
+    def it_creates_one_task_per_sample():
+        evals = [
+            {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
+            {"prompt": "p2", "expected": "e2", "_source": "2.md", "_content": "c2"},
+        ]
+
+        tasks = build_tasks(evals, samples=2)
+
+        assert [(t["eval_idx"], t["iteration"]) for t in tasks] == [(0, 1), (0, 2), (1, 1), (1, 2)]
+        assert tasks[2]["prompt"] == "p2"
+        assert tasks[0]["total_iterations"] == 2
+
+    def it_copies_scripts_and_assertions_only_when_present():
+        asserts = [{"type": "contains", "value": "1"}]
+        gate = [{"type": "contains", "value": "2"}]
+        evals = [
+            {"prompt": "p", "expected": "e", "_source": "1.md", "_content": "c", "setup": "x"},
+            {
+                "prompt": "p",
+                "expected": "e",
+                "_source": "2.md",
+                "_content": "c",
+                "assertions": asserts,
+            },
+            {"prompt": "p", "expected": "e", "_source": "3.md", "_content": "c", "gate": gate},
+        ]
+
+        first, second, third = build_tasks(evals, samples=1)
+
+        assert first["setup"] == "x"
+        assert "teardown" not in first
+        assert "assertions" not in first
+        assert second["assertions"] == asserts
+        assert "gate" not in second
+        assert third["gate"] == gate
+        assert "setup_snapshot" not in first
+
+    def it_copies_the_setup_snapshot_opt_out():
+        evals = [
+            {
+                "prompt": "p",
+                "expected": "e",
+                "_source": "1.md",
+                "_content": "c",
+                "setup": "x",
+                "setup_snapshot": False,
+            },
+        ]
+
+        (task,) = build_tasks(evals, samples=1)
+
+        assert task["setup_snapshot"] is False
+
+    def it_compiles_each_evals_plans_once_for_all_samples():
+        evals = [
+            {
+                "prompt": "p",
+                "expected": "e",
+                "_source": "1.md",
+                "_content": "c",
+                "assertions": [{"type": "contains", "value": "x"}],
+            },
+            {
+                "prompt": "p",
+                "expected": "e",
+                "_source": "2.md",
+                "_content": "c",
+                "gate": [{"type": "contains", "value": "y"}],
+            },
+        ]
+
+        first, second, third, fourth = build_tasks(evals, samples=2)
+
+        assert isinstance(first["assertion_plan"], AssertionPlan)
+        assert first["assertion_plan"] is second["assertion_plan"]
+        assert third["gate_plan"] is fourth["gate_plan"]
+        assert "gate_plan" not in first
+        assert "assertion_plan" not in third
@@ -0,0 +1,20 @@
+"""Compile an eval's assertions and gate once for all of its tasks."""
+
+from ..judge.run_assertions import AssertionPlan
+
+# Task keys holding compiled plans; they are not data, so results leave them out
+PLAN_KEYS = ("assertion_plan", "gate_plan")
+
+
+def compile_plans(eval_data: dict) -> dict[str, AssertionPlan]:
+    """Return the task keys for ``eval_data``'s compiled ``assertions`` and ``gate``.
+
+    Built once per eval and shared by every sample's task, so grading and
+    the fail-fast check never recompile them.
+    """
+    plans = {}
+    if eval_data.get("assertions"):
+        plans["assertion_plan"] = AssertionPlan(eval_data["assertions"])
+    if eval_data.get("gate"):
+        plans["gate_plan"] = AssertionPlan(eval_data["gate"])
+    return plans
@@ -0,0 +1,21 @@
+"""Tests for compile_plans."""
+
+from skillet.eval.evaluate.compile_plans import compile_plans
+from skillet.eval.judge.run_assertions import AssertionPlan
+
+
+def describe_compile_plans():
+    def it_compiles_assertions_and_gate():
+        plans = compile_plans(
+            {
+                "assertions": [{"type": "contains", "value": "ok"}],
+                "gate": [{"type": "not_contains", "value": "bad"}],
+            }
+        )
+
+        assert isinstance(plans["assertion_plan"], AssertionPlan)
+        assert plans["assertion_plan"].run("ok", None)["pass"] is True
+        assert plans["gate_plan"].run("bad", None)["pass"] is False
+
+    def it_compiles_nothing_for_an_eval_without_checks():
+        assert compile_plans({"prompt": "p", "expected": "e", "assertions": []}) == {}
@@ -0,0 +1,10 @@
+"""Join the results of a conversation's runs before and after a resume."""
+
+from dataclasses import replace
+
+from skillet._internal.sdk import QueryResult, Usage
+
+
+def continued(before: QueryResult, after: QueryResult, usage: Usage | None) -> QueryResult:
+    """One result for a conversation run as ``before`` and then resumed as ``after``."""
+    return replace(after, tool_calls=[*before.tool_calls, *after.tool_calls], usage=usage)
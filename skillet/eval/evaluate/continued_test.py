@@ -0,0 +1,24 @@
+"""Tests for continued."""
+
+from skillet._internal.sdk import QueryResult, Usage
+from skillet.eval.evaluate.continued import continued
+
+
+def describe_continued():
+    def it_keeps_the_resumed_answer_and_every_tool_call():
+        before = QueryResult(text="first", tool_calls=[{"name": "Read"}], session_id="s1")
+        after = QueryResult(text="second", tool_calls=[{"name": "Bash"}], session_id="s2")
+
+        result = continued(before, after, None)
+
+        assert result.text == "second"
+        assert result.session_id == "s2"
+        assert result.tool_calls == [{"name": "Read"}, {"name": "Bash"}]
+
+    def it_takes_the_given_usage():
+        usage = Usage(input_tokens=5)
+        after = QueryResult(text="", tool_calls=[], usage=Usage(input_tokens=1))
+
+        result = continued(QueryResult(text="", tool_calls=[]), after, usage)
+
+        assert result.usage == usage
@@ -0,0 +1,62 @@
+"""Run an eval's setup and conversation."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from skillet._internal.cache import SetupSnapshots
+from skillet._internal.sdk import QueryResult
+from skillet.agent import Agent
+
+from ..run_prompt import run_prompt
+from .run_branch import run_branch
+from .run_setup import run_setup
+from .shared_runs import SharedRuns
+
+
+async def converse(  # noqa: PLR0913
+    task: dict,
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    agent: Agent,
+    home_dir: str,
+    script_cwd: str | None,
+    *,
+    stop_on_tool: Callable[[dict], bool] | None,
+    setup_snapshots: SetupSnapshots | None,
+    shared_runs: SharedRuns | None,
+) -> tuple[QueryResult, int] | dict:
+    """Run setup and ``task``'s conversation, from a shared prefix where there is one.
+
+    Returns the result and how many turns came from shared prefixes, or the
+    failed payload if setup failed.
+    """
+    branch = shared_runs.branch_point(task) if shared_runs is not None else None
+    if shared_runs is not None and branch:
+        return await run_branch(
+            task,
+            branch,
+            skill_path,
+            allowed_tools,
+            agent,
+            home_dir,
+            script_cwd,
+            stop_on_tool=stop_on_tool,
+            setup_snapshots=setup_snapshots,
+            shared_runs=shared_runs,
+        )
+
+    if task.get("setup"):
+        failure = await run_setup(task, home_dir, script_cwd, setup_snapshots)
+        if failure is not None:
+            return failure
+
+    query_result = await run_prompt(
+        task["prompt"],
+        skill_path,
+        allowed_tools,
+        cwd=script_cwd,
+        home_dir=home_dir,
+        agent=agent,
+        stop_on_tool=stop_on_tool,
+    )
+    return query_result, 0
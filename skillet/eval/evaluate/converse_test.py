@@ -0,0 +1,86 @@
+"""Tests for converse."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skillet._internal.sdk import QueryResult
+from skillet.agent import Agent
+from skillet.eval.evaluate.converse import converse
+
+_CONVERSE = "skillet.eval.evaluate.converse"
+
+
+def _task(**overrides) -> dict:
+    return {"eval_source": "test.yaml", "iteration": 1, "prompt": "hi", **overrides}
+
+
+async def _run(task: dict, shared_runs=None):
+    return await converse(
+        task,
+        None,
+        None,
+        Agent.CLAUDE,
+        "/home",
+        None,
+        stop_on_tool=None,
+        setup_snapshots=None,
+        shared_runs=shared_runs,
+    )
+
+
+def describe_converse():
+    @pytest.mark.asyncio
+    async def it_runs_setup_and_then_the_conversation():
+        with (
+            patch(f"{_CONVERSE}.run_setup", new_callable=AsyncMock) as mock_setup,
+            patch(f"{_CONVERSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+        ):
+            mock_setup.return_value = None
+            mock_run.return_value = QueryResult(text="done")
+
+            result = await _run(_task(setup="true"))
+
+        mock_setup.assert_awaited_once()
+        assert result == (QueryResult(text="done"), 0)
+
+    @pytest.mark.asyncio
+    async def it_returns_a_failed_setup_without_running_the_agent():
+        failure = {"pass": False}
+        with (
+            patch(f"{_CONVERSE}.run_setup", new_callable=AsyncMock, return_value=failure),
+            patch(f"{_CONVERSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+        ):
+            result = await _run(_task(setup="false"))
+
+        mock_run.assert_not_called()
+        assert result is failure
+
+    @pytest.mark.asyncio
+    async def it_branches_from_a_shared_prefix():
+        shared_runs = MagicMock()
+        shared_runs.branch_point.return_value = 2
+        branched = (QueryResult(text="branched"), 2)
+        with (
+            patch(f"{_CONVERSE}.run_branch", new_callable=AsyncMock, return_value=branched) as b,
+            patch(f"{_CONVERSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+        ):
+            result = await _run(_task(prompt=["a", "b", "c"]), shared_runs)
+
+        mock_run.assert_not_called()
+        assert b.call_args.args[1] == 2
+        assert result == branched
+
+    @pytest.mark.asyncio
+    async def it_runs_the_whole_conversation_without_a_branch_point():
+        shared_runs = MagicMock()
+        shared_runs.branch_point.return_value = None
+        with (
+            patch(f"{_CONVERSE}.run_branch", new_callable=AsyncMock) as mock_branch,
+            patch(f"{_CONVERSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+        ):
+            mock_run.return_value = QueryResult(text="done")
+            await _run(_task(), shared_runs)
+
+        mock_branch.assert_not_called()
+        mock_run.assert_awaited_once()
@@ -0,0 +1,8 @@
+"""Copy one isolated HOME into another."""
+
+import shutil
+
+
+def copy_home(src: str, dst: str) -> None:
+    """Copy ``src`` over ``dst``, keeping symlinks as links."""
+    shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
@@ -0,0 +1,27 @@
+"""Tests for copy_home."""
+
+from skillet.eval.evaluate.copy_home import copy_home
+
+
+def describe_copy_home():
+    def it_copies_into_an_existing_home(tmp_path):
+        src, dst = tmp_path / "src", tmp_path / "dst"
+        (src / ".config").mkdir(parents=True)
+        (src / ".config" / "settings").write_text("on")
+        dst.mkdir()
+        (dst / "kept").write_text("yes")
+
+        copy_home(str(src), str(dst))
+
+        assert (dst / ".config" / "settings").read_text() == "on"
+        assert (dst / "kept").read_text() == "yes"
+
+    def it_keeps_symlinks_as_links(tmp_path):
+        src, dst = tmp_path / "src", tmp_path / "dst"
+        src.mkdir()
+        (src / "link").symlink_to("/nonexistent/target")
+
+        copy_home(str(src), str(dst))
+
+        assert (dst / "link").is_symlink()
+        assert str((dst / "link").readlink()) == "/nonexistent/target"
@@ -0,0 +1,17 @@
+"""Result payload for an iteration that could not be run or graded."""
+
+from skillet._internal.cache import INFRA_FAILURE_KEY
+
+
+def error_payload(iteration: int, response: str, error: Exception) -> dict:
+    """An uncached, failed result for an iteration the agent or grader could not finish."""
+    return {
+        "iteration": iteration,
+        "response": response,
+        "judgment": {
+            "pass": False,
+            "reasoning": f"Error ({type(error).__name__}): {error}",
+        },
+        "pass": False,
+        INFRA_FAILURE_KEY: True,
+    }
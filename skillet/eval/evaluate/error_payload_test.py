@@ -0,0 +1,20 @@
+"""Tests for error_payload."""
+
+from skillet._internal.cache import INFRA_FAILURE_KEY
+from skillet.eval.evaluate.error_payload import error_payload
+
+
+def describe_error_payload():
+    def it_fails_the_iteration_with_the_error_as_reasoning():
+        payload = error_payload(2, "partial", TimeoutError("too slow"))
+
+        assert payload["iteration"] == 2
+        assert payload["response"] == "partial"
+        assert payload["pass"] is False
+        assert payload["judgment"] == {
+            "pass": False,
+            "reasoning": "Error (TimeoutError): too slow",
+        }
+
+    def it_marks_the_failure_as_infrastructure():
+        assert error_payload(1, "", OSError("gone"))[INFRA_FAILURE_KEY] is True
@@ -0,0 +1,36 @@
+"""Estimate how long an eval task will take, for longest-first scheduling."""
+
+import statistics
+
+# Without any history, a single-turn eval costs one unit; only the relative
+# order matters to the scheduler.
+_DEFAULT_COST = 1.0
+
+# Setup and teardown scripts add work around the agent run.
+_SCRIPT_FACTOR = 1.5
+
+
+def estimate_task_cost(tasks: list[dict], latencies: dict[str, float]) -> list[float]:
+    """Return an estimated cost for each task, in the same order.
+
+    An eval with cached history costs its mean observed latency. An eval
+    without history is estimated from the median known latency (or a unit
+    cost when there is none), scaled by its number of turns and bumped when
+    it has setup or teardown scripts, so multi-turn and scripted evals are
+    assumed slow until measured.
+    """
+    known = list(latencies.values())
+    baseline = statistics.median(known) if known else _DEFAULT_COST
+
+    costs = []
+    for task in tasks:
+        latency = latencies.get(task["eval_source"])
+        if latency is not None:
+            costs.append(latency)
+            continue
+        prompt = task["prompt"]
+        cost = baseline * (len(prompt) if isinstance(prompt, list) else 1)
+        if task.get("setup") or task.get("teardown"):
+            cost *= _SCRIPT_FACTOR
+        costs.append(cost)
+    return costs
@@ -0,0 +1,36 @@
+"""Tests for estimate_task_cost."""
+
+from skillet.eval.evaluate.estimate_task_cost import estimate_task_cost
+
+
+def _task(source: str, prompt="p", **extra) -> dict:
+    return {"eval_source": source, "prompt": prompt, **extra}
+
+
+def describe_estimate_task_cost():
+    def it_uses_the_mean_observed_latency():
+        assert estimate_task_cost([_task("a.yaml")], {"a.yaml": 12.5}) == [12.5]
+
+    def it_costs_untimed_single_turn_evals_at_the_median():
+        tasks = [_task("new.yaml")]
+
+        assert estimate_task_cost(tasks, {"a": 10.0, "b": 20.0, "c": 90.0}) == [20.0]
+
+    def it_scales_untimed_evals_by_their_turns():
+        tasks = [_task("multi.yaml", prompt=["one", "two", "three"])]
+
+        assert estimate_task_cost(tasks, {"a": 10.0}) == [30.0]
+
+    def it_bumps_untimed_scripted_evals():
+        tasks = [_task("s.yaml", setup="echo hi"), _task("t.yaml", teardown="echo bye")]
+
+        assert estimate_task_cost(tasks, {"a": 10.0}) == [15.0, 15.0]
+
+    def it_ranks_multi_turn_and_scripted_evals_first_without_history():
+        tasks = [
+            _task("plain.yaml"),
+            _task("scripted.yaml", setup="x"),
+            _task("multi.yaml", prompt=["a", "b"]),
+        ]
+
+        assert estimate_task_cost(tasks, {}) == [1.0, 1.5, 2.0]
@@ -1,6 +1,5 @@
 """Run evaluations against evals."""
 
-import asyncio
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 
@@ -8,12 +7,17 @@ from skillet import config
 from skillet._internal.cache import build_iteration_cache
 from skillet.agent import Agent
 from skillet.evals import load_evals
+from skillet.evals.select import select_evals
 
-from .result import EvaluateResult, IterationResult, PerEvalMetric
-from .run_single_eval import run_single_eval
+from ..judge import JudgeTiers
+from .build_tasks import build_tasks
+from .replay_cached import replay_cached
+from .result import EvaluateResult
+from .run_tasks import run_tasks
+from .summarize_results import summarize_results
 
 
-async def evaluate(  # noqa: PLR0913, C901
+async def evaluate(  # noqa: PLR0913
     name: str,
     skill_path: Path | None = None,
     samples: int = 3,
@@ -26,123 +30,142 @@ async def evaluate(  # noqa: PLR0913, C901
     skillet_dir: Path | None = None,
     *,
     agent: Agent,
+    budget: int | None = None,
+    seed: int | None = None,
+    cached_only: bool = False,
+    regrade: bool = False,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
 ) -> EvaluateResult:
     """Evaluate evals in parallel, with caching.
 
     ``skillet_dir`` is the root holding ``evals/`` and ``cache/``; entry points
     inject it, and it falls back to the configured ``SKILLET_DIR`` when ``None``.
-    """
-    import random
 
+    ``budget`` runs a stable, representative subset of at most that many evals
+    (see :func:`select_budget`), chosen from prompt-similarity clusters and the
+    cached history of each eval. It takes precedence over ``max_evals``.
+
+    ``max_evals`` draws a random sample stratified by ``_meta`` category or
+    subdirectory; pass ``seed`` to make it reproducible. The chosen evals and
+    seed are recorded on the result.
+
+    Up to ``parallel`` tasks run at once, longest first: each eval's expected
+    duration comes from its cached history, and evals never timed are assumed
+    to scale with their turns and scripts (see :func:`estimate_task_cost`).
+
+    ``cached_only`` reports from the cache without running the agent under
+    test: iterations with no cached response, or none graded under the
+    eval's current criteria, are left out and counted in ``missing_count``.
+    ``regrade`` also skips the agent under test, but grades every cached
+    response with the current assertions or judge (see :func:`replay_cached`).
+
+    ``fail_fast_assertions`` kills a fresh run at the first tool call that
+    fails one of its eval's assertions outright (a ``tool_not_called`` tool)
+    and grades the partial transcript, which is not cached.
+
+    ``judge_tiers`` has a fast judge try each judged response before the full
+    judge (see :func:`judge_tiered`); evals with a ``gate`` check it first
+    either way. How each tier fared is reported in ``tier_stats``.
+
+    ``sandbox`` gives every fresh iteration its own copy-on-write clone of the
+    project directory, so parallel runs that write files do not collide (see
+    :func:`isolated_workspace`). It is not part of the cache key: the agent
+    starts from the same files either way, so sandboxed and unsandboxed
+    runs reuse each other's responses.
+
+    Setup scripts run once per starting state: later iterations restore
+    what the first one left in HOME and the project clone (see
+    :class:`SetupSnapshots`) unless the eval sets ``setup_snapshot: false``.
+    Without ``sandbox`` a skill eval's setup writes into the real project,
+    so it runs every time.
+
+    The tokens and cost each agent run reports are cached with its response
+    and summed per eval and, over fresh runs, for the call (``usage``).
+    ``max_cost`` (US dollars) and ``max_tokens`` cap the fresh runs: once
+    either is reached no new task starts, and the tasks left are counted in
+    ``skipped_count``. Runs already started finish, so the total can
+    overshoot a cap by up to ``parallel`` runs.
+
+    With ``share_runs`` (the default), evals that would make identical agent
+    runs (same prompt, setup and teardown, and sample index) run the agent
+    once per sample; every eval grades that response with its own criteria
+    (see :class:`SharedRuns`). Such a group is scheduled as one task, and
+    the iterations it spared are counted in ``shared_count``. Multi-turn
+    evals whose conversations only open the same way run those turns once
+    and branch by resuming the session; ``shared_turns`` counts the turns
+    that saved. Unlike identical runs, branches of one prefix are not
+    scheduled together: a branch that starts while its prefix runs waits
+    for it.
+    """
     if evals_list is None:
         evals_list = load_evals(name, skillet_dir=skillet_dir)
     total_evals = len(evals_list)
 
-    # Sample evals if requested
-    if max_evals and max_evals < len(evals_list):
-        evals_list = random.sample(evals_list, max_evals)
-
-    # Build task list
-    tasks = []
-    for eval_idx, eval_data in enumerate(evals_list):
-        for i in range(samples):
-            task = {
-                "eval_idx": eval_idx,
-                "eval_source": eval_data["_source"],
-                "eval_content": eval_data["_content"],
-                "iteration": i + 1,
-                "total_iterations": samples,
-                "prompt": eval_data["prompt"],
-                "expected": eval_data["expected"],
-            }
-            # Include setup/teardown if present in the eval
-            if eval_data.get("setup"):
-                task["setup"] = eval_data["setup"]
-            if eval_data.get("teardown"):
-                task["teardown"] = eval_data["teardown"]
-            if eval_data.get("assertions"):
-                task["assertions"] = eval_data["assertions"]
-            tasks.append(task)
-
-    # Construct the cache at runtime under the injected (or configured) root and
-    # thread it down, so caching is fully owned by cachetta's decorator.
     cache_root = skillet_dir / "cache" if skillet_dir is not None else config.CACHE_DIR
-    iteration_cache = build_iteration_cache(cache_root, name, skill_path, agent)
-
-    # Run with semaphore for parallelism control
-    semaphore = asyncio.Semaphore(parallel)
-
-    async def run_with_semaphore(task):
-        async with semaphore:
-            return await run_single_eval(
-                task,
-                skill_path,
-                allowed_tools,
-                iteration_cache,
-                on_status,
-                skip_cache,
-                agent=agent,
-            )
-
-    # Run all tasks
-    raw_results = await asyncio.gather(*[run_with_semaphore(t) for t in tasks])
-
-    # Convert raw dicts to IterationResult dataclasses
-    results = [
-        IterationResult(
-            eval_idx=r["eval_idx"],
-            eval_source=r["eval_source"],
-            iteration=r["iteration"],
-            response=r["response"],
-            passed=r["pass"],
-            tool_calls=r.get("tool_calls"),
-            judgment=r.get("judgment"),
-            cached=r.get("cached", False),
+
+    # Sample evals if requested
+    evals_list = select_evals(
+        evals_list,
+        name,
+        agent=agent,
+        cache_root=cache_root,
+        max_evals=max_evals,
+        budget=budget,
+        seed=seed,
+    )
+
+    tasks = build_tasks(evals_list, samples)
+
+    missing_count = skipped_count = 0
+    if cached_only or regrade:
+        # Construct the cache at runtime under the injected (or configured) root and
+        # thread it down, so caching is fully owned by cachetta's decorator.
+        replayed = await replay_cached(
+            tasks,
+            skill_path,
+            allowed_tools,
+            build_iteration_cache(cache_root, name, skill_path, agent),
+            on_status,
+            agent=agent,
+            regrade=regrade,
+            skip_cache=skip_cache,
+            parallel=parallel,
+            judge_tiers=judge_tiers,
         )
-        for r in raw_results
-    ]
-
-    # Calculate stats
-    cached_count = sum(1 for r in results if r.cached)
-    fresh_count = len(results) - cached_count
-    total_pass = sum(1 for r in results if r.passed)
-    total_runs = len(results)
-    pass_rate = total_pass / total_runs * 100 if total_runs > 0 else 0
-
-    # Per-eval pass@k and pass^k metrics
-    from collections import defaultdict
-
-    from skillet.metrics.pass_at_k import pass_at_k
-    from skillet.metrics.pass_pow_k import pass_pow_k
-
-    evals_by_source: dict[str, list[IterationResult]] = defaultdict(list)
-    for r in results:
-        evals_by_source[r.eval_source].append(r)
-
-    per_eval_metrics = []
-    for source, eval_results in evals_by_source.items():
-        n = len(eval_results)
-        c = sum(1 for r in eval_results if r.passed)
-        per_eval_metrics.append(
-            PerEvalMetric(
-                eval_source=source,
-                pass_at_k=pass_at_k(n, c, samples),
-                pass_pow_k=pass_pow_k(n, c, samples),
-                k=samples,
-                n=n,
-                c=c,
-            )
+        raw_results = [r for r in replayed if r is not None]
+        missing_count = len(tasks) - len(raw_results)
+    else:
+        (ran,) = await run_tasks(
+            [(skill_path, agent, tasks)],
+            name,
+            evals_list,
+            cache_root=cache_root,
+            allowed_tools=allowed_tools,
+            parallel=parallel,
+            on_status=on_status,
+            skip_cache=skip_cache,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            max_cost=max_cost,
+            max_tokens=max_tokens,
+            share_runs=share_runs,
         )
-
-    return EvaluateResult(
-        results=results,
-        tasks=tasks,
-        pass_rate=pass_rate,
-        total_runs=total_runs,
-        total_pass=total_pass,
-        cached_count=cached_count,
-        fresh_count=fresh_count,
+        raw_results = [r for r in ran if r is not None]
+        skipped_count = len(tasks) - len(raw_results)
+
+    return summarize_results(
+        raw_results,
+        tasks,
+        samples=samples,
+        evals_list=evals_list,
         total_evals=total_evals,
-        sampled_evals=len(evals_list),
-        per_eval_metrics=per_eval_metrics,
+        seed=seed,
+        missing_count=missing_count,
+        skipped_count=skipped_count,
     )
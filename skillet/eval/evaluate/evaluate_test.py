@@ -8,6 +8,7 @@ from skillet.agent import Agent
 from skillet.eval.evaluate import evaluate
 
 _EVAL = "skillet.eval.evaluate.evaluate"
+_RUN = "skillet.eval.evaluate.run_tasks"
 
 
 def describe_evaluate():
@@ -17,7 +18,7 @@ def describe_evaluate():
     async def it_loads_evals_by_name():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             mock_load.return_value = [
                 {"prompt": "p1", "expected": "e1", "_source": "test.md", "_content": "c1"}
@@ -39,7 +40,7 @@ def describe_evaluate():
     async def it_calculates_pass_rate():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             mock_load.return_value = [
                 {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
@@ -75,15 +76,13 @@ def describe_evaluate():
     async def it_respects_max_evals():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
-            patch("random.sample") as mock_sample,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             evals = [
                 {"prompt": f"p{i}", "expected": f"e{i}", "_source": f"{i}.md", "_content": f"c{i}"}
                 for i in range(10)
             ]
             mock_load.return_value = evals
-            mock_sample.return_value = evals[:2]
             mock_run.return_value = {
                 "pass": True,
                 "cached": False,
@@ -95,15 +94,85 @@ def describe_evaluate():
 
             result = await evaluate("test-evals", samples=1, max_evals=2, agent=Agent.CLAUDE)
 
-            mock_sample.assert_called_once()
             assert result.sampled_evals == 2
             assert result.total_evals == 10
+            assert len(result.selected_evals) == 2
+
+    @pytest.mark.asyncio
+    async def it_samples_reproducibly_with_a_seed():
+        evals = [
+            {"prompt": f"p{i}", "expected": f"e{i}", "_source": f"{i}.md", "_content": f"c{i}"}
+            for i in range(10)
+        ]
+        with patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = {
+                "pass": True,
+                "cached": False,
+                "eval_source": "0.md",
+                "eval_idx": 0,
+                "iteration": 1,
+                "response": "r",
+            }
+
+            first = await evaluate(
+                "test-evals", samples=1, max_evals=3, evals_list=evals, agent=Agent.CLAUDE, seed=9
+            )
+            again = await evaluate(
+                "test-evals", samples=1, max_evals=3, evals_list=evals, agent=Agent.CLAUDE, seed=9
+            )
+
+        assert first.selected_evals == again.selected_evals
+        assert first.seed == 9
+        assert first.to_dict()["selected_evals"] == first.selected_evals
+
+    @pytest.mark.asyncio
+    async def it_selects_a_budget_subset_from_cached_history(tmp_path):
+        with (
+            patch(f"{_EVAL}.select_evals") as mock_select,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
+        ):
+            evals = [
+                {"prompt": f"p{i}", "expected": f"e{i}", "_source": f"{i}.md", "_content": f"c{i}"}
+                for i in range(10)
+            ]
+            mock_select.return_value = evals[:3]
+            mock_run.return_value = {
+                "pass": True,
+                "cached": False,
+                "eval_source": "0.md",
+                "eval_idx": 0,
+                "iteration": 1,
+                "response": "r",
+            }
+
+            result = await evaluate(
+                "test-evals",
+                samples=1,
+                max_evals=5,
+                evals_list=evals,
+                skillet_dir=tmp_path,
+                agent=Agent.CLAUDE,
+                budget=3,
+            )
+
+            mock_select.assert_called_once_with(
+                evals,
+                "test-evals",
+                agent=Agent.CLAUDE,
+                cache_root=tmp_path / "cache",
+                max_evals=5,
+                budget=3,
+                seed=None,
+            )
+            assert result.sampled_evals == 3
+            assert result.selected_evals == ["0.md", "1.md", "2.md"]
+            assert result.total_evals == 10
 
     @pytest.mark.asyncio
     async def it_skips_load_evals_when_evals_list_provided():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             evals = [{"prompt": "p1", "expected": "e1", "_source": "test.md", "_content": "c1"}]
             mock_run.return_value = {
@@ -119,11 +188,37 @@ def describe_evaluate():
 
             mock_load.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def it_runs_the_slowest_evals_first_and_keeps_results_in_order():
+        evals = [
+            {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
+            {"prompt": "p2", "expected": "e2", "_source": "2.md", "_content": "c2"},
+            {"prompt": ["a", "b"], "expected": "e3", "_source": "3.md", "_content": "c3"},
+        ]
+        started = []
+
+        async def run(task, *_args, **_kwargs):
+            started.append(task["eval_source"])
+            return {**task, "pass": True, "cached": False, "response": "r"}
+
+        with (
+            patch(f"{_RUN}.run_single_eval", side_effect=run),
+            patch(f"{_RUN}.read_eval_latencies", return_value={"1.md": 5.0, "2.md": 30.0}),
+        ):
+            result = await evaluate(
+                "test-evals", samples=1, evals_list=evals, parallel=1, agent=Agent.CLAUDE
+            )
+
+        # 2.md is slowest by history; the untimed two-turn 3.md is estimated
+        # at twice the median (35s), ahead of it
+        assert started == ["3.md", "2.md", "1.md"]
+        assert [r.eval_source for r in result.results] == ["1.md", "2.md", "3.md"]
+
     @pytest.mark.asyncio
     async def it_tracks_cached_vs_fresh_counts():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             mock_load.return_value = [
                 {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
@@ -153,11 +248,97 @@ def describe_evaluate():
             assert result.cached_count == 1
             assert result.fresh_count == 1
 
+    @pytest.mark.asyncio
+    async def it_stops_starting_tasks_once_a_usage_cap_is_reached():
+        evals = [
+            {"prompt": f"p{i}", "expected": "e", "_source": f"{i}.md", "_content": "c"}
+            for i in range(3)
+        ]
+
+        async def fake_run(task, *_args, **_kw):
+            return {
+                "pass": True,
+                "cached": False,
+                "eval_source": task["eval_source"],
+                "eval_idx": task["eval_idx"],
+                "iteration": 1,
+                "response": "r",
+                "usage": {"output_tokens": 60, "cost_usd": 0.5},
+            }
+
+        with patch(f"{_RUN}.run_single_eval", side_effect=fake_run):
+            result = await evaluate(
+                "test-evals",
+                samples=1,
+                parallel=1,
+                evals_list=evals,
+                agent=Agent.CLAUDE,
+                max_tokens=100,
+            )
+
+        assert result.total_runs == 2
+        assert result.skipped_count == 1
+        assert result.missing_count == 0
+        assert result.usage.output_tokens == 120
+        assert result.usage.cost_usd == 1.0
+
+    @pytest.mark.asyncio
+    async def it_schedules_evals_with_identical_runs_together():
+        evals = [
+            {"prompt": "same", "expected": "e1", "_source": "1.md", "_content": "c1"},
+            {"prompt": "other", "expected": "e2", "_source": "2.md", "_content": "c2"},
+            {"prompt": "same", "expected": "e3", "_source": "3.md", "_content": "c3"},
+        ]
+        started = []
+
+        async def run(task, *_args, shared_runs, **_kwargs):
+            started.append(task["eval_source"])
+            payload, shared = await shared_runs.run(
+                task, AsyncMock(return_value={"iteration": task["iteration"]})
+            )
+            return {**task, **payload, "pass": True, "response": "r", "shared": shared}
+
+        with (
+            patch(f"{_RUN}.run_single_eval", side_effect=run),
+            patch(f"{_RUN}.read_eval_latencies", return_value={"2.md": 30.0, "3.md": 5.0}),
+        ):
+            result = await evaluate(
+                "test-evals", samples=2, evals_list=evals, parallel=1, agent=Agent.CLAUDE
+            )
+
+        # 1.md and 3.md share each sample's run, so they start back to back
+        assert started == ["2.md", "2.md", "1.md", "3.md", "1.md", "3.md"]
+        assert [r.eval_source for r in result.results] == [
+            "1.md",
+            "1.md",
+            "2.md",
+            "2.md",
+            "3.md",
+            "3.md",
+        ]
+        assert result.shared_count == 2
+
+    @pytest.mark.asyncio
+    async def it_gives_every_eval_its_own_runs_without_sharing():
+        evals = [
+            {"prompt": "same", "expected": f"e{i}", "_source": f"{i}.md", "_content": "c"}
+            for i in range(2)
+        ]
+
+        with patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run:
+            mock_run.side_effect = lambda task, *_a, **_kw: {**task, "pass": True, "response": "r"}
+            result = await evaluate(
+                "test-evals", samples=1, evals_list=evals, agent=Agent.CLAUDE, share_runs=False
+            )
+
+        assert all(c.kwargs["shared_runs"] is None for c in mock_run.call_args_list)
+        assert result.shared_count == 0
+
     @pytest.mark.asyncio
     async def it_includes_setup_in_task():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             mock_load.return_value = [
                 {
@@ -187,7 +368,7 @@ def describe_evaluate():
     async def it_includes_assertions_in_task():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             assertions = [{"type": "contains", "value": "hello"}]
             mock_load.return_value = [
@@ -218,7 +399,7 @@ def describe_evaluate():
     async def it_includes_teardown_in_task():
         with (
             patch(f"{_EVAL}.load_evals") as mock_load,
-            patch(f"{_EVAL}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
         ):
             mock_load.return_value = [
                 {
@@ -243,3 +424,47 @@ def describe_evaluate():
             call_args = mock_run.call_args
             task = call_args[0][0]
             assert task.get("teardown") == "echo teardown"
+
+    @pytest.mark.asyncio
+    async def it_reports_from_the_cache_and_counts_missing_iterations():
+        evals = [{"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"}]
+        cached = {
+            "pass": True,
+            "cached": True,
+            "eval_source": "1.md",
+            "eval_idx": 0,
+            "iteration": 1,
+            "response": "r",
+        }
+        with (
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_EVAL}.replay_cached", new_callable=AsyncMock) as mock_replay,
+        ):
+            mock_replay.return_value = [cached, None, None]
+
+            result = await evaluate(
+                "test-evals", evals_list=evals, samples=3, agent=Agent.CLAUDE, cached_only=True
+            )
+
+        mock_run.assert_not_called()
+        assert mock_replay.call_args.kwargs["regrade"] is False
+        assert result.total_runs == 1
+        assert result.missing_count == 2
+        assert result.cached_count == 1
+
+    @pytest.mark.asyncio
+    async def it_regrades_cached_responses():
+        evals = [{"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"}]
+        with (
+            patch(f"{_RUN}.run_single_eval", new_callable=AsyncMock) as mock_run,
+            patch(f"{_EVAL}.replay_cached", new_callable=AsyncMock) as mock_replay,
+        ):
+            mock_replay.return_value = [None]
+
+            result = await evaluate(
+                "test-evals", evals_list=evals, samples=1, agent=Agent.CLAUDE, regrade=True
+            )
+
+        mock_run.assert_not_called()
+        assert mock_replay.call_args.kwargs["regrade"] is True
+        assert result.missing_count == 1
@@ -0,0 +1,22 @@
+"""Shape a run payload into the iteration result evaluate reports."""
+
+from skillet._internal.cache import STOPPED_EARLY_KEY
+
+
+def finalize_result(payload: dict, task: dict, *, cached: bool, shared: bool = False) -> dict:
+    """Build the public iteration result from a (cached or fresh) run payload."""
+    return {
+        "eval_idx": task["eval_idx"],
+        "eval_source": task["eval_source"],
+        "iteration": payload["iteration"],
+        "response": payload["response"],
+        "tool_calls": payload.get("tool_calls"),
+        "judgment": payload["judgment"],
+        "pass": payload["pass"],
+        "cached": cached,
+        "shared": shared,
+        "shared_turns": 0 if cached or shared else payload.get("shared_turns", 0),
+        "grade_cached": payload.get("grade_cached", False),
+        "stopped_early": payload.get(STOPPED_EARLY_KEY, False),
+        "usage": payload.get("usage"),
+    }
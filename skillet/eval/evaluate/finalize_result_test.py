@@ -0,0 +1,42 @@
+"""Tests for finalize_result."""
+
+from skillet._internal.cache import STOPPED_EARLY_KEY
+from skillet.eval.evaluate.finalize_result import finalize_result
+
+TASK = {"eval_idx": 3, "eval_source": "a.yaml", "iteration": 1, "prompt": "p"}
+PAYLOAD = {
+    "iteration": 1,
+    "response": "r",
+    "judgment": {"pass": True, "reasoning": "ok"},
+    "pass": True,
+    "shared_turns": 2,
+}
+
+
+def describe_finalize_result():
+    def it_combines_the_task_and_payload():
+        result = finalize_result(PAYLOAD, TASK, cached=False)
+
+        assert result["eval_idx"] == 3
+        assert result["eval_source"] == "a.yaml"
+        assert result["response"] == "r"
+        assert result["pass"] is True
+        assert result["shared_turns"] == 2
+        assert "prompt" not in result
+
+    def it_defaults_the_optional_fields():
+        result = finalize_result(PAYLOAD, TASK, cached=False)
+
+        assert result["tool_calls"] is None
+        assert result["usage"] is None
+        assert result["grade_cached"] is False
+        assert result["stopped_early"] is False
+
+    def it_reports_a_stopped_run():
+        result = finalize_result({**PAYLOAD, STOPPED_EARLY_KEY: True}, TASK, cached=False)
+
+        assert result["stopped_early"] is True
+
+    def it_credits_no_shared_turns_to_cached_or_shared_results():
+        assert finalize_result(PAYLOAD, TASK, cached=True)["shared_turns"] == 0
+        assert finalize_result(PAYLOAD, TASK, cached=False, shared=True)["shared_turns"] == 0
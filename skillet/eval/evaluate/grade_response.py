@@ -0,0 +1,86 @@
+"""Grade an agent response against an eval's current criteria."""
+
+from pathlib import Path
+
+from skillet._internal.cache import build_grade_cache, mark_used
+from skillet.agent import Agent
+
+from ..judge import JudgeTiers, judge_response, judge_tiered, run_assertions
+from .error_payload import error_payload
+from .task_grading_key import task_grading_key
+
+
+async def _judge(
+    task: dict, payload: dict, agent: Agent, judge_tiers: JudgeTiers | None = None
+) -> dict:
+    """Grade a response payload with the eval's assertions, or else the LLM judge.
+
+    An eval's ``gate`` or a fast judge (``judge_tiers``) grades through
+    :func:`judge_tiered`, which records the tier that decided.
+    """
+    if task.get("assertions"):
+        return run_assertions(
+            response=payload["response"],
+            assertions=task.get("assertion_plan") or task["assertions"],
+            tool_calls=payload.get("tool_calls"),
+        )
+    if task.get("gate") or judge_tiers is not None:
+        return await judge_tiered(
+            task["prompt"],
+            payload["response"],
+            task["expected"],
+            payload.get("tool_calls"),
+            agent=agent,
+            gate=task.get("gate_plan") or task.get("gate"),
+            tiers=judge_tiers,
+        )
+    return await judge_response(
+        prompt=task["prompt"],
+        response=payload["response"],
+        expected=task["expected"],
+        tool_calls=payload.get("tool_calls"),
+        agent=agent,
+    )
+
+
+async def grade_response(
+    task: dict,
+    payload: dict,
+    response_path: Path | None,
+    *,
+    read: bool,
+    agent: Agent,
+    judge_tiers: JudgeTiers | None = None,
+) -> dict:
+    """Return ``payload`` with its ``judgment`` and ``pass``, using the grade cache.
+
+    Grades are cached beside the response at ``response_path`` under the
+    eval's :func:`grading_key`; without a path (a cache that cannot resolve
+    one) the response is graded uncached. A grader that raises yields an
+    uncached infra failure, leaving the cached response in place for the
+    next run to grade again.
+
+    ``judge_tiers`` tries a fast judge before the full one (see
+    :func:`judge_tiered`); it is part of the grading key, so grades made with
+    and without it are cached apart. ``grade_cached`` on the result marks
+    a grade read from the cache rather than made now.
+    """
+    key = task_grading_key(task, judge_tiers)
+    graded = False
+
+    async def _execute(payload: dict, _key: str) -> dict:
+        nonlocal graded
+        graded = True
+        return await _judge(task, payload, agent, judge_tiers)
+
+    try:
+        if response_path is None:
+            judgment = await _execute(payload, key)
+        else:
+            grade_cache = build_grade_cache(response_path).copy(read=read)
+            judgment = await grade_cache.wrap(_execute)(payload, key)
+            if not graded:
+                mark_used(grade_cache, payload, key)
+    except Exception as e:
+        return error_payload(payload["iteration"], payload["response"], e)
+    return {**payload, "judgment": judgment, "pass": judgment["pass"], "grade_cached": not graded}
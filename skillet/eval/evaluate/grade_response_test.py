@@ -0,0 +1,107 @@
+"""Tests for grade_response."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillet._internal.cache import INFRA_FAILURE_KEY
+from skillet.agent import Agent
+from skillet.eval.evaluate.grade_response import grade_response
+from skillet.eval.judge import JudgeTiers
+from skillet.eval.judge.run_assertions import AssertionPlan
+
+_GRADE = "skillet.eval.evaluate.grade_response"
+
+_PAYLOAD = {"iteration": 1, "response": "done", "tool_calls": []}
+
+
+def _make_task(**overrides) -> dict:
+    return {"prompt": "test", "expected": "result", **overrides}
+
+
+@pytest.fixture
+def mock_judge():
+    with patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock:
+        mock.return_value = {"pass": True, "reasoning": "OK"}
+        yield mock
+
+
+def describe_grade_response():
+    @pytest.mark.asyncio
+    async def it_caches_the_grade_beside_the_response(tmp_path, mock_judge: AsyncMock):
+        path = tmp_path / "iter-1.cache"
+        for _ in range(2):
+            result = await grade_response(
+                _make_task(), _PAYLOAD, path, read=True, agent=Agent.CLAUDE
+            )
+
+        mock_judge.assert_called_once()
+        assert result["pass"] is True
+        assert result["grade_cached"] is True
+        assert len(list((tmp_path / "grades").iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def it_grades_with_assertions_without_the_judge(tmp_path, mock_judge: AsyncMock):
+        task = _make_task(assertions=[{"type": "contains", "value": "done"}])
+
+        result = await grade_response(task, _PAYLOAD, None, read=True, agent=Agent.CLAUDE)
+
+        mock_judge.assert_not_called()
+        assert result["pass"] is True
+        assert result["grade_cached"] is False
+        assert not (tmp_path / "grades").exists()
+
+    @pytest.mark.asyncio
+    async def it_grades_with_the_plan_the_task_carries(mock_judge: AsyncMock):
+        task = _make_task(
+            assertions=[{"type": "contains", "value": "done"}],
+            assertion_plan=AssertionPlan([{"type": "contains", "value": "missing"}]),
+        )
+
+        result = await grade_response(task, _PAYLOAD, None, read=True, agent=Agent.CLAUDE)
+
+        mock_judge.assert_not_called()
+        assert result["pass"] is False
+
+    @pytest.mark.asyncio
+    async def it_returns_an_uncached_failure_when_the_judge_raises(tmp_path, mock_judge: AsyncMock):
+        mock_judge.side_effect = RuntimeError("judge down")
+
+        result = await grade_response(
+            _make_task(), _PAYLOAD, tmp_path / "iter-1.cache", read=True, agent=Agent.CLAUDE
+        )
+
+        assert result[INFRA_FAILURE_KEY] is True
+        assert result["response"] == "done"
+        assert not (tmp_path / "grades").exists()
+
+    @pytest.mark.asyncio
+    async def it_grades_a_gated_eval_through_the_tiers(mock_judge: AsyncMock):
+        task = _make_task(gate=[{"type": "contains", "value": "nope"}])
+
+        result = await grade_response(task, _PAYLOAD, None, read=True, agent=Agent.CLAUDE)
+
+        mock_judge.assert_not_called()
+        assert result["pass"] is False
+        assert result["judgment"]["tier"] == "gate"
+
+    @pytest.mark.asyncio
+    async def it_caches_tiered_grades_apart_from_plain_ones(tmp_path, mock_judge: AsyncMock):
+        mock_judge.return_value = {"pass": True, "reasoning": "full"}
+        path = tmp_path / "iter-1.cache"
+        with patch(f"{_GRADE}.judge_tiered", new_callable=AsyncMock) as tiered:
+            tiered.return_value = {"pass": False, "reasoning": "fast", "tier": "fast"}
+            result = await grade_response(
+                _make_task(),
+                _PAYLOAD,
+                path,
+                read=True,
+                agent=Agent.CLAUDE,
+                judge_tiers=JudgeTiers("haiku"),
+            )
+        plain = await grade_response(_make_task(), _PAYLOAD, path, read=True, agent=Agent.CLAUDE)
+
+        assert tiered.call_args.kwargs["tiers"] == JudgeTiers("haiku")
+        assert result["pass"] is False
+        assert plain["pass"] is True
+        assert len(list((tmp_path / "grades").iterdir())) == 2
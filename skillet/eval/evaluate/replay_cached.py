@@ -0,0 +1,123 @@
+"""Report eval iterations from the cache without running the agent under test."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from cachetta import Cachetta
+
+from skillet._internal.cache import build_grade_cache, read_cache_files
+from skillet.agent import Agent
+
+from ..judge import JudgeTiers
+from .finalize_result import finalize_result
+from .grade_response import grade_response
+from .task_grading_key import task_grading_key
+
+
+def _read_grades(
+    tasks: list[dict],
+    responses: list[dict | None],
+    response_paths: list[Path],
+    judge_tiers: JudgeTiers | None,
+) -> list[dict | None]:
+    """Attach each cached response's grade under current criteria, read in bulk."""
+    present = [i for i, payload in enumerate(responses) if payload is not None]
+    grade_paths = [
+        build_grade_cache(response_paths[i]).path(
+            responses[i], task_grading_key(tasks[i], judge_tiers)
+        )
+        for i in present
+    ]
+    payloads: list[dict | None] = [None] * len(tasks)
+    for i, judgment in zip(present, read_cache_files(grade_paths), strict=True):
+        if isinstance(judgment, dict) and "pass" in judgment:
+            payloads[i] = {**responses[i], "judgment": judgment, "pass": judgment["pass"]}
+    return payloads
+
+
+async def _regrade(
+    tasks: list[dict],
+    responses: list[dict | None],
+    response_paths: list[Path],
+    *,
+    agent: Agent,
+    read: bool,
+    parallel: int,
+    judge_tiers: JudgeTiers | None,
+) -> list[dict | None]:
+    """Grade each cached response with current criteria, ``parallel`` at a time."""
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def grade(task: dict, payload: dict | None, path: Path) -> dict | None:
+        if payload is None:
+            return None
+        async with semaphore:
+            return await grade_response(
+                task, payload, path, read=read, agent=agent, judge_tiers=judge_tiers
+            )
+
+    return list(
+        await asyncio.gather(
+            *(
+                grade(task, payload, path)
+                for task, payload, path in zip(tasks, responses, response_paths, strict=True)
+            )
+        )
+    )
+
+
+async def replay_cached(  # noqa: PLR0913
+    tasks: list[dict],
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    iteration_cache: Cachetta,
+    on_status: Callable[[dict, str, dict | None], Awaitable[None]] | None = None,
+    *,
+    agent: Agent,
+    regrade: bool = False,
+    skip_cache: bool = False,
+    parallel: int = 3,
+    judge_tiers: JudgeTiers | None = None,
+) -> list[dict | None]:
+    """Return each task's result from the cache alone, or ``None`` where it is missing.
+
+    Cached responses are read in bulk (see :func:`read_cache_files`). By
+    default their grades under the eval's current criteria are read the same
+    way, and an iteration with no cached response or no current grade is
+    missing. With ``regrade`` every cached response is graded through
+    :func:`grade_response` instead, up to ``parallel`` at a time: current
+    grades are reused (all are redone with ``skip_cache``), and new ones are
+    cached. Only iterations with no cached response are missing then.
+
+    The agent under test never runs. Regrading may call ``agent`` as the
+    judge for evals without assertions. Grades are read and made under
+    ``judge_tiers`` as in :func:`grade_response`. Results count as cached, and
+    ``on_status`` reports ``cached`` or ``missing`` for each task.
+    """
+    response_paths = [Path(iteration_cache.path(t, skill_path, allowed_tools)) for t in tasks]
+    responses = [
+        payload if isinstance(payload, dict) and "response" in payload else None
+        for payload in read_cache_files(response_paths)
+    ]
+
+    if regrade:
+        payloads = await _regrade(
+            tasks,
+            responses,
+            response_paths,
+            agent=agent,
+            read=not skip_cache,
+            parallel=parallel,
+            judge_tiers=judge_tiers,
+        )
+    else:
+        payloads = _read_grades(tasks, responses, response_paths, judge_tiers)
+
+    results = []
+    for task, payload in zip(tasks, payloads, strict=True):
+        result = finalize_result(payload, task, cached=True) if payload is not None else None
+        if on_status:
+            await on_status(task, "cached" if result else "missing", result)
+        results.append(result)
+    return results
@@ -0,0 +1,112 @@
+"""Tests for replay_cached."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from cachetta import write_cache
+
+from skillet._internal.cache import build_iteration_cache
+from skillet.agent import Agent
+from skillet.eval.evaluate.replay_cached import replay_cached
+
+_GRADE = "skillet.eval.evaluate.grade_response"
+
+
+def _make_task(iteration: int = 1, **overrides) -> dict:
+    return {
+        "eval_source": "test.yaml",
+        "eval_content": "content",
+        "eval_idx": 0,
+        "iteration": iteration,
+        "prompt": "test",
+        "expected": "result",
+        **overrides,
+    }
+
+
+def _response(iteration: int) -> dict:
+    return {"iteration": iteration, "response": f"r{iteration}", "tool_calls": [], "duration": 1.0}
+
+
+@pytest.fixture
+def mock_judge():
+    with patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock:
+        mock.return_value = {"pass": True, "reasoning": "OK"}
+        yield mock
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """An iteration cache holding a response for iteration 1 only."""
+    cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+    write_cache(cache, _response(1), _make_task(1), None, None)
+    return cache
+
+
+def describe_replay_cached():
+    @pytest.mark.asyncio
+    async def it_marks_iterations_without_a_response_missing(cache, mock_judge: AsyncMock):
+        on_status = AsyncMock()
+        tasks = [_make_task(1), _make_task(2)]
+
+        results = await replay_cached(
+            tasks, None, None, cache, on_status, agent=Agent.CLAUDE, regrade=True
+        )
+
+        assert results[0]["response"] == "r1"
+        assert results[0]["cached"] is True
+        assert results[1] is None
+        assert [c.args[1] for c in on_status.call_args_list] == ["cached", "missing"]
+        mock_judge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_reads_grades_cached_by_a_regrade(cache, mock_judge: AsyncMock):
+        await replay_cached([_make_task(1)], None, None, cache, agent=Agent.CLAUDE, regrade=True)
+
+        [result] = await replay_cached([_make_task(1)], None, None, cache, agent=Agent.CLAUDE)
+
+        mock_judge.assert_called_once()
+        assert result["pass"] is True
+        assert result["judgment"]["reasoning"] == "OK"
+
+    @pytest.mark.asyncio
+    async def it_treats_a_response_without_a_current_grade_as_missing(cache, mock_judge: AsyncMock):
+        await replay_cached([_make_task(1)], None, None, cache, agent=Agent.CLAUDE, regrade=True)
+
+        results = await replay_cached(
+            [_make_task(1, expected="stricter")], None, None, cache, agent=Agent.CLAUDE
+        )
+
+        assert results == [None]
+        mock_judge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_regrades_without_running_the_agent(cache, mock_judge: AsyncMock):
+        mock_judge.return_value = {"pass": False, "reasoning": "stricter"}
+        with patch("skillet.eval.evaluate.converse.run_prompt") as mock_run:
+            [result] = await replay_cached(
+                [_make_task(1, expected="stricter")],
+                None,
+                None,
+                cache,
+                agent=Agent.CLAUDE,
+                regrade=True,
+            )
+
+        mock_run.assert_not_called()
+        assert result["pass"] is False
+
+    @pytest.mark.asyncio
+    async def it_redoes_cached_grades_with_skip_cache(cache, mock_judge: AsyncMock):
+        for _ in range(2):
+            await replay_cached(
+                [_make_task(1)],
+                None,
+                None,
+                cache,
+                agent=Agent.CLAUDE,
+                regrade=True,
+                skip_cache=True,
+            )
+
+        assert mock_judge.call_count == 2
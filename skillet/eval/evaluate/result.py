@@ -1,12 +1,25 @@
 """Evaluate result data structures."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
+from skillet._internal.sdk import Usage
+
+from .compile_plans import PLAN_KEYS
+
 
 @dataclass
 class IterationResult:
-    """Result of a single eval iteration."""
+    """Result of a single eval iteration.
+
+    ``usage`` is what the agent run reported spending, also for a cached
+    response (what it cost when it ran); ``None`` if nothing was reported.
+    ``shared`` marks a response taken from another eval's identical run
+    in the same call; ``shared_turns`` counts the opening turns of a fresh
+    conversation that came from a prefix run for another eval.
+    ``grade_cached`` marks a judgment read from the grade cache rather than
+    made in this call.
+    """
 
     eval_idx: int
     eval_source: str
@@ -16,6 +29,11 @@ class IterationResult:
     tool_calls: list[dict] | None = None
     judgment: dict | None = None
     cached: bool = False
+    stopped_early: bool = False
+    usage: Usage | None = None
+    shared: bool = False
+    shared_turns: int = 0
+    grade_cached: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary, mapping 'passed' back to 'pass' for JSON compat."""
@@ -26,7 +44,11 @@ class IterationResult:
 
 @dataclass
 class PerEvalMetric:
-    """Per-eval pass@k and pass^k metrics."""
+    """Per-eval pass@k and pass^k metrics.
+
+    ``usage`` sums the usage of the eval's iterations, cached ones included,
+    so it is what one full run of the eval costs.
+    """
 
     eval_source: str
     pass_at_k: float | None
@@ -34,11 +56,43 @@ class PerEvalMetric:
     k: int
     n: int
     c: int
+    usage: Usage | None = None
+
+
+@dataclass
+class TierStats:
+    """How one judging tier fared across the tiered grades a run made.
+
+    Grades read from the cache are left out: their latencies are from the
+    run that made them.
+
+    Attributes:
+        tier: ``gate``, ``fast`` or ``full``.
+        ran: Grades this tier was tried on.
+        decided: Grades whose verdict came from this tier.
+        mean_seconds: Average time the tier took when it ran.
+    """
+
+    tier: str
+    ran: int
+    decided: int
+    mean_seconds: float
 
 
 @dataclass
 class EvaluateResult:
-    """Complete result of an evaluate() call."""
+    """Complete result of an evaluate() call.
+
+    ``usage`` is what this call spent: the sum over fresh iterations that
+    ran the agent, or ``None`` when none reported usage. ``skipped_count``
+    is the number of tasks never started because a ``max_cost``/``max_tokens``
+    cap was reached. ``shared_count`` is the number of iterations that took
+    another eval's response instead of running the agent, and
+    ``shared_turns`` the number of conversation turns not run again because
+    a shared prefix had run them. ``suite_pass_rate`` is the full suite's
+    pass rate estimated from a ``budget`` subset, weighting each eval by the
+    evals it stands for; ``None`` when the evals ran unweighted.
+    """
 
     results: list[IterationResult]
     tasks: list[dict]
@@ -50,12 +104,21 @@ class EvaluateResult:
     total_evals: int
     sampled_evals: int
     per_eval_metrics: list[PerEvalMetric]
+    selected_evals: list[str] = field(default_factory=list)
+    seed: int | None = None
+    missing_count: int = 0
+    tier_stats: list[TierStats] = field(default_factory=list)
+    usage: Usage | None = None
+    skipped_count: int = 0
+    shared_count: int = 0
+    shared_turns: int = 0
+    suite_pass_rate: float | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
             "results": [r.to_dict() for r in self.results],
-            "tasks": self.tasks,
+            "tasks": [{k: v for k, v in t.items() if k not in PLAN_KEYS} for t in self.tasks],
             "pass_rate": self.pass_rate,
             "total_runs": self.total_runs,
             "total_pass": self.total_pass,
@@ -64,4 +127,13 @@ class EvaluateResult:
             "total_evals": self.total_evals,
             "sampled_evals": self.sampled_evals,
             "per_eval_metrics": [asdict(m) for m in self.per_eval_metrics],
+            "selected_evals": self.selected_evals,
+            "seed": self.seed,
+            "missing_count": self.missing_count,
+            "tier_stats": [asdict(s) for s in self.tier_stats],
+            "usage": asdict(self.usage) if self.usage is not None else None,
+            "skipped_count": self.skipped_count,
+            "shared_count": self.shared_count,
+            "shared_turns": self.shared_turns,
+            "suite_pass_rate": self.suite_pass_rate,
         }
@@ -1,5 +1,9 @@
 """Tests for evaluate result dataclasses."""
 
+import json
+
+from skillet._internal.sdk import Usage
+from skillet.eval.evaluate.build_tasks import build_tasks
 from skillet.eval.evaluate.result import EvaluateResult, IterationResult, PerEvalMetric
 
 
@@ -100,3 +104,61 @@ def describe_evaluate_result():
         assert len(d["results"]) == 1
         assert d["results"][0]["pass"] is True
         assert d["per_eval_metrics"][0]["pass_at_k"] == 1.0
+        assert d["usage"] is None
+        assert d["skipped_count"] == 0
+
+    def it_serializes_to_json_without_the_compiled_plans():
+        evals = [
+            {
+                "prompt": "p",
+                "expected": "e",
+                "_source": "001.yaml",
+                "_content": "c",
+                "assertions": [{"type": "contains", "value": "hi"}],
+                "gate": [{"type": "contains", "value": "hi"}],
+            }
+        ]
+        tasks = build_tasks(evals, samples=1)
+        result = EvaluateResult(
+            results=[],
+            tasks=tasks,
+            pass_rate=0.0,
+            total_runs=0,
+            total_pass=0,
+            cached_count=0,
+            fresh_count=0,
+            total_evals=1,
+            sampled_evals=1,
+            per_eval_metrics=[],
+        )
+
+        d = json.loads(json.dumps(result.to_dict()))
+
+        assert d["tasks"][0]["assertions"] == [{"type": "contains", "value": "hi"}]
+        assert "assertion_plan" not in d["tasks"][0]
+        assert "gate_plan" not in d["tasks"][0]
+        assert "assertion_plan" in tasks[0]
+
+    def it_serializes_usage():
+        usage = Usage(output_tokens=2, cost_usd=0.1)
+        iteration = IterationResult(
+            eval_idx=0, eval_source="001.yaml", iteration=1, response="hi", passed=True, usage=usage
+        )
+        result = EvaluateResult(
+            results=[iteration],
+            tasks=[],
+            pass_rate=100.0,
+            total_runs=1,
+            total_pass=1,
+            cached_count=0,
+            fresh_count=1,
+            total_evals=1,
+            sampled_evals=1,
+            per_eval_metrics=[],
+            usage=usage,
+        )
+
+        d = result.to_dict()
+
+        assert d["usage"]["output_tokens"] == 2
+        assert d["results"][0]["usage"]["cost_usd"] == 0.1
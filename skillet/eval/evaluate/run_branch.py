@@ -0,0 +1,81 @@
+"""Run a conversation on from the shared prefix it branches off."""
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from skillet._internal.cache import SetupSnapshots
+from skillet._internal.sdk import QueryResult
+from skillet.agent import Agent
+
+from ..run_prompt import run_prompt
+from .continued import continued
+from .copy_home import copy_home
+from .run_prefix import run_prefix
+from .shared_prefix import SharedPrefix
+from .shared_runs import SharedRuns
+
+
+async def run_branch(  # noqa: PLR0913
+    task: dict,
+    branch: int,
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    agent: Agent,
+    home_dir: str,
+    script_cwd: str | None,
+    *,
+    stop_on_tool: Callable[[dict], bool] | None,
+    setup_snapshots: SetupSnapshots | None,
+    shared_runs: SharedRuns,
+) -> tuple[QueryResult, int] | dict:
+    """Run ``task``'s conversation on from the shared prefix of its first ``branch`` turns.
+
+    Returns the whole conversation, with the usage of the turns this task
+    ran, and how many turns came from prefixes run for other tasks; or the
+    failed payload of a prefix whose setup failed.
+
+    Raises:
+        RuntimeError: If the prefix came back with neither a failure nor a
+            result and HOME to resume from.
+    """
+
+    async def execute(parent: SharedPrefix | None, prompts: list[str]) -> SharedPrefix:
+        return await run_prefix(
+            task,
+            parent,
+            prompts,
+            skill_path,
+            allowed_tools,
+            agent,
+            script_cwd,
+            stop_on_tool=stop_on_tool,
+            setup_snapshots=setup_snapshots,
+            shared_runs=shared_runs,
+        )
+
+    prefix, usage, shared_turns = await shared_runs.prefix(task, branch, execute)
+    if prefix.failure is not None:
+        return prefix.failure
+    if prefix.result is None or prefix.home is None:
+        raise RuntimeError(f"Shared prefix of {task['eval_source']} has no result to resume from")
+    result = replace(prefix.result, usage=usage)
+    prompts = [task["prompt"]] if isinstance(task["prompt"], str) else task["prompt"]
+    rest = prompts[branch:]
+    if rest and not result.stopped_early:
+        await asyncio.to_thread(copy_home, prefix.home, home_dir)
+        suffix = await run_prompt(
+            rest,
+            skill_path,
+            allowed_tools,
+            cwd=script_cwd,
+            home_dir=home_dir,
+            agent=agent,
+            stop_on_tool=stop_on_tool,
+            resume=result.session_id,
+        )
+        if suffix.usage is not None:
+            usage = suffix.usage if usage is None else usage + suffix.usage
+        result = continued(result, suffix, usage)
+    return result, shared_turns
@@ -0,0 +1,95 @@
+"""Tests for run_branch."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skillet._internal.sdk import QueryResult, Usage
+from skillet.agent import Agent
+from skillet.eval.evaluate.run_branch import run_branch
+from skillet.eval.evaluate.shared_prefix import SharedPrefix
+
+_BRANCH = "skillet.eval.evaluate.run_branch"
+
+
+def _shared_runs(prefix: SharedPrefix, usage: Usage | None = None, reused: int = 0) -> MagicMock:
+    runs = MagicMock()
+    runs.prefix = AsyncMock(return_value=(prefix, usage, reused))
+    return runs
+
+
+async def _run(task: dict, branch: int, home_dir: str, runs: MagicMock):
+    return await run_branch(
+        task,
+        branch,
+        None,
+        None,
+        Agent.CLAUDE,
+        home_dir,
+        None,
+        stop_on_tool=None,
+        setup_snapshots=None,
+        shared_runs=runs,
+    )
+
+
+def _task(prompt: list[str]) -> dict:
+    return {"eval_source": "test.yaml", "iteration": 1, "prompt": prompt}
+
+
+def describe_run_branch():
+    @pytest.mark.asyncio
+    async def it_resumes_the_rest_of_the_conversation_from_the_prefix(tmp_path):
+        prefix_home = tmp_path / "prefix"
+        prefix_home.mkdir()
+        (prefix_home / "session").write_text("s1")
+        home = tmp_path / "home"
+        home.mkdir()
+        prefix = SharedPrefix(
+            result=QueryResult(text="one", tool_calls=[{"name": "Read"}], session_id="s1"),
+            home=str(prefix_home),
+        )
+
+        with patch(f"{_BRANCH}.run_prompt", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = QueryResult(
+                text="two", tool_calls=[{"name": "Bash"}], usage=Usage(3, 3)
+            )
+            result, shared_turns = await _run(
+                _task(["a", "b"]), 1, str(home), _shared_runs(prefix, Usage(1, 1), reused=1)
+            )
+
+        assert mock_run.call_args.args[0] == ["b"]
+        assert mock_run.call_args.kwargs["resume"] == "s1"
+        assert (home / "session").read_text() == "s1"
+        assert result.text == "two"
+        assert result.tool_calls == [{"name": "Read"}, {"name": "Bash"}]
+        assert result.usage == Usage(4, 4)
+        assert shared_turns == 1
+
+    @pytest.mark.asyncio
+    async def it_ends_at_the_prefix_when_no_turns_are_left(tmp_path):
+        prefix = SharedPrefix(result=QueryResult(text="one"), home=str(tmp_path))
+
+        with patch(f"{_BRANCH}.run_prompt", new_callable=AsyncMock) as mock_run:
+            result, shared_turns = await _run(
+                _task(["a"]), 1, str(tmp_path), _shared_runs(prefix, reused=1)
+            )
+
+        mock_run.assert_not_called()
+        assert result.text == "one"
+        assert shared_turns == 1
+
+    @pytest.mark.asyncio
+    async def it_returns_the_failure_of_a_prefix_whose_setup_failed(tmp_path):
+        failure = {"pass": False, "response": "Setup failed"}
+
+        result = await _run(
+            _task(["a", "b"]), 1, str(tmp_path), _shared_runs(SharedPrefix(failure=failure))
+        )
+
+        assert result is failure
+
+    @pytest.mark.asyncio
+    async def it_raises_for_a_prefix_with_nothing_to_resume(tmp_path):
+        with pytest.raises(RuntimeError, match="no result to resume from"):
+            await _run(_task(["a", "b"]), 1, str(tmp_path), _shared_runs(SharedPrefix()))
@@ -0,0 +1,36 @@
+"""Run tasks on a bounded pool, highest priority first."""
+
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable
+
+
+async def run_by_priority[T, R](
+    items: list[T],
+    run: Callable[[T], Awaitable[R]],
+    *,
+    priorities: list[float],
+    parallel: int,
+    stop: Callable[[], bool] | None = None,
+) -> list[R | None]:
+    """Run ``run(item)`` for every item, at most ``parallel`` at a time.
+
+    Idle workers always take the highest-priority item left, ties going to
+    the earlier item. Given estimated durations as priorities, this is
+    longest-processing-time-first scheduling: slow items start early instead
+    of stretching the tail of the run. Results come back in ``items`` order.
+
+    Once ``stop()`` returns true no further item is started; items already
+    running finish, and those never started come back as ``None``.
+    """
+    queue = [(-priority, idx) for idx, priority in enumerate(priorities)]
+    heapq.heapify(queue)
+    results: list[R | None] = [None] * len(items)
+
+    async def worker() -> None:
+        while queue and not (stop and stop()):
+            _, idx = heapq.heappop(queue)
+            results[idx] = await run(items[idx])
+
+    await asyncio.gather(*(worker() for _ in range(min(parallel, len(items)))))
+    return results
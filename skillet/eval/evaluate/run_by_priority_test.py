@@ -0,0 +1,71 @@
+"""Tests for run_by_priority."""
+
+import asyncio
+
+import pytest
+
+from skillet.eval.evaluate.run_by_priority import run_by_priority
+
+
+def describe_run_by_priority():
+    @pytest.mark.asyncio
+    async def it_starts_items_highest_priority_first():
+        started = []
+
+        async def run(item):
+            started.append(item)
+            await asyncio.sleep(0)
+            return item.upper()
+
+        results = await run_by_priority(
+            ["a", "b", "c", "d"], run, priorities=[1.0, 5.0, 1.0, 3.0], parallel=1
+        )
+
+        assert started == ["b", "d", "a", "c"]
+        assert results == ["A", "B", "C", "D"]
+
+    @pytest.mark.asyncio
+    async def it_runs_at_most_parallel_items_at_once():
+        running = peak = 0
+
+        async def run(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return item
+
+        await run_by_priority(list(range(8)), run, priorities=[0.0] * 8, parallel=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def it_returns_nothing_for_no_items():
+        async def run(item):
+            return item
+
+        assert await run_by_priority([], run, priorities=[], parallel=3) == []
+
+    @pytest.mark.asyncio
+    async def it_propagates_errors():
+        async def run(item):
+            raise RuntimeError(item)
+
+        with pytest.raises(RuntimeError):
+            await run_by_priority(["x"], run, priorities=[1.0], parallel=2)
+
+    @pytest.mark.asyncio
+    async def it_starts_nothing_more_once_stopped():
+        started = []
+
+        async def run(item):
+            started.append(item)
+            return item
+
+        results = await run_by_priority(
+            ["a", "b", "c"], run, priorities=[3.0, 2.0, 1.0], parallel=1, stop=lambda: started
+        )
+
+        assert started == ["a"]
+        assert results == ["a", None, None]
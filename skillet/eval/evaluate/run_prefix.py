@@ -0,0 +1,59 @@
+"""Run the opening turns that several evals' conversations share."""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+from skillet._internal.cache import SetupSnapshots
+from skillet.agent import Agent
+
+from ..isolated_home import isolated_home
+from ..run_prompt import run_prompt
+from .continued import continued
+from .copy_home import copy_home
+from .run_setup import run_setup
+from .shared_prefix import SharedPrefix
+from .shared_runs import SharedRuns
+
+
+async def run_prefix(  # noqa: PLR0913
+    task: dict,
+    parent: SharedPrefix | None,
+    prompts: list[str],
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    agent: Agent,
+    script_cwd: str | None,
+    *,
+    stop_on_tool: Callable[[dict], bool] | None,
+    setup_snapshots: SetupSnapshots | None,
+    shared_runs: SharedRuns,
+) -> SharedPrefix:
+    """Run a shared prefix's turns in a HOME of their own, kept for the branches to copy.
+
+    ``prompts`` are the turns after ``parent``, the prefix this one goes on
+    from; without a parent, ``task``'s setup runs first.
+    """
+    resumed = parent.result if parent is not None else None
+    with isolated_home(agent) as home_dir:
+        if parent is not None and parent.home is not None:
+            await asyncio.to_thread(copy_home, parent.home, home_dir)
+        elif task.get("setup"):
+            failure = await run_setup(task, home_dir, script_cwd, setup_snapshots)
+            if failure is not None:
+                return SharedPrefix(failure=failure)
+        result = await run_prompt(
+            prompts,
+            skill_path,
+            allowed_tools,
+            cwd=script_cwd,
+            home_dir=home_dir,
+            agent=agent,
+            stop_on_tool=stop_on_tool,
+            resume=resumed.session_id if resumed is not None else None,
+        )
+        home = shared_runs.home_dir()
+        await asyncio.to_thread(copy_home, home_dir, home)
+    if resumed is not None:
+        result = continued(resumed, result, result.usage)
+    return SharedPrefix(result=result, home=home)
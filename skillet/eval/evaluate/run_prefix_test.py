@@ -0,0 +1,92 @@
+"""Tests for run_prefix."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillet._internal.sdk import QueryResult, Usage
+from skillet.agent import Agent
+from skillet.eval.evaluate.run_prefix import run_prefix
+from skillet.eval.evaluate.shared_prefix import SharedPrefix
+from skillet.eval.evaluate.shared_runs import SharedRuns
+
+_PREFIX = "skillet.eval.evaluate.run_prefix"
+
+
+def _task(**overrides) -> dict:
+    return {"eval_source": "test.yaml", "iteration": 1, "prompt": ["a", "b", "c"], **overrides}
+
+
+async def _run(task: dict, parent: SharedPrefix | None, prompts: list[str], runs: SharedRuns):
+    return await run_prefix(
+        task,
+        parent,
+        prompts,
+        None,
+        None,
+        Agent.CLAUDE,
+        None,
+        stop_on_tool=None,
+        setup_snapshots=None,
+        shared_runs=runs,
+    )
+
+
+def describe_run_prefix():
+    @pytest.mark.asyncio
+    async def it_runs_setup_and_the_turns_and_keeps_their_home():
+        runs = SharedRuns()
+
+        async def fake_run_prompt(*_args, home_dir=None, resume=None, **_kw):
+            assert (Path(home_dir) / "tool").read_text() == "built\n"
+            assert resume is None
+            (Path(home_dir) / "session").write_text("s1")
+            return QueryResult(text="two", session_id="s1")
+
+        with patch(f"{_PREFIX}.run_prompt", side_effect=fake_run_prompt) as mock_run:
+            prefix = await _run(_task(setup="echo built > $HOME/tool"), None, ["a", "b"], runs)
+
+        runs.close()
+        assert mock_run.call_args.args[0] == ["a", "b"]
+        assert prefix.result is not None
+        assert prefix.result.text == "two"
+        assert prefix.home is not None
+        assert prefix.failure is None
+
+    @pytest.mark.asyncio
+    async def it_returns_a_failed_setup_without_running_the_turns():
+        with patch(f"{_PREFIX}.run_prompt", new_callable=AsyncMock) as mock_run:
+            prefix = await _run(_task(setup="exit 1"), None, ["a"], SharedRuns())
+
+        mock_run.assert_not_called()
+        assert prefix.failure is not None
+        assert prefix.result is None
+
+    @pytest.mark.asyncio
+    async def it_continues_a_parent_from_a_copy_of_its_home(tmp_path):
+        runs = SharedRuns()
+        (tmp_path / "session").write_text("s1")
+        parent = SharedPrefix(
+            result=QueryResult(
+                text="one", tool_calls=[{"name": "Read"}], session_id="s1", usage=Usage(1, 1)
+            ),
+            home=str(tmp_path),
+        )
+
+        async def fake_run_prompt(*_args, home_dir=None, resume=None, **_kw):
+            assert (Path(home_dir) / "session").read_text() == "s1"
+            assert resume == "s1"
+            return QueryResult(
+                text="two", tool_calls=[{"name": "Bash"}], session_id="s2", usage=Usage(5, 5)
+            )
+
+        with patch(f"{_PREFIX}.run_prompt", side_effect=fake_run_prompt):
+            prefix = await _run(_task(setup="exit 1"), parent, ["b"], runs)
+
+        runs.close()
+        assert prefix.result is not None
+        assert prefix.result.text == "two"
+        assert prefix.result.tool_calls == [{"name": "Read"}, {"name": "Bash"}]
+        assert prefix.result.session_id == "s2"
+        assert prefix.result.usage == Usage(5, 5)
@@ -0,0 +1,42 @@
+"""Run an eval's setup script, or restore a snapshot of what it did."""
+
+import asyncio
+import logging
+import tarfile
+
+from skillet._internal.cache import INFRA_FAILURE_KEY, SetupSnapshots
+
+from ..run_script import run_script
+
+logger = logging.getLogger(__name__)
+
+
+async def run_setup(
+    task: dict, home_dir: str, script_cwd: str | None, snapshots: SetupSnapshots | None
+) -> dict | None:
+    """Run ``task``'s setup, or restore a snapshot of it; a failed payload if setup fails."""
+    snapshot = None
+    if snapshots is not None and task.get("setup_snapshot", True):
+        roots = {"home": home_dir, **({"project": script_cwd} if script_cwd else {})}
+        snapshot = await asyncio.to_thread(snapshots.prepare, task["setup"], roots)
+        if await asyncio.to_thread(snapshot.restore):
+            return None
+
+    returncode, stdout, stderr = run_script(task["setup"], home_dir, script_cwd)
+    if returncode != 0:
+        return {
+            "iteration": task["iteration"],
+            "response": f"Setup failed (exit {returncode}): {stderr or stdout}",
+            "judgment": {
+                "pass": False,
+                "reasoning": f"Setup script failed: {stderr or stdout}",
+            },
+            "pass": False,
+            INFRA_FAILURE_KEY: True,
+        }
+    if snapshot is not None:
+        try:
+            await asyncio.to_thread(snapshot.save)
+        except (OSError, tarfile.TarError) as e:
+            logger.warning(f"Could not snapshot setup for {task['eval_source']}: {e}")
+    return None
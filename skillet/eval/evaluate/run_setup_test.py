@@ -0,0 +1,63 @@
+"""Tests for run_setup."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillet._internal.cache import INFRA_FAILURE_KEY, SetupSnapshots
+from skillet.eval.evaluate.run_setup import run_setup
+from skillet.eval.run_script import run_script
+
+_SETUP = "skillet.eval.evaluate.run_setup"
+
+
+def _task(**overrides) -> dict:
+    return {"eval_source": "test.yaml", "iteration": 1, "setup": "true", **overrides}
+
+
+def describe_run_setup():
+    @pytest.mark.asyncio
+    async def it_runs_the_script_in_the_home_and_project(tmp_path):
+        with patch(f"{_SETUP}.run_script", return_value=(0, "", "")) as mock_script:
+            failure = await run_setup(_task(), "/home", str(tmp_path), None)
+
+        assert failure is None
+        mock_script.assert_called_once_with("true", "/home", str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def it_returns_an_infra_failure_when_the_script_fails():
+        with patch(f"{_SETUP}.run_script", return_value=(2, "", "no such tool")):
+            failure = await run_setup(_task(), "/home", None, None)
+
+        assert failure is not None
+        assert failure["pass"] is False
+        assert failure[INFRA_FAILURE_KEY] is True
+        assert "exit 2" in failure["response"]
+        assert "no such tool" in failure["judgment"]["reasoning"]
+
+    @pytest.mark.asyncio
+    async def it_restores_a_snapshot_instead_of_running_again(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        task = _task(setup="echo built > $HOME/tool")
+        homes = [tmp_path / "home1", tmp_path / "home2"]
+
+        with patch(f"{_SETUP}.run_script", wraps=run_script) as mock_script:
+            for home in homes:
+                home.mkdir()
+                assert await run_setup(task, str(home), None, snapshots) is None
+
+        assert mock_script.call_count == 1
+        assert (homes[1] / "tool").read_text() == "built\n"
+
+    @pytest.mark.asyncio
+    async def it_skips_snapshots_for_evals_that_opt_out(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        task = _task(setup_snapshot=False)
+
+        with patch(f"{_SETUP}.run_script", return_value=(0, "", "")) as mock_script:
+            for _ in range(2):
+                await run_setup(task, str(tmp_path), None, snapshots)
+
+        assert mock_script.call_count == 2
+        assert not Path(tmp_path / "cache" / "setup-snapshots").exists()
@@ -1,17 +1,26 @@
 """Run a single evaluation task."""
 
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
 
 from cachetta import Cachetta
 
-from skillet._internal.cache import INFRA_FAILURE_KEY
+from skillet._internal.cache import STOPPED_EARLY_KEY, SetupSnapshots, mark_used
 from skillet.agent import Agent
 
 from ..isolated_home import isolated_home
-from ..judge import judge_response, run_assertions
-from ..run_prompt import run_prompt
+from ..isolated_workspace import isolated_workspace
+from ..judge import JudgeTiers
+from ..judge.run_assertions import AssertionPlan
 from ..run_script import run_script
+from .converse import converse
+from .error_payload import error_payload
+from .finalize_result import finalize_result
+from .grade_response import grade_response
+from .shared_runs import SharedRuns
 
 
 def _script_cwd(skill_path: Path | None, agent: Agent) -> str | None:
@@ -23,103 +32,165 @@ def _script_cwd(skill_path: Path | None, agent: Agent) -> str | None:
     return None
 
 
+@asynccontextmanager
+async def _workspace(project_dir: str | None, *, sandbox: bool) -> AsyncIterator[str | None]:
+    """Where the iteration runs: a private clone of the project, or the project itself."""
+    if not sandbox:
+        yield project_dir
+        return
+    async with isolated_workspace(project_dir) as workspace:
+        yield workspace
+
+
+def _stop_on_tool(task: dict) -> Callable[[dict], bool] | None:
+    """The check that ends ``task``'s run early, if its assertions or gate can fail mid-run."""
+    if task.get("assertions"):
+        plan = task.get("assertion_plan") or AssertionPlan(task["assertions"])
+    elif task.get("gate"):
+        plan = task.get("gate_plan") or AssertionPlan(task["gate"])
+    else:
+        return None
+    return plan.ruled_out_by if plan.can_rule_out else None
+
+
+async def _run_in_workspace(  # noqa: PLR0913
+    task: dict,
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    agent: Agent,
+    home_dir: str,
+    script_cwd: str | None,
+    *,
+    fail_fast: bool,
+    setup_snapshots: SetupSnapshots | None,
+    shared_runs: SharedRuns | None = None,
+) -> dict:
+    """Run setup, the agent and teardown with ``script_cwd`` as the project directory."""
+    start = time.perf_counter()
+    try:
+        conversation = await converse(
+            task,
+            skill_path,
+            allowed_tools,
+            agent,
+            home_dir,
+            script_cwd,
+            stop_on_tool=_stop_on_tool(task) if fail_fast else None,
+            setup_snapshots=setup_snapshots,
+            shared_runs=shared_runs,
+        )
+        if isinstance(conversation, dict):
+            return conversation
+        query_result, shared_turns = conversation
+
+        # Run teardown after the prompt (best effort, don't fail the eval)
+        if task.get("teardown"):
+            run_script(task["teardown"], home_dir, script_cwd)
+
+        payload = {
+            "iteration": task["iteration"],
+            "response": query_result.text,
+            "tool_calls": query_result.tool_calls,
+            "duration": round(time.perf_counter() - start, 3),
+        }
+        if query_result.usage is not None:
+            payload["usage"] = asdict(query_result.usage)
+        if query_result.stopped_early:
+            payload[STOPPED_EARLY_KEY] = True
+        if shared_turns:
+            payload["shared_turns"] = shared_turns
+        return payload
+    except (KeyboardInterrupt, SystemExit):
+        # Let critical exceptions propagate - don't suppress user interrupts
+        # or explicit exit requests. Still run teardown first (best effort).
+        if task.get("teardown"):
+            run_script(task["teardown"], home_dir, script_cwd)
+        raise
+    except Exception as e:
+        # Run teardown on error too (best effort)
+        if task.get("teardown"):
+            run_script(task["teardown"], home_dir, script_cwd)
+
+        return error_payload(task["iteration"], str(e), e)
+
+
 async def _run_iteration(
-    task: dict, skill_path: Path | None, allowed_tools: list[str] | None, agent: Agent
+    task: dict,
+    skill_path: Path | None,
+    allowed_tools: list[str] | None,
+    agent: Agent,
+    *,
+    fail_fast: bool = False,
+    sandbox: bool = False,
+    setup_snapshots: SetupSnapshots | None = None,
+    shared_runs: SharedRuns | None = None,
 ) -> dict:
-    """Run one eval iteration in an isolated HOME and return its result payload.
+    """Run one eval iteration's agent in an isolated HOME and return its response payload.
 
-    This is the expensive leaf wrapped by the cachetta decorator. A successful
-    run returns ``{iteration, response, tool_calls, judgment, pass}`` (which is
-    cached). Setup-script failures and exceptions return a payload tagged with
-    ``INFRA_FAILURE_KEY`` so the cache's condition hook keeps them out of the
-    cache. ``KeyboardInterrupt``/``SystemExit`` propagate after teardown runs.
-    """
-    script_cwd = _script_cwd(skill_path, agent)
+    This is the expensive leaf wrapped by the response-layer cache. A
+    successful run returns ``{iteration, response, tool_calls, duration}``
+    (which is cached); grading happens afterwards in :func:`grade_response`, so the
+    cached response outlives edits to the eval's grading criteria.
+    Setup-script failures and exceptions return a failed, graded payload
+    tagged with ``INFRA_FAILURE_KEY`` so the cache's condition hook keeps
+    them out of the cache. ``KeyboardInterrupt``/``SystemExit`` propagate
+    after teardown runs.
 
-    with isolated_home(agent) as home_dir:
-        try:
-            if task.get("setup"):
-                returncode, stdout, stderr = run_script(task["setup"], home_dir, script_cwd)
-                if returncode != 0:
-                    return {
-                        "iteration": task["iteration"],
-                        "response": f"Setup failed (exit {returncode}): {stderr or stdout}",
-                        "judgment": {
-                            "pass": False,
-                            "reasoning": f"Setup script failed: {stderr or stdout}",
-                        },
-                        "pass": False,
-                        INFRA_FAILURE_KEY: True,
-                    }
-
-            query_result = await run_prompt(
-                task["prompt"], skill_path, allowed_tools, home_dir=home_dir, agent=agent
-            )
+    ``duration`` is the iteration's wall-clock time in seconds, which later
+    runs read back to schedule the slowest evals first. When the agent
+    reports its tokens and cost, they are cached too, as ``usage`` (a
+    :class:`Usage` as a dict).
 
-            # Run teardown after the prompt (best effort, don't fail the eval)
-            if task.get("teardown"):
-                run_script(task["teardown"], home_dir, script_cwd)
+    With ``fail_fast`` the agent is killed at the first tool call that fails
+    one of the eval's assertions or its gate outright (``tool_not_called``).
+    The partial transcript is returned tagged with ``STOPPED_EARLY_KEY``,
+    which keeps it out of the cache; teardown still runs.
 
-            if task.get("assertions"):
-                judgment = run_assertions(
-                    response=query_result.text,
-                    assertions=task["assertions"],
-                    tool_calls=query_result.tool_calls,
-                )
-            else:
-                judgment = await judge_response(
-                    prompt=task["prompt"],
-                    response=query_result.text,
-                    expected=task["expected"],
-                    tool_calls=query_result.tool_calls,
-                    agent=agent,
+    With ``sandbox`` the iteration gets its own clone of the project
+    directory (see :func:`isolated_workspace`): setup, the agent and
+    teardown all run in the clone, so parallel iterations never share files.
+    A project that cannot be cloned is an infra failure.
+
+    With ``setup_snapshots`` a setup script that already ran from the same
+    starting state is not run again: what it left in HOME and the project
+    directory is restored from its snapshot (see :class:`SetupSnapshots`).
+    Evals with ``setup_snapshot: false`` always run their setup, and so
+    does a skill eval without ``sandbox``, whose setup writes into the
+    real project.
+
+    With ``shared_runs`` a multi-turn conversation whose opening turns
+    another eval shares (see :meth:`SharedRuns.branch_point`) resumes from
+    a fork of that shared prefix's session instead of re-running its turns.
+    The payload's ``usage`` then covers only the turns this iteration ran,
+    and ``shared_turns`` counts the ones it took from prefixes run for other
+    evals. The session lives in the agent's HOME under the project
+    directory's path, so sandboxed iterations, each in its own clone,
+    do not share prefixes.
+    """
+    project_dir = _script_cwd(skill_path, agent)
+    # Unsandboxed, setup writes into the real project, whose state carries
+    # over from one iteration to the next
+    if project_dir is not None and not sandbox:
+        setup_snapshots = None
+    with isolated_home(agent) as home_dir:
+        try:
+            async with _workspace(project_dir, sandbox=sandbox) as cwd:
+                return await _run_in_workspace(
+                    task,
+                    skill_path,
+                    allowed_tools,
+                    agent,
+                    home_dir,
+                    cwd,
+                    fail_fast=fail_fast,
+                    setup_snapshots=setup_snapshots,
+                    shared_runs=None if sandbox else shared_runs,
                 )
+        except OSError as e:
+            return error_payload(task["iteration"], f"Could not clone the project: {e}", e)
 
-            return {
-                "iteration": task["iteration"],
-                "response": query_result.text,
-                "tool_calls": query_result.tool_calls,
-                "judgment": judgment,
-                "pass": judgment["pass"],
-            }
-        except (KeyboardInterrupt, SystemExit):
-            # Let critical exceptions propagate - don't suppress user interrupts
-            # or explicit exit requests. Still run teardown first (best effort).
-            if task.get("teardown"):
-                run_script(task["teardown"], home_dir, script_cwd)
-            raise
-        except Exception as e:
-            # Run teardown on error too (best effort)
-            if task.get("teardown"):
-                run_script(task["teardown"], home_dir, script_cwd)
-
-            return {
-                "iteration": task["iteration"],
-                "response": str(e),
-                "judgment": {
-                    "pass": False,
-                    "reasoning": f"Error ({type(e).__name__}): {e}",
-                },
-                "pass": False,
-                INFRA_FAILURE_KEY: True,
-            }
-
-
-def _finalize_result(payload: dict, task: dict, *, cached: bool) -> dict:
-    """Build the public iteration result from a (cached or fresh) run payload."""
-    return {
-        "eval_idx": task["eval_idx"],
-        "eval_source": task["eval_source"],
-        "iteration": payload["iteration"],
-        "response": payload["response"],
-        "tool_calls": payload.get("tool_calls"),
-        "judgment": payload["judgment"],
-        "pass": payload["pass"],
-        "cached": cached,
-    }
-
-
-async def run_single_eval(
+
+async def run_single_eval(  # noqa: PLR0913
     task: dict,
     skill_path: Path | None,
     allowed_tools: list[str] | None,
@@ -128,34 +199,97 @@ async def run_single_eval(
     skip_cache: bool = False,
     *,
     agent: Agent,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    setup_snapshots: SetupSnapshots | None = None,
+    shared_runs: SharedRuns | None = None,
 ) -> dict:
     """Run a single evaluation task, using ``iteration_cache`` for memoization.
 
     Caching (read/write, atomic writes, in-flight de-duplication) is delegated
-    to cachetta's decorator. ``skip_cache`` disables reads (the run always
-    executes) while still persisting fresh results, matching prior behavior.
+    to cachetta's decorator, in two layers: ``iteration_cache`` holds the
+    agent's response, and grades of that response are cached beside it (see
+    :func:`build_grade_cache`). Editing only an eval's grading criteria
+    therefore re-grades the cached response without re-running the agent.
+    ``skip_cache`` disables reads of both layers (the run always executes)
+    while still persisting fresh results, matching prior behavior.
 
     Whether the result came from cache is derived from whether the wrapped leaf
     actually executed: on a hit the decorator returns the stored payload without
-    calling it, so no separate existence check is needed.
+    calling it, so no separate existence check is needed. ``cached`` reports
+    the response layer: a cached response that was re-graded is still cached.
+
+    ``fail_fast_assertions`` stops a fresh run as soon as a tool call fails
+    one of the eval's assertions outright, grading the partial transcript
+    without caching it (see :func:`_run_iteration`). ``judge_tiers`` tries
+    a fast judge before the full one (see :func:`grade_response`).
+    ``sandbox`` runs each fresh iteration in its own clone of the project.
+    ``setup_snapshots`` restores setup scripts' results instead of
+    re-running them.
+
+    With ``shared_runs``, a task whose run would be identical to another
+    eval's (see :class:`SharedRuns`) takes that eval's response instead of
+    running the agent again; it is still graded and cached as its own, and
+    reported with ``shared``. A response found in the cache is offered to
+    the other evals too. Multi-turn conversations that share their opening
+    turns with another eval's run those turns once and branch from there;
+    ``shared_turns`` reports how many turns a fresh result took from such
+    a shared prefix.
     """
     cache = iteration_cache.copy(read=not skip_cache)
 
-    ran = False
+    ran = shared = False
 
     async def _execute(
         task: dict, skill_path: Path | None, allowed_tools: list[str] | None
     ) -> dict:
-        nonlocal ran
+        nonlocal ran, shared
         ran = True
-        return await _run_iteration(task, skill_path, allowed_tools, agent)
+
+        def run() -> Awaitable[dict]:
+            return _run_iteration(
+                task,
+                skill_path,
+                allowed_tools,
+                agent,
+                fail_fast=fail_fast_assertions,
+                sandbox=sandbox,
+                setup_snapshots=setup_snapshots,
+                shared_runs=shared_runs,
+            )
+
+        if shared_runs is None:
+            return await run()
+        payload, shared = await shared_runs.run(task, run)
+        return payload
 
     if on_status:
         await on_status(task, "running", None)
 
     payload = await cache.wrap(_execute)(task, skill_path, allowed_tools)
     cached = not ran
-    result = _finalize_result(payload, task, cached=cached)
+    if cached:
+        mark_used(cache, task, skill_path, allowed_tools)
+        if shared_runs is not None:
+            shared_runs.offer(task, payload)
+    # Infra failures come back already graded as failed
+    if "judgment" not in payload:
+        # A partial transcript is not cached, so neither is its grade
+        response_path = (
+            Path(cache.path(task, skill_path, allowed_tools))
+            if callable(cache.path) and not payload.get(STOPPED_EARLY_KEY)
+            else None
+        )
+        payload = await grade_response(
+            task,
+            payload,
+            response_path,
+            read=not skip_cache,
+            agent=agent,
+            judge_tiers=judge_tiers,
+        )
+    result = finalize_result(payload, task, cached=cached, shared=shared)
     if on_status:
         await on_status(task, "cached" if cached else "done", result)
     return result
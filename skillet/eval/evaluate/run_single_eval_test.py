@@ -1,26 +1,51 @@
 """Tests for run_single_eval."""
 
+import os
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from dataclasses import asdict
 from pathlib import Path
 from typing import cast
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from cachetta import Cachetta
+from cachetta import Cachetta, write_cache
 
-from skillet._internal.sdk import QueryResult
+from skillet._internal.cache import SetupSnapshots, build_iteration_cache
+from skillet._internal.sdk import QueryResult, Usage
 from skillet.agent import Agent
 from skillet.eval.evaluate import run_single_eval
+from skillet.eval.evaluate.shared_runs import SharedRuns
+from skillet.eval.run_script import run_script
 
-_RSE = "skillet.eval.evaluate.run_single_eval"
+_EVALUATE = "skillet.eval.evaluate"
+_GRADE = f"{_EVALUATE}.grade_response"
 
-# A full success payload as produced by the cacheable leaf, used to model a
+
+@contextmanager
+def _patch_in[M: Mock](name: str, modules: tuple[str, ...], mock: M) -> Iterator[M]:
+    """Patch ``name`` with one ``mock`` in every module of the iteration that calls it."""
+    with ExitStack() as stack:
+        for module in modules:
+            stack.enter_context(patch(f"{_EVALUATE}.{module}.{name}", mock))
+        yield mock
+
+
+def _patch_run_prompt(**kwargs) -> AbstractContextManager[AsyncMock]:
+    return _patch_in("run_prompt", ("converse", "run_prefix", "run_branch"), AsyncMock(**kwargs))
+
+
+def _patch_run_script(**kwargs) -> AbstractContextManager[MagicMock]:
+    # Setup runs in run_setup, teardown in run_single_eval
+    return _patch_in("run_script", ("run_setup", "run_single_eval"), MagicMock(**kwargs))
+
+
+# A response-layer payload as produced by the cacheable leaf, used to model a
 # cache hit in the fake below.
 _HIT_PAYLOAD = {
     "iteration": 1,
     "response": "cached response",
     "tool_calls": [],
-    "judgment": {"pass": True, "reasoning": "cached"},
-    "pass": True,
 }
 
 
@@ -33,6 +58,8 @@ class _FakeCache:
     drops the hit so the wrapped function always runs.
     """
 
+    path = None
+
     def __init__(self, *, hit_payload: dict | None = None):
         self._hit_payload = hit_payload
 
@@ -65,20 +92,30 @@ def _passthrough() -> Cachetta:
     return cast(Cachetta, _FakeCache())
 
 
+@pytest.fixture
+def mock_judge():
+    with patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock:
+        mock.return_value = {"pass": True, "reasoning": "OK"}
+        yield mock
+
+
 def describe_run_single_eval():
     """Tests for run_single_eval function."""
 
     @pytest.mark.asyncio
-    async def it_returns_cached_result_when_available():
+    async def it_returns_cached_result_when_available(mock_judge: AsyncMock):
         cache = cast(Cachetta, _FakeCache(hit_payload=_HIT_PAYLOAD))
 
         result = await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
 
         assert result["cached"] is True
         assert result["response"] == "cached response"
+        # The cached response is graded against the eval's current criteria
+        assert result["pass"] is True
+        assert mock_judge.call_args.kwargs["response"] == "cached response"
 
     @pytest.mark.asyncio
-    async def it_reports_running_then_cached_for_a_hit():
+    async def it_reports_running_then_cached_for_a_hit(mock_judge: AsyncMock):
         status_calls = []
 
         async def on_status(_task, state, result):
@@ -93,12 +130,13 @@ def describe_run_single_eval():
         # The leaf never runs on a hit, so we only learn it was cached after the
         # decorator returns: status goes running -> cached.
         assert [state for state, _ in status_calls] == ["running", "cached"]
+        mock_judge.assert_called_once()
 
     @pytest.mark.asyncio
     async def it_skips_cache_when_flag_set():
         with (
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
         ):
             mock_run.return_value = QueryResult(text="fresh response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -113,9 +151,112 @@ def describe_run_single_eval():
             assert result["cached"] is False
             assert result["response"] == "fresh response"
 
+    @pytest.mark.asyncio
+    async def it_records_the_iteration_duration_in_the_cached_payload():
+        payloads = []
+
+        class _Recording(_FakeCache):
+            def wrap(self, fn):
+                async def wrapper(*args, **kwargs):
+                    payloads.append(await fn(*args, **kwargs))
+                    return payloads[-1]
+
+                return wrapper
+
+        with (
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+        ):
+            mock_run.return_value = QueryResult(text="r", tool_calls=[])
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+
+            result = await run_single_eval(
+                _make_task(), None, None, cast(Cachetta, _Recording()), agent=Agent.CLAUDE
+            )
+
+        assert payloads[0]["duration"] >= 0
+        assert "duration" not in result
+
+    @pytest.mark.asyncio
+    async def it_caches_and_returns_the_reported_usage(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        usage = Usage(input_tokens=3, output_tokens=4, cost_usd=0.01)
+
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="r", tool_calls=[], usage=usage)
+            fresh = await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+            cached = await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+
+        assert mock_run.call_count == mock_judge.call_count == 1
+        assert fresh["usage"] == cached["usage"] == asdict(usage)
+        assert cached["cached"] is True
+
+    @pytest.mark.asyncio
+    async def it_marks_a_real_cache_hit_as_recently_used(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        task = _make_task()
+        write_cache(cache, _HIT_PAYLOAD, task, None, None)
+        entry = Path(cache.path(task))
+        os.utime(entry, (1_000_000, 1_000_000))
+
+        result = await run_single_eval(task, None, None, cache, agent=Agent.CLAUDE)
+
+        assert result["cached"] is True
+        assert entry.stat().st_mtime > 1_000_000
+        mock_judge.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_regrades_a_cached_response_when_criteria_change(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+
+            await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+            mock_judge.return_value = {"pass": False, "reasoning": "stricter"}
+            result = await run_single_eval(
+                _make_task(expected="something stricter"), None, None, cache, agent=Agent.CLAUDE
+            )
+
+        mock_run.assert_called_once()
+        assert mock_judge.call_count == 2
+        assert result["cached"] is True
+        assert result["pass"] is False
+
+    @pytest.mark.asyncio
+    async def it_reuses_a_cached_grade_for_unchanged_criteria(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+
+            await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+            result = await run_single_eval(
+                _make_task(name="renamed"), None, None, cache, agent=Agent.CLAUDE
+            )
+
+        mock_run.assert_called_once()
+        mock_judge.assert_called_once()
+        assert result["pass"] is True
+
+    @pytest.mark.asyncio
+    async def it_keeps_the_response_when_the_judge_fails(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        mock_judge.side_effect = [RuntimeError("judge down"), {"pass": True, "reasoning": "OK"}]
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+
+            failed = await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+            retried = await run_single_eval(_make_task(), None, None, cache, agent=Agent.CLAUDE)
+
+        assert failed["pass"] is False
+        assert "judge down" in failed["judgment"]["reasoning"]
+        assert failed["response"] == "response"
+        mock_run.assert_called_once()
+        assert retried["cached"] is True
+        assert retried["pass"] is True
+
     @pytest.mark.asyncio
     async def it_handles_setup_script_failure():
-        with patch(f"{_RSE}.run_script", return_value=(1, "", "setup failed")):
+        with _patch_run_script(return_value=(1, "", "setup failed")):
             task = _make_task(setup="exit 1")
 
             result = await run_single_eval(task, None, None, _passthrough(), agent=Agent.CLAUDE)
@@ -133,9 +274,9 @@ def describe_run_single_eval():
             return (0, "", "")
 
         with (
-            patch(f"{_RSE}.run_script", side_effect=track_run_script),
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            _patch_run_script(side_effect=track_run_script),
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
         ):
             mock_run.return_value = QueryResult(text="response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -155,8 +296,8 @@ def describe_run_single_eval():
             status_calls.append((state, result))
 
         with (
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
         ):
             mock_run.return_value = QueryResult(text="response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -177,7 +318,7 @@ def describe_run_single_eval():
         async def on_status(_task, state, result):
             status_calls.append((state, result))
 
-        with patch(f"{_RSE}.run_script", return_value=(1, "", "setup error")):
+        with _patch_run_script(return_value=(1, "", "setup error")):
             task = _make_task(setup="exit 1")
 
             await run_single_eval(
@@ -199,8 +340,8 @@ def describe_run_single_eval():
             return (0, "", "")
 
         with (
-            patch(f"{_RSE}.run_script", side_effect=track_run_script),
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+            _patch_run_script(side_effect=track_run_script),
+            _patch_run_prompt() as mock_run,
         ):
             mock_run.side_effect = RuntimeError("prompt failed")
 
@@ -220,7 +361,7 @@ def describe_run_single_eval():
         async def on_status(_task, state, result):
             status_calls.append((state, result))
 
-        with patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run:
+        with _patch_run_prompt() as mock_run:
             mock_run.side_effect = RuntimeError("prompt failed")
 
             await run_single_eval(
@@ -236,9 +377,9 @@ def describe_run_single_eval():
     @pytest.mark.asyncio
     async def it_uses_assertions_instead_of_judge():
         with (
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
-            patch(f"{_RSE}.run_assertions") as mock_assertions,
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            patch(f"{_GRADE}.run_assertions") as mock_assertions,
         ):
             mock_run.return_value = QueryResult(text="The answer is 4", tool_calls=[])
             mock_assertions.return_value = {"pass": True, "reasoning": "All assertions passed"}
@@ -254,9 +395,9 @@ def describe_run_single_eval():
     @pytest.mark.asyncio
     async def it_falls_back_to_judge_without_assertions():
         with (
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
-            patch(f"{_RSE}.run_assertions") as mock_assertions,
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            patch(f"{_GRADE}.run_assertions") as mock_assertions,
         ):
             mock_run.return_value = QueryResult(text="response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -279,9 +420,9 @@ def describe_run_single_eval():
             return (0, "", "")
 
         with (
-            patch(f"{_RSE}.run_script", side_effect=capture_run_script),
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            _patch_run_script(side_effect=capture_run_script),
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
         ):
             mock_run.return_value = QueryResult(text="response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -304,9 +445,9 @@ def describe_run_single_eval():
             return (0, "", "")
 
         with (
-            patch(f"{_RSE}.run_script", side_effect=capture_run_script),
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch(f"{_RSE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            _patch_run_script(side_effect=capture_run_script),
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
         ):
             mock_run.return_value = QueryResult(text="response", tool_calls=[])
             mock_judge.return_value = {"pass": True, "reasoning": "OK"}
@@ -326,7 +467,7 @@ def describe_exception_handling():
     @pytest.mark.asyncio
     async def it_propagates_keyboard_interrupt():
         """KeyboardInterrupt should not be caught - let user cancel."""
-        with patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run:
+        with _patch_run_prompt() as mock_run:
             mock_run.side_effect = KeyboardInterrupt()
 
             with pytest.raises(KeyboardInterrupt):
@@ -335,7 +476,7 @@ def describe_exception_handling():
     @pytest.mark.asyncio
     async def it_propagates_system_exit():
         """SystemExit should not be caught - let process exit."""
-        with patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run:
+        with _patch_run_prompt() as mock_run:
             mock_run.side_effect = SystemExit(1)
 
             with pytest.raises(SystemExit):
@@ -352,8 +493,8 @@ def describe_exception_handling():
             return (0, "", "")
 
         with (
-            patch(f"{_RSE}.run_script", side_effect=track_run_script),
-            patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run,
+            _patch_run_script(side_effect=track_run_script),
+            _patch_run_prompt() as mock_run,
         ):
             mock_run.side_effect = KeyboardInterrupt()
 
@@ -367,7 +508,7 @@ def describe_exception_handling():
     @pytest.mark.asyncio
     async def it_includes_exception_type_in_error_message():
         """Error message should include exception type for debugging."""
-        with patch(f"{_RSE}.run_prompt", new_callable=AsyncMock) as mock_run:
+        with _patch_run_prompt() as mock_run:
             mock_run.side_effect = ValueError("invalid value")
 
             result = await run_single_eval(
@@ -377,3 +518,387 @@ def describe_exception_handling():
             assert result["pass"] is False
             assert "ValueError" in result["judgment"]["reasoning"]
             assert "invalid value" in result["judgment"]["reasoning"]
+
+
+def describe_fail_fast_assertions():
+    """Stopping a run once an assertion is already failed."""
+
+    @pytest.mark.asyncio
+    async def it_stops_on_a_forbidden_tool_and_does_not_cache_the_run(tmp_path):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        task = _make_task(assertions=[{"type": "tool_not_called", "value": "Bash"}])
+        partial = QueryResult(text="", tool_calls=[{"name": "Bash"}], stopped_early=True)
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = partial
+
+            result = await run_single_eval(
+                task, None, None, cache, agent=Agent.CLAUDE, fail_fast_assertions=True
+            )
+            again = await run_single_eval(
+                task, None, None, cache, agent=Agent.CLAUDE, fail_fast_assertions=True
+            )
+
+        stop = mock_run.call_args.kwargs["stop_on_tool"]
+        assert stop({"name": "Bash"}) is True
+        assert stop({"name": "Read"}) is False
+        assert result["pass"] is False
+        assert result["stopped_early"] is True
+        assert again["cached"] is False
+        assert mock_run.call_count == 2
+        assert not list(tmp_path.rglob("*.cache"))
+
+    @pytest.mark.asyncio
+    async def it_stops_on_a_tool_the_gate_forbids():
+        task = _make_task(gate=[{"type": "tool_not_called", "value": "Bash"}])
+        partial = QueryResult(text="", tool_calls=[{"name": "Bash"}], stopped_early=True)
+        with (
+            _patch_run_prompt() as mock_run,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+        ):
+            mock_run.return_value = partial
+
+            result = await run_single_eval(
+                task, None, None, _passthrough(), agent=Agent.CLAUDE, fail_fast_assertions=True
+            )
+
+        assert mock_run.call_args.kwargs["stop_on_tool"]({"name": "Bash"}) is True
+        mock_judge.assert_not_called()
+        assert result["pass"] is False
+        assert result["judgment"]["tier"] == "gate"
+
+    @pytest.mark.asyncio
+    async def it_runs_to_completion_when_assertions_cannot_fail_mid_run():
+        task = _make_task(assertions=[{"type": "contains", "value": "result"}])
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="result")
+
+            result = await run_single_eval(
+                task, None, None, _passthrough(), agent=Agent.CLAUDE, fail_fast_assertions=True
+            )
+
+        assert mock_run.call_args.kwargs["stop_on_tool"] is None
+        assert result["stopped_early"] is False
+
+    @pytest.mark.asyncio
+    async def it_is_off_by_default():
+        task = _make_task(assertions=[{"type": "tool_not_called", "value": "Bash"}])
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="done")
+
+            await run_single_eval(task, None, None, _passthrough(), agent=Agent.CLAUDE)
+
+        assert mock_run.call_args.kwargs["stop_on_tool"] is None
+
+
+def describe_sandbox():
+    """Running an iteration in its own clone of the project."""
+
+    @pytest.mark.asyncio
+    async def it_runs_scripts_and_the_agent_in_a_clone(tmp_path):
+        project = tmp_path / "project"
+        skill_path = project / ".claude" / "skills" / "demo"
+        skill_path.mkdir(parents=True)
+        (project / "data.txt").write_text("original")
+        task = _make_task(setup="echo changed > data.txt", teardown="cat data.txt > seen.txt")
+        cwds = []
+
+        async def fake_run_prompt(*_args, cwd=None, **_kw):
+            cwds.append(cwd)
+            assert (Path(cwd) / "data.txt").read_text() == "changed\n"
+            return QueryResult(text="response", tool_calls=[])
+
+        with (
+            _patch_run_prompt(side_effect=fake_run_prompt),
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            patch("skillet.eval.isolated_workspace.config.WORKSPACE_DIR", tmp_path / "work"),
+        ):
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+            result = await run_single_eval(
+                task, skill_path, None, _passthrough(), agent=Agent.CLAUDE, sandbox=True
+            )
+
+        assert result["pass"] is True
+        assert cwds[0] != str(project)
+        assert Path(cwds[0]).name == "project"
+        assert (project / "data.txt").read_text() == "original"
+        assert not (project / "seen.txt").exists()
+
+    @pytest.mark.asyncio
+    async def it_reports_a_project_it_cannot_clone_as_an_infra_failure(tmp_path):
+        skill_path = tmp_path / "missing" / ".claude" / "skills" / "demo"
+        with _patch_run_prompt() as mock_run:
+            result = await run_single_eval(
+                _make_task(), skill_path, None, _passthrough(), agent=Agent.CLAUDE, sandbox=True
+            )
+
+        mock_run.assert_not_called()
+        assert result["pass"] is False
+        assert "Could not clone the project" in result["response"]
+
+
+def describe_setup_snapshots():
+    """Restoring a setup script's result instead of re-running it."""
+
+    @pytest.mark.asyncio
+    async def it_runs_setup_once_per_starting_state(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        task = _make_task(setup="echo built > $HOME/tool")
+        homes = []
+
+        async def fake_run_prompt(*_args, home_dir=None, **_kw):
+            homes.append((Path(home_dir) / "tool").read_text())
+            return QueryResult(text="response", tool_calls=[])
+
+        with (
+            _patch_run_prompt(side_effect=fake_run_prompt),
+            _patch_run_script(wraps=run_script) as mock_script,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+        ):
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+            for _ in range(2):
+                await run_single_eval(
+                    task, None, None, _passthrough(), agent=Agent.CLAUDE, setup_snapshots=snapshots
+                )
+
+        assert mock_script.call_count == 1
+        assert homes == ["built\n", "built\n"]
+
+    @pytest.mark.asyncio
+    async def it_restores_a_skill_evals_setup_into_each_sandbox(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        project = tmp_path / "project"
+        skill_path = project / ".claude" / "skills" / "demo"
+        skill_path.mkdir(parents=True)
+        task = _make_task(setup="echo built > data.txt")
+        seen = []
+
+        async def fake_run_prompt(*_args, cwd=None, **_kw):
+            seen.append((Path(cwd) / "data.txt").read_text())
+            return QueryResult(text="response", tool_calls=[])
+
+        with (
+            _patch_run_prompt(side_effect=fake_run_prompt),
+            _patch_run_script(wraps=run_script) as mock_script,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+            patch("skillet.eval.isolated_workspace.config.WORKSPACE_DIR", tmp_path / "work"),
+        ):
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+            for _ in range(2):
+                await run_single_eval(
+                    task,
+                    skill_path,
+                    None,
+                    _passthrough(),
+                    agent=Agent.CLAUDE,
+                    sandbox=True,
+                    setup_snapshots=snapshots,
+                )
+
+        assert mock_script.call_count == 1
+        assert seen == ["built\n", "built\n"]
+        assert not (project / "data.txt").exists()
+
+    @pytest.mark.asyncio
+    async def it_runs_a_skill_evals_setup_every_time_without_a_sandbox(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        skill_path = tmp_path / "project" / ".claude" / "skills" / "demo"
+        skill_path.mkdir(parents=True)
+
+        with (
+            _patch_run_prompt() as mock_run,
+            _patch_run_script(return_value=(0, "", "")) as mock_script,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+        ):
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+            for _ in range(2):
+                await run_single_eval(
+                    _make_task(setup="true"),
+                    skill_path,
+                    None,
+                    _passthrough(),
+                    agent=Agent.CLAUDE,
+                    setup_snapshots=snapshots,
+                )
+
+        assert mock_script.call_count == 2
+        assert not (tmp_path / "cache" / "setup-snapshots").exists()
+
+    @pytest.mark.asyncio
+    async def it_always_runs_setup_for_evals_that_opt_out(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+        task = _make_task(setup="true")
+        task["setup_snapshot"] = False
+
+        with (
+            _patch_run_prompt() as mock_run,
+            _patch_run_script(return_value=(0, "", "")) as mock_script,
+            patch(f"{_GRADE}.judge_response", new_callable=AsyncMock) as mock_judge,
+        ):
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+            for _ in range(2):
+                await run_single_eval(
+                    task, None, None, _passthrough(), agent=Agent.CLAUDE, setup_snapshots=snapshots
+                )
+
+        assert mock_script.call_count == 2
+        assert not (tmp_path / "cache" / "setup-snapshots").exists()
+
+    @pytest.mark.asyncio
+    async def it_does_not_snapshot_a_failed_setup(tmp_path):
+        snapshots = SetupSnapshots(tmp_path / "cache")
+
+        with _patch_run_script(return_value=(1, "", "boom")):
+            result = await run_single_eval(
+                _make_task(setup="false"),
+                None,
+                None,
+                _passthrough(),
+                agent=Agent.CLAUDE,
+                setup_snapshots=snapshots,
+            )
+
+        assert result["pass"] is False
+        assert not (tmp_path / "cache" / "setup-snapshots").exists()
+
+
+def describe_shared_runs():
+    """Evals with identical runs sharing one agent response."""
+
+    @pytest.mark.asyncio
+    async def it_grades_and_caches_one_response_per_eval(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        shared = SharedRuns()
+        first = _make_task()
+        second = _make_task(eval_source="other.md", eval_idx=1, expected="something else")
+
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="r", tool_calls=[])
+            results = [
+                await run_single_eval(
+                    task, None, None, cache, agent=Agent.CLAUDE, shared_runs=shared
+                )
+                for task in (first, second)
+            ]
+
+        assert mock_run.call_count == 1
+        assert mock_judge.call_count == 2
+        assert [r["shared"] for r in results] == [False, True]
+        assert [r["cached"] for r in results] == [False, False]
+        assert Path(cache.path(second, None, None)).exists()
+
+    @pytest.mark.asyncio
+    async def it_shares_a_cached_response_with_an_eval_that_missed(tmp_path, mock_judge: AsyncMock):
+        cache = build_iteration_cache(tmp_path, "evals", None, Agent.CLAUDE)
+        first = _make_task()
+        write_cache(cache, _HIT_PAYLOAD, first, None, None)
+
+        with _patch_run_prompt() as mock_run:
+            shared = SharedRuns()
+            await run_single_eval(first, None, None, cache, agent=Agent.CLAUDE, shared_runs=shared)
+            result = await run_single_eval(
+                _make_task(eval_source="other.md", eval_idx=1),
+                None,
+                None,
+                cache,
+                agent=Agent.CLAUDE,
+                shared_runs=shared,
+            )
+
+        mock_run.assert_not_called()
+        assert mock_judge.call_count == 2
+        assert result["shared"] is True
+        assert result["response"] == "cached response"
+
+
+def describe_shared_prefixes():
+    """Multi-turn evals branching from shared opening turns."""
+
+    @pytest.mark.asyncio
+    async def it_runs_the_shared_turns_once_and_resumes_each_branch(mock_judge: AsyncMock):
+        tasks = [
+            _make_task(prompt=["one", "two"]),
+            _make_task(prompt=["one", "three"], eval_source="other.md", eval_idx=1),
+        ]
+        shared = SharedRuns()
+        shared.group(tasks)
+        calls = []
+
+        async def fake_run_prompt(prompts, *_args, home_dir, resume=None, **_kw):
+            session = Path(home_dir) / "session"
+            calls.append((prompts, resume, session.read_text() if resume else None))
+            session.write_text(f"{session.read_text() if resume else ''}{prompts[-1]};")
+            return QueryResult(
+                text=prompts[-1],
+                tool_calls=[{"name": prompts[-1]}],
+                usage=Usage(output_tokens=len(prompts)),
+                session_id=f"s-{prompts[-1]}",
+            )
+
+        with _patch_run_prompt(side_effect=fake_run_prompt):
+            results = [
+                await run_single_eval(
+                    task, None, None, _passthrough(), agent=Agent.CLAUDE, shared_runs=shared
+                )
+                for task in tasks
+            ]
+        shared.close()
+
+        assert calls == [
+            (["one"], None, None),
+            (["two"], "s-one", "one;"),
+            (["three"], "s-one", "one;"),
+        ]
+        assert [r["response"] for r in results] == ["two", "three"]
+        assert results[1]["tool_calls"] == [{"name": "one"}, {"name": "three"}]
+        # The shared turn is charged to the eval that ran it
+        assert [r["usage"]["output_tokens"] for r in results] == [2, 1]
+        assert [r["shared_turns"] for r in results] == [0, 1]
+        assert mock_judge.call_count == 2
+
+    @pytest.mark.asyncio
+    async def it_does_not_share_prefixes_between_sandboxed_runs(mock_judge: AsyncMock):
+        tasks = [
+            _make_task(prompt=["one", "two"]),
+            _make_task(prompt=["one", "three"], eval_source="other.md", eval_idx=1),
+        ]
+        shared = SharedRuns()
+        shared.group(tasks)
+
+        with _patch_run_prompt() as mock_run:
+            mock_run.return_value = QueryResult(text="r", tool_calls=[])
+            for task in tasks:
+                await run_single_eval(
+                    task,
+                    None,
+                    None,
+                    _passthrough(),
+                    agent=Agent.CLAUDE,
+                    sandbox=True,
+                    shared_runs=shared,
+                )
+
+        assert [c.args[0] for c in mock_run.call_args_list] == [["one", "two"], ["one", "three"]]
+        assert mock_judge.call_count == 2
+
+    @pytest.mark.asyncio
+    async def it_fails_every_branch_of_a_prefix_whose_setup_failed():
+        tasks = [
+            _make_task(prompt=["one", "two"], setup="false"),
+            _make_task(prompt=["one", "three"], setup="false", eval_source="other.md"),
+        ]
+        shared = SharedRuns()
+        shared.group(tasks)
+
+        with (
+            _patch_run_script(return_value=(1, "", "boom")),
+            _patch_run_prompt() as mock_run,
+        ):
+            result = await run_single_eval(
+                tasks[0], None, None, _passthrough(), agent=Agent.CLAUDE, shared_runs=shared
+            )
+
+        mock_run.assert_not_called()
+        assert result["pass"] is False
+        assert "Setup failed" in result["response"]
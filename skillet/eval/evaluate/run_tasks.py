@@ -0,0 +1,124 @@
+"""Run the tasks of one or more arms on a shared, longest-first schedule."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from skillet._internal.cache import SetupSnapshots, build_iteration_cache, read_eval_latencies
+from skillet.agent import Agent
+
+from ..judge import JudgeTiers
+from .estimate_task_cost import estimate_task_cost
+from .run_by_priority import run_by_priority
+from .run_single_eval import run_single_eval
+from .shared_runs import SharedRuns
+from .usage_budget import UsageBudget
+
+
+async def run_tasks(  # noqa: PLR0913
+    arms: list[tuple[Path | None, Agent, list[dict]]],
+    name: str,
+    evals_list: list[dict],
+    *,
+    cache_root: Path,
+    allowed_tools: list[str] | None = None,
+    parallel: int = 3,
+    on_status: Callable[[dict, str, dict | None], Awaitable[None]] | None = None,
+    skip_cache: bool = False,
+    fail_fast_assertions: bool = False,
+    judge_tiers: JudgeTiers | None = None,
+    sandbox: bool = False,
+    max_cost: float | None = None,
+    max_tokens: int | None = None,
+    share_runs: bool = True,
+) -> list[list[dict | None]]:
+    """Run every task of each ``(skill_path, agent, tasks)`` arm.
+
+    Each arm has its own iteration cache and, with ``share_runs``, its own
+    :class:`SharedRuns`: identical runs are scheduled as one group and share
+    one response within an arm. Arms with the same agent share one
+    longest-first queue of ``parallel`` workers (see :func:`run_by_priority`),
+    interleaved by task so every arm progresses at once; different agents run
+    side by side. Setup snapshots and the ``max_cost``/``max_tokens`` budget
+    span all arms. The other options are passed to :func:`run_single_eval`.
+
+    Returns each arm's results in task order, ``None`` for the tasks the
+    usage budget left unstarted.
+    """
+    caches = [build_iteration_cache(cache_root, name, path, agent) for path, agent, _ in arms]
+    setup_snapshots = SetupSnapshots(cache_root, read=not skip_cache)
+    usage_budget = UsageBudget(max_cost, max_tokens)
+    shared_runs = [SharedRuns(fail_fast=fail_fast_assertions) if share_runs else None for _ in arms]
+
+    async def run(slot: tuple[int, int]) -> dict:
+        arm, i = slot
+        skill_path, agent, tasks = arms[arm]
+        result = await run_single_eval(
+            tasks[i],
+            skill_path,
+            allowed_tools,
+            caches[arm],
+            on_status,
+            skip_cache,
+            agent=agent,
+            fail_fast_assertions=fail_fast_assertions,
+            judge_tiers=judge_tiers,
+            sandbox=sandbox,
+            setup_snapshots=setup_snapshots,
+            shared_runs=shared_runs[arm],
+        )
+        usage_budget.record(result)
+        return result
+
+    async def run_group(group: list[tuple[int, int]]) -> list[dict]:
+        # The first task runs the agent; the rest take its response and grade it
+        first = await run(group[0])
+        return [first, *await asyncio.gather(*(run(slot) for slot in group[1:]))]
+
+    queues = [
+        _queue(arms, agent, shared_runs, read_eval_latencies(cache_root, name, evals_list, agent))
+        for agent in dict.fromkeys(agent for _, agent, _ in arms)
+    ]
+    try:
+        ran = await asyncio.gather(
+            *(
+                run_by_priority(
+                    groups,
+                    run_group,
+                    priorities=priorities,
+                    parallel=parallel,
+                    stop=usage_budget.exhausted,
+                )
+                for groups, priorities in queues
+            )
+        )
+    finally:
+        for shared in shared_runs:
+            if shared:
+                shared.close()
+
+    results: list[list[dict | None]] = [[None] * len(tasks) for _, _, tasks in arms]
+    for (groups, _), queue_results in zip(queues, ran, strict=True):
+        for group, group_results in zip(groups, queue_results, strict=True):
+            for (arm, i), result in zip(group, group_results or [None] * len(group), strict=True):
+                results[arm][i] = result
+    return results
+
+
+def _queue(
+    arms: list[tuple[Path | None, Agent, list[dict]]],
+    agent: Agent,
+    shared_runs: list[SharedRuns | None],
+    latencies: dict[str, float],
+) -> tuple[list[list[tuple[int, int]]], list[float]]:
+    """``agent``'s groups of ``(arm, task)`` slots, interleaved, with their priorities."""
+    costs, groups = {}, []
+    for arm, (_, arm_agent, tasks) in enumerate(arms):
+        if arm_agent is not agent:
+            continue
+        costs[arm] = estimate_task_cost(tasks, latencies)
+        shared = shared_runs[arm]
+        indices = shared.group(tasks) if shared else [[i] for i in range(len(tasks))]
+        groups += [[(arm, i) for i in group] for group in indices]
+    groups.sort(key=lambda group: (group[0][1], group[0][0]))
+    return groups, [max(costs[arm][i] for arm, i in group) for group in groups]
@@ -0,0 +1,78 @@
+"""Tests for run_tasks."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from skillet.agent import Agent
+from skillet.eval.evaluate.build_tasks import build_tasks
+from skillet.eval.evaluate.run_tasks import run_tasks
+
+_RUN = "skillet.eval.evaluate.run_tasks"
+
+EVALS = [
+    {"prompt": "p1", "expected": "e1", "_source": "1.md", "_content": "c1"},
+    {"prompt": "p2", "expected": "e2", "_source": "2.md", "_content": "c2"},
+]
+
+
+def _runner(log: list, usage: dict | None = None):
+    """Fake run_single_eval recording (agent, skill, eval, sample) as each run starts."""
+
+    async def run(task, skill_path, _tools, _cache, _on_status, _skip, *, agent, **_kw):
+        log.append((agent, skill_path, task["eval_idx"], task["iteration"]))
+        await asyncio.sleep(0)
+        return {**task, "pass": True, "cached": False, "usage": usage}
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def mock_build_iteration_cache():
+    with patch(f"{_RUN}.build_iteration_cache") as mock:
+        mock.side_effect = lambda *_args: MagicMock()
+        yield mock
+
+
+def describe_run_tasks():
+    @pytest.mark.asyncio
+    async def it_returns_each_arms_results_in_task_order(tmp_path):
+        tasks = build_tasks(EVALS, 2)
+        log = []
+        arms = [(None, Agent.CLAUDE, tasks), (Path("skill"), Agent.CLAUDE, tasks)]
+
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner(log)):
+            results = await run_tasks(arms, "evals", EVALS, cache_root=tmp_path, parallel=1)
+
+        assert [[(r["eval_idx"], r["iteration"]) for r in arm] for arm in results] == [
+            [(0, 1), (0, 2), (1, 1), (1, 2)]
+        ] * 2
+        # One queue for the shared agent, alternating between its arms
+        assert [skill for _, skill, _, _ in log[:2]] == [None, Path("skill")]
+
+    @pytest.mark.asyncio
+    async def it_gives_each_agent_its_own_queue(tmp_path):
+        tasks = build_tasks(EVALS, 1)
+        log = []
+        arms = [(None, Agent.CLAUDE, tasks), (None, Agent.CODEX, tasks)]
+
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner(log)):
+            await run_tasks(arms, "evals", EVALS, cache_root=tmp_path, parallel=1)
+
+        # Both agents start at once, each on its own worker
+        assert {agent for agent, *_ in log[:2]} == {Agent.CLAUDE, Agent.CODEX}
+
+    @pytest.mark.asyncio
+    async def it_leaves_tasks_unstarted_by_the_shared_budget_as_none(tmp_path):
+        tasks = build_tasks(EVALS, 1)
+        arms = [(None, Agent.CLAUDE, tasks), (None, Agent.CODEX, tasks)]
+        usage = {"input_tokens": 10, "output_tokens": 0, "cost_usd": None}
+
+        with patch(f"{_RUN}.run_single_eval", side_effect=_runner([], usage)):
+            results = await run_tasks(
+                arms, "evals", EVALS, cache_root=tmp_path, parallel=1, max_tokens=10
+            )
+
+        assert sum(r is None for arm in results for r in arm) == 2
@@ -0,0 +1,24 @@
+"""The opening turns of several evals' conversations, run once."""
+
+from dataclasses import dataclass
+
+from skillet._internal.sdk import QueryResult
+
+
+@dataclass(frozen=True)
+class SharedPrefix:
+    """A conversation prefix that several evals branch from (see :class:`SharedRuns`).
+
+    ``result`` covers every turn up to here: the last turn's text, all tool
+    calls and the session to resume. Its ``usage`` is only what this
+    prefix's own turns spent, not the prefixes it continued. ``home`` is a
+    copy of the HOME the turns ran in, which holds the agent's session; a
+    branch copies it into its own HOME before resuming.
+
+    A prefix whose setup script failed carries the failed payload as
+    ``failure`` instead.
+    """
+
+    result: QueryResult | None = None
+    home: str | None = None
+    failure: dict | None = None
@@ -0,0 +1,36 @@
+"""Tests for SharedPrefix."""
+
+import dataclasses
+
+import pytest
+
+from skillet._internal.sdk import QueryResult
+from skillet.eval.evaluate.shared_prefix import SharedPrefix
+
+
+def describe_SharedPrefix():
+    def it_defaults_every_field_to_none():
+        prefix = SharedPrefix()
+
+        assert prefix.result is None
+        assert prefix.home is None
+        assert prefix.failure is None
+
+    def it_holds_a_result_and_the_home_to_resume_it_from():
+        result = QueryResult(text="hi", session_id="s1")
+
+        prefix = SharedPrefix(result=result, home="/tmp/home")
+
+        assert prefix.result is result
+        assert prefix.home == "/tmp/home"
+        assert prefix.failure is None
+
+    def it_holds_a_failed_setup_instead():
+        prefix = SharedPrefix(failure={"pass": False})
+
+        assert prefix.failure == {"pass": False}
+        assert prefix.result is None
+
+    def it_is_frozen():
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            SharedPrefix().home = "/tmp/home"  # type: ignore[misc]
@@ -0,0 +1,219 @@
+"""Agent runs shared by evals whose runs would be identical or start the same way."""
+
+import asyncio
+import json
+import tempfile
+from collections import Counter
+from collections.abc import Awaitable, Callable
+
+from skillet._internal.cache import INFRA_FAILURE_KEY, hash_content
+from skillet._internal.sdk import Usage
+
+from .shared_prefix import SharedPrefix
+
+
+def _turns(task: dict) -> list[str]:
+    prompt = task["prompt"]
+    return [prompt] if isinstance(prompt, str) else list(prompt)
+
+
+class SharedRuns:
+    """Run the agent once per run key and hand the response to every task with that key.
+
+    Within one variant (skill, agent and tools), two tasks make identical
+    agent runs when their prompt, setup and teardown scripts and sample
+    index match; with ``fail_fast`` the assertions or gate that can stop
+    the run must match too. Evals that differ only in ``expected`` or
+    ``assertions`` therefore share one response, which each grades and
+    caches on its own.
+
+    A response is shared from the moment its run starts (later tasks wait
+    for it) and also when it came from the cache. Infra failures are not
+    shared: each task retries its own run. ``shared`` counts the responses
+    handed out.
+
+    Multi-turn conversations that only start the same way share their
+    opening turns. :meth:`group` builds a prefix tree over the prompts of
+    tasks with the same setup and sample index; a node where conversations
+    diverge, or where one ends and another goes on, is run once as a
+    :class:`SharedPrefix` and each conversation through it resumes from a
+    fork of its session (see :meth:`prefix`). Tasks with a teardown script
+    never share a prefix, since teardown must follow their own last turn.
+    """
+
+    def __init__(self, *, fail_fast: bool = False) -> None:
+        self.fail_fast = fail_fast
+        self.shared = 0
+        self._runs: dict[str, asyncio.Future[dict]] = {}
+        self._branches: set[str] = set()
+        self._prefixes: dict[str, asyncio.Future[SharedPrefix]] = {}
+        self._homes: tempfile.TemporaryDirectory[str] | None = None
+
+    def _stop(self, task: dict) -> list | None:
+        return (task.get("assertions") or task.get("gate")) if self.fail_fast else None
+
+    def key(self, task: dict) -> str:
+        """The run key of ``task``."""
+        return hash_content(
+            json.dumps(
+                {
+                    "prompt": task["prompt"],
+                    "setup": task.get("setup"),
+                    "teardown": task.get("teardown"),
+                    "iteration": task["iteration"],
+                    "stop": self._stop(task),
+                },
+                sort_keys=True,
+            )
+        )
+
+    def _prefix_key(self, task: dict, turns: int) -> str:
+        return hash_content(
+            json.dumps(
+                {
+                    "turns": _turns(task)[:turns],
+                    "setup": task.get("setup"),
+                    "iteration": task["iteration"],
+                    "stop": self._stop(task),
+                },
+                sort_keys=True,
+            )
+        )
+
+    def group(self, tasks: list[dict]) -> list[list[int]]:
+        """Indices of ``tasks`` grouped by run key, in order of first appearance.
+
+        Also records where the tasks' conversations share a prefix, for
+        :meth:`branch_point`.
+        """
+        groups: dict[str, list[int]] = {}
+        for idx, task in enumerate(tasks):
+            groups.setdefault(self.key(task), []).append(idx)
+
+        paths = [
+            [self._prefix_key(task, n) for n in range(1, len(_turns(task)) + 1)]
+            for task in (tasks[idxs[0]] for idxs in groups.values())
+            if not task.get("teardown")
+        ]
+        counts = Counter(key for path in paths for key in path)
+        for path in paths:
+            for n, key in enumerate(path):
+                # Shared, and where some conversation ends or turns off
+                if counts[key] > 1 and (n + 1 == len(path) or counts[key] > counts[path[n + 1]]):
+                    self._branches.add(key)
+        return list(groups.values())
+
+    def branch_point(self, task: dict) -> int | None:
+        """How many of ``task``'s opening turns come from a shared prefix, if any."""
+        if task.get("teardown"):
+            return None
+        for turns in range(len(_turns(task)), 0, -1):
+            if self._prefix_key(task, turns) in self._branches:
+                return turns
+        return None
+
+    def home_dir(self) -> str:
+        """A new directory, kept as long as this object, to save a prefix's HOME in."""
+        if self._homes is None:
+            self._homes = tempfile.TemporaryDirectory(
+                prefix="skillet-prefix-", ignore_cleanup_errors=True
+            )
+        return tempfile.mkdtemp(dir=self._homes.name)
+
+    def close(self) -> None:
+        """Delete the saved prefix HOMEs."""
+        if self._homes is not None:
+            self._homes.cleanup()
+            self._homes = None
+        self._prefixes.clear()
+
+    def offer(self, task: dict, payload: dict) -> None:
+        """Make a cached response available to the tasks that share ``task``'s key."""
+        key = self.key(task)
+        if key not in self._runs and INFRA_FAILURE_KEY not in payload:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(payload)
+            self._runs[key] = future
+
+    async def run(self, task: dict, execute: Callable[[], Awaitable[dict]]) -> tuple[dict, bool]:
+        """Return ``task``'s response and whether it was shared from another task's run.
+
+        The first task with a key runs ``execute``; later ones wait for and
+        copy its response. If that run was an infra failure, the waiting
+        task runs ``execute`` itself.
+        """
+        key = self.key(task)
+        existing = self._runs.get(key)
+        if existing is not None:
+            payload = await asyncio.shield(existing)
+            if INFRA_FAILURE_KEY not in payload:
+                self.shared += 1
+                return dict(payload), True
+            return await execute(), False
+
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        self._runs[key] = future
+        try:
+            payload = await execute()
+        except BaseException as e:
+            del self._runs[key]
+            future.set_exception(e)
+            # Waiters re-raise it; keep asyncio from reporting it as unretrieved
+            future.exception()
+            raise
+        future.set_result(payload)
+        if INFRA_FAILURE_KEY in payload:
+            del self._runs[key]
+        return payload, False
+
+    async def prefix(
+        self,
+        task: dict,
+        turns: int,
+        execute: Callable[[SharedPrefix | None, list[str]], Awaitable[SharedPrefix]],
+    ) -> tuple[SharedPrefix, Usage | None, int]:
+        """The shared prefix of ``task``'s first ``turns`` turns, run on first request.
+
+        ``execute(parent, prompts)`` runs ``prompts`` continuing ``parent``,
+        the nearest shorter shared prefix (``None``: start the conversation,
+        setup included). Prefixes are built on demand, so the first task to
+        reach one runs it and later ones wait for it. A prefix that stopped
+        early or failed setup is passed on as is.
+
+        Returns the prefix, the usage of the turns this call ran (``None``
+        if it ran none that reported usage) and how many turns it took
+        from prefixes other tasks ran. A failed prefix is not kept, so the
+        next task to need it tries again.
+        """
+        key = self._prefix_key(task, turns)
+        existing = self._prefixes.get(key)
+        if existing is not None:
+            prefix = await asyncio.shield(existing)
+            return prefix, None, 0 if prefix.failure is not None else turns
+
+        future: asyncio.Future[SharedPrefix] = asyncio.get_running_loop().create_future()
+        self._prefixes[key] = future
+        try:
+            start = next(
+                (n for n in range(turns - 1, 0, -1) if self._prefix_key(task, n) in self._branches),
+                0,
+            )
+            parent, usage, reused = (
+                await self.prefix(task, start, execute) if start else (None, None, 0)
+            )
+            if parent is not None and (parent.result is None or parent.result.stopped_early):
+                prefix = parent
+            else:
+                prefix = await execute(parent, _turns(task)[start:turns])
+                own = prefix.result.usage if prefix.result is not None else None
+                if own is not None:
+                    usage = own if usage is None else usage + own
+        except BaseException as e:
+            del self._prefixes[key]
+            future.set_exception(e)
+            future.exception()
+            raise
+        future.set_result(prefix)
+        if prefix.failure is not None:
+            del self._prefixes[key]
+        return prefix, usage, reused
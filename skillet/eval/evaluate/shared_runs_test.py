@@ -0,0 +1,224 @@
+"""Tests for the SharedRuns class."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from skillet._internal.cache import INFRA_FAILURE_KEY
+from skillet._internal.sdk import QueryResult, Usage
+from skillet.eval.evaluate.shared_prefix import SharedPrefix
+from skillet.eval.evaluate.shared_runs import SharedRuns
+
+
+def _task(**overrides) -> dict:
+    return {"prompt": "p", "expected": "e", "iteration": 1, **overrides}
+
+
+def describe_SharedRuns():
+    def describe_key():
+        def it_ignores_grading_criteria():
+            shared = SharedRuns()
+            assert shared.key(_task()) == shared.key(
+                _task(expected="other", assertions=[{"type": "contains", "value": "x"}])
+            )
+
+        def it_separates_prompts_scripts_and_samples():
+            shared = SharedRuns()
+            keys = {
+                shared.key(t)
+                for t in (
+                    _task(),
+                    _task(prompt="q"),
+                    _task(setup="echo hi"),
+                    _task(teardown="rm -f x"),
+                    _task(iteration=2),
+                )
+            }
+            assert len(keys) == 5
+
+        def it_separates_assertions_that_can_stop_a_fail_fast_run():
+            shared = SharedRuns(fail_fast=True)
+            stop = [{"type": "tool_not_called", "value": "Bash"}]
+            assert shared.key(_task()) != shared.key(_task(assertions=stop))
+
+    def describe_group():
+        def it_groups_tasks_by_key_in_order():
+            tasks = [_task(), _task(prompt="q"), _task(expected="x"), _task(iteration=2)]
+            assert SharedRuns().group(tasks) == [[0, 2], [1], [3]]
+
+    def describe_run():
+        @pytest.mark.asyncio
+        async def it_runs_once_and_hands_a_copy_to_waiting_tasks():
+            shared = SharedRuns()
+            calls = 0
+
+            async def execute():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0)
+                return {"iteration": 1, "response": "r"}
+
+            (first, first_shared), (second, second_shared) = await asyncio.gather(
+                shared.run(_task(), execute), shared.run(_task(expected="x"), execute)
+            )
+
+            assert calls == 1
+            assert first == second == {"iteration": 1, "response": "r"}
+            assert first is not second
+            assert (first_shared, second_shared) == (False, True)
+            assert shared.shared == 1
+
+        @pytest.mark.asyncio
+        async def it_lets_each_task_retry_an_infra_failure():
+            shared = SharedRuns()
+            responses = iter([{"response": "boom", INFRA_FAILURE_KEY: True}, {"response": "r"}])
+
+            async def execute():
+                return next(responses)
+
+            await shared.run(_task(), execute)
+            payload, was_shared = await shared.run(_task(expected="x"), execute)
+
+            assert payload == {"response": "r"}
+            assert was_shared is False
+
+        @pytest.mark.asyncio
+        async def it_shares_offered_cached_responses():
+            shared = SharedRuns()
+            shared.offer(_task(), {"response": "cached"})
+
+            async def execute():
+                raise AssertionError("should not run")
+
+            payload, was_shared = await shared.run(_task(expected="x"), execute)
+
+            assert payload == {"response": "cached"}
+            assert was_shared is True
+
+        @pytest.mark.asyncio
+        async def it_propagates_a_raised_run_to_waiting_tasks():
+            shared = SharedRuns()
+
+            async def execute():
+                await asyncio.sleep(0)
+                raise RuntimeError("boom")
+
+            results = await asyncio.gather(
+                shared.run(_task(), execute),
+                shared.run(_task(expected="x"), execute),
+                return_exceptions=True,
+            )
+
+            assert all(isinstance(r, RuntimeError) for r in results)
+
+    def describe_branch_point():
+        def it_branches_where_conversations_diverge_or_end():
+            tasks = [
+                _task(prompt=["a", "b", "c"]),
+                _task(prompt=["a", "b", "d"]),
+                _task(prompt=["a", "b"]),
+                _task(prompt=["x", "y"]),
+            ]
+            shared = SharedRuns()
+            shared.group(tasks)
+
+            assert [shared.branch_point(t) for t in tasks] == [2, 2, 2, None]
+
+        def it_keeps_the_deepest_shared_prefix():
+            tasks = [
+                _task(prompt=["a", "b", "c", "d"]),
+                _task(prompt=["a", "b", "c", "e"]),
+                _task(prompt=["a", "f"]),
+            ]
+            shared = SharedRuns()
+            shared.group(tasks)
+
+            assert [shared.branch_point(t) for t in tasks] == [3, 3, 1]
+
+        def it_shares_nothing_across_setups_samples_or_with_teardowns():
+            tasks = [
+                _task(prompt=["a", "b"]),
+                _task(prompt=["a", "c"], setup="echo hi"),
+                _task(prompt=["a", "d"], iteration=2),
+                _task(prompt=["a", "e"], teardown="rm -f x"),
+            ]
+            shared = SharedRuns()
+            shared.group(tasks)
+
+            assert [shared.branch_point(t) for t in tasks] == [None] * 4
+
+    def describe_prefix():
+        @pytest.mark.asyncio
+        async def it_runs_each_shared_prefix_once_continuing_the_shorter_one():
+            tasks = [
+                _task(prompt=["a", "b", "c", "d"]),
+                _task(prompt=["a", "b", "c", "e"]),
+                _task(prompt=["a", "f"]),
+            ]
+            shared = SharedRuns()
+            shared.group(tasks)
+            runs = []
+
+            async def execute(parent, prompts):
+                runs.append((parent.result.text if parent else None, prompts))
+                usage = Usage(output_tokens=len(prompts))
+                return SharedPrefix(result=QueryResult(text=prompts[-1], usage=usage), home="h")
+
+            first = await shared.prefix(tasks[0], 3, execute)
+            second = await shared.prefix(tasks[1], 3, execute)
+            third = await shared.prefix(tasks[2], 1, execute)
+
+            assert runs == [(None, ["a"]), ("a", ["b", "c"])]
+            assert first[1:] == (Usage(output_tokens=3), 0)
+            assert second[1:] == (None, 3)
+            assert third[1:] == (None, 1)
+            assert first[0] is second[0]
+
+        @pytest.mark.asyncio
+        async def it_retries_a_prefix_whose_setup_failed():
+            tasks = [_task(prompt=["a", "b"]), _task(prompt=["a", "c"])]
+            shared = SharedRuns()
+            shared.group(tasks)
+            outcomes = iter(
+                [SharedPrefix(failure={"pass": False}), SharedPrefix(result=QueryResult("a"))]
+            )
+
+            async def execute(_parent, _prompts):
+                return next(outcomes)
+
+            failed, _, reused = await shared.prefix(tasks[0], 1, execute)
+            retried, _, _ = await shared.prefix(tasks[1], 1, execute)
+
+            assert failed.failure == {"pass": False}
+            assert reused == 0
+            assert retried.result == QueryResult("a")
+
+        @pytest.mark.asyncio
+        async def it_passes_on_a_prefix_that_stopped_early():
+            tasks = [
+                _task(prompt=["a", "b", "c"]),
+                _task(prompt=["a", "b", "d"]),
+                _task(prompt=["a", "e"]),
+            ]
+            shared = SharedRuns()
+            shared.group(tasks)
+            runs = []
+
+            async def execute(_parent, prompts):
+                runs.append(prompts)
+                return SharedPrefix(result=QueryResult("a", stopped_early=True), home="h")
+
+            stopped, _, _ = await shared.prefix(tasks[0], 2, execute)
+
+            assert runs == [["a"]]
+            assert stopped.result.stopped_early is True
+
+    def describe_home_dir():
+        def it_makes_directories_that_close_deletes():
+            shared = SharedRuns()
+            first, second = shared.home_dir(), shared.home_dir()
+
+            assert first != second
+            shared.close()
+            assert not Path(first).exists()
@@ -0,0 +1,150 @@
+"""Aggregate raw iteration results into an EvaluateResult."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from skillet._internal.sdk import Usage
+from skillet.metrics.pass_at_k import pass_at_k
+from skillet.metrics.pass_pow_k import pass_pow_k
+
+from .result import EvaluateResult, IterationResult, PerEvalMetric, TierStats
+
+_TIERS = ("gate", "fast", "full")
+
+
+def _tier_stats(results: list[IterationResult]) -> list[TierStats]:
+    """Per-tier counts and latencies of the grades ``judge_tiered`` made in this run."""
+    seconds: dict[str, list[float]] = defaultdict(list)
+    decided: dict[str, int] = defaultdict(int)
+    for r in results:
+        if r.grade_cached or not r.judgment or "tier" not in r.judgment:
+            continue
+        decided[r.judgment["tier"]] += 1
+        for tier, elapsed in r.judgment.get("tier_seconds", {}).items():
+            seconds[tier].append(elapsed)
+    return [
+        TierStats(
+            tier=tier,
+            ran=len(seconds[tier]),
+            decided=decided[tier],
+            mean_seconds=sum(seconds[tier]) / len(seconds[tier]),
+        )
+        for tier in _TIERS
+        if seconds[tier]
+    ]
+
+
+def _suite_pass_rate(metrics: list[PerEvalMetric], evals_list: list[dict]) -> float | None:
+    """Pass rate of the full suite estimated from a weighted subset, if the evals carry weights.
+
+    Each eval's own pass rate counts ``_weight`` times (the suite evals it
+    stands for, set by ``select_budget``); evals with no results are left out.
+    """
+    weights = {e["_source"]: e["_weight"] for e in evals_list if "_weight" in e}
+    if not weights:
+        return None
+    scored = [(weights.get(m.eval_source, 1.0), m.c / m.n) for m in metrics if m.n]
+    total = sum(weight for weight, _ in scored)
+    return sum(weight * rate for weight, rate in scored) / total * 100 if total else 0.0
+
+
+def _total_usage(results: Iterable[IterationResult]) -> Usage | None:
+    """Sum of the usages reported, or ``None`` when none were."""
+    usages = [r.usage for r in results if r.usage is not None]
+    return sum(usages[1:], usages[0]) if usages else None
+
+
+def summarize_results(
+    raw_results: list[dict],
+    tasks: list[dict],
+    *,
+    samples: int,
+    evals_list: list[dict],
+    total_evals: int,
+    seed: int | None = None,
+    missing_count: int = 0,
+    skipped_count: int = 0,
+) -> EvaluateResult:
+    """Build an :class:`EvaluateResult` from ``run_single_eval`` outputs.
+
+    Computes the overall pass rate, cache hit counts, and per-eval pass@k and
+    pass^k. ``evals_list`` is the (possibly sampled) set that ran and
+    ``total_evals`` the size of the suite it was drawn from.
+    ``missing_count`` is the number of tasks with no result (cache-only
+    runs) and ``skipped_count`` the number never started because a usage
+    cap was reached; rates and pass@k cover the results that exist. When
+    ``evals_list`` is a weighted budget subset, ``suite_pass_rate``
+    estimates the full suite's pass rate from it. Grades
+    made through judging tiers are tallied per tier in ``tier_stats``.
+    Usage is summed per eval over every iteration and for the run over
+    fresh ones, leaving out responses shared from another eval's run (so
+    each agent run is counted once).
+    """
+    results = [
+        IterationResult(
+            eval_idx=r["eval_idx"],
+            eval_source=r["eval_source"],
+            iteration=r["iteration"],
+            response=r["response"],
+            passed=r["pass"],
+            tool_calls=r.get("tool_calls"),
+            judgment=r.get("judgment"),
+            cached=r.get("cached", False),
+            stopped_early=r.get("stopped_early", False),
+            usage=Usage(**r["usage"]) if r.get("usage") else None,
+            shared=r.get("shared", False),
+            shared_turns=r.get("shared_turns", 0),
+            grade_cached=r.get("grade_cached", False),
+        )
+        for r in raw_results
+    ]
+
+    # Calculate stats
+    cached_count = sum(1 for r in results if r.cached)
+    fresh_count = len(results) - cached_count
+    total_pass = sum(1 for r in results if r.passed)
+    total_runs = len(results)
+    pass_rate = total_pass / total_runs * 100 if total_runs > 0 else 0
+
+    # Per-eval pass@k and pass^k metrics
+    evals_by_source: dict[str, list[IterationResult]] = defaultdict(list)
+    for r in results:
+        evals_by_source[r.eval_source].append(r)
+
+    per_eval_metrics = []
+    for source, eval_results in evals_by_source.items():
+        n = len(eval_results)
+        c = sum(1 for r in eval_results if r.passed)
+        per_eval_metrics.append(
+            PerEvalMetric(
+                eval_source=source,
+                pass_at_k=pass_at_k(n, c, samples),
+                pass_pow_k=pass_pow_k(n, c, samples),
+                k=samples,
+                n=n,
+                c=c,
+                usage=_total_usage(eval_results),
+            )
+        )
+
+    return EvaluateResult(
+        results=results,
+        tasks=tasks,
+        pass_rate=pass_rate,
+        total_runs=total_runs,
+        total_pass=total_pass,
+        cached_count=cached_count,
+        fresh_count=fresh_count,
+        total_evals=total_evals,
+        sampled_evals=len(evals_list),
+        per_eval_metrics=per_eval_metrics,
+        selected_evals=[e["_source"] for e in evals_list],
+        seed=seed,
+        missing_count=missing_count,
+        tier_stats=_tier_stats(results),
+        usage=_total_usage(r for r in results if not (r.cached or r.shared)),
+        skipped_count=skipped_count,
+        shared_count=sum(1 for r in results if r.shared),
+        shared_turns=sum(r.shared_turns for r in results),
+        suite_pass_rate=_suite_pass_rate(per_eval_metrics, evals_list),
+    )
@@ -0,0 +1,169 @@
+"""Tests for evaluate/summarize_results module."""
+
+from skillet._internal.sdk import Usage
+from skillet.eval.evaluate.summarize_results import summarize_results
+from skillet.evals.select import select_budget
+
+EVALS = [
+    {"_source": "1.md"},
+    {"_source": "2.md"},
+]
+
+
+def _raw(idx: int, source: str, iteration: int, passed: bool, cached: bool = False) -> dict:
+    return {
+        "eval_idx": idx,
+        "eval_source": source,
+        "iteration": iteration,
+        "response": "r",
+        "pass": passed,
+        "cached": cached,
+    }
+
+
+def describe_summarize_results():
+    def it_computes_pass_rate_and_cache_counts():
+        raw = [_raw(0, "1.md", 1, True, cached=True), _raw(1, "2.md", 1, False)]
+
+        result = summarize_results(raw, [], samples=1, evals_list=EVALS, total_evals=5, seed=7)
+
+        assert result.pass_rate == 50.0
+        assert (result.cached_count, result.fresh_count) == (1, 1)
+        assert (result.sampled_evals, result.total_evals) == (2, 5)
+        assert result.selected_evals == ["1.md", "2.md"]
+        assert result.seed == 7
+
+    def it_computes_per_eval_metrics():
+        raw = [_raw(0, "1.md", 1, True), _raw(0, "1.md", 2, False)]
+
+        result = summarize_results(raw, [], samples=2, evals_list=EVALS[:1], total_evals=1)
+
+        (metric,) = result.per_eval_metrics
+        assert (metric.n, metric.c, metric.k) == (2, 1, 2)
+        assert metric.pass_at_k == 1.0
+
+    def it_carries_the_missing_count():
+        raw = [_raw(0, "1.md", 1, True, cached=True)]
+
+        result = summarize_results(
+            raw, [], samples=2, evals_list=EVALS[:1], total_evals=1, missing_count=1
+        )
+
+        assert result.missing_count == 1
+        assert result.total_runs == 1
+
+    def it_sums_usage_per_eval_and_over_fresh_runs():
+        raw = [
+            {**_raw(0, "1.md", 1, True, cached=True), "usage": {"output_tokens": 5}},
+            {**_raw(0, "1.md", 2, True), "usage": {"output_tokens": 7, "cost_usd": 0.2}},
+            _raw(1, "2.md", 1, True),
+        ]
+
+        result = summarize_results(
+            raw, [], samples=2, evals_list=EVALS, total_evals=2, skipped_count=3
+        )
+
+        first, second = result.per_eval_metrics
+        assert first.usage == Usage(output_tokens=12, cost_usd=0.2)
+        assert second.usage is None
+        assert result.usage == Usage(output_tokens=7, cost_usd=0.2)
+        assert result.results[0].usage == Usage(output_tokens=5)
+        assert result.skipped_count == 3
+
+    def it_counts_shared_responses_once_in_the_run_usage():
+        usage = {"output_tokens": 7}
+        raw = [
+            {**_raw(0, "1.md", 1, True), "usage": usage},
+            {**_raw(1, "2.md", 1, False), "usage": usage, "shared": True},
+        ]
+
+        result = summarize_results(raw, [], samples=1, evals_list=EVALS, total_evals=2)
+
+        assert result.shared_count == 1
+        assert result.results[1].shared is True
+        assert result.usage == Usage(output_tokens=7)
+        assert [m.usage for m in result.per_eval_metrics] == [Usage(output_tokens=7)] * 2
+
+    def it_sums_the_turns_taken_from_shared_prefixes():
+        raw = [_raw(0, "1.md", 1, True), {**_raw(1, "2.md", 1, True), "shared_turns": 2}]
+
+        result = summarize_results(raw, [], samples=1, evals_list=EVALS, total_evals=2)
+
+        assert result.shared_turns == 2
+        assert result.results[1].shared_turns == 2
+
+    def it_tallies_the_judging_tiers():
+        fast = {"pass": True, "tier": "fast", "tier_seconds": {"gate": 0.0, "fast": 1.0}}
+        full = {"pass": True, "tier": "full", "tier_seconds": {"fast": 3.0, "full": 5.0}}
+        raw = [
+            {**_raw(0, "1.md", 1, True), "judgment": fast},
+            {**_raw(0, "1.md", 2, True), "judgment": full},
+            {**_raw(1, "2.md", 1, True), "judgment": {"pass": True, "reasoning": "plain"}},
+        ]
+
+        result = summarize_results(raw, [], samples=2, evals_list=EVALS, total_evals=2)
+
+        stats = {(s.tier, s.ran, s.decided, s.mean_seconds) for s in result.tier_stats}
+        assert stats == {("gate", 1, 0, 0.0), ("fast", 2, 1, 2.0), ("full", 1, 1, 5.0)}
+        assert [s.tier for s in result.tier_stats] == ["gate", "fast", "full"]
+
+    def it_leaves_cached_grades_out_of_the_tiers():
+        fast = {"pass": True, "tier": "fast", "tier_seconds": {"fast": 1.0}}
+        full = {"pass": True, "tier": "full", "tier_seconds": {"fast": 3.0, "full": 5.0}}
+        raw = [
+            {**_raw(0, "1.md", 1, True), "judgment": fast},
+            {**_raw(0, "1.md", 2, True, cached=True), "judgment": full, "grade_cached": True},
+        ]
+
+        result = summarize_results(raw, [], samples=2, evals_list=EVALS[:1], total_evals=1)
+
+        stats = {(s.tier, s.ran, s.decided, s.mean_seconds) for s in result.tier_stats}
+        assert stats == {("fast", 1, 1, 1.0)}
+        assert result.results[1].grade_cached is True
+
+    def it_reports_no_tiers_for_untiered_grades():
+        result = summarize_results(
+            [_raw(0, "1.md", 1, True)], [], samples=1, evals_list=EVALS[:1], total_evals=1
+        )
+
+        assert result.tier_stats == []
+
+    def it_handles_no_results():
+        result = summarize_results([], [], samples=1, evals_list=[], total_evals=0)
+
+        assert result.pass_rate == 0
+        assert result.per_eval_metrics == []
+
+    def it_estimates_the_suite_pass_rate_from_a_budget_subset():
+        commits = [
+            {"_source": f"commit-{i}.md", "prompt": f"Write a conventional commit for file {i}"}
+            for i in range(8)
+        ]
+        others = [
+            {"_source": "sql.md", "prompt": "Refactor the database migration script to use async"},
+            {"_source": "haiku.md", "prompt": "Write a haiku about autumn leaves falling"},
+            {"_source": "docker.md", "prompt": "Shrink the Dockerfile with a multi-stage build"},
+            {"_source": "regex.md", "prompt": "Explain what this regular expression matches"},
+        ]
+        # Skewed suite: the large cluster always passes, the singletons always fail
+        passes = {e["_source"]: e in commits for e in commits + others}
+        subset = select_budget(commits + others, 5)
+        raw = [
+            _raw(idx, e["_source"], i, passes[e["_source"]])
+            for idx, e in enumerate(subset)
+            for i in (1, 2)
+        ]
+
+        result = summarize_results(raw, [], samples=2, evals_list=subset, total_evals=12)
+
+        full_suite = sum(passes.values()) / len(passes) * 100
+        assert result.pass_rate == 20.0
+        assert result.suite_pass_rate is not None
+        assert abs(result.suite_pass_rate - full_suite) < 1e-9
+
+    def it_has_no_suite_estimate_for_unweighted_evals():
+        raw = [_raw(0, "1.md", 1, True)]
+
+        result = summarize_results(raw, [], samples=1, evals_list=EVALS[:1], total_evals=1)
+
+        assert result.suite_pass_rate is None
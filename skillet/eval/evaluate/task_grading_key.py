@@ -0,0 +1,10 @@
+"""Key a task's grading criteria for the grade cache."""
+
+from ..judge import JudgeTiers, grading_key
+
+
+def task_grading_key(task: dict, judge_tiers: JudgeTiers | None) -> str:
+    """The :func:`grading_key` of ``task``'s criteria under ``judge_tiers``."""
+    return grading_key(
+        task["expected"], task.get("assertions"), gate=task.get("gate"), tiers=judge_tiers
+    )
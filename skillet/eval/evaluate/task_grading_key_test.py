@@ -0,0 +1,26 @@
+"""Tests for task_grading_key."""
+
+from skillet.eval.evaluate.task_grading_key import task_grading_key
+from skillet.eval.judge import JudgeTiers, grading_key
+
+GATE = [{"type": "contains", "value": "ok"}]
+
+
+def describe_task_grading_key():
+    def it_keys_the_tasks_criteria():
+        task = {"expected": "says hi", "gate": GATE, "prompt": "p"}
+
+        assert task_grading_key(task, None) == grading_key("says hi", gate=GATE)
+
+    def it_includes_the_judge_tiers():
+        task = {"expected": "says hi"}
+        tiers = JudgeTiers("haiku", 0.8)
+
+        assert task_grading_key(task, tiers) == grading_key("says hi", tiers=tiers)
+        assert task_grading_key(task, tiers) != task_grading_key(task, None)
+
+    def it_ignores_compiled_plans():
+        assertions = [{"type": "contains", "value": "4"}]
+        task = {"expected": "", "assertions": assertions, "assertion_plan": object()}
+
+        assert task_grading_key(task, None) == grading_key("", assertions)
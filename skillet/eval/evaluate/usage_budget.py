@@ -0,0 +1,31 @@
+"""Token and cost caps for a run's fresh agent runs."""
+
+from skillet._internal.sdk import Usage
+
+
+class UsageBudget:
+    """Tally what fresh iterations spend and report when a cap is reached.
+
+    ``max_cost`` caps the reported cost in US dollars and ``max_tokens`` the
+    total tokens (:attr:`Usage.total_tokens`); ``None`` leaves either
+    uncapped. Cached results, and responses shared from another eval's run,
+    cost nothing. An agent that reports no cost
+    (codex) never reaches ``max_cost``.
+    """
+
+    def __init__(self, max_cost: float | None = None, max_tokens: int | None = None) -> None:
+        self.max_cost = max_cost
+        self.max_tokens = max_tokens
+        self.spent = Usage()
+
+    def record(self, result: dict) -> None:
+        """Charge a ``run_single_eval`` result's usage, unless it was cached or shared."""
+        if not (result.get("cached") or result.get("shared")) and result.get("usage"):
+            self.spent += Usage(**result["usage"])
+
+    def exhausted(self) -> bool:
+        """Whether the spend so far has reached either cap."""
+        if self.max_tokens is not None and self.spent.total_tokens >= self.max_tokens:
+            return True
+        cost = self.spent.cost_usd
+        return self.max_cost is not None and cost is not None and cost >= self.max_cost
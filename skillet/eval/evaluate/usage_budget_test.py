@@ -0,0 +1,40 @@
+"""Tests for evaluate/usage_budget module."""
+
+from skillet.eval.evaluate.usage_budget import UsageBudget
+
+
+def _result(*, cached: bool = False, shared: bool = False, **usage) -> dict:
+    return {"cached": cached, "shared": shared, "usage": usage or None}
+
+
+def describe_UsageBudget():
+    def it_is_never_exhausted_without_caps():
+        budget = UsageBudget()
+        budget.record(_result(output_tokens=10**9, cost_usd=10**6))
+
+        assert budget.exhausted() is False
+
+    def it_stops_at_the_token_cap():
+        budget = UsageBudget(max_tokens=100)
+        budget.record(_result(input_tokens=40, output_tokens=40))
+        assert budget.exhausted() is False
+
+        budget.record(_result(cache_read_tokens=20))
+        assert budget.exhausted() is True
+
+    def it_stops_at_the_cost_cap():
+        budget = UsageBudget(max_cost=1.0)
+        budget.record(_result(cost_usd=0.6))
+        assert budget.exhausted() is False
+
+        budget.record(_result(cost_usd=0.4))
+        assert budget.exhausted() is True
+
+    def it_does_not_charge_cached_or_shared_results_or_unreported_usage():
+        budget = UsageBudget(max_tokens=1)
+        budget.record(_result(cached=True, output_tokens=50))
+        budget.record(_result(shared=True, output_tokens=50))
+        budget.record(_result())
+
+        assert budget.spent.total_tokens == 0
+        assert budget.exhausted() is False
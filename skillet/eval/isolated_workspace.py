@@ -0,0 +1,110 @@
+"""Async context manager for a per-iteration copy of the project directory."""
+
+import asyncio
+import errno
+import fcntl
+import functools
+import logging
+import shutil
+import sys
+import tempfile
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from skillet import config
+
+logger = logging.getLogger(__name__)
+
+# ioctl(FICLONE): share the source file's extents (Linux btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+
+# Errors meaning the filesystem (or the pair of them) cannot reflink
+_NO_REFLINK = {errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.EBADF}
+
+# Cleanups still running, kept referenced so they are not collected mid-run
+_pending: set[asyncio.Future[None]] = set()
+
+
+@functools.cache
+def _warn_copying(src: Path) -> None:
+    """Warn, once per project, that its clones are full copies."""
+    logger.warning(
+        "Cannot reflink %s into %s; every sandboxed iteration copies the whole project, "
+        "including directories such as .git and node_modules. Set SKILLET_WORKSPACE_DIR "
+        "to a directory on the project's filesystem, if it supports reflinks, to clone it "
+        "without copying.",
+        src,
+        config.WORKSPACE_DIR or tempfile.gettempdir(),
+    )
+
+
+def _clone_tree(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst``, reflinking files where the filesystem allows.
+
+    Symlinks are copied as links. The first file that cannot be reflinked
+    switches the rest of the tree to plain copies, with a warning the first
+    time it happens for ``src``. Nothing is left out of a copy: an agent
+    may need the project's ``.git`` or installed dependencies.
+    """
+    reflink = sys.platform == "linux"
+
+    def clone_file(src_file: str, dst_file: str) -> None:
+        nonlocal reflink
+        if reflink:
+            try:
+                with Path(src_file).open("rb") as s, Path(dst_file).open("wb") as d:
+                    fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+                shutil.copystat(src_file, dst_file)
+                return
+            except OSError as e:
+                if e.errno not in _NO_REFLINK:
+                    raise
+                reflink = False
+                _warn_copying(src)
+        shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, symlinks=True, copy_function=clone_file)
+
+
+def _cleanup(root: str) -> None:
+    """Delete ``root`` off the event loop; the run does not wait for it."""
+    future = asyncio.get_running_loop().run_in_executor(None, shutil.rmtree, root, True)
+    _pending.add(future)
+    future.add_done_callback(_pending.discard)
+
+
+@asynccontextmanager
+async def isolated_workspace(project_dir: str | None) -> AsyncGenerator[str, None]:
+    """Async context manager for a private working directory for one eval iteration.
+
+    Clones ``project_dir`` (the directory holding the skill's ``.claude`` or
+    ``.codex``) into a temporary directory, so parallel iterations that write
+    files never see each other's changes or touch the real project. Files are
+    reflinked where the filesystem supports it (copy-on-write: the clone costs
+    no data until a file is written) and copied otherwise. Without a project
+    the workspace starts empty.
+
+    Clones are made under ``SKILLET_WORKSPACE_DIR`` (default: the system temp
+    directory); reflinks need it on the project's filesystem. The clone is
+    deleted in the background once the context exits.
+
+    Args:
+        project_dir: Directory to clone, or ``None`` for an empty workspace.
+
+    Yields:
+        Path to the workspace
+    """
+    parent = config.WORKSPACE_DIR
+    if parent is not None:
+        parent.mkdir(parents=True, exist_ok=True)
+    root = tempfile.mkdtemp(prefix="skillet-work-", dir=parent)
+    workspace = Path(root) / (Path(project_dir).name if project_dir else "workspace")
+    try:
+        if project_dir:
+            await asyncio.to_thread(_clone_tree, Path(project_dir), workspace)
+        else:
+            workspace.mkdir()
+        yield str(workspace)
+    finally:
+        _cleanup(root)
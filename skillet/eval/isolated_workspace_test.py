@@ -0,0 +1,116 @@
+"""Tests for eval/isolated_workspace module."""
+
+import asyncio
+import errno
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skillet.eval.isolated_workspace import isolated_workspace
+
+_IW = "skillet.eval.isolated_workspace"
+
+
+async def _drain_cleanups() -> None:
+    await asyncio.gather(*list(sys.modules[_IW]._pending))
+
+
+def describe_isolated_workspace():
+    """Tests for the per-iteration project clone."""
+
+    @pytest.fixture
+    def project(tmp_path: Path) -> Path:
+        root = tmp_path / "project"
+        (root / ".claude" / "skills" / "demo").mkdir(parents=True)
+        (root / ".claude" / "skills" / "demo" / "SKILL.md").write_text("# Demo")
+        (root / "src").mkdir()
+        (root / "src" / "app.py").write_text("print('hi')")
+        (root / "link.py").symlink_to("src/app.py")
+        return root
+
+    @pytest.fixture(autouse=True)
+    def workspace_dir(tmp_path: Path):
+        with patch(f"{_IW}.config.WORKSPACE_DIR", tmp_path / "work"):
+            yield tmp_path / "work"
+
+    @pytest.mark.asyncio
+    async def it_clones_the_project_under_its_own_name(project: Path, workspace_dir: Path):
+        async with isolated_workspace(str(project)) as workspace:
+            clone = Path(workspace)
+            assert clone.name == "project"
+            assert clone.parent.parent == workspace_dir
+            assert (clone / ".claude" / "skills" / "demo" / "SKILL.md").read_text() == "# Demo"
+            assert (clone / "src" / "app.py").read_text() == "print('hi')"
+            assert (clone / "link.py").is_symlink()
+
+    @pytest.mark.asyncio
+    async def it_keeps_writes_out_of_the_project(project: Path):
+        async with (
+            isolated_workspace(str(project)) as first,
+            isolated_workspace(str(project)) as second,
+        ):
+            (Path(first) / "src" / "app.py").write_text("changed")
+            (Path(first) / "new.txt").write_text("new")
+
+            assert (Path(second) / "src" / "app.py").read_text() == "print('hi')"
+        assert (project / "src" / "app.py").read_text() == "print('hi')"
+        assert not (project / "new.txt").exists()
+
+    @pytest.mark.asyncio
+    async def it_starts_empty_without_a_project():
+        async with isolated_workspace(None) as workspace:
+            assert Path(workspace).is_dir()
+            assert not any(Path(workspace).iterdir())
+
+    @pytest.mark.asyncio
+    async def it_deletes_the_clone_in_the_background(project: Path):
+        async with isolated_workspace(str(project)) as workspace:
+            root = Path(workspace).parent
+
+        await _drain_cleanups()
+        assert not root.exists()
+
+    @pytest.mark.asyncio
+    async def it_cleans_up_when_the_body_raises(project: Path):
+        with pytest.raises(RuntimeError):
+            async with isolated_workspace(str(project)) as workspace:
+                root = Path(workspace).parent
+                raise RuntimeError("boom")
+
+        await _drain_cleanups()
+        assert not root.exists()
+
+    @pytest.mark.asyncio
+    async def it_falls_back_to_copies_once_reflinks_are_unsupported(project: Path):
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch(f"{_IW}.fcntl.ioctl", side_effect=unsupported) as ioctl:
+            async with isolated_workspace(str(project)) as workspace:
+                assert (Path(workspace) / "src" / "app.py").read_text() == "print('hi')"
+
+        assert ioctl.call_count == 1
+
+    @pytest.mark.asyncio
+    async def it_warns_once_per_project_when_falling_back_to_copies(
+        project: Path, caplog: pytest.LogCaptureFixture
+    ):
+        sys.modules[_IW]._warn_copying.cache_clear()
+        unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+        with patch(f"{_IW}.fcntl.ioctl", side_effect=unsupported):
+            for _ in range(2):
+                async with isolated_workspace(str(project)):
+                    pass
+
+        warnings = [r for r in caplog.records if "Cannot reflink" in r.message]
+        assert len(warnings) == 1
+        assert "SKILLET_WORKSPACE_DIR" in warnings[0].message
+
+    @pytest.mark.asyncio
+    async def it_raises_on_other_clone_errors(project: Path):
+        with (
+            patch(f"{_IW}.fcntl.ioctl", side_effect=OSError(errno.EIO, "I/O error")),
+            pytest.raises(OSError, match="I/O error"),
+        ):
+            async with isolated_workspace(str(project)):
+                pass
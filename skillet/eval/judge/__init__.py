@@ -1,6 +1,9 @@
 """LLM-as-judge for evaluating responses."""
 
+from .grading_key import grading_key
 from .judge_response import judge_response
+from .judge_tiered import judge_tiered
 from .run_assertions import run_assertions
+from .types import JudgeTiers
 
-__all__ = ["judge_response", "run_assertions"]
+__all__ = ["JudgeTiers", "grading_key", "judge_response", "judge_tiered", "run_assertions"]
@@ -0,0 +1,38 @@
+"""Key an eval's grading criteria for the grade cache."""
+
+import json
+
+from skillet._internal.cache import hash_content, hash_file
+
+from .judge_response import FAST_JUDGE_PROMPT, JUDGE_PROMPT
+from .types import JudgeTiers
+
+
+def grading_key(
+    expected: str,
+    assertions: list[dict] | None = None,
+    *,
+    gate: list[dict] | None = None,
+    tiers: JudgeTiers | None = None,
+) -> str:
+    """Return a short hash of everything a grade depends on besides the response.
+
+    Evals with ``assertions`` are graded by the assertions alone. Otherwise
+    the LLM judge grades against ``expected`` with the judge prompt template,
+    so the template's hash is part of the key and editing it re-grades. A
+    ``gate`` and a fast judge (``tiers``) can decide a grade before the full
+    judge does, so they are part of the key when set.
+    """
+    if assertions:
+        criteria: dict = {"assertions": assertions}
+    else:
+        criteria = {"expected": expected, "judge": hash_file(JUDGE_PROMPT)}
+        if gate:
+            criteria["gate"] = gate
+        if tiers is not None:
+            criteria["fast_judge"] = {
+                "model": tiers.fast_model,
+                "escalate_below": tiers.escalate_below,
+                "prompt": hash_file(FAST_JUDGE_PROMPT),
+            }
+    return hash_content(json.dumps(criteria, sort_keys=True))
@@ -0,0 +1,52 @@
+"""Tests for grading_key."""
+
+from unittest.mock import patch
+
+from skillet.eval.judge import grading_key
+from skillet.eval.judge.types import JudgeTiers
+
+
+def describe_grading_key():
+    def it_changes_with_expected():
+        assert grading_key("says hi") != grading_key("says bye")
+
+    def it_changes_with_assertions():
+        a = grading_key("x", [{"type": "contains", "value": "4"}])
+        b = grading_key("x", [{"type": "contains", "value": "5"}])
+
+        assert a != b
+
+    def it_ignores_expected_when_assertions_grade():
+        assertions = [{"type": "contains", "value": "4"}]
+
+        assert grading_key("one", assertions) == grading_key("two", assertions)
+
+    def it_changes_with_the_judge_template():
+        before = grading_key("says hi")
+
+        with patch("skillet.eval.judge.grading_key.hash_file", return_value="newtemplate"):
+            assert grading_key("says hi") != before
+
+    def it_keeps_the_key_of_evals_without_a_gate_or_fast_judge():
+        assert grading_key("says hi", gate=None, tiers=None) == grading_key("says hi")
+
+    def it_changes_with_the_gate():
+        a = grading_key("x", gate=[{"type": "contains", "value": "4"}])
+        b = grading_key("x", gate=[{"type": "contains", "value": "5"}])
+
+        assert a != b
+        assert a != grading_key("x")
+
+    def it_changes_with_the_fast_judge():
+        haiku = grading_key("x", tiers=JudgeTiers("haiku"))
+
+        assert haiku != grading_key("x")
+        assert haiku != grading_key("x", tiers=JudgeTiers("sonnet"))
+        assert haiku != grading_key("x", tiers=JudgeTiers("haiku", escalate_below=0.5))
+
+    def it_ignores_the_gate_and_fast_judge_when_assertions_grade():
+        assertions = [{"type": "contains", "value": "4"}]
+
+        assert grading_key("x", assertions, tiers=JudgeTiers("haiku")) == grading_key(
+            "x", assertions
+        )
@@ -10,6 +10,7 @@ from .format_tool_calls import format_tool_calls
 from .judge_via_agent import judge_via_agent
 
 JUDGE_PROMPT = Path(__file__).parent / "judge.txt"
+FAST_JUDGE_PROMPT = Path(__file__).parent / "fast_judge.txt"
 
 
 async def judge_response(
@@ -19,26 +20,33 @@ async def judge_response(
     tool_calls: list[dict] | None = None,
     *,
     agent: Agent,
+    model: str | None = None,
 ) -> dict:
     """Use the selected agent as a judge to evaluate if a response meets expectations.
 
     The verdict is produced by ``agent``'s own CLI. A judge that cannot return a
     valid verdict raises (``JudgeError``), failing the eval loudly rather than
     silently grading it as a pass.
+
+    With ``model`` the judge runs on that model as a fast judge: it is asked
+    for its ``confidence`` too, which the result carries.
     """
     formatted_prompt = format_prompt(prompt)
     formatted_tools = format_tool_calls(tool_calls or [])
 
     judge_prompt = load_prompt(
-        JUDGE_PROMPT,
+        FAST_JUDGE_PROMPT if model else JUDGE_PROMPT,
         prompt=formatted_prompt,
         response=response,
         tools=formatted_tools,
         expected=expected,
     )
 
-    judgment = await judge_via_agent(judge_prompt, agent)
-    return {
+    judgment = await judge_via_agent(judge_prompt, agent, model=model)
+    result = {
         "pass": judgment.passed,
         "reasoning": judgment.reasoning,
     }
+    if model:
+        result["confidence"] = judgment.confidence
+    return result
@@ -62,6 +62,34 @@ def describe_judge_response():
 
         assert mock_judge_via_agent.call_args[0][1] is Agent.CLAUDE
 
+    @pytest.mark.asyncio
+    async def it_leaves_confidence_out_of_full_judgments(mock_judge_via_agent):
+        result = await judge_response(
+            prompt="test", response="response", expected="expected", agent=Agent.CLAUDE
+        )
+
+        assert "confidence" not in result
+        assert '"confidence"' not in mock_judge_via_agent.call_args[0][0]
+        assert mock_judge_via_agent.call_args[1]["model"] is None
+
+    @pytest.mark.asyncio
+    async def it_asks_a_fast_judge_for_its_confidence(mock_judge_via_agent):
+        mock_judge_via_agent.return_value = Judgment.model_validate(
+            {"pass": True, "reasoning": "OK", "confidence": 0.95}
+        )
+
+        result = await judge_response(
+            prompt="test",
+            response="response",
+            expected="expected",
+            agent=Agent.CLAUDE,
+            model="haiku",
+        )
+
+        assert result == {"pass": True, "reasoning": "OK", "confidence": 0.95}
+        assert '"confidence"' in mock_judge_via_agent.call_args[0][0]
+        assert mock_judge_via_agent.call_args[1]["model"] == "haiku"
+
     @pytest.mark.asyncio
     async def it_includes_tool_calls_in_prompt(mock_judge_via_agent):
         tool_calls = [{"name": "read_file", "input": {"path": "/test.txt"}}]
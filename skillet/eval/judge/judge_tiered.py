@@ -0,0 +1,59 @@
+"""Grade a response through cheap tiers before the full LLM judge."""
+
+import time
+
+from skillet.agent import Agent
+
+from .judge_response import judge_response
+from .run_assertions import AssertionPlan, run_assertions
+from .types import JudgeTiers
+
+
+async def judge_tiered(
+    prompt: str | list[str],
+    response: str,
+    expected: str,
+    tool_calls: list[dict] | None = None,
+    *,
+    agent: Agent,
+    gate: list[dict] | AssertionPlan | None = None,
+    tiers: JudgeTiers | None = None,
+) -> dict:
+    """Judge ``response`` against ``expected``, trying the cheapest tier first.
+
+    1. ``gate``: assertions checked without an agent call. A failing gate
+       fails the response outright; a passing one moves on to a judge.
+    2. Fast judge (``tiers``): its verdict stands when it is at least
+       ``escalate_below`` confident and does not contradict a passing gate.
+    3. Full judge: everything the tiers above did not settle.
+
+    The result has the shape of ``judge_response()``'s, plus ``tier`` (the
+    tier that decided) and ``tier_seconds`` (time spent in each tier that ran).
+    """
+    seconds: dict[str, float] = {}
+
+    def decided(tier: str, judgment: dict) -> dict:
+        return {**judgment, "tier": tier, "tier_seconds": seconds}
+
+    if gate:
+        start = time.perf_counter()
+        checked = run_assertions(response=response, assertions=gate, tool_calls=tool_calls)
+        seconds["gate"] = time.perf_counter() - start
+        if not checked["pass"]:
+            return decided("gate", {**checked, "reasoning": f"Gate: {checked['reasoning']}"})
+
+    if tiers is not None:
+        start = time.perf_counter()
+        fast = await judge_response(
+            prompt, response, expected, tool_calls, agent=agent, model=tiers.fast_model
+        )
+        seconds["fast"] = time.perf_counter() - start
+        confidence = fast.get("confidence")
+        sure = confidence is not None and confidence >= tiers.escalate_below
+        if sure and (fast["pass"] or not gate):
+            return decided("fast", fast)
+
+    start = time.perf_counter()
+    full = await judge_response(prompt, response, expected, tool_calls, agent=agent)
+    seconds["full"] = time.perf_counter() - start
+    return decided("full", full)
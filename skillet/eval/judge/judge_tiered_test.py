@@ -0,0 +1,104 @@
+"""Tests for judge/judge_tiered module."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillet.agent import Agent
+from skillet.eval.judge.judge_tiered import judge_tiered
+from skillet.eval.judge.types import JudgeTiers
+
+_GATE = [{"type": "contains", "value": "hello"}]
+
+
+def _fast(passed: bool, confidence: float | None) -> dict:
+    return {"pass": passed, "reasoning": "fast", "confidence": confidence}
+
+
+def describe_judge_tiered():
+    @pytest.fixture(autouse=True)
+    def mock_judge_response():
+        with patch(
+            "skillet.eval.judge.judge_tiered.judge_response", new_callable=AsyncMock
+        ) as mock:
+            mock.return_value = {"pass": True, "reasoning": "full"}
+            yield mock
+
+    async def _judge(response: str = "hello there", **kwargs) -> dict:
+        return await judge_tiered("Say hello", response, "A greeting", agent=Agent.CLAUDE, **kwargs)
+
+    @pytest.mark.asyncio
+    async def it_uses_the_full_judge_without_tiers(mock_judge_response):
+        result = await _judge()
+
+        assert result["pass"] is True
+        assert result["tier"] == "full"
+        assert set(result["tier_seconds"]) == {"full"}
+        assert mock_judge_response.call_args.kwargs.get("model") is None
+
+    @pytest.mark.asyncio
+    async def it_fails_on_the_gate_without_calling_a_judge(mock_judge_response):
+        result = await _judge("goodbye", gate=_GATE, tiers=JudgeTiers("haiku"))
+
+        assert result["pass"] is False
+        assert result["tier"] == "gate"
+        assert result["reasoning"].startswith("Gate: ")
+        assert set(result["tier_seconds"]) == {"gate"}
+        mock_judge_response.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def it_judges_after_a_passing_gate(mock_judge_response):
+        result = await _judge(gate=_GATE)
+
+        assert result["tier"] == "full"
+        assert set(result["tier_seconds"]) == {"gate", "full"}
+        mock_judge_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def it_keeps_a_confident_fast_verdict(mock_judge_response):
+        mock_judge_response.return_value = _fast(False, 0.9)
+
+        result = await _judge(tiers=JudgeTiers("haiku", escalate_below=0.8))
+
+        assert result["pass"] is False
+        assert result["tier"] == "fast"
+        assert mock_judge_response.await_count == 1
+        assert mock_judge_response.call_args.kwargs["model"] == "haiku"
+
+    @pytest.mark.asyncio
+    async def it_escalates_an_unsure_fast_verdict(mock_judge_response):
+        mock_judge_response.side_effect = [_fast(False, 0.5), {"pass": True, "reasoning": "full"}]
+
+        result = await _judge(tiers=JudgeTiers("haiku", escalate_below=0.8))
+
+        assert result["pass"] is True
+        assert result["tier"] == "full"
+        assert set(result["tier_seconds"]) == {"fast", "full"}
+        assert mock_judge_response.await_args_list[1].kwargs.get("model") is None
+
+    @pytest.mark.asyncio
+    async def it_escalates_a_fast_verdict_without_a_confidence(mock_judge_response):
+        mock_judge_response.side_effect = [_fast(True, None), {"pass": False, "reasoning": "no"}]
+
+        result = await _judge(tiers=JudgeTiers("haiku"))
+
+        assert result["tier"] == "full"
+        assert result["pass"] is False
+
+    @pytest.mark.asyncio
+    async def it_escalates_when_the_fast_judge_contradicts_the_gate(mock_judge_response):
+        mock_judge_response.side_effect = [_fast(False, 1.0), {"pass": True, "reasoning": "full"}]
+
+        result = await _judge(gate=_GATE, tiers=JudgeTiers("haiku"))
+
+        assert result["tier"] == "full"
+        assert set(result["tier_seconds"]) == {"gate", "fast", "full"}
+
+    @pytest.mark.asyncio
+    async def it_keeps_a_confident_fast_pass_that_agrees_with_the_gate(mock_judge_response):
+        mock_judge_response.return_value = _fast(True, 0.95)
+
+        result = await _judge(gate=_GATE, tiers=JudgeTiers("haiku"))
+
+        assert result["tier"] == "fast"
+        assert result["pass"] is True
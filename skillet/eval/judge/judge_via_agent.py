@@ -1,6 +1,6 @@
 """Obtain a judge verdict from the selected agent's CLI."""
 
-from skillet._internal.agent import run_agent
+from skillet._internal.agent import Role, run_agent
 from skillet.agent import Agent
 from skillet.errors import JudgeError
 
@@ -17,9 +17,11 @@ _RETRY_SUFFIX = (
 _MAX_ATTEMPTS = 2
 
 
-async def judge_via_agent(judge_prompt: str, agent: Agent) -> Judgment:
+async def judge_via_agent(judge_prompt: str, agent: Agent, *, model: str | None = None) -> Judgment:
     """Run ``judge_prompt`` through ``agent`` and parse its reply as a verdict.
 
+    ``model`` runs the judge on a model other than the CLI's default.
+
     The agent is asked for a JSON object matching :class:`Judgment`. If the
     first reply is not valid JSON, it is retried once with a stricter
     instruction. Errors from the CLI itself (e.g. a missing or failing
@@ -32,7 +34,7 @@ async def judge_via_agent(judge_prompt: str, agent: Agent) -> Judgment:
 
     for attempt in range(_MAX_ATTEMPTS):
         prompt = judge_prompt if attempt == 0 else judge_prompt + _RETRY_SUFFIX
-        result = await run_agent(agent, [prompt], allowed_tools=[])
+        result = await run_agent(agent, [prompt], allowed_tools=[], role=Role.JUDGE, model=model)
         try:
             return parse_judgment(result.text)
         except ValueError as e:
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from skillet._internal.agent import Role
 from skillet._internal.sdk import QueryResult
 from skillet.agent import Agent
 from skillet.errors import JudgeError
@@ -47,6 +48,18 @@ def describe_judge_via_agent():
 
         assert mock_run_agent.call_args[1]["allowed_tools"] == []
 
+    @pytest.mark.asyncio
+    async def it_charges_the_judge_budget(mock_run_agent):
+        await judge_via_agent("judge this", Agent.CLAUDE)
+
+        assert mock_run_agent.call_args[1]["role"] is Role.JUDGE
+
+    @pytest.mark.asyncio
+    async def it_runs_the_judge_on_the_given_model(mock_run_agent):
+        await judge_via_agent("judge this", Agent.CLAUDE, model="haiku")
+
+        assert mock_run_agent.call_args[1]["model"] == "haiku"
+
     @pytest.mark.asyncio
     async def it_retries_once_on_invalid_json(mock_run_agent, mock_parse_judgment):
         mock_parse_judgment.side_effect = [
@@ -1,5 +1,6 @@
 """Deterministic code-based assertion grading."""
 
+from .assertion_plan import AssertionPlan
 from .run_assertions import run_assertions
 
-__all__ = ["run_assertions"]
+__all__ = ["AssertionPlan", "run_assertions"]
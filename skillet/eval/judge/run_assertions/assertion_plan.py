@@ -0,0 +1,112 @@
+"""An eval's assertions, compiled once to grade many responses."""
+
+import contextlib
+import re
+from collections.abc import Callable
+
+from .check_contains import check_contains
+from .check_ends_with import check_ends_with
+from .check_not_contains import check_not_contains
+from .check_regex import check_regex
+from .check_starts_with import check_starts_with
+from .check_tool_called import check_tool_called
+from .check_tool_not_called import check_tool_not_called
+
+_CHECKERS: dict[str, Callable[..., str | None]] = {
+    "contains": check_contains,
+    "not_contains": check_not_contains,
+    "regex": check_regex,
+    "starts_with": check_starts_with,
+    "ends_with": check_ends_with,
+    "tool_called": check_tool_called,
+    "tool_not_called": check_tool_not_called,
+}
+
+_LITERAL_TYPES = {"contains", "not_contains"}
+
+
+class AssertionPlan:
+    """Assertions resolved up front, so grading a response is one sweep over them.
+
+    Compiling looks up each assertion's checker, compiles its ``regex``
+    pattern (an invalid one is still reported when graded) and gathers the
+    distinct lowercased ``contains``/``not_contains`` literals, longest
+    first, noting which literals occur inside which. :meth:`run` then
+    searches the response for each literal at most once, however many
+    assertions share it, and skips those implied by a longer literal
+    already found.
+
+    :meth:`ruled_out_by` answers, mid-run, whether a tool call alone
+    already fails the plan.
+    """
+
+    def __init__(self, assertions: list[dict]) -> None:
+        self._steps: list[tuple[Callable[..., str | None], str, re.Pattern[str] | None]] = []
+        literals: set[str] = set()
+        forbidden_tools: set[str] = set()
+        for assertion in assertions:
+            kind = assertion["type"]
+            value = assertion.get("value", "")
+            pattern = None
+            if kind in _LITERAL_TYPES:
+                literals.add(value.lower())
+            elif kind == "regex":
+                with contextlib.suppress(re.error):
+                    pattern = re.compile(value)
+            elif kind == "tool_not_called":
+                forbidden_tools.add(value)
+            self._steps.append((_CHECKERS[kind], value, pattern))
+
+        self._forbidden_tools = frozenset(forbidden_tools)
+        self._literals = sorted(literals, key=len, reverse=True)
+        self._implied = {
+            literal: [other for other in self._literals if other != literal and other in literal]
+            for literal in self._literals
+        }
+
+    @property
+    def can_rule_out(self) -> bool:
+        """Whether some tool call could fail the plan before the run ends."""
+        return bool(self._forbidden_tools)
+
+    def ruled_out_by(self, tool_call: dict) -> bool:
+        """Whether ``tool_call`` fails the plan whatever the agent does next.
+
+        Only a ``tool_not_called`` assertion is decided by one call; every
+        other check depends on output still to come.
+        """
+        return tool_call.get("name") in self._forbidden_tools
+
+    def find_literals(self, response_lower: str) -> set[str]:
+        """The plan's literals that occur in ``response_lower``."""
+        found: set[str] = set()
+        for literal in self._literals:
+            if literal not in found and literal in response_lower:
+                found.add(literal)
+                found.update(self._implied[literal])
+        return found
+
+    def run(self, response: str, tool_calls: list[dict] | None = None) -> dict:
+        """Grade ``response``; the result has the shape of ``judge_response()``'s."""
+        response_lower = response.lower()
+        found = self.find_literals(response_lower)
+        tool_names = {tc.get("name", "") for tc in (tool_calls or [])}
+
+        failures = [
+            failure
+            for checker, value, pattern in self._steps
+            if (
+                failure := checker(
+                    value=value,
+                    response=response,
+                    response_lower=response_lower,
+                    found=found,
+                    pattern=pattern,
+                    tool_names=tool_names,
+                )
+            )
+        ]
+
+        passed = not failures
+        reasoning = "All assertions passed" if passed else "; ".join(failures)
+        return {"pass": passed, "reasoning": reasoning}
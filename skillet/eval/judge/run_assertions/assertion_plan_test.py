@@ -0,0 +1,68 @@
+"""Tests for AssertionPlan."""
+
+from skillet.eval.judge.run_assertions import AssertionPlan
+
+
+def describe_assertion_plan():
+    def it_finds_literals_case_insensitively():
+        plan = AssertionPlan(
+            [{"type": "contains", "value": "Answer"}, {"type": "not_contains", "value": "wrong"}]
+        )
+
+        assert plan.find_literals("the answer is 4") == {"answer"}
+
+    def it_infers_literals_inside_a_longer_match():
+        plan = AssertionPlan(
+            [{"type": "contains", "value": "swer"}, {"type": "contains", "value": "the answer"}]
+        )
+
+        assert plan.find_literals("the answer is 4") == {"the answer", "swer"}
+
+    def it_shares_one_literal_between_assertions():
+        plan = AssertionPlan(
+            [{"type": "contains", "value": "4"}, {"type": "not_contains", "value": "4"}]
+        )
+
+        result = plan.run("the answer is 4")
+
+        assert result["pass"] is False
+        assert result["reasoning"] == "not_contains: expected response NOT to contain '4'"
+
+    def it_reports_failures_in_assertion_order():
+        plan = AssertionPlan(
+            [
+                {"type": "regex", "value": r"^\d+$"},
+                {"type": "tool_called", "value": "Read"},
+                {"type": "contains", "value": "missing"},
+            ]
+        )
+
+        reasons = plan.run("no numbers", [{"name": "Write"}])["reasoning"].split("; ")
+
+        assert [r.split(":")[0] for r in reasons] == ["regex", "tool_called", "contains"]
+
+    def it_reports_an_invalid_regex_when_graded():
+        result = AssertionPlan([{"type": "regex", "value": "[invalid"}]).run("test")
+
+        assert result["pass"] is False
+        assert "invalid pattern" in result["reasoning"]
+
+    def it_grades_many_responses_with_one_plan():
+        plan = AssertionPlan([{"type": "starts_with", "value": "yes"}])
+
+        assert plan.run("Yes, done")["pass"] is True
+        assert plan.run("No")["pass"] is False
+
+    def it_is_ruled_out_by_a_forbidden_tool_call():
+        plan = AssertionPlan(
+            [{"type": "tool_not_called", "value": "Bash"}, {"type": "tool_called", "value": "Read"}]
+        )
+
+        assert plan.can_rule_out is True
+        assert plan.ruled_out_by({"name": "Bash", "input": {}}) is True
+        assert plan.ruled_out_by({"name": "Read", "input": {}}) is False
+
+    def it_cannot_rule_out_without_tool_not_called():
+        plan = AssertionPlan([{"type": "contains", "value": "x"}])
+
+        assert plan.can_rule_out is False
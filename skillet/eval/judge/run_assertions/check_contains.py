@@ -1,7 +1,9 @@
 """Check that response contains a value (case-insensitive)."""
 
+from collections.abc import Set
 
-def check_contains(value: str, response_lower: str, **_: object) -> str | None:
-    if value.lower() not in response_lower:
+
+def check_contains(value: str, found: Set[str], **_: object) -> str | None:
+    if value.lower() not in found:
         return f"contains: expected response to contain '{value}'"
     return None
@@ -1,7 +1,9 @@
 """Check that response does not contain a value (case-insensitive)."""
 
+from collections.abc import Set
 
-def check_not_contains(value: str, response_lower: str, **_: object) -> str | None:
-    if value.lower() in response_lower:
+
+def check_not_contains(value: str, found: Set[str], **_: object) -> str | None:
+    if value.lower() in found:
         return f"not_contains: expected response NOT to contain '{value}'"
     return None
@@ -5,13 +5,13 @@ from skillet.eval.judge.run_assertions.check_not_contains import check_not_conta
 
 def describe_check_not_contains():
     def it_passes_when_value_absent():
-        assert check_not_contains("5", response_lower="the answer is 4") is None
+        assert check_not_contains("5", found=set()) is None
 
     def it_fails_when_value_present():
-        result = check_not_contains("5", response_lower="the answer is 5")
+        result = check_not_contains("5", found={"5"})
         assert result is not None
         assert "not_contains" in result
 
     def it_is_case_insensitive():
-        result = check_not_contains("hello", response_lower="hello world")
+        result = check_not_contains("Hello", found={"hello"})
         assert result is not None
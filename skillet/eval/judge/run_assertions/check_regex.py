@@ -3,10 +3,13 @@
 import re
 
 
-def check_regex(value: str, response: str, **_: object) -> str | None:
+def check_regex(
+    value: str, response: str, pattern: re.Pattern[str] | None = None, **_: object
+) -> str | None:
     try:
-        if not re.search(value, response):
-            return f"regex: pattern '{value}' did not match"
+        compiled = pattern or re.compile(value)
     except re.error as e:
         return f"regex: invalid pattern '{value}': {e}"
+    if not compiled.search(response):
+        return f"regex: pattern '{value}' did not match"
     return None
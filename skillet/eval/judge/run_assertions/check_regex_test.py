@@ -1,5 +1,7 @@
 """Tests for check_regex."""
 
+import re
+
 from skillet.eval.judge.run_assertions.check_regex import check_regex
 
 
@@ -19,3 +21,8 @@ def describe_check_regex():
 
     def it_supports_case_insensitive_flag():
         assert check_regex("(?i)hello", response="HELLO world") is None
+
+    def it_uses_a_precompiled_pattern():
+        assert (
+            check_regex("ignored", response="the answer is 42", pattern=re.compile(r"\d+")) is None
+        )
@@ -2,7 +2,7 @@
 
 import pytest
 
-from skillet.eval.judge.run_assertions import run_assertions
+from skillet.eval.judge.run_assertions import AssertionPlan, run_assertions
 
 
 def describe_run_assertions():
@@ -122,3 +122,9 @@ def describe_run_assertions():
     def it_handles_parametrized_cases(response, assertions, expected_pass):
         result = run_assertions(response, assertions)
         assert result["pass"] is expected_pass
+
+    def it_grades_with_a_compiled_plan():
+        plan = AssertionPlan([{"type": "contains", "value": "4"}])
+
+        assert run_assertions("The answer is 4", plan)["pass"] is True
+        assert run_assertions("The answer is 5", plan)["pass"] is False
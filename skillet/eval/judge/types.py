@@ -1,5 +1,7 @@
 """Type definitions for the judge module."""
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -16,3 +18,23 @@ class Judgment(BaseModel):
         default="",
         description="One sentence explanation of the judgment",
     )
+    confidence: float | None = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description="How sure the judge is of its verdict, from 0 to 1 (fast judge only)",
+    )
+
+
+@dataclass(frozen=True)
+class JudgeTiers:
+    """A cheaper judge to try before the full one.
+
+    Attributes:
+        fast_model: Model the fast judge runs on (passed to the judge CLI).
+        escalate_below: Fast verdicts less confident than this go to the
+            full judge.
+    """
+
+    fast_model: str
+    escalate_below: float = 0.8
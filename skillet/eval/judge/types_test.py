@@ -1,5 +1,8 @@
 """Tests for the judge types."""
 
+import pytest
+from pydantic import ValidationError
+
 from skillet.eval.judge.types import Judgment
 
 
@@ -19,4 +22,16 @@ def describe_judgment():
 
     def it_serializes_back_to_the_pass_alias():
         judgment = Judgment.model_validate({"pass": True, "reasoning": "ok"})
-        assert judgment.model_dump(by_alias=True) == {"pass": True, "reasoning": "ok"}
+        assert judgment.model_dump(by_alias=True) == {
+            "pass": True,
+            "reasoning": "ok",
+            "confidence": None,
+        }
+
+    def it_accepts_a_confidence_between_0_and_1():
+        judgment = Judgment.model_validate({"pass": True, "confidence": 0.9})
+        assert judgment.confidence == 0.9
+
+    def it_rejects_a_confidence_out_of_range():
+        with pytest.raises(ValidationError):
+            Judgment.model_validate({"pass": True, "confidence": 2})
@@ -1,6 +1,7 @@
 """Run prompts through the agent under test."""
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 
 from skillet._internal.agent import run_agent
@@ -17,6 +18,8 @@ async def run_prompt(
     home_dir: str | None = None,
     *,
     agent: Agent,
+    stop_on_tool: Callable[[dict], bool] | None = None,
+    resume: str | None = None,
 ) -> QueryResult:
     """Run a prompt (or multi-turn conversation) through the agent and return the response.
 
@@ -28,6 +31,10 @@ async def run_prompt(
         cwd: Working directory for the agent
         home_dir: Custom HOME directory for isolated execution
         agent: The agent under test (drives the CLI that runs the skill).
+        stop_on_tool: Kill the agent at the first tool call this returns true
+            for; the result is then the partial transcript (``stopped_early``).
+        resume: Session to continue (an earlier result's ``session_id``)
+            instead of starting a new conversation.
 
     Returns:
         QueryResult with text response and all tool calls made
@@ -60,7 +67,15 @@ async def run_prompt(
         env = os.environ.copy()
         env["HOME"] = home_dir
 
-    result = await run_agent(agent, prompts, allowed_tools=tools or None, cwd=cwd, env=env)
+    result = await run_agent(
+        agent,
+        prompts,
+        allowed_tools=tools or None,
+        cwd=cwd,
+        env=env,
+        stop_on_tool=stop_on_tool,
+        resume=resume,
+    )
 
     if not result.text:
         result.text = "(no text response - the agent may have only used tools)"
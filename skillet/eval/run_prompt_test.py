@@ -107,6 +107,15 @@ def describe_run_prompt():
 
             assert mock_run.call_args[0][0] is Agent.CODEX
 
+    @pytest.mark.asyncio
+    async def it_passes_the_session_to_resume_through():
+        with patch("skillet.eval.run_prompt.run_agent", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = QueryResult(text="response", tool_calls=[])
+
+            await run_prompt(["two"], agent=Agent.CLAUDE, resume="sess-1")
+
+            assert mock_run.call_args.kwargs["resume"] == "sess-1"
+
     @pytest.mark.asyncio
     async def it_sets_custom_home_dir():
         with (
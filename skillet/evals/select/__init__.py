@@ -0,0 +1,8 @@
+"""Choose which evals of a suite to run."""
+
+from .cluster_evals import cluster_evals
+from .sample_evals import sample_evals
+from .select_budget import select_budget
+from .select_evals import select_evals
+
+__all__ = ["cluster_evals", "sample_evals", "select_budget", "select_evals"]
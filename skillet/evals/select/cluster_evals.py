@@ -0,0 +1,28 @@
+"""Group evals whose prompts are near-paraphrases of each other."""
+
+from skillet.generate.dedupe import SimilarityIndex
+
+# Looser than the generate-evals dedupe cutoff: evals only need to be about the
+# same thing to share a cluster, not be re-phrasings of one another.
+DEFAULT_CLUSTER_THRESHOLD = 0.5
+
+
+def cluster_evals(
+    evals: list[dict], threshold: float = DEFAULT_CLUSTER_THRESHOLD
+) -> list[list[int]]:
+    """Partition eval indices into clusters of similar prompts.
+
+    Greedy leader clustering: each eval joins the cluster whose first member
+    (its leader) is most similar, if that similarity reaches ``threshold``;
+    otherwise it starts a new cluster. Deterministic for a given eval order.
+    """
+    index = SimilarityIndex()
+    clusters: list[list[int]] = []
+    for i, eval_data in enumerate(evals):
+        match = index.most_similar(eval_data["prompt"])
+        if match is not None and match[1] >= threshold:
+            clusters[int(match[0])].append(i)
+            continue
+        index.add(str(len(clusters)), eval_data["prompt"])
+        clusters.append([i])
+    return clusters
@@ -0,0 +1,24 @@
+"""Tests for cluster_evals."""
+
+from skillet.evals.select.cluster_evals import cluster_evals
+
+
+def describe_cluster_evals():
+    def it_returns_no_clusters_for_no_evals():
+        assert cluster_evals([]) == []
+
+    def it_groups_similar_prompts():
+        evals = [
+            {"prompt": "Write a conventional commit message for this diff"},
+            {"prompt": "Refactor the database migration script to use async"},
+            {"prompt": "Write a conventional commit message for the diff below"},
+        ]
+        assert cluster_evals(evals) == [[0, 2], [1]]
+
+    def it_keeps_distinct_prompts_apart():
+        evals = [{"prompt": "alpha bravo charlie"}, {"prompt": "xylophone zebra quartz"}]
+        assert cluster_evals(evals) == [[0], [1]]
+
+    def it_handles_multi_turn_prompts():
+        evals = [{"prompt": ["open the file", "edit line 3"]}, {"prompt": "something else"}]
+        assert cluster_evals(evals, threshold=1.0) == [[0], [1]]
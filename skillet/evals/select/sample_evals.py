@@ -0,0 +1,46 @@
+"""Draw a seeded random sample of evals, stratified by category."""
+
+import random
+from collections import defaultdict
+from pathlib import PurePath
+
+
+def _stratum(eval_data: dict) -> str:
+    """Group key for an eval: its ``category``, else its subdirectory.
+
+    ``skillet generate-evals`` writes a ``category`` (positive, negative,
+    ambiguity) into each eval; hand-written suites are usually organized
+    into subdirectories instead. Top-level evals without a category share
+    the ``"."`` stratum.
+    """
+    if eval_data.get("category"):
+        return str(eval_data["category"])
+    return str(PurePath(eval_data["_source"]).parent)
+
+
+def sample_evals(evals: list[dict], count: int, seed: int | None = None) -> list[dict]:
+    """Return ``count`` evals drawn at random, proportionally from each stratum.
+
+    Slots are shared out by largest remainder, so a small category is not
+    starved by a large one. With a ``seed`` the draw is reproducible: re-runs
+    pick the same evals, hit the same cache entries, and give comparable
+    numbers. The sample keeps the suite's order.
+    """
+    if count >= len(evals):
+        return list(evals)
+
+    strata: dict[str, list[int]] = defaultdict(list)
+    for i, eval_data in enumerate(evals):
+        strata[_stratum(eval_data)].append(i)
+    keys = sorted(strata)
+
+    quotas = {key: count * len(strata[key]) / len(evals) for key in keys}
+    alloc = {key: int(quota) for key, quota in quotas.items()}
+    leftover = count - sum(alloc.values())
+    by_remainder = sorted(keys, key=lambda key: (alloc[key] - quotas[key], key))
+    for key in by_remainder[:leftover]:
+        alloc[key] += 1
+
+    rng = random.Random(seed)
+    chosen = [i for key in keys for i in rng.sample(strata[key], alloc[key])]
+    return [evals[i] for i in sorted(chosen)]
@@ -0,0 +1,83 @@
+"""Tests for sample_evals."""
+
+from pathlib import Path
+
+from skillet.evals.load import load_evals
+from skillet.evals.select.sample_evals import sample_evals
+from skillet.generate.types import CandidateEval
+from skillet.generate.write import write_candidates
+
+
+def _eval(source: str, category: str | None = None) -> dict:
+    data: dict = {"_source": source, "prompt": source}
+    if category is not None:
+        data["category"] = category
+    return data
+
+
+_SUITE = [
+    *[_eval(f"git/{i}.yaml") for i in range(6)],
+    *[_eval(f"sql/{i}.yaml") for i in range(3)],
+    _eval("top.yaml"),
+]
+
+
+def describe_sample_evals():
+    def it_returns_everything_when_count_covers_the_suite():
+        assert sample_evals(_SUITE, 20) == _SUITE
+
+    def it_returns_exactly_count_evals():
+        assert len(sample_evals(_SUITE, 4, seed=1)) == 4
+
+    def it_is_reproducible_with_a_seed():
+        assert sample_evals(_SUITE, 5, seed=7) == sample_evals(list(_SUITE), 5, seed=7)
+
+    def it_varies_with_the_seed():
+        draws = {tuple(e["_source"] for e in sample_evals(_SUITE, 3, seed=s)) for s in range(10)}
+        assert len(draws) > 1
+
+    def it_allocates_proportionally_across_subdirectories():
+        chosen = sample_evals(_SUITE, 5, seed=3)
+        dirs = [e["_source"].split("/")[0] for e in chosen]
+        assert dirs.count("git") == 3
+        assert len(dirs) - dirs.count("git") == 2
+
+    def it_covers_every_stratum_when_count_allows():
+        chosen = sample_evals(_SUITE, 3, seed=0)
+        assert {e["_source"].split("/")[0] for e in chosen} >= {"git", "sql"}
+
+    def it_prefers_category_over_directory():
+        suite = [
+            *[_eval(f"a/{i}.yaml", "positive") for i in range(4)],
+            *[_eval(f"a/n{i}.yaml", "negative") for i in range(4)],
+        ]
+        chosen = sample_evals(suite, 4, seed=5)
+        categories = [e["category"] for e in chosen]
+        assert categories.count("positive") == 2
+        assert categories.count("negative") == 2
+
+    def it_stratifies_generated_evals_by_category(tmp_path: Path):
+        candidates = [
+            CandidateEval(
+                prompt=f"Prompt {category} {i}",
+                expected="Something",
+                name=f"{category}-{i}",
+                category=category,
+                source="goal:1",
+                confidence=0.9,
+                rationale="r",
+            )
+            for category, count in (("positive", 6), ("negative", 2))
+            for i in range(count)
+        ]
+        write_candidates(candidates, tmp_path)
+
+        chosen = sample_evals(load_evals(str(tmp_path)), 4, seed=0)
+
+        categories = [e["category"] for e in chosen]
+        assert categories.count("positive") == 3
+        assert categories.count("negative") == 1
+
+    def it_preserves_suite_order():
+        chosen = sample_evals(_SUITE, 6, seed=2)
+        assert chosen == [e for e in _SUITE if e in chosen]
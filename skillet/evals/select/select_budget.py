@@ -0,0 +1,69 @@
+"""Pick a stable, representative subset of evals for a fixed run budget."""
+
+from skillet._internal.cache import hash_content
+
+from .cluster_evals import cluster_evals
+
+
+def _informativeness(passes: int, runs: int) -> float:
+    """Posterior variance of an eval's pass rate under a uniform Beta(1, 1) prior.
+
+    An eval with no history scores the maximum (it might discriminate); one
+    that always passes or always fails scores lower the more runs back that
+    up, so it yields its slot to evals whose outcome actually varies.
+    """
+    alpha = passes + 1
+    beta = runs - passes + 1
+    total = alpha + beta
+    return alpha * beta / (total * total * (total + 1))
+
+
+def select_budget(
+    evals: list[dict],
+    budget: int,
+    outcomes: dict[str, tuple[int, int]] | None = None,
+) -> list[dict]:
+    """Return at most ``budget`` evals that best represent the whole suite.
+
+    Evals are clustered by prompt similarity, and clusters are visited
+    round-robin so every topic is covered before any gets a second eval.
+    Within a cluster, and in the order clusters are visited, evals with the
+    most informative history (``outcomes`` maps ``_source`` to
+    ``(passes, runs)``) come first, so always-pass and always-fail evals are
+    de-prioritized. Ties break on a hash of the source path rather than at
+    random, so the same suite and history always yield the same subset — and
+    therefore the same cache entries. The subset keeps the suite's order.
+
+    The subset leans toward evals near 50% and covers small clusters as well
+    as large ones, so its plain pass rate is not the suite's. Each chosen
+    eval is returned with a ``_weight``: how many evals of the suite it
+    stands for (its cluster's size over the evals chosen from it), which
+    :func:`~skillet.eval.evaluate.summarize_results` uses to estimate the
+    full suite's pass rate.
+    """
+    if budget >= len(evals):
+        return list(evals)
+    outcomes = outcomes or {}
+
+    def rank(i: int) -> tuple[float, str]:
+        source = evals[i]["_source"]
+        passes, runs = outcomes.get(source, (0, 0))
+        return (-_informativeness(passes, runs), hash_content(source))
+
+    clusters = [sorted(members, key=rank) for members in cluster_evals(evals)]
+    clusters.sort(key=lambda members: rank(members[0]))
+
+    chosen: list[int] = []
+    depth = 0
+    while len(chosen) < budget:
+        for members in clusters:
+            if depth < len(members) and len(chosen) < budget:
+                chosen.append(members[depth])
+        depth += 1
+
+    weights: dict[int, float] = {}
+    for members in clusters:
+        picked = [i for i in members if i in chosen]
+        for i in picked:
+            weights[i] = len(members) / len(picked)
+    return [{**evals[i], "_weight": weights[i]} for i in sorted(chosen)]
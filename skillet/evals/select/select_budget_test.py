@@ -0,0 +1,57 @@
+"""Tests for select_budget."""
+
+from skillet.evals.select.select_budget import select_budget
+
+
+def _eval(source: str, prompt: str) -> dict:
+    return {"_source": source, "prompt": prompt}
+
+
+_SUITE = [
+    _eval("commit-1.yaml", "Write a conventional commit message for this diff"),
+    _eval("commit-2.yaml", "Write a conventional commit message for the diff below"),
+    _eval("commit-3.yaml", "Write a conventional commit message for these changes"),
+    _eval("sql.yaml", "Refactor the database migration script to use async"),
+    _eval("haiku.yaml", "Write a haiku about autumn leaves falling"),
+]
+
+
+def describe_select_budget():
+    def it_returns_everything_when_budget_covers_the_suite():
+        assert select_budget(_SUITE, 10) == _SUITE
+
+    def it_returns_at_most_budget_evals():
+        assert len(select_budget(_SUITE, 2)) == 2
+
+    def it_covers_distinct_clusters_before_repeating_one():
+        chosen = {e["_source"] for e in select_budget(_SUITE, 3)}
+        assert {"sql.yaml", "haiku.yaml"} <= chosen
+        assert len(chosen & {"commit-1.yaml", "commit-2.yaml", "commit-3.yaml"}) == 1
+
+    def it_prefers_discriminative_evals_within_a_cluster():
+        outcomes = {
+            "commit-1.yaml": (10, 10),  # always passes
+            "commit-2.yaml": (5, 10),  # flaky: most informative
+            "commit-3.yaml": (0, 10),  # always fails
+        }
+        chosen = {e["_source"] for e in select_budget(_SUITE, 3, outcomes)}
+        assert "commit-2.yaml" in chosen
+
+    def it_deprioritizes_always_pass_clusters():
+        outcomes = {"sql.yaml": (20, 20), "haiku.yaml": (3, 6)}
+        suite = [_SUITE[3], _SUITE[4]]
+        assert [e["_source"] for e in select_budget(suite, 1, outcomes)] == ["haiku.yaml"]
+
+    def it_is_stable_across_calls():
+        assert select_budget(_SUITE, 3) == select_budget(list(_SUITE), 3)
+
+    def it_preserves_suite_order():
+        chosen = [e["_source"] for e in select_budget(_SUITE, 4)]
+        assert chosen == [e["_source"] for e in _SUITE if e["_source"] in chosen]
+
+    def it_weights_each_eval_by_the_evals_it_stands_for():
+        weights = {e["_source"]: e["_weight"] for e in select_budget(_SUITE, 3)}
+        assert weights.pop("sql.yaml") == 1
+        assert weights.pop("haiku.yaml") == 1
+        assert list(weights.values()) == [3]
+        assert sum(e["_weight"] for e in select_budget(_SUITE, 4)) == len(_SUITE)
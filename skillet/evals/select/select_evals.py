@@ -0,0 +1,33 @@
+"""Narrow a loaded suite to the evals a run should execute."""
+
+from pathlib import Path
+
+from skillet._internal.cache import read_eval_outcomes
+from skillet.agent import Agent
+
+from .sample_evals import sample_evals
+from .select_budget import select_budget
+
+
+def select_evals(
+    evals: list[dict],
+    name: str,
+    *,
+    agent: Agent,
+    cache_root: Path,
+    max_evals: int | None = None,
+    budget: int | None = None,
+    seed: int | None = None,
+) -> list[dict]:
+    """Apply ``budget`` or ``max_evals`` (with ``seed``) to a suite.
+
+    The single place a run's subset is chosen, so the CLI (which needs the
+    subset up front for its display) and :func:`evaluate` never sample twice.
+    ``budget`` takes precedence and reads cached history from ``cache_root``.
+    """
+    if budget is not None and budget < len(evals):
+        outcomes = read_eval_outcomes(cache_root, name, evals, agent)
+        return select_budget(evals, budget, outcomes)
+    if max_evals and max_evals < len(evals):
+        return sample_evals(evals, max_evals, seed)
+    return list(evals)
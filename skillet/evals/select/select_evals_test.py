@@ -0,0 +1,41 @@
+"""Tests for select_evals."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from skillet.agent import Agent
+from skillet.evals.select.select_evals import select_evals
+
+_SUITE = [{"_source": f"{i}.yaml", "prompt": f"prompt {i}"} for i in range(5)]
+
+
+def describe_select_evals():
+    def it_returns_the_whole_suite_by_default(tmp_path: Path):
+        assert select_evals(_SUITE, "s", agent=Agent.CLAUDE, cache_root=tmp_path) == _SUITE
+
+    def it_samples_max_evals_with_the_seed(tmp_path: Path):
+        first = select_evals(
+            _SUITE, "s", agent=Agent.CLAUDE, cache_root=tmp_path, max_evals=2, seed=4
+        )
+        again = select_evals(
+            _SUITE, "s", agent=Agent.CLAUDE, cache_root=tmp_path, max_evals=2, seed=4
+        )
+        assert len(first) == 2
+        assert first == again
+
+    def it_prefers_budget_over_max_evals(tmp_path: Path):
+        with (
+            patch(
+                "skillet.evals.select.select_evals.read_eval_outcomes", return_value={}
+            ) as mock_outcomes,
+            patch(
+                "skillet.evals.select.select_evals.select_budget", return_value=_SUITE[:1]
+            ) as mock_budget,
+        ):
+            chosen = select_evals(
+                _SUITE, "s", agent=Agent.CODEX, cache_root=tmp_path, max_evals=3, budget=1
+            )
+
+        assert chosen == _SUITE[:1]
+        mock_outcomes.assert_called_once_with(tmp_path, "s", _SUITE, Agent.CODEX)
+        mock_budget.assert_called_once_with(_SUITE, 1, {})
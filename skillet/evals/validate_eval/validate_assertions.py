@@ -1,5 +1,6 @@
 """Validate the assertions field of an eval."""
 
+import re
 from typing import cast
 
 from skillet.errors import EvalValidationError
@@ -16,7 +17,11 @@ VALID_ASSERTION_TYPES = {
 
 
 def validate_assertions(assertions: list[object], source: str) -> None:
-    """Validate each assertion has a valid type and value."""
+    """Validate each assertion has a valid type and value.
+
+    ``regex`` patterns are compiled here, so a bad pattern fails the load
+    rather than every graded sample.
+    """
     for i, raw_assertion in enumerate(assertions):
         if not isinstance(raw_assertion, dict):
             raise EvalValidationError(f"Eval {source}: assertion {i} must be a dictionary")
@@ -37,3 +42,11 @@ def validate_assertions(assertions: list[object], source: str) -> None:
             raise EvalValidationError(
                 f"Eval {source}: assertion {i} missing required field 'value'"
             )
+
+        if assertion["type"] == "regex":
+            try:
+                re.compile(str(assertion["value"]))
+            except re.error as e:
+                raise EvalValidationError(
+                    f"Eval {source}: assertion {i} has invalid regex '{assertion['value']}': {e}"
+                ) from None
@@ -41,3 +41,7 @@ def describe_validate_assertions():
 
     def it_passes_empty_list():
         validate_assertions([], "test.yaml")
+
+    def it_raises_for_an_invalid_regex():
+        with pytest.raises(EvalValidationError, match="assertion 0 has invalid regex"):
+            validate_assertions([{"type": "regex", "value": "[invalid"}], "test.yaml")
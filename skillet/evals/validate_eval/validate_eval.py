@@ -18,8 +18,18 @@ def validate_eval(eval_data: dict, source: str) -> None:
         missing_str = ", ".join(sorted(missing))
         raise EvalValidationError(f"Eval {source} missing required fields: {missing_str}")
 
-    if "assertions" in eval_data:
-        raw = eval_data["assertions"]
-        if not isinstance(raw, list):
-            raise EvalValidationError(f"Eval {source}: 'assertions' must be a list")
-        validate_assertions(raw, source)
+    for field in ("assertions", "gate"):
+        if field in eval_data:
+            raw = eval_data[field]
+            if not isinstance(raw, list):
+                raise EvalValidationError(f"Eval {source}: '{field}' must be a list")
+            validate_assertions(raw, source)
+
+    if "setup_snapshot" in eval_data and not isinstance(eval_data["setup_snapshot"], bool):
+        raise EvalValidationError(f"Eval {source}: 'setup_snapshot' must be true or false")
+
+    if eval_data.get("assertions") and eval_data.get("gate"):
+        raise EvalValidationError(
+            f"Eval {source}: use 'assertions' to grade by assertions alone or 'gate' "
+            "to check them before the judge, not both"
+        )
@@ -54,3 +54,59 @@ def describe_validate_eval():
         }
         with pytest.raises(EvalValidationError, match="must be a list"):
             validate_eval(eval_data, "test.yaml")
+
+    def it_passes_with_a_valid_gate():
+        eval_data = {
+            "timestamp": "2024-01-01",
+            "prompt": "test",
+            "expected": "expected",
+            "name": "test",
+            "gate": [{"type": "tool_not_called", "value": "Bash"}],
+        }
+        validate_eval(eval_data, "test.yaml")
+
+    def it_validates_gate_assertions():
+        eval_data = {
+            "timestamp": "2024-01-01",
+            "prompt": "test",
+            "expected": "expected",
+            "name": "test",
+            "gate": [{"type": "nope", "value": "x"}],
+        }
+        with pytest.raises(EvalValidationError, match="invalid type"):
+            validate_eval(eval_data, "test.yaml")
+
+    def it_raises_for_a_non_list_gate():
+        eval_data = {
+            "timestamp": "2024-01-01",
+            "prompt": "test",
+            "expected": "expected",
+            "name": "test",
+            "gate": "not a list",
+        }
+        with pytest.raises(EvalValidationError, match="'gate' must be a list"):
+            validate_eval(eval_data, "test.yaml")
+
+    def it_raises_for_both_assertions_and_a_gate():
+        eval_data = {
+            "timestamp": "2024-01-01",
+            "prompt": "test",
+            "expected": "expected",
+            "name": "test",
+            "assertions": [{"type": "contains", "value": "hello"}],
+            "gate": [{"type": "contains", "value": "hello"}],
+        }
+        with pytest.raises(EvalValidationError, match="not both"):
+            validate_eval(eval_data, "test.yaml")
+
+    def it_raises_for_a_non_boolean_setup_snapshot():
+        eval_data = {
+            "timestamp": "2024-01-01",
+            "prompt": "test",
+            "expected": "expected",
+            "name": "test",
+            "setup": "echo hi",
+            "setup_snapshot": "no",
+        }
+        with pytest.raises(EvalValidationError, match="'setup_snapshot' must be true or false"):
+            validate_eval(eval_data, "test.yaml")
@@ -10,10 +10,11 @@ Usage:
 """
 
 from .generate_evals import generate_evals
-from .types import CandidateEval, EvalDomain, GenerateResult
+from .types import CandidateEval, DuplicateCandidate, EvalDomain, GenerateResult
 
 __all__ = [
     "CandidateEval",
+    "DuplicateCandidate",
     "EvalDomain",
     "GenerateResult",
     "generate_evals",
@@ -0,0 +1,10 @@
+"""Near-duplicate detection for generated eval candidates."""
+
+from .dedupe_candidates import DEFAULT_DEDUPE_THRESHOLD, dedupe_candidates
+from .similarity_index import SimilarityIndex
+
+__all__ = [
+    "DEFAULT_DEDUPE_THRESHOLD",
+    "SimilarityIndex",
+    "dedupe_candidates",
+]
@@ -0,0 +1,40 @@
+"""Drop generated candidates that near-duplicate existing evals or each other."""
+
+from pathlib import Path
+
+from skillet.config import DEFAULT_DEDUPE_THRESHOLD
+
+from ..types import CandidateEval, DuplicateCandidate
+from .load_existing_prompts import load_existing_prompts
+from .similarity_index import SimilarityIndex
+
+
+def dedupe_candidates(
+    candidates: list[CandidateEval],
+    existing_dir: Path | None = None,
+    threshold: float = DEFAULT_DEDUPE_THRESHOLD,
+) -> tuple[list[CandidateEval], list[DuplicateCandidate]]:
+    """Split ``candidates`` into ``(kept, duplicates)`` by prompt similarity.
+
+    The index is seeded with every eval prompt already under ``existing_dir``,
+    and each kept candidate is added as it is accepted, so a batch cannot
+    contain two near-identical prompts either. Earlier candidates win ties.
+    """
+    index = SimilarityIndex()
+    if existing_dir is not None:
+        for key, prompt in load_existing_prompts(existing_dir).items():
+            index.add(key, prompt)
+
+    kept: list[CandidateEval] = []
+    duplicates: list[DuplicateCandidate] = []
+    for i, candidate in enumerate(candidates):
+        match = index.most_similar(candidate.prompt)
+        if match is not None and match[1] >= threshold:
+            duplicates.append(
+                DuplicateCandidate(candidate=candidate, duplicate_of=match[0], similarity=match[1])
+            )
+            continue
+        kept.append(candidate)
+        index.add(f"candidate:{candidate.name or i + 1}", candidate.prompt)
+
+    return kept, duplicates
@@ -0,0 +1,56 @@
+"""Tests for dedupe_candidates function."""
+
+from pathlib import Path
+
+from skillet.generate.dedupe.dedupe_candidates import dedupe_candidates
+from skillet.generate.types import CandidateEval
+
+
+def _candidate(prompt: str, name: str = "c") -> CandidateEval:
+    return CandidateEval(prompt, "expected", name, "positive", "goal:1", 0.9, "r")
+
+
+def describe_dedupe_candidates():
+    def it_keeps_distinct_candidates():
+        candidates = [
+            _candidate("Write a haiku about autumn leaves", "haiku"),
+            _candidate("Refactor the database migration script", "refactor"),
+        ]
+        kept, duplicates = dedupe_candidates(candidates)
+        assert kept == candidates
+        assert duplicates == []
+
+    def it_drops_near_duplicates_within_the_batch():
+        first = _candidate("Convert this date string to ISO 8601 format please", "first")
+        second = _candidate("convert this date string to ISO 8601 format, please!", "second")
+
+        kept, duplicates = dedupe_candidates([first, second])
+
+        assert kept == [first]
+        assert len(duplicates) == 1
+        assert duplicates[0].candidate is second
+        assert duplicates[0].duplicate_of == "candidate:first"
+
+    def it_drops_candidates_matching_existing_evals(tmp_path: Path):
+        (tmp_path / "dates.yaml").write_text(
+            "prompt: Convert this date string to ISO 8601 format please\n"
+        )
+        candidate = _candidate("Convert this date string to ISO 8601 format, please")
+
+        kept, duplicates = dedupe_candidates([candidate], tmp_path)
+
+        assert kept == []
+        assert duplicates[0].duplicate_of == "dates.yaml"
+        assert duplicates[0].similarity >= 0.8
+
+    def it_respects_the_threshold():
+        candidates = [
+            _candidate("Convert this date string to ISO 8601 format please", "a"),
+            _candidate("Convert this date string to ISO 8601 format, please!", "b"),
+        ]
+        kept, _ = dedupe_candidates(candidates, threshold=1.01)
+        assert len(kept) == 2
+
+    def it_tolerates_a_missing_existing_dir(tmp_path: Path):
+        kept, _ = dedupe_candidates([_candidate("hello there")], tmp_path / "missing")
+        assert len(kept) == 1
@@ -0,0 +1,31 @@
+"""Read the prompts of eval files already present in a directory."""
+
+from pathlib import Path
+
+import yaml
+
+
+def load_existing_prompts(directory: Path) -> dict[str, str | list[str]]:
+    """Return ``{relative path: prompt}`` for each eval YAML under ``directory``.
+
+    Unlike ``load_evals`` this is lenient: unreadable, invalid, or prompt-less
+    files are skipped rather than raised, since the directory may hold drafts
+    that are still under review. A missing directory yields an empty mapping.
+    """
+    if not directory.is_dir():
+        return {}
+
+    prompts: dict[str, str | list[str]] = {}
+    for eval_file in sorted(directory.rglob("*.yaml")):
+        try:
+            data = yaml.safe_load(eval_file.read_text())
+        except (OSError, UnicodeDecodeError, yaml.YAMLError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        prompt = data.get("prompt")
+        if isinstance(prompt, str) or (
+            isinstance(prompt, list) and all(isinstance(p, str) for p in prompt)
+        ):
+            prompts[str(eval_file.relative_to(directory))] = prompt
+    return prompts
@@ -0,0 +1,32 @@
+"""Tests for load_existing_prompts function."""
+
+from pathlib import Path
+
+from skillet.generate.dedupe.load_existing_prompts import load_existing_prompts
+
+
+def describe_load_existing_prompts():
+    def it_returns_empty_for_missing_directory(tmp_path: Path):
+        assert load_existing_prompts(tmp_path / "missing") == {}
+
+    def it_reads_prompts_keyed_by_relative_path(tmp_path: Path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.yaml").write_text("prompt: hello\nexpected: hi\n")
+        (tmp_path / "sub" / "b.yaml").write_text("prompt:\n  - one\n  - two\n")
+
+        assert load_existing_prompts(tmp_path) == {
+            "a.yaml": "hello",
+            "sub/b.yaml": ["one", "two"],
+        }
+
+    def it_reads_generated_candidates_with_comment_headers(tmp_path: Path):
+        (tmp_path / "c.yaml").write_text("# Generated eval candidate\nprompt: hi\n# _meta: {}\n")
+        assert load_existing_prompts(tmp_path) == {"c.yaml": "hi"}
+
+    def it_skips_invalid_or_promptless_files(tmp_path: Path):
+        (tmp_path / "bad.yaml").write_text("prompt: [unclosed\n")
+        (tmp_path / "list.yaml").write_text("- just\n- a list\n")
+        (tmp_path / "noprompt.yaml").write_text("expected: x\n")
+        (tmp_path / "nested.yaml").write_text("prompt:\n  - {a: 1}\n")
+
+        assert load_existing_prompts(tmp_path) == {}
@@ -0,0 +1,41 @@
+"""Compute a MinHash signature for a set of shingles."""
+
+import functools
+import hashlib
+import random
+
+# Mersenne prime larger than any 64-bit shingle hash, for the universal hash family.
+_PRIME = (1 << 61) - 1
+
+# Fixed seed so signatures are stable across processes and runs.
+_SEED = 1729
+
+DEFAULT_NUM_PERM = 128
+
+
+@functools.lru_cache(maxsize=8)
+def _permutations(num_perm: int) -> tuple[tuple[int, int], ...]:
+    """Return ``num_perm`` deterministic ``(a, b)`` coefficients for ``(a*x + b) % p``."""
+    rng = random.Random(_SEED)  # nosec B311 - not used for security
+    return tuple((rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm))
+
+
+def _hash_shingle(value: str) -> int:
+    """Hash a shingle to a stable 64-bit integer (``hash()`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def minhash_signature(shingles: set[str], num_perm: int = DEFAULT_NUM_PERM) -> tuple[int, ...]:
+    """Return the MinHash signature of ``shingles``.
+
+    The fraction of positions at which two signatures agree estimates the
+    Jaccard similarity of the underlying shingle sets. Each shingle is hashed
+    once; the ``num_perm`` permutations are simulated with a seeded universal
+    hash family, so no network or model is needed and results are reproducible.
+    An empty set yields a signature of all ``_PRIME`` sentinels.
+    """
+    hashes = [_hash_shingle(s) for s in shingles]
+    return tuple(
+        min(((a * h + b) % _PRIME for h in hashes), default=_PRIME)
+        for a, b in _permutations(num_perm)
+    )
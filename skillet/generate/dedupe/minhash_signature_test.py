@@ -0,0 +1,34 @@
+"""Tests for minhash_signature function."""
+
+from skillet.generate.dedupe.minhash_signature import minhash_signature
+from skillet.generate.dedupe.shingle import shingle
+
+
+def _agreement(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
+
+
+def describe_minhash_signature():
+    def it_returns_num_perm_values():
+        assert len(minhash_signature({"abc"}, num_perm=16)) == 16
+
+    def it_is_deterministic():
+        shingles = shingle("convert this date to ISO format")
+        assert minhash_signature(shingles) == minhash_signature(set(shingles))
+
+    def it_matches_identical_sets_exactly():
+        sig = minhash_signature(shingle("same prompt"))
+        assert _agreement(sig, minhash_signature(shingle("same prompt"))) == 1.0
+
+    def it_estimates_high_similarity_for_near_duplicates():
+        a = minhash_signature(shingle("Convert this date string to ISO 8601 format please"))
+        b = minhash_signature(shingle("Convert this date string to ISO 8601 format, please!"))
+        assert _agreement(a, b) > 0.9
+
+    def it_estimates_low_similarity_for_unrelated_prompts():
+        a = minhash_signature(shingle("Write a haiku about autumn leaves"))
+        b = minhash_signature(shingle("Refactor the database migration script"))
+        assert _agreement(a, b) < 0.2
+
+    def it_handles_empty_sets():
+        assert len(set(minhash_signature(set(), num_perm=8))) == 1
@@ -0,0 +1,19 @@
+"""Break a prompt into character shingles for similarity estimation."""
+
+import re
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def shingle(prompt: str | list[str], k: int = 5) -> set[str]:
+    """Return the set of ``k``-character shingles of a normalized prompt.
+
+    Case and punctuation are folded away so that prompts differing only in
+    formatting produce the same shingles. Multi-turn prompts are joined turn by
+    turn. Prompts shorter than ``k`` yield a single shingle (the whole text).
+    """
+    text = " ".join(prompt) if isinstance(prompt, list) else prompt
+    normalized = _NON_WORD_RE.sub(" ", text.lower()).strip()
+    if len(normalized) <= k:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + k] for i in range(len(normalized) - k + 1)}
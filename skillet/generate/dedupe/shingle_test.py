@@ -0,0 +1,20 @@
+"""Tests for shingle function."""
+
+from skillet.generate.dedupe.shingle import shingle
+
+
+def describe_shingle():
+    def it_returns_k_character_shingles():
+        assert shingle("abcdef", k=5) == {"abcde", "bcdef"}
+
+    def it_ignores_case_and_punctuation():
+        assert shingle("Hello, World!") == shingle("hello world")
+
+    def it_joins_multi_turn_prompts():
+        assert shingle(["first turn", "second turn"]) == shingle("first turn second turn")
+
+    def it_returns_whole_text_for_short_prompts():
+        assert shingle("hi", k=5) == {"hi"}
+
+    def it_returns_empty_set_for_blank_prompts():
+        assert shingle("  ?! ") == set()
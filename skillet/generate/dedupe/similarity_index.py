@@ -0,0 +1,62 @@
+"""In-memory MinHash/LSH index over eval prompts."""
+
+from collections import defaultdict
+
+from .minhash_signature import DEFAULT_NUM_PERM, minhash_signature
+from .shingle import shingle
+
+# Rows per LSH band. With 128 permutations this gives 32 bands, whose candidate
+# threshold (~(1/32)^(1/4) ≈ 0.42) sits well below any useful dedupe threshold,
+# so true near-duplicates are almost never missed by the bucket lookup.
+_ROWS_PER_BAND = 4
+
+
+class SimilarityIndex:
+    """Find previously-seen prompts similar to a new one, without a network call.
+
+    Prompts are reduced to MinHash signatures and bucketed by LSH bands, so a
+    lookup only compares signatures that share at least one band with the query
+    rather than scanning every entry. Similarity is the signature agreement
+    ratio, an estimate of the Jaccard similarity of the prompts' shingles.
+
+    Example:
+        index = SimilarityIndex()
+        index.add("001.yaml", "Convert this date to ISO format")
+        index.most_similar("Convert the date to ISO format")  # ("001.yaml", 0.8...)
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM):
+        """Create an empty index using ``num_perm`` MinHash permutations."""
+        self.num_perm = num_perm
+        self._signatures: dict[str, tuple[int, ...]] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (i, signature[i : i + _ROWS_PER_BAND]) for i in range(0, len(signature), _ROWS_PER_BAND)
+        ]
+
+    def add(self, key: str, prompt: str | list[str]) -> None:
+        """Index ``prompt`` under ``key`` (replacing any previous entry for ``key``)."""
+        signature = minhash_signature(shingle(prompt), self.num_perm)
+        self._signatures[key] = signature
+        for band in self._bands(signature):
+            self._buckets[band].add(key)
+
+    def most_similar(self, prompt: str | list[str]) -> tuple[str, float] | None:
+        """Return ``(key, similarity)`` of the closest indexed prompt, or ``None``."""
+        signature = minhash_signature(shingle(prompt), self.num_perm)
+        candidates: set[str] = set()
+        for band in self._bands(signature):
+            candidates |= self._buckets.get(band, set())
+
+        best: tuple[str, float] | None = None
+        for key in sorted(candidates):
+            other = self._signatures[key]
+            similarity = sum(a == b for a, b in zip(signature, other, strict=True)) / self.num_perm
+            if best is None or similarity > best[1]:
+                best = (key, similarity)
+        return best
@@ -0,0 +1,44 @@
+"""Tests for SimilarityIndex."""
+
+from skillet.generate.dedupe.similarity_index import SimilarityIndex
+
+
+def describe_SimilarityIndex():
+    def it_starts_empty():
+        index = SimilarityIndex()
+        assert len(index) == 0
+        assert index.most_similar("anything") is None
+
+    def it_finds_near_duplicate_prompts():
+        index = SimilarityIndex()
+        index.add("001.yaml", "Convert this date string to ISO 8601 format please")
+        match = index.most_similar("convert this date string to ISO 8601 format, please")
+        assert match is not None
+        assert match[0] == "001.yaml"
+        assert match[1] > 0.9
+
+    def it_returns_the_closest_of_several_entries():
+        index = SimilarityIndex()
+        index.add("dates.yaml", "Format the date as YYYY-MM-DD")
+        index.add("commits.yaml", "Write a conventional commit message for this diff")
+        match = index.most_similar("Write a conventional commit message for the diff")
+        assert match is not None
+        assert match[0] == "commits.yaml"
+
+    def it_skips_unrelated_prompts():
+        index = SimilarityIndex()
+        index.add("a.yaml", "Write a haiku about autumn leaves falling")
+        match = index.most_similar("Refactor the database migration script to use async")
+        assert match is None or match[1] < 0.3
+
+    def it_replaces_entries_with_the_same_key():
+        index = SimilarityIndex()
+        index.add("a.yaml", "first prompt text here")
+        index.add("a.yaml", "second prompt text here")
+        assert len(index) == 1
+
+    def it_indexes_multi_turn_prompts():
+        index = SimilarityIndex()
+        index.add("multi.yaml", ["Open the config file", "Now change the port to 8080"])
+        match = index.most_similar(["Open the config file", "Now change the port to 8080"])
+        assert match == ("multi.yaml", 1.0)
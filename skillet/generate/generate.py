@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from skillet._internal.agent import query_structured_via_agent
+from skillet._internal.agent import Role, query_structured_via_agent
 from skillet.agent import Agent
 from skillet.prompts import load_prompt
 
@@ -80,7 +80,7 @@ async def generate_candidates(
 
     # Route through the selected agent's CLI. The helper asks for JSON
     # matching the schema and retries once on an unparseable reply.
-    response = await query_structured_via_agent(prompt, GenerateResponse, agent)
+    response = await query_structured_via_agent(prompt, GenerateResponse, agent, role=Role.GENERATE)
 
     # Convert to CandidateEval objects
     candidates = [
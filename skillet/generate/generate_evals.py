@@ -5,6 +5,7 @@ from pathlib import Path
 from skillet.agent import Agent
 
 from .analyze import analyze_skill
+from .dedupe import DEFAULT_DEDUPE_THRESHOLD, dedupe_candidates
 from .generate import generate_candidates
 from .resolve_skill_path import resolve_skill_path
 from .types import EvalDomain, GenerateResult
@@ -19,12 +20,19 @@ async def generate_evals(
     use_lint: bool = True,
     max_per_category: int = 5,
     domains: list[EvalDomain] | None = None,
+    dedupe_threshold: float | None = DEFAULT_DEDUPE_THRESHOLD,
 ) -> GenerateResult:
     """Generate candidate eval files from a SKILL.md.
 
     Analyzes the skill to extract goals, prohibitions, and examples,
     then uses the selected ``agent`` to generate test cases for each.
     Optionally incorporates lint findings to target weak spots.
+
+    Candidates whose prompt is a near-duplicate (estimated similarity at or
+    above ``dedupe_threshold``) of an eval already in ``output_dir``, or of an
+    earlier candidate in the same batch, are dropped and reported in
+    ``GenerateResult.duplicates`` so re-runs don't pile up re-phrasings that
+    would each be evaluated again. Pass ``None`` to keep every candidate.
     """
     # Resolve path to SKILL.md
     skill_file = resolve_skill_path(skill_path)
@@ -41,6 +49,10 @@ async def generate_evals(
         domains=domains,
     )
 
+    duplicates = []
+    if dedupe_threshold is not None:
+        candidates, duplicates = dedupe_candidates(candidates, output_dir, dedupe_threshold)
+
     # Build result
     result = GenerateResult(
         skill_path=skill_file,
@@ -52,6 +64,7 @@ async def generate_evals(
             "prohibitions": analysis.prohibitions,
             "example_count": len(analysis.examples),
         },
+        duplicates=duplicates,
     )
 
     # Write candidates if output_dir specified
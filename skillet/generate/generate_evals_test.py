@@ -156,3 +156,52 @@ def describe_generate_evals():
         assert result.analysis["goals"] == ["Goal one", "Goal two"]
         assert result.analysis["prohibitions"] == ["Don't do bad things"]
         assert result.analysis["example_count"] == 1
+
+    @pytest.mark.asyncio
+    async def it_drops_near_duplicates_of_existing_evals(tmp_path: Path):
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("# Skill")
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        (output_dir / "existing.yaml").write_text(
+            "prompt: Convert this date string to ISO 8601 format please\n"
+        )
+        duplicate = CandidateEval(
+            prompt="Convert this date string to ISO 8601 format, please!",
+            expected="ISO date",
+            name="dup",
+            category="positive",
+            source="goal:1",
+            confidence=0.9,
+            rationale="r",
+        )
+
+        with patch(
+            "skillet.generate.generate_evals.generate_candidates",
+            new_callable=AsyncMock,
+            return_value=[duplicate],
+        ):
+            result = await generate_evals(skill_file, agent=Agent.CLAUDE, output_dir=output_dir)
+
+        assert result.candidates == []
+        assert result.duplicates[0].duplicate_of == "existing.yaml"
+        assert sorted(p.name for p in output_dir.glob("*.yaml")) == ["existing.yaml"]
+
+    @pytest.mark.asyncio
+    async def it_keeps_duplicates_when_dedupe_disabled(tmp_path: Path):
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("# Skill")
+        candidates = [
+            CandidateEval("Same prompt text here", "e", "a", "positive", "s", 0.9, "r"),
+            CandidateEval("Same prompt text here", "e", "b", "positive", "s", 0.9, "r"),
+        ]
+
+        with patch(
+            "skillet.generate.generate_evals.generate_candidates",
+            new_callable=AsyncMock,
+            return_value=candidates,
+        ):
+            result = await generate_evals(skill_file, agent=Agent.CLAUDE, dedupe_threshold=None)
+
+        assert len(result.candidates) == 2
+        assert result.duplicates == []
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from skillet._internal.agent import Role
 from skillet.agent import Agent
 from skillet.generate.analyze import SkillAnalysis
 from skillet.generate.generate import (
@@ -221,3 +222,4 @@ def describe_generate_candidates():
             await generate_candidates(analysis, agent=Agent.CODEX)
 
         assert mock_query.call_args[0][2] is Agent.CODEX
+        assert mock_query.call_args[1]["role"] is Role.GENERATE
@@ -29,6 +29,15 @@ class CandidateEval:
     domain: EvalDomain | None = None
 
 
+@dataclass
+class DuplicateCandidate:
+    """A candidate dropped because its prompt near-duplicates an existing one."""
+
+    candidate: CandidateEval
+    duplicate_of: str  # Existing eval path, or "candidate:<name>" within the batch
+    similarity: float  # Estimated Jaccard similarity, 0.0-1.0
+
+
 @dataclass
 class GenerateResult:
     """Result from generating evals for a skill."""
@@ -36,6 +45,7 @@ class GenerateResult:
     skill_path: Path
     candidates: list[CandidateEval]
     analysis: dict = field(default_factory=dict)  # Extracted goals, prohibitions, etc.
+    duplicates: list[DuplicateCandidate] = field(default_factory=list)  # Dropped as near-dupes
 
 
 class CandidateResponse(BaseModel):
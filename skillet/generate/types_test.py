@@ -2,7 +2,7 @@
 
 import pytest
 
-from skillet.generate.types import CandidateEval, EvalDomain
+from skillet.generate.types import CandidateEval, DuplicateCandidate, EvalDomain
 
 
 def describe_EvalDomain():
@@ -50,3 +50,12 @@ def describe_CandidateEval():
             rationale="tests something",
         )
         assert eval_.domain is None
+
+
+def describe_DuplicateCandidate():
+    def it_records_the_match():
+        candidate = CandidateEval("p", "e", "n", "positive", "s", 0.9, "r")
+        dup = DuplicateCandidate(candidate=candidate, duplicate_of="001.yaml", similarity=0.9)
+        assert dup.candidate is candidate
+        assert dup.duplicate_of == "001.yaml"
+        assert dup.similarity == 0.9
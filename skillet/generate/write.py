@@ -48,6 +48,8 @@ def _candidate_to_dict(candidate: CandidateEval, skill_name: str | None) -> dict
         "prompt": candidate.prompt,
         "expected": candidate.expected,
         "name": candidate.name,
+        # A real key, not metadata: --max-evals stratifies on it
+        "category": candidate.category,
     }
 
     # Add metadata as comments (stored in _meta for reference)
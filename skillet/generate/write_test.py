@@ -147,3 +147,4 @@ def describe_write_candidates():
         assert len(loaded) == 1
         assert loaded[0]["prompt"] == "What is 2+2?"
         assert loaded[0]["name"] == "loadable"
+        assert loaded[0]["category"] == "positive"
@@ -0,0 +1,17 @@
+"""Upper confidence bound on a pass rate (Hoeffding)."""
+
+from math import log, sqrt
+
+
+def pass_rate_upper_bound(n: int, c: int, confidence: float) -> float:
+    """Pass rate that n runs with c passes rule out, with the given confidence.
+
+    Hoeffding's inequality bounds how far the observed rate ``c / n`` can sit
+    below the true one: with probability ``confidence`` the true rate is at
+    most ``c / n + sqrt(ln(1 / (1 - confidence)) / (2n))``. It is distribution
+    free, so it holds for any eval mix, at the cost of being conservative.
+    """
+    if n == 0:
+        return 1.0
+    margin = sqrt(log(1 / (1 - confidence)) / (2 * n))
+    return min(1.0, c / n + margin)
@@ -0,0 +1,26 @@
+"""Tests for pass_rate_upper_bound."""
+
+import pytest
+
+from skillet.metrics.pass_rate_upper_bound import pass_rate_upper_bound
+
+
+def describe_pass_rate_upper_bound():
+    def it_is_one_with_no_runs():
+        assert pass_rate_upper_bound(0, 0, 0.95) == 1.0
+
+    def it_is_at_least_the_observed_rate():
+        assert pass_rate_upper_bound(10, 4, 0.95) > 0.4
+
+    def it_tightens_with_more_runs():
+        assert pass_rate_upper_bound(100, 40, 0.95) < pass_rate_upper_bound(10, 4, 0.95)
+
+    def it_widens_with_more_confidence():
+        assert pass_rate_upper_bound(10, 4, 0.99) > pass_rate_upper_bound(10, 4, 0.9)
+
+    def it_caps_at_one():
+        assert pass_rate_upper_bound(2, 2, 0.95) == 1.0
+
+    def it_matches_hoeffding():
+        # sqrt(ln(20) / 40) ~= 0.2737
+        assert pass_rate_upper_bound(20, 0, 0.95) == pytest.approx(0.2737, abs=1e-4)
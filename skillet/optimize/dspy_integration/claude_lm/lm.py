@@ -5,10 +5,13 @@ that Skillet's eval system uses, ensuring consistent behavior.
 """
 
 import uuid
+from pathlib import Path
 from typing import Any
 
 from dspy.clients.base_lm import BaseLM
 
+from skillet import config as skillet_config
+from skillet._internal.cache import LMResponseCache
 from skillet._internal.run_sync import run_sync
 
 from .dataclasses import Choice, CompletionResponse, Message
@@ -34,6 +37,11 @@ class ClaudeAgentLM(BaseLM):
         # Now DSPy will use Claude Agent SDK for all LLM calls
         predict = dspy.Predict("question -> answer")
         result = predict(question="What is 2+2?")
+
+    Responses are cached on disk (``<SKILLET_DIR>/cache/lm`` by default),
+    keyed by model, prompt and options, so optimizers that re-issue the same
+    prompt across trials and reruns don't pay for it twice. Pass
+    ``cache=False`` to the constructor or to a single call to bypass it.
     """
 
     def __init__(
@@ -41,6 +49,10 @@ class ClaudeAgentLM(BaseLM):
         model: str = "claude-agent-sdk",
         model_type: str = "chat",
         max_tokens: int = 4096,
+        *,
+        cache: bool = True,
+        cache_dir: Path | None = None,
+        max_history: int = 1000,
         **kwargs,
     ):
         """Initialize the Claude Agent LM.
@@ -49,13 +61,20 @@ class ClaudeAgentLM(BaseLM):
             model: Model identifier (for DSPy tracking, actual model is determined by Claude CLI)
             model_type: Type of model interface (chat, text, responses)
             max_tokens: Maximum tokens for response
+            cache: Read and write the on-disk response cache by default
+            cache_dir: Response cache directory (default: ``CACHE_DIR / "lm"``)
+            max_history: Most recent calls kept in ``history``
             **kwargs: Additional options passed to Claude Agent SDK
         """
         self.model = model
         self.model_type = model_type
         self.max_tokens = max_tokens
+        self.cache = cache
+        self.cache_dir = cache_dir or skillet_config.CACHE_DIR / "lm"
+        self.max_history = max_history
         self.kwargs = kwargs
         self.history: list[dict] = []
+        self._response_cache = LMResponseCache(self.cache_dir)
 
     def forward(
         self,
@@ -74,6 +93,12 @@ class ClaudeAgentLM(BaseLM):
             CompletionResponse in OpenAI format
         """
         extracted_prompt = extract_prompt(prompt, messages)
+        use_cache = kwargs.pop("cache", self.cache)
+        request = self._cache_request(extracted_prompt, kwargs)
+
+        cached = self._response_cache.get(request) if use_cache else None
+        if cached is not None:
+            return self._build_response(extracted_prompt, cached, kwargs)
 
         # Call Claude Agent SDK (synchronously, as DSPy expects sync)
         response_text = run_sync(
@@ -85,6 +110,8 @@ class ClaudeAgentLM(BaseLM):
             )
         )
 
+        if use_cache and response_text:
+            self._response_cache.put(request, response_text)
         return self._build_response(extracted_prompt, response_text, kwargs)
 
     async def aforward(
@@ -95,6 +122,12 @@ class ClaudeAgentLM(BaseLM):
     ) -> CompletionResponse:
         """Async forward pass through Claude Agent SDK."""
         extracted_prompt = extract_prompt(prompt, messages)
+        use_cache = kwargs.pop("cache", self.cache)
+        request = self._cache_request(extracted_prompt, kwargs)
+
+        cached = self._response_cache.get(request) if use_cache else None
+        if cached is not None:
+            return self._build_response(extracted_prompt, cached, kwargs)
 
         # Call Claude Agent SDK asynchronously
         response_text = await query_assistant_text(
@@ -104,8 +137,19 @@ class ClaudeAgentLM(BaseLM):
             **self.kwargs,
         )
 
+        if use_cache and response_text:
+            self._response_cache.put(request, response_text)
         return self._build_response(extracted_prompt, response_text, kwargs)
 
+    def _cache_request(self, prompt: str, kwargs: dict) -> dict[str, Any]:
+        """Everything that can change the response, as the cache key."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "prompt": prompt,
+            "kwargs": {**self.kwargs, **kwargs},
+        }
+
     def _build_response(self, prompt: str, response_text: str, kwargs: dict) -> CompletionResponse:
         """Build a CompletionResponse and update history."""
         result = CompletionResponse(
@@ -130,12 +174,16 @@ class ClaudeAgentLM(BaseLM):
             model=self.model,
             model_type=self.model_type,
             max_tokens=self.max_tokens,
+            cache=self.cache,
+            cache_dir=self.cache_dir,
+            max_history=self.max_history,
             **new_kwargs,
         )
 
     def update_history(self, entry: dict[str, Any]) -> None:
-        """Update the history with a new entry."""
+        """Update the history with a new entry, dropping the oldest past ``max_history``."""
         self.history.append(entry)
+        del self.history[: -self.max_history]
 
     def inspect_history(self, n: int = 1) -> list[dict]:
         """Return the last n history entries."""
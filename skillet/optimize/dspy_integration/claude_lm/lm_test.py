@@ -1,6 +1,6 @@
 """Tests for ClaudeAgentLM."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 
 import pytest
 
@@ -11,12 +11,27 @@ CLAUDE_LM_MODULE = "skillet.optimize.dspy_integration.claude_lm.lm"
 
 @pytest.fixture(autouse=True)
 def mock_run_sync():
-    """Mock run_sync to avoid actual SDK calls."""
-    with patch(f"{CLAUDE_LM_MODULE}.run_sync") as mock:
+    """Mock run_sync to avoid actual SDK calls.
+
+    The fake closes the coroutine it is handed, since nothing will await it.
+    """
+
+    def close(coro):
+        coro.close()
+        return DEFAULT
+
+    with patch(f"{CLAUDE_LM_MODULE}.run_sync", side_effect=close) as mock:
         mock.return_value = "mocked response"
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def lm_cache_dir(tmp_path):
+    """Point the default response cache at a per-test directory."""
+    with patch("skillet.config.CACHE_DIR", tmp_path):
+        yield tmp_path / "lm"
+
+
 @pytest.fixture
 def mock_query_async():
     """Mock query_assistant_text for async tests."""
@@ -73,6 +88,63 @@ def describe_ClaudeAgentLM():
             result = lm.forward()
             assert result.choices[0].message.content == ""
 
+        def it_serves_repeated_prompts_from_cache(mock_run_sync, lm_cache_dir):
+            mock_run_sync.return_value = "Answer"
+            lm = ClaudeAgentLM()
+            lm.forward(prompt="Question")
+
+            mock_run_sync.reset_mock()
+            result = ClaudeAgentLM().forward(prompt="Question")
+
+            assert not mock_run_sync.called
+            assert result.choices[0].message.content == "Answer"
+            assert len(list(lm_cache_dir.glob("*.json"))) == 1
+
+        def it_keys_the_cache_on_kwargs_and_model(mock_run_sync):
+            mock_run_sync.return_value = "Answer"
+            ClaudeAgentLM().forward(prompt="Question")
+
+            mock_run_sync.reset_mock()
+            ClaudeAgentLM().forward(prompt="Question", rollout_id=1)
+            ClaudeAgentLM(model="other").forward(prompt="Question")
+            ClaudeAgentLM(custom_arg="x").forward(prompt="Question")
+
+            assert mock_run_sync.call_count == 3
+
+        def it_bypasses_the_cache_when_the_call_says_so(mock_run_sync):
+            mock_run_sync.return_value = "Answer"
+            lm = ClaudeAgentLM()
+            lm.forward(prompt="Question")
+            lm.forward(prompt="Question", cache=False)
+
+            assert mock_run_sync.call_count == 2
+            assert "cache" not in lm.history[-1]["kwargs"]
+
+        def it_bypasses_the_cache_when_disabled(mock_run_sync, lm_cache_dir):
+            mock_run_sync.return_value = "Answer"
+            lm = ClaudeAgentLM(cache=False)
+            lm.forward(prompt="Question")
+            lm.forward(prompt="Question")
+
+            assert mock_run_sync.call_count == 2
+            assert not lm_cache_dir.exists()
+
+        def it_does_not_cache_empty_responses(mock_run_sync):
+            mock_run_sync.return_value = ""
+            lm = ClaudeAgentLM()
+            lm.forward(prompt="Question")
+            lm.forward(prompt="Question")
+
+            assert mock_run_sync.call_count == 2
+
+        def it_bounds_history(mock_run_sync):
+            mock_run_sync.return_value = "Answer"
+            lm = ClaudeAgentLM(max_history=2, cache=False)
+            for prompt in ("First", "Second", "Third"):
+                lm.forward(prompt=prompt)
+
+            assert [entry["prompt"] for entry in lm.history] == ["Second", "Third"]
+
     def describe_aforward():
         @pytest.mark.asyncio
         async def it_calls_query_assistant_text_async(mock_query_async):
@@ -88,6 +160,16 @@ def describe_ClaudeAgentLM():
             result = await lm.aforward(messages=[{"role": "user", "content": "Question"}])
             assert result.choices[0].message.content == "Response"
 
+        @pytest.mark.asyncio
+        async def it_shares_the_cache_with_forward(mock_query_async, mock_run_sync):
+            mock_run_sync.return_value = "Sync answer"
+            ClaudeAgentLM().forward(prompt="Question")
+
+            result = await ClaudeAgentLM().aforward(prompt="Question")
+
+            assert mock_query_async.await_count == 0
+            assert result.choices[0].message.content == "Sync answer"
+
     def describe_copy():
         def it_returns_new_instance():
             lm = ClaudeAgentLM(max_tokens=1000)
@@ -96,6 +178,13 @@ def describe_ClaudeAgentLM():
             assert copied.max_tokens == 1000
             assert copied.kwargs["extra_arg"] == "new"
 
+        def it_keeps_cache_settings(tmp_path):
+            lm = ClaudeAgentLM(cache=False, cache_dir=tmp_path, max_history=5)
+            copied = lm.copy()
+            assert copied.cache is False
+            assert copied.cache_dir == tmp_path
+            assert copied.max_history == 5
+
         def it_preserves_original():
             lm = ClaudeAgentLM()
             lm.copy(extra_arg="test")
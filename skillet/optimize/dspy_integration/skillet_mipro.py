@@ -1,13 +1,18 @@
 """MIPROv2 wrapper with callback hooks for Skillet's UX."""
 
+import contextvars
 import logging
+import random
 from collections import defaultdict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
 from dspy.teleprompt import MIPROv2
 from dspy.teleprompt.mipro_optimizer_v2 import eval_candidate_program, save_candidate_program
 
+from skillet import config
+
 from .claude_lm.dataclasses import TrialResult
 
 logger = logging.getLogger(__name__)
@@ -16,6 +21,16 @@ logger = logging.getLogger(__name__)
 CallbackType = Callable[..., None] | None
 
 
+def _configured_parallelism() -> int:
+    """``SKILLET_TRIAL_PARALLELISM`` as an int, 1 when unset."""
+    try:
+        return int(config.TRIAL_PARALLELISM or 1)
+    except ValueError:
+        raise ValueError(
+            f"SKILLET_TRIAL_PARALLELISM must be an integer, got {config.TRIAL_PARALLELISM!r}"
+        ) from None
+
+
 class SkilletMIPRO(MIPROv2):
     """MIPROv2 with callback hooks for progress reporting.
 
@@ -24,6 +39,14 @@ class SkilletMIPRO(MIPROv2):
     - on_trial_complete: Called when a trial finishes with its score
     - on_new_best: Called when a new best program is found
 
+    With ``trial_parallelism > 1`` it asks optuna for that many trials at a
+    time and evaluates them concurrently on a bounded thread pool, then
+    records and reports them in trial order, so callbacks still fire in
+    order (every start in a batch precedes its completions). Left unset,
+    ``trial_parallelism`` comes from ``SKILLET_TRIAL_PARALLELISM`` (default 1),
+    so a program that builds the optimizer can be switched to parallel
+    trials without changing it.
+
     Example:
         optimizer = SkilletMIPRO(
             metric=metric,
@@ -36,6 +59,7 @@ class SkilletMIPRO(MIPROv2):
     _on_trial_complete: CallbackType
     _on_new_best: CallbackType
     _current_instruction_candidates: dict[int, list[str]]
+    _trial_parallelism: int
 
     def __init__(
         self,
@@ -44,6 +68,7 @@ class SkilletMIPRO(MIPROv2):
         on_trial_start: CallbackType = None,
         on_trial_complete: CallbackType = None,
         on_new_best: CallbackType = None,
+        trial_parallelism: int | None = None,
         **kwargs,
     ):
         """Initialize SkilletMIPRO with callbacks.
@@ -53,6 +78,8 @@ class SkilletMIPRO(MIPROv2):
             on_trial_start: Called at start of each trial (trial_num, total_trials)
             on_trial_complete: Called after each trial with TrialResult
             on_new_best: Called when a new best score is achieved
+            trial_parallelism: Trials evaluated concurrently (1 runs them one at a time;
+                ``None`` reads ``SKILLET_TRIAL_PARALLELISM``)
             **kwargs: Passed to MIPROv2
         """
         super().__init__(metric=metric, **kwargs)
@@ -60,6 +87,11 @@ class SkilletMIPRO(MIPROv2):
         self._on_trial_complete = on_trial_complete
         self._on_new_best = on_new_best
         self._current_instruction_candidates = {}
+        if trial_parallelism is None:
+            trial_parallelism = _configured_parallelism()
+        if trial_parallelism < 1:
+            raise ValueError(f"trial_parallelism must be at least 1, got {trial_parallelism}")
+        self._trial_parallelism = trial_parallelism
 
     def _optimize_prompt_parameters(  # noqa: C901, PLR0913, PLR0915
         self,
@@ -129,9 +161,9 @@ class SkilletMIPRO(MIPROv2):
         param_score_dict = defaultdict(list)
         fully_evaled_param_combos = {}
 
-        def objective(trial):
-            nonlocal program, best_program, best_score, trial_logs, total_eval_calls, score_data
+        batch_size = minibatch_size if minibatch else len(valset)
 
+        def start_trial(trial) -> tuple[int, Any, list]:
             trial_num = trial.number + 2  # +2 because trial 1 is default
             if self._on_trial_start:
                 self._on_trial_start(trial_num, adjusted_num_trials)
@@ -148,12 +180,18 @@ class SkilletMIPRO(MIPROv2):
                 trial_logs,
                 trial_num,
             )
+            return trial_num, candidate_program, chosen_params
 
-            # Evaluate
-            batch_size = minibatch_size if minibatch else len(valset)
-            score = eval_candidate_program(
-                batch_size, valset, candidate_program, evaluate, self.rng
+        def score_trial(candidate_program: Any, rng: random.Random) -> float:
+            return eval_candidate_program(
+                batch_size, valset, candidate_program, evaluate, rng
             ).score
+
+        def finish_trial(
+            trial, trial_num: int, candidate_program: Any, chosen_params: list, score: float
+        ) -> float:
+            nonlocal best_program, best_score, total_eval_calls
+
             total_eval_calls += batch_size
 
             is_new_best = False
@@ -241,10 +279,43 @@ class SkilletMIPRO(MIPROv2):
 
             return score
 
+        def objective(trial):
+            trial_num, candidate_program, chosen_params = start_trial(trial)
+            score = score_trial(candidate_program, self.rng)
+            return finish_trial(trial, trial_num, candidate_program, chosen_params, score)
+
         # Create and run Optuna study
         sampler = optuna.samplers.TPESampler(seed=seed, multivariate=True)
         study = optuna.create_study(direction="maximize", sampler=sampler)
-        study.optimize(objective, n_trials=num_trials, show_progress_bar=False)
+        if self._trial_parallelism <= 1:
+            study.optimize(objective, n_trials=num_trials, show_progress_bar=False)
+        else:
+            with ThreadPoolExecutor(max_workers=self._trial_parallelism) as pool:
+                for first in range(0, num_trials, self._trial_parallelism):
+                    trials = [
+                        study.ask() for _ in range(min(self._trial_parallelism, num_trials - first))
+                    ]
+                    started = [start_trial(trial) for trial in trials]
+                    # Minibatches are drawn from per-trial generators seeded in
+                    # trial order, so a run stays reproducible under any
+                    # completion order. Each worker inherits the caller's
+                    # contextvars (e.g. a dspy.context(lm=...) override).
+                    futures = [
+                        pool.submit(
+                            contextvars.copy_context().run,
+                            score_trial,
+                            candidate_program,
+                            random.Random(self.rng.random()),
+                        )
+                        for _, candidate_program, _ in started
+                    ]
+                    for trial, (trial_num, candidate_program, chosen_params), future in zip(
+                        trials, started, futures, strict=True
+                    ):
+                        score = finish_trial(
+                            trial, trial_num, candidate_program, chosen_params, future.result()
+                        )
+                        study.tell(trial, score)
 
         # Final full evaluation if needed
         if minibatch and num_trials % minibatch_full_eval_steps != 0:
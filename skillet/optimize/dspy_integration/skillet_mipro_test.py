@@ -1,7 +1,15 @@
 """Tests for SkilletMIPRO."""
 
+import random
+import sys
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+from dspy.teleprompt import MIPROv2
+
 from skillet.optimize.dspy_integration.skillet_mipro import SkilletMIPRO
 
 
@@ -10,6 +18,69 @@ def _noop_init(_self, **_kwargs):
     pass
 
 
+def _parallel_mipro(parallelism: int, events: list) -> SkilletMIPRO:
+    """Build a SkilletMIPRO whose hooks record callback order."""
+    with patch.object(SkilletMIPRO, "__init__", _noop_init):
+        mipro = SkilletMIPRO.__new__(SkilletMIPRO)
+    mipro._on_trial_start = lambda num, _total: events.append(("start", num))
+    mipro._on_trial_complete = lambda result: events.append(("complete", result.trial_num))
+    mipro._on_new_best = lambda result: events.append(("best", result.trial_num))
+    mipro._current_instruction_candidates = {}
+    mipro._trial_parallelism = parallelism
+    mipro.rng = random.Random(0)
+    mipro.log_dir = None
+    mipro._select_and_insert_instructions_and_demos = MagicMock(
+        side_effect=lambda prog, *_args: (
+            (prog.id,),
+            None,
+        )
+    )
+    mipro._log_normal_eval = MagicMock()
+    return mipro
+
+
+class _FakeStudy:
+    """Just enough of an optuna study for ask/tell and optimize."""
+
+    def __init__(self):
+        self.told = []
+        self._next = 0
+
+    def ask(self):
+        trial = SimpleNamespace(number=self._next)
+        self._next += 1
+        return trial
+
+    def tell(self, trial, score):
+        self.told.append((trial.number, score))
+
+    def optimize(self, objective, n_trials, **_kwargs):
+        for _ in range(n_trials):
+            trial = self.ask()
+            self.tell(trial, objective(trial))
+
+
+def _fake_optuna(study: _FakeStudy) -> SimpleNamespace:
+    return SimpleNamespace(
+        logging=SimpleNamespace(WARNING=0, set_verbosity=lambda _level: None),
+        samplers=SimpleNamespace(TPESampler=lambda **_kwargs: None),
+        create_study=lambda **_kwargs: study,
+    )
+
+
+def _program(counter: list) -> MagicMock:
+    program = MagicMock()
+
+    def deepcopy():
+        counter.append(1)
+        copy = _program(counter)
+        copy.id = len(counter)
+        return copy
+
+    program.deepcopy.side_effect = deepcopy
+    return program
+
+
 def describe_SkilletMIPRO():
     def describe_init():
         def it_stores_callbacks():
@@ -28,6 +99,31 @@ def describe_SkilletMIPRO():
             assert mipro._on_trial_complete is on_complete
             assert mipro._on_new_best is on_best
 
+        def it_reads_trial_parallelism_from_the_environment():
+            with (
+                patch.object(MIPROv2, "__init__", _noop_init),
+                patch("skillet.config.TRIAL_PARALLELISM", "4"),
+            ):
+                assert SkilletMIPRO(metric=MagicMock())._trial_parallelism == 4
+                assert SkilletMIPRO(metric=MagicMock(), trial_parallelism=2)._trial_parallelism == 2
+
+        def it_defaults_to_sequential_trials():
+            with (
+                patch.object(MIPROv2, "__init__", _noop_init),
+                patch("skillet.config.TRIAL_PARALLELISM", ""),
+            ):
+                assert SkilletMIPRO(metric=MagicMock())._trial_parallelism == 1
+
+        def it_rejects_invalid_parallelism():
+            with patch.object(MIPROv2, "__init__", _noop_init):
+                with (
+                    patch("skillet.config.TRIAL_PARALLELISM", "many"),
+                    pytest.raises(ValueError, match="SKILLET_TRIAL_PARALLELISM"),
+                ):
+                    SkilletMIPRO(metric=MagicMock())
+                with pytest.raises(ValueError, match="at least 1"):
+                    SkilletMIPRO(metric=MagicMock(), trial_parallelism=0)
+
     def describe_get_current_instruction():
         def it_extracts_from_skill_module():
             with patch.object(SkilletMIPRO, "__init__", _noop_init):
@@ -76,3 +172,115 @@ def describe_SkilletMIPRO():
 
             result = mipro._get_current_instruction(mock_program)
             assert result == ""
+
+    def describe_optimize_prompt_parameters():
+        def _run(mipro, scores: dict[int, float], num_trials: int, delays: dict | None = None):
+            threads = set()
+            study = _FakeStudy()
+
+            def evaluate_candidate(_size, _valset, prog, _evaluate, _rng):
+                threads.add(threading.get_ident())
+                time.sleep((delays or {}).get(getattr(prog, "id", 0), 0))
+                return SimpleNamespace(score=scores.get(getattr(prog, "id", 0), 10.0))
+
+            with (
+                patch(
+                    "skillet.optimize.dspy_integration.skillet_mipro.eval_candidate_program",
+                    side_effect=evaluate_candidate,
+                ),
+                patch("skillet.optimize.dspy_integration.skillet_mipro.save_candidate_program"),
+                patch.dict(sys.modules, {"optuna": _fake_optuna(study)}),
+            ):
+                best = mipro._optimize_prompt_parameters(
+                    program=_program([]),
+                    instruction_candidates={0: ["a", "b"]},
+                    demo_candidates=None,
+                    evaluate=MagicMock(),
+                    valset=[1, 2, 3],
+                    num_trials=num_trials,
+                    minibatch=False,
+                    minibatch_size=3,
+                    minibatch_full_eval_steps=10,
+                    seed=0,
+                )
+            return best, threads, study
+
+        def it_fires_callbacks_in_trial_order_when_parallel():
+            events = []
+            mipro = _parallel_mipro(2, events)
+
+            _run(mipro, {}, num_trials=3)
+
+            assert events == [
+                ("start", 1),
+                ("complete", 1),
+                ("best", 1),
+                ("start", 2),
+                ("start", 3),
+                ("complete", 2),
+                ("complete", 3),
+                ("start", 4),
+                ("complete", 4),
+            ]
+
+        def it_pins_the_callback_order_when_later_trials_finish_first():
+            events = []
+            mipro = _parallel_mipro(3, events)
+
+            # Trial 2 (candidate 4) scores slowest; trial 3 (candidate 5) is a new best
+            _run(mipro, {5: 90.0}, num_trials=5, delays={4: 0.2})
+
+            assert events == [
+                ("start", 1),
+                ("complete", 1),
+                ("best", 1),
+                ("start", 2),
+                ("start", 3),
+                ("start", 4),
+                ("complete", 2),
+                ("complete", 3),
+                ("best", 3),
+                ("complete", 4),
+                ("start", 5),
+                ("start", 6),
+                ("complete", 5),
+                ("complete", 6),
+            ]
+
+        def it_scores_a_batch_on_worker_threads():
+            mipro = _parallel_mipro(2, [])
+
+            _, threads, study = _run(mipro, {}, num_trials=2)
+
+            # The default program is scored up front on the caller's thread
+            assert threads - {threading.get_ident()}
+            assert [number for number, _ in study.told] == [0, 1]
+
+        def it_keeps_the_best_candidate():
+            events = []
+            mipro = _parallel_mipro(3, events)
+
+            # Ids follow the deepcopy counter: 1-3 are setup copies, so the
+            # batch's candidates are 4, 5 and 6 (trials 2, 3 and 4).
+            best, _, study = _run(mipro, {5: 90.0}, num_trials=3)
+
+            assert [num for kind, num in events if kind == "best"] == [1, 3]
+            assert study.told == [(0, 10.0), (1, 90.0), (2, 10.0)]
+            assert best.id == 7
+
+        def it_runs_sequentially_by_default():
+            events = []
+            mipro = _parallel_mipro(1, events)
+
+            _, threads, _ = _run(mipro, {}, num_trials=2)
+
+            assert threads == {threading.get_ident()}
+            assert events == [
+                ("start", 1),
+                ("complete", 1),
+                ("best", 1),
+                ("start", 2),
+                ("complete", 2),
+                ("start", 3),
+                ("complete", 3),
+            ]
@@ -1,6 +1,7 @@
 """Iterative skill tuning using DSPy."""
 
 from .result import EvalResult, RoundResult, TuneConfig, TuneResult
+from .round_log import RoundLog
 from .tune_dspy import tune_dspy
 
 # tune is an alias for tune_dspy (the only implementation)
@@ -8,6 +9,7 @@ tune = tune_dspy
 
 __all__ = [
     "EvalResult",
+    "RoundLog",
     "RoundResult",
     "TuneConfig",
     "TuneResult",
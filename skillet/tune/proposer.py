@@ -16,6 +16,7 @@ def propose_instruction(
     trainset: list,
     failures: list[dict],
     instruction_history: list[dict],
+    variant: int = 0,
 ) -> str:
     """Generate a new instruction using DSPy's proposal mechanism.
 
@@ -27,15 +28,20 @@ def propose_instruction(
         trainset: Training examples from evals
         failures: List of failed eval results
         instruction_history: Previous instruction attempts with scores
+        variant: Which window of failures to ground on. Beam mode proposes
+            several candidates from one parent; rotating the failures each
+            sees keeps them from converging on the same fix.
 
     Returns:
         Improved instruction text
     """
-    # Build context for proposal
+    # Build context for proposal (3 failures, rotated by variant)
+    start = variant * 3 % len(failures) if failures else 0
+    shown = (failures[start:] + failures[:start])[:3]
     failures_summary = "\n".join(
         [
             f"- Prompt: {f['prompt']}\n  Expected: {f['expected']}\n  Got: {f['response'][:200]}..."
-            for f in failures[:3]  # Limit to 3 failures
+            for f in shown
         ]
     )
 
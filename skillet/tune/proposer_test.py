@@ -126,6 +126,25 @@ def describe_propose_instruction():
         assert "Q2" in call_kwargs["failures"]
         assert "Q3" not in call_kwargs["failures"]
 
+    def it_rotates_failures_by_variant(mock_dspy):
+        from skillet.tune.proposer import propose_instruction
+
+        failures = [
+            {"prompt": f"Q{i}", "expected": f"A{i}", "response": f"Wrong{i}"} for i in range(5)
+        ]
+
+        propose_instruction(
+            current_instruction="Test",
+            trainset=[],
+            failures=failures,
+            instruction_history=[],
+            variant=1,
+        )
+
+        shown = mock_dspy.Predict.return_value.call_args[1]["failures"]
+        assert [q for q in ("Q3", "Q4", "Q0") if q in shown] == ["Q3", "Q4", "Q0"]
+        assert "Q1" not in shown
+
     def it_uses_dspy_context(mock_dspy):
         from skillet.tune.proposer import propose_instruction
 
@@ -3,8 +3,8 @@
 import json
 import platform
 import sys
-from collections.abc import Awaitable, Callable
-from dataclasses import asdict, dataclass, field
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -34,6 +34,20 @@ class RoundResult:
     evals: list[EvalResult]
 
 
+@dataclass
+class CandidateNode:
+    """One evaluated candidate in a tune run's search tree."""
+
+    id: int
+    round: int
+    parent: int | None
+    pass_rate: float
+    skill_content: str
+    survived: bool = False
+    rejected: bool = False
+    """Dropped after the racing minibatch; ``pass_rate`` is then the minibatch rate."""
+
+
 @dataclass
 class TuneConfig:
     """Configuration for a tune run."""
@@ -42,6 +56,15 @@ class TuneConfig:
     target_pass_rate: float = 100.0
     samples: int = 1
     parallel: int = 3
+    skip_cache: bool = False
+    candidates: int = 1
+    """Candidate instructions proposed and evaluated per round (beam mode when > 1)."""
+    beam_width: int = 1
+    """Best candidates carried forward as parents for the next round's proposals."""
+    minibatch: int = 0
+    """Evals a proposed candidate is first raced on before the full set (0 disables racing)."""
+    rejection_confidence: float = 0.95
+    """Confidence with which racing must rule out beating the incumbent to reject."""
 
 
 @dataclass
@@ -102,6 +125,13 @@ class TuneResult:
     original_skill: str
     best_skill: str
     rounds: list[RoundResult] = field(default_factory=list)
+    search_tree: list[CandidateNode] = field(default_factory=list)
+    round_log: str | None = None
+    """JSONL log holding each round's full eval results (responses and tool calls).
+
+    When set, ``rounds`` keeps only each eval's verdict and reasoning in memory;
+    read the rest back with :meth:`stream_rounds`.
+    """
 
     @classmethod
     def create(
@@ -158,7 +188,15 @@ class TuneResult:
 
     @classmethod
     def load(cls, path: Path) -> "TuneResult":
-        """Load results from a JSON file."""
+        """Load results from a JSON file or a ``RoundLog`` JSONL log.
+
+        A log from a run that died early loads as the rounds it finished.
+        Rounds loaded from a log keep only each eval's verdict and reasoning,
+        as during the run; :meth:`stream_rounds` reads back the rest.
+        """
+        if path.suffix == ".jsonl":
+            return cls._load_round_log(path)
+
         with path.open() as f:
             data = json.load(f)
 
@@ -169,14 +207,68 @@ class TuneResult:
             result=TuneResultSummary(**data["result"]),
             original_skill=data["original_skill"],
             best_skill=data["best_skill"],
-            rounds=[
-                RoundResult(
-                    round=r["round"],
-                    pass_rate=r["pass_rate"],
-                    skill_content=r["skill_content"],
-                    tip_used=r["tip_used"],
-                    evals=[EvalResult(**e) for e in r["evals"]],
-                )
-                for r in data["rounds"]
-            ],
+            rounds=[_round_from_dict(r) for r in data["rounds"]],
+            search_tree=[CandidateNode(**n) for n in data.get("search_tree", [])],
+            round_log=data.get("round_log"),
         )
+
+    @classmethod
+    def _load_round_log(cls, path: Path) -> "TuneResult":
+        from .round_log import RoundLog
+
+        result: TuneResult | None = None
+        for record in RoundLog.read(path, resolve_responses=False):
+            kind = record.pop("type")
+            if kind == "start":
+                result = cls(
+                    metadata=TuneMetadata(**record["metadata"]),
+                    config=TuneConfig(**record["config"]),
+                    result=TuneResultSummary(
+                        success=False, final_pass_rate=0.0, rounds_completed=0, best_round=0
+                    ),
+                    original_skill=record["original_skill"],
+                    best_skill=record["original_skill"],
+                    round_log=str(path),
+                )
+            elif result is None:
+                continue
+            elif kind == "candidate":
+                result.search_tree.append(CandidateNode(**record))
+            elif kind == "round":
+                round_result = _round_from_dict(record)
+                round_result.evals = [
+                    replace(e, response=None, tool_calls=None) for e in round_result.evals
+                ]
+                result.add_round(round_result)
+            elif kind == "final":
+                result.metadata = TuneMetadata(**record["metadata"])
+                result.result = TuneResultSummary(**record["result"])
+                result.best_skill = record["best_skill"]
+                for node in result.search_tree:
+                    node.survived = node.id in record["survived"]
+        if result is None:
+            raise ValueError(f"Not a tune round log: {path}")
+        return result
+
+    @classmethod
+    def stream_rounds(cls, path: Path) -> Iterator[RoundResult]:
+        """Yield the rounds of a ``RoundLog`` one at a time, with full eval results.
+
+        Only the round being yielded is held in memory, so long tunes with
+        large responses can be walked without loading the whole run.
+        """
+        from .round_log import RoundLog
+
+        for record in RoundLog.read(path):
+            if record.pop("type") == "round":
+                yield _round_from_dict(record)
+
+
+def _round_from_dict(data: dict[str, Any]) -> RoundResult:
+    return RoundResult(
+        round=data["round"],
+        pass_rate=data["pass_rate"],
+        skill_content=data["skill_content"],
+        tip_used=data["tip_used"],
+        evals=[EvalResult(**e) for e in data["evals"]],
+    )
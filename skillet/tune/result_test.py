@@ -1,9 +1,13 @@
 """Tests for tune result data structures."""
 
+import shutil
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from skillet.tune.result import (
+    CandidateNode,
     EvalResult,
     RoundResult,
     TuneConfig,
@@ -148,3 +152,135 @@ def describe_TuneResult():
             assert len(loaded.rounds) == 1
             assert loaded.rounds[0].pass_rate == 0.6
             assert loaded.rounds[0].evals[0].source == "eval1.yaml"
+
+    def it_round_trips_the_search_tree(tmp_path: Path):
+        result = TuneResult.create(
+            eval_set="tree",
+            skill_path=Path("/skill"),
+            original_skill="original",
+            config=TuneConfig(candidates=2, beam_width=1),
+        )
+        result.search_tree = [
+            CandidateNode(id=0, round=1, parent=None, pass_rate=50.0, skill_content="original"),
+            CandidateNode(
+                id=1, round=2, parent=0, pass_rate=75.0, skill_content="v1", survived=True
+            ),
+        ]
+        path = tmp_path / "results.json"
+        result.save(path)
+
+        loaded = TuneResult.load(path)
+
+        assert loaded.search_tree == result.search_tree
+        assert loaded.config.candidates == 2
+
+    def it_loads_results_saved_before_the_search_tree_existed(tmp_path: Path):
+        import json
+
+        result = TuneResult.create(
+            eval_set="old",
+            skill_path=Path("/skill"),
+            original_skill="original",
+            config=TuneConfig(),
+        )
+        data = result.to_dict()
+        del data["search_tree"]
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps(data))
+
+        assert TuneResult.load(path).search_tree == []
+
+    def describe_round_logs():
+        def _write_log(path: Path, *, finish: bool) -> TuneResult:
+            from skillet.tune.round_log import RoundLog
+
+            log = RoundLog(path)
+            result = TuneResult.create(
+                eval_set="logged",
+                skill_path=Path("/skill"),
+                original_skill="original",
+                config=TuneConfig(max_rounds=2),
+            )
+            log.start(result)
+            node = CandidateNode(id=0, round=1, parent=None, pass_rate=40.0, skill_content="o")
+            log.candidate(node)
+            for num, rate, skill, response in (
+                (1, 40.0, "original", "x"),
+                (2, 80.0, "better", "y"),
+            ):
+                round_result = RoundResult(
+                    round=num,
+                    pass_rate=rate,
+                    skill_content=skill,
+                    tip_used=None,
+                    evals=[
+                        EvalResult(source="a.yaml", passed=False, reasoning="r", response=response)
+                    ],
+                )
+                log.round(round_result)
+                result.add_round(round_result)
+            if finish:
+                node.survived = True
+                result.search_tree.append(node)
+                result.finalize(success=False)
+                log.finish(result)
+            return result
+
+        def it_loads_a_finished_log(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            _write_log(path, finish=True)
+
+            loaded = TuneResult.load(path)
+
+            assert loaded.metadata.eval_set == "logged"
+            assert loaded.metadata.completed_at
+            assert loaded.best_skill == "better"
+            assert loaded.result.final_pass_rate == 80.0
+            assert [r.round for r in loaded.rounds] == [1, 2]
+            assert loaded.search_tree[0].survived is True
+            assert loaded.round_log == str(path)
+
+        def it_leaves_responses_in_the_log_when_loading(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            _write_log(path, finish=True)
+            shutil.rmtree(tmp_path / "run.responses")
+
+            loaded = TuneResult.load(path)
+
+            assert [e.response for r in loaded.rounds for e in r.evals] == [None, None]
+            assert loaded.rounds[1].evals[0].reasoning == "r"
+
+        def it_loads_the_finished_rounds_of_an_interrupted_log(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            _write_log(path, finish=False)
+
+            loaded = TuneResult.load(path)
+
+            assert loaded.result.rounds_completed == 2
+            assert loaded.result.best_round == 2
+            assert loaded.best_skill == "better"
+            assert not loaded.metadata.completed_at
+
+        def it_rejects_files_that_are_not_round_logs(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            path.write_text('{"type": "round"}\n')
+
+            with pytest.raises(ValueError, match="Not a tune round log"):
+                TuneResult.load(path)
+
+        def it_streams_rounds_with_responses(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            _write_log(path, finish=True)
+
+            rounds = TuneResult.stream_rounds(path)
+
+            assert next(rounds).evals[0].response == "x"
+            assert next(rounds).evals[0].response == "y"
+            assert next(rounds, None) is None
+
+        def it_round_trips_the_log_reference_through_json(tmp_path: Path):
+            result = _write_log(tmp_path / "run.jsonl", finish=True)
+            result.round_log = str(tmp_path / "run.jsonl")
+            result.save(tmp_path / "run.json")
+
+            assert TuneResult.load(tmp_path / "run.json").round_log == result.round_log
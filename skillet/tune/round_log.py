@@ -0,0 +1,107 @@
+"""Append-only JSONL log of a tune run, written as rounds complete."""
+
+import json
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from skillet._internal.cache import hash_content
+
+from .result import CandidateNode, RoundResult, TuneResult
+
+
+class RoundLog:
+    """Stream a tune run to ``path``, one JSON record per line.
+
+    Records are appended as the run progresses, so a crash keeps every round
+    finished so far:
+
+    - ``start``: metadata, config and the original skill
+    - ``candidate``: one per evaluated candidate (a ``CandidateNode``)
+    - ``round``: one per round (a ``RoundResult``)
+    - ``final``: the summary, best skill and surviving candidate ids
+
+    With ``dedupe_responses`` each eval response is written once to
+    ``<path>.responses/<hash>.txt`` and referenced by hash, so the same
+    response across samples, candidates and rounds costs its bytes once.
+    """
+
+    def __init__(self, path: Path, *, dedupe_responses: bool = True) -> None:
+        self.path = path
+        self.responses_dir = path.with_suffix(".responses")
+        self.dedupe_responses = dedupe_responses
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _store_response(self, response: str) -> str:
+        key = hash_content(response)
+        blob = self.responses_dir / f"{key}.txt"
+        if not blob.exists():
+            self.responses_dir.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_suffix(".tmp")
+            tmp.write_text(response)
+            tmp.replace(blob)
+        return key
+
+    def start(self, result: TuneResult) -> None:
+        """Begin a fresh log for ``result``, replacing any earlier one at ``path``."""
+        self.path.unlink(missing_ok=True)
+        self._append(
+            {
+                "type": "start",
+                "metadata": asdict(result.metadata),
+                "config": asdict(result.config),
+                "original_skill": result.original_skill,
+            }
+        )
+
+    def candidate(self, node: CandidateNode) -> None:
+        """Record one evaluated candidate."""
+        self._append({"type": "candidate", **asdict(node)})
+
+    def round(self, round_result: RoundResult) -> None:
+        """Record one finished round, storing responses by hash when deduping."""
+        record = {"type": "round", **asdict(round_result)}
+        if self.dedupe_responses:
+            for entry in record["evals"]:
+                if entry["response"] is not None:
+                    entry["response_ref"] = self._store_response(entry.pop("response"))
+        self._append(record)
+
+    def finish(self, result: TuneResult) -> None:
+        """Record the run's outcome."""
+        self._append(
+            {
+                "type": "final",
+                "metadata": asdict(result.metadata),
+                "result": asdict(result.result),
+                "best_skill": result.best_skill,
+                "survived": [node.id for node in result.search_tree if node.survived],
+            }
+        )
+
+    @classmethod
+    def read(cls, path: Path, *, resolve_responses: bool = True) -> Iterator[dict[str, Any]]:
+        """Yield the log's records one line at a time, resolving stored responses.
+
+        Without ``resolve_responses`` the stored responses are not read, and
+        evals whose response was stored by hash come back without one. A
+        truncated last line (the run died mid-write) is skipped.
+        """
+        responses_dir = path.with_suffix(".responses")
+        with path.open() as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                for entry in record.get("evals", []):
+                    if "response_ref" in entry:
+                        ref = entry.pop("response_ref")
+                        if resolve_responses:
+                            entry["response"] = (responses_dir / f"{ref}.txt").read_text()
+                yield record
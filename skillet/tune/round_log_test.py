@@ -0,0 +1,113 @@
+"""Tests for round_log module."""
+
+import json
+from pathlib import Path
+
+from skillet.tune.result import (
+    CandidateNode,
+    EvalResult,
+    RoundResult,
+    TuneConfig,
+    TuneResult,
+)
+from skillet.tune.round_log import RoundLog
+
+
+def _result() -> TuneResult:
+    return TuneResult.create(
+        eval_set="log-test",
+        skill_path=Path("/skill"),
+        original_skill="original",
+        config=TuneConfig(max_rounds=2),
+    )
+
+
+def _round(num: int, response: str | None = "same response") -> RoundResult:
+    return RoundResult(
+        round=num,
+        pass_rate=50.0 * num,
+        skill_content=f"v{num}",
+        tip_used="tip",
+        evals=[
+            EvalResult(source="a.yaml", passed=True, reasoning="ok", response=response),
+            EvalResult(source="b.yaml", passed=False, reasoning="no", response=response),
+        ],
+    )
+
+
+def _types(path: Path) -> list[str]:
+    return [json.loads(line)["type"] for line in path.read_text().splitlines()]
+
+
+def describe_RoundLog():
+    def it_appends_one_record_per_event(tmp_path: Path):
+        path = tmp_path / "run.jsonl"
+        log = RoundLog(path)
+        result = _result()
+
+        log.start(result)
+        log.candidate(CandidateNode(id=0, round=1, parent=None, pass_rate=50.0, skill_content="v"))
+        log.round(_round(1))
+        log.finish(result)
+
+        assert _types(path) == ["start", "candidate", "round", "final"]
+
+    def it_starts_a_fresh_log(tmp_path: Path):
+        path = tmp_path / "run.jsonl"
+        path.write_text('{"type": "stale"}\n')
+
+        RoundLog(path).start(_result())
+
+        assert _types(path) == ["start"]
+
+    def it_stores_each_distinct_response_once(tmp_path: Path):
+        path = tmp_path / "run.jsonl"
+        log = RoundLog(path)
+        log.round(_round(1))
+        log.round(_round(2))
+
+        blobs = list((tmp_path / "run.responses").iterdir())
+        assert len(blobs) == 1
+        assert blobs[0].read_text() == "same response"
+        assert "same response" not in path.read_text()
+
+    def it_inlines_responses_without_dedupe(tmp_path: Path):
+        path = tmp_path / "run.jsonl"
+        RoundLog(path, dedupe_responses=False).round(_round(1))
+
+        assert "same response" in path.read_text()
+        assert not (tmp_path / "run.responses").exists()
+
+    def describe_read():
+        def it_resolves_stored_responses(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            RoundLog(path).round(_round(1))
+
+            (record,) = RoundLog.read(path)
+
+            assert [e["response"] for e in record["evals"]] == ["same response"] * 2
+            assert "response_ref" not in record["evals"][0]
+
+        def it_leaves_stored_responses_unread_on_request(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            RoundLog(path).round(_round(1))
+
+            (record,) = RoundLog.read(path, resolve_responses=False)
+
+            assert all("response" not in e and "response_ref" not in e for e in record["evals"])
+
+        def it_keeps_missing_responses_missing(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            RoundLog(path).round(_round(1, response=None))
+
+            (record,) = RoundLog.read(path)
+
+            assert record["evals"][0]["response"] is None
+
+        def it_skips_a_truncated_last_line(tmp_path: Path):
+            path = tmp_path / "run.jsonl"
+            RoundLog(path).round(_round(1))
+            with path.open("a") as f:
+                f.write('{"type": "round", "rou')
+
+            assert [r["round"] for r in RoundLog.read(path)] == [1]
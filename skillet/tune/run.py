@@ -4,77 +4,79 @@ import asyncio
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 
+from cachetta import Cachetta
+
 from skillet.agent import Agent
-from skillet.eval import judge_response, run_prompt
+from skillet.eval.evaluate.compile_plans import compile_plans
+from skillet.eval.evaluate.run_single_eval import run_single_eval
 
 
-async def run_tune_eval(
+async def run_tune_eval(  # noqa: PLR0913
     evals: list[dict],
     skill_path: Path,
     samples: int = 1,
     parallel: int = 3,
     on_status: Callable[[dict, str, dict | None], Awaitable[None]] | None = None,
+    *,
+    iteration_cache: Cachetta,
+    skip_cache: bool = False,
+    semaphore: asyncio.Semaphore | None = None,
+    candidate: int | None = None,
+    eval_indices: list[int] | None = None,
 ) -> tuple[float, list[dict]]:
-    """Run evals for tuning (no caching) and return pass rate + results."""
+    """Run evals for tuning and return pass rate + results.
+
+    Each iteration goes through :func:`run_single_eval` with ``iteration_cache``
+    (keyed by the candidate's skill hash, as ``evaluate()`` keys a skill), so
+    a candidate the proposer returns again — in this session or an earlier
+    one — costs nothing.
+    Results also carry ``prompt`` and ``expected`` for the proposer.
+
+    Beam mode evaluates several candidates at once: it passes one shared
+    ``semaphore`` so ``parallel`` bounds agent runs across all of them, and
+    tags each candidate's tasks with ``candidate`` so status updates from
+    concurrent candidates stay distinct.
+
+    ``eval_indices`` restricts the run to those evals (racing scores a
+    minibatch first); tasks keep their index in the full ``evals`` list.
+    """
+    indices = range(len(evals)) if eval_indices is None else eval_indices
     tasks = []
-    for eval_idx, eval_item in enumerate(evals):
+    for eval_idx in indices:
+        eval_item = evals[eval_idx]
+        plans = compile_plans(eval_item)
         for i in range(samples):
-            tasks.append(
-                {
-                    "eval_idx": eval_idx,
-                    "eval_source": eval_item["_source"],
-                    "eval_content": eval_item["_content"],
-                    "iteration": i + 1,
-                    "prompt": eval_item["prompt"],
-                    "expected": eval_item["expected"],
-                }
-            )
+            task = {
+                "eval_idx": eval_idx,
+                "eval_source": eval_item["_source"],
+                "eval_content": eval_item["_content"],
+                "iteration": i + 1,
+                "prompt": eval_item["prompt"],
+                "expected": eval_item["expected"],
+            }
+            for key in ("setup", "teardown", "assertions", "gate"):
+                if eval_item.get(key):
+                    task[key] = eval_item[key]
+            task.update(plans)
+            if candidate is not None:
+                task["candidate"] = candidate
+            tasks.append(task)
 
-    semaphore = asyncio.Semaphore(parallel)
+    semaphore = semaphore or asyncio.Semaphore(parallel)
 
     async def run_single(task):
         async with semaphore:
-            if on_status:
-                await on_status(task, "running", None)
-            try:
-                query_result = await run_prompt(task["prompt"], skill_path, agent=Agent.CLAUDE)
-                # Parked tune path: pinned to claude until it is wired to --agent.
-                judgment = await judge_response(
-                    prompt=task["prompt"],
-                    response=query_result.text,
-                    expected=task["expected"],
-                    tool_calls=query_result.tool_calls,
-                    agent=Agent.CLAUDE,
-                )
-                result = {
-                    "eval_idx": task["eval_idx"],
-                    "eval_source": task["eval_source"],
-                    "iteration": task["iteration"],
-                    "prompt": task["prompt"],
-                    "expected": task["expected"],
-                    "response": query_result.text,
-                    "tool_calls": query_result.tool_calls,
-                    "judgment": judgment,
-                    "pass": judgment["pass"],
-                }
-                if on_status:
-                    await on_status(task, "done", result)
-                return result
-            except Exception as e:
-                result = {
-                    "eval_idx": task["eval_idx"],
-                    "eval_source": task["eval_source"],
-                    "iteration": task["iteration"],
-                    "prompt": task["prompt"],
-                    "expected": task["expected"],
-                    "response": str(e),
-                    "tool_calls": [],
-                    "judgment": {"pass": False, "reasoning": f"Error: {e}"},
-                    "pass": False,
-                }
-                if on_status:
-                    await on_status(task, "done", result)
-                return result
+            # Parked tune path: pinned to claude until it is wired to --agent.
+            result = await run_single_eval(
+                task,
+                skill_path,
+                None,
+                iteration_cache,
+                on_status,
+                skip_cache,
+                agent=Agent.CLAUDE,
+            )
+            return {**result, "prompt": task["prompt"], "expected": task["expected"]}
 
     results = await asyncio.gather(*[run_single(t) for t in tasks])
 
@@ -5,31 +5,46 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from skillet._internal.sdk import QueryResult
+from skillet._internal.cache import INFRA_FAILURE_KEY, build_iteration_cache
+from skillet.agent import Agent
 from skillet.tune.run import run_tune_eval
 
+_LEAF = "skillet.eval.evaluate.run_single_eval._run_iteration"
+
+
+def _payload(task: dict, passed: bool = True) -> dict:
+    return {
+        "iteration": task["iteration"],
+        "response": "response",
+        "tool_calls": [],
+        "judgment": {"pass": passed, "reasoning": "OK" if passed else "bad"},
+        "pass": passed,
+    }
+
+
+def _cache(tmp_path: Path, skill: str = "cand1"):
+    skill_dir = tmp_path / "skills" / skill
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(skill)
+    return build_iteration_cache(tmp_path, "evals", skill_dir, Agent.CLAUDE)
+
 
 def describe_run_tune_eval():
     """Tests for run_tune_eval function."""
 
     @pytest.mark.asyncio
-    async def it_calculates_pass_rate():
-        with (
-            patch("skillet.tune.run.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch("skillet.tune.run.judge_response", new_callable=AsyncMock) as mock_judge,
-        ):
-            mock_run.return_value = QueryResult(text="response", tool_calls=[])
-            mock_judge.side_effect = [
-                {"pass": True, "reasoning": "OK"},
-                {"pass": False, "reasoning": "bad"},
-            ]
+    async def it_calculates_pass_rate(tmp_path: Path):
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task, task["prompt"] == "p1")
 
             evals = [
                 {"_source": "a.md", "_content": "c1", "prompt": "p1", "expected": "e1"},
                 {"_source": "b.md", "_content": "c2", "prompt": "p2", "expected": "e2"},
             ]
 
-            pass_rate, results = await run_tune_eval(evals, Path("/skill.md"), samples=1)
+            pass_rate, results = await run_tune_eval(
+                evals, Path("/skill.md"), samples=1, iteration_cache=_cache(tmp_path)
+            )
 
             assert pass_rate == 50.0
             assert len(results) == 2
@@ -37,77 +52,183 @@ def describe_run_tune_eval():
             assert results[1]["pass"] is False
 
     @pytest.mark.asyncio
-    async def it_handles_multiple_samples():
-        with (
-            patch("skillet.tune.run.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch("skillet.tune.run.judge_response", new_callable=AsyncMock) as mock_judge,
-        ):
-            mock_run.return_value = QueryResult(text="response", tool_calls=[])
-            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+    async def it_handles_multiple_samples(tmp_path: Path):
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
 
             evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
 
-            pass_rate, results = await run_tune_eval(evals, Path("/skill.md"), samples=3)
+            pass_rate, results = await run_tune_eval(
+                evals, Path("/skill.md"), samples=3, iteration_cache=_cache(tmp_path)
+            )
 
             assert len(results) == 3
             assert pass_rate == 100.0
 
     @pytest.mark.asyncio
-    async def it_calls_status_callback():
+    async def it_includes_prompt_and_expected_for_the_proposer(tmp_path: Path):
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task, passed=False)
+
+            evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
+
+            _, results = await run_tune_eval(
+                evals, Path("/skill.md"), iteration_cache=_cache(tmp_path)
+            )
+
+            assert results[0]["prompt"] == "p"
+            assert results[0]["expected"] == "e"
+
+    @pytest.mark.asyncio
+    async def it_reuses_cached_results_for_a_repeated_candidate(tmp_path: Path):
+        evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
+
+            await run_tune_eval(evals, Path("/skill.md"), iteration_cache=_cache(tmp_path))
+            _, results = await run_tune_eval(
+                evals, Path("/skill.md"), iteration_cache=_cache(tmp_path)
+            )
+
+            mock_leaf.assert_called_once()
+            assert results[0]["cached"] is True
+
+    @pytest.mark.asyncio
+    async def it_runs_a_new_candidate_fresh(tmp_path: Path):
+        evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
+
+            await run_tune_eval(evals, Path("/skill.md"), iteration_cache=_cache(tmp_path, "a"))
+            await run_tune_eval(evals, Path("/skill.md"), iteration_cache=_cache(tmp_path, "b"))
+
+            assert mock_leaf.call_count == 2
+
+    @pytest.mark.asyncio
+    async def it_reruns_when_skip_cache_is_set(tmp_path: Path):
+        evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
+
+            await run_tune_eval(evals, Path("/skill.md"), iteration_cache=_cache(tmp_path))
+            await run_tune_eval(
+                evals, Path("/skill.md"), iteration_cache=_cache(tmp_path), skip_cache=True
+            )
+
+            assert mock_leaf.call_count == 2
+
+    @pytest.mark.asyncio
+    async def it_calls_status_callback(tmp_path: Path):
         status_calls = []
 
         async def on_status(task, state, _result):
             status_calls.append((task["eval_source"], state))
 
-        with (
-            patch("skillet.tune.run.run_prompt", new_callable=AsyncMock) as mock_run,
-            patch("skillet.tune.run.judge_response", new_callable=AsyncMock) as mock_judge,
-        ):
-            mock_run.return_value = QueryResult(text="response", tool_calls=[])
-            mock_judge.return_value = {"pass": True, "reasoning": "OK"}
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
 
             evals = [{"_source": "test.md", "_content": "c", "prompt": "p", "expected": "e"}]
 
-            await run_tune_eval(evals, Path("/skill.md"), samples=1, on_status=on_status)
+            await run_tune_eval(
+                evals,
+                Path("/skill.md"),
+                samples=1,
+                on_status=on_status,
+                iteration_cache=_cache(tmp_path),
+            )
 
             assert ("test.md", "running") in status_calls
             assert ("test.md", "done") in status_calls
 
     @pytest.mark.asyncio
-    async def it_handles_exceptions():
-        with (
-            patch("skillet.tune.run.run_prompt", new_callable=AsyncMock) as mock_run,
-        ):
-            mock_run.side_effect = RuntimeError("network error")
-
-            evals = [{"_source": "test.md", "_content": "c", "prompt": "p", "expected": "e"}]
-
-            pass_rate, results = await run_tune_eval(evals, Path("/skill.md"), samples=1)
+    async def it_does_not_cache_infra_failures(tmp_path: Path):
+        evals = [{"_source": "test.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: {
+                **_payload(task, passed=False),
+                "response": "network error",
+                INFRA_FAILURE_KEY: True,
+            }
+
+            pass_rate, results = await run_tune_eval(
+                evals, Path("/skill.md"), iteration_cache=_cache(tmp_path)
+            )
+            await run_tune_eval(evals, Path("/skill.md"), iteration_cache=_cache(tmp_path))
 
             assert pass_rate == 0.0
-            assert results[0]["pass"] is False
             assert "network error" in results[0]["response"]
+            assert mock_leaf.call_count == 2
 
     @pytest.mark.asyncio
-    async def it_calls_status_callback_on_exception():
-        """Test that on_status is called even when an exception occurs."""
-        status_calls = []
+    async def it_shares_a_semaphore_across_candidates(tmp_path: Path):
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        async def leaf(task, *_, **_kw):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _payload(task)
+
+        evals = [
+            {"_source": f"{i}.md", "_content": f"c{i}", "prompt": "p", "expected": "e"}
+            for i in range(4)
+        ]
+        semaphore = asyncio.Semaphore(2)
+        with patch(_LEAF, side_effect=leaf):
+            await asyncio.gather(
+                *[
+                    run_tune_eval(
+                        evals,
+                        Path("/skill.md"),
+                        parallel=10,
+                        iteration_cache=_cache(tmp_path, f"cand{k}"),
+                        semaphore=semaphore,
+                        candidate=k,
+                    )
+                    for k in range(3)
+                ]
+            )
+
+        assert peak == 2
 
-        async def on_status(task, state, result):
-            status_calls.append((task["eval_source"], state, result))
+    @pytest.mark.asyncio
+    async def it_tags_tasks_with_the_candidate(tmp_path: Path):
+        seen = []
 
-        with (
-            patch("skillet.tune.run.run_prompt", new_callable=AsyncMock) as mock_run,
-        ):
-            mock_run.side_effect = RuntimeError("network error")
+        async def on_status(task, _state, _result):
+            seen.append(task.get("candidate"))
 
-            evals = [{"_source": "test.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        evals = [{"_source": "a.md", "_content": "c", "prompt": "p", "expected": "e"}]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
 
-            await run_tune_eval(evals, Path("/skill.md"), samples=1, on_status=on_status)
+            await run_tune_eval(
+                evals,
+                Path("/skill.md"),
+                on_status=on_status,
+                iteration_cache=_cache(tmp_path),
+                candidate=2,
+            )
 
-            # Should have both running and done calls
-            assert ("test.md", "running", None) in status_calls
-            # done call should have the error result
-            done_calls = [c for c in status_calls if c[1] == "done"]
-            assert len(done_calls) == 1
-            assert done_calls[0][2]["pass"] is False
+        assert seen == [2, 2]
+
+    @pytest.mark.asyncio
+    async def it_runs_only_the_selected_evals(tmp_path: Path):
+        evals = [
+            {"_source": f"{i}.md", "_content": f"c{i}", "prompt": f"p{i}", "expected": "e"}
+            for i in range(4)
+        ]
+        with patch(_LEAF, new_callable=AsyncMock) as mock_leaf:
+            mock_leaf.side_effect = lambda task, *_, **_kw: _payload(task)
+
+            _, results = await run_tune_eval(
+                evals, Path("/skill.md"), iteration_cache=_cache(tmp_path), eval_indices=[1, 3]
+            )
+
+        assert [r["eval_idx"] for r in results] == [1, 3]
+        assert [r["eval_source"] for r in results] == ["1.md", "3.md"]
@@ -7,36 +7,105 @@ This gives us the best of both worlds:
 - Skillet's accurate eval measurement via Claude Code
 """
 
+import asyncio
+import functools
+import math
+import shutil
 import tempfile
+from dataclasses import replace
 from pathlib import Path
 
+from skillet import config as skillet_config
+from skillet._internal.cache import ScoreMemo, build_iteration_cache, hash_content
+from skillet.agent import Agent
 from skillet.evals import load_evals
+from skillet.evals.select import sample_evals
+from skillet.metrics.pass_rate_upper_bound import pass_rate_upper_bound
 from skillet.optimize import evals_to_trainset
 from skillet.skill.get_skill_file import get_skill_file
 
 from .proposer import propose_instruction
 from .result import (
+    CandidateNode,
     RoundResult,
     TuneCallbacks,
     TuneConfig,
     TuneResult,
 )
 from .results_to_eval_results import results_to_eval_results
+from .round_log import RoundLog
 from .run import run_tune_eval
 
 
-async def tune_dspy(
+def _skill_text(parent: int | None, content: str) -> str:
+    """The skill file text evaluated for a candidate: proposals gain a final newline."""
+    return content if parent is None else content + "\n"
+
+
+def _write_candidate(temp_dir: Path, skill_path: Path, text: str) -> Path:
+    """Lay out a candidate like ``skill_path`` with ``text`` as its skill file.
+
+    A skill directory is copied whole with its ``SKILL.md`` replaced, so the
+    candidate hashes (``hash_directory``) exactly as ``skillet eval`` hashes
+    the same skill and the two share iteration cache entries. Any
+    ``.claude/`` layout is kept. Each distinct text gets its own directory,
+    named by its hash: candidates never overwrite each other mid-run, and
+    ``hash_directory``'s per-path memo stays correct.
+    """
+    root = temp_dir / f"candidate-{hash_content(text)[:16]}"
+    if ".claude" in skill_path.parts:
+        claude_idx = skill_path.parts.index(".claude")
+        candidate = root / Path(*skill_path.parts[claude_idx:])
+    else:
+        candidate = root / skill_path.name
+    if candidate.exists():
+        return candidate
+    if skill_path.is_dir():
+        shutil.copytree(skill_path, candidate, symlinks=True)
+        (candidate / "SKILL.md").write_text(text)
+    else:
+        candidate.parent.mkdir(parents=True, exist_ok=True)
+        candidate.write_text(text)
+    return candidate
+
+
+async def tune_dspy(  # noqa: C901, PLR0912, PLR0915
     name: str,
     skill_path: Path,
     config: TuneConfig | None = None,
     callbacks: TuneCallbacks | None = None,
     evals_list: list[dict] | None = None,
     skillet_dir: Path | None = None,
+    *,
+    round_log: Path | None = None,
 ) -> TuneResult:
     """Tune a skill using DSPy's MIPROv2-inspired instruction generation.
 
-    ``skillet_dir`` is the root holding ``evals/`` when ``name`` is a bare name;
-    it falls back to the configured ``SKILLET_DIR`` when ``None``.
+    ``skillet_dir`` is the root holding ``evals/`` when ``name`` is a bare name
+    and ``cache/``; it falls back to the configured ``SKILLET_DIR`` when ``None``.
+
+    Each round's candidate is evaluated through the same iteration cache as
+    ``evaluate()``, keyed by ``hash_directory`` of the candidate as written
+    (see :func:`_write_candidate`), so re-scoring a skill already run by
+    ``skillet eval`` or an earlier tune costs no agent runs. Each fully scored
+    candidate's pass rate is recorded in a :class:`ScoreMemo`; the memo only
+    feeds the proposer's instruction history (earlier sessions' scores
+    included) and never skips an evaluation, since the proposer needs each
+    parent's failures.
+
+    With ``config.candidates > 1`` tuning runs as a beam search: each round
+    proposes that many candidates from the ``config.beam_width`` best seen so
+    far and evaluates them concurrently, sharing one ``config.parallel``
+    budget. Every evaluated candidate is recorded in ``search_tree``; each
+    round's best becomes its :class:`RoundResult`.
+
+    With ``config.minibatch`` set, proposed candidates are first raced on that
+    many evals and only plausible winners are scored on the full set (see
+    ``race_candidates``), cutting agent runs spent on clearly worse proposals.
+
+    With ``round_log`` set, the run is appended to that JSONL file as it goes
+    (see :class:`RoundLog`) and the returned rounds keep only each eval's
+    verdict and reasoning; responses and tool calls live in the log.
     """
     # Use defaults if not provided
     config = config or TuneConfig()
@@ -47,6 +116,9 @@ async def tune_dspy(
     original_skill_content = original_skill_file.read_text()
     evals = evals_list if evals_list is not None else load_evals(name, skillet_dir=skillet_dir)
     trainset = evals_to_trainset(evals)
+    cache_root = skillet_dir / "cache" if skillet_dir is not None else skillet_config.CACHE_DIR
+    # Parked tune path: pinned to claude until it is wired to --agent.
+    score_memo = ScoreMemo(cache_root, name, evals, Agent.CLAUDE, config.samples)
 
     # Create result tracker
     tune_result = TuneResult.create(
@@ -55,83 +127,209 @@ async def tune_dspy(
         original_skill=original_skill_content,
         config=config,
     )
+    log = RoundLog(round_log) if round_log is not None else None
+    if log:
+        tune_result.round_log = str(round_log)
+        log.start(tune_result)
+
+    # One budget for every agent run in a round, however many candidates
+    semaphore = asyncio.Semaphore(config.parallel)
+    beam_mode = config.candidates > 1
 
     # Create temporary directory for skill iterations
     with tempfile.TemporaryDirectory(prefix="skillet-tune-dspy-") as temp_dir:
-        # Set up temp skill path
-        if ".claude" in skill_path.parts:
-            claude_idx = skill_path.parts.index(".claude")
-            relative_path = Path(*skill_path.parts[claude_idx:])
-            temp_skill_path = Path(temp_dir) / relative_path
-        else:
-            temp_skill_path = Path(temp_dir) / original_skill_file.name
-
-        temp_skill_path.parent.mkdir(parents=True, exist_ok=True)
-        temp_skill_path.write_text(original_skill_content)
 
-        current_skill_content = original_skill_content
-        instruction_history: list[dict] = []
-
-        for round_num in range(1, config.max_rounds + 1):
-            if callbacks.on_round_start:
-                await callbacks.on_round_start(round_num, config.max_rounds)
+        async def evaluate_candidate(
+            slot: int, parent: int | None, content: str, indices: list[int] | None = None
+        ) -> tuple[float, list[dict]]:
+            temp_skill_path = _write_candidate(
+                Path(temp_dir), skill_path, _skill_text(parent, content)
+            )
 
             # Run evals using our native eval system
-            pass_rate, results = await run_tune_eval(
+            iteration_cache = build_iteration_cache(cache_root, name, temp_skill_path, Agent.CLAUDE)
+            return await run_tune_eval(
                 evals,
                 temp_skill_path,
                 config.samples,
                 config.parallel,
                 callbacks.on_eval_status,
+                iteration_cache=iteration_cache,
+                skip_cache=config.skip_cache,
+                semaphore=semaphore,
+                candidate=slot if beam_mode else None,
+                eval_indices=indices,
             )
 
-            # Record this round
+        async def race_candidates(
+            round_num: int, incumbent: float
+        ) -> tuple[list[tuple[float, list[dict]]], set[int]]:
+            """Score ``pending`` on a minibatch; finish only plausible winners.
+
+            Every candidate in a round shares one stratified minibatch, so
+            they are compared on equal footing. A candidate whose Hoeffding
+            upper bound falls below the incumbent's pass rate is rejected;
+            of the rest, the better half (successive halving) is promoted to
+            the remaining evals. Returns per-slot scores and rejected slots.
+            """
+            chosen = {id(e) for e in sample_evals(evals, config.minibatch, seed=round_num)}
+            batch = [i for i, e in enumerate(evals) if id(e) in chosen]
+            rest = [i for i, e in enumerate(evals) if id(e) not in chosen]
+
+            raced = await asyncio.gather(
+                *[
+                    evaluate_candidate(slot, parent, content, batch)
+                    for slot, (parent, content) in enumerate(pending)
+                ]
+            )
+            plausible = [
+                slot
+                for slot, (_, results) in enumerate(raced)
+                if pass_rate_upper_bound(
+                    len(results), sum(r["pass"] for r in results), config.rejection_confidence
+                )
+                >= incumbent / 100
+            ]
+            plausible.sort(key=lambda slot: raced[slot][0], reverse=True)
+            promoted = plausible[: math.ceil(len(pending) / 2)]
+
+            finished = await asyncio.gather(
+                *[
+                    evaluate_candidate(slot, pending[slot][0], pending[slot][1], rest)
+                    for slot in promoted
+                ]
+            )
+            scores = list(raced)
+            for slot, (_, more) in zip(promoted, finished, strict=True):
+                results = sorted(
+                    [*raced[slot][1], *more], key=lambda r: (r["eval_idx"], r["iteration"])
+                )
+                pass_rate = sum(r["pass"] for r in results) / len(results) * 100
+                scores[slot] = (pass_rate, results)
+            return scores, set(range(len(pending))) - set(promoted)
+
+        search_tree = tune_result.search_tree
+        failures: dict[int, list[dict]] = {}
+        survivors: list[CandidateNode] = []
+        pending: list[tuple[int | None, str]] = [(None, original_skill_content)]
+        instruction_history = [
+            h for h in score_memo.history() if h["instruction"] != original_skill_content
+        ]
+
+        for round_num in range(1, config.max_rounds + 1):
+            if callbacks.on_round_start:
+                await callbacks.on_round_start(round_num, config.max_rounds)
+
+            if survivors and 0 < config.minibatch < len(evals):
+                scores, rejected = await race_candidates(round_num, survivors[0].pass_rate)
+            else:
+                scores = await asyncio.gather(
+                    *[
+                        evaluate_candidate(slot, parent, content)
+                        for slot, (parent, content) in enumerate(pending)
+                    ]
+                )
+                rejected = set()
+
+            evaluated = []
+            for slot, ((parent, content), (pass_rate, results)) in enumerate(
+                zip(pending, scores, strict=True)
+            ):
+                node = CandidateNode(
+                    id=len(search_tree),
+                    round=round_num,
+                    parent=parent,
+                    pass_rate=pass_rate,
+                    skill_content=content,
+                    rejected=slot in rejected,
+                )
+                search_tree.append(node)
+                if log:
+                    log.candidate(node)
+                evaluated.append((node, results))
+                failures[node.id] = [r for r in results if not r["pass"]]
+                # A rejected candidate's score covers only the minibatch
+                if not node.rejected:
+                    score_memo.put(_skill_text(parent, content), node.pass_rate)
+                    # Track for instruction proposal
+                    instruction_history.append(
+                        {
+                            "instruction": node.skill_content,
+                            "score": node.pass_rate / 100,  # Normalize to 0-1
+                        }
+                    )
+
+            # Record this round by its best fully scored candidate
+            finished = [e for e in evaluated if not e[0].rejected] or evaluated
+            best, best_results = max(finished, key=lambda e: e[0].pass_rate)
             round_result = RoundResult(
                 round=round_num,
-                pass_rate=pass_rate,
-                skill_content=current_skill_content,
+                pass_rate=best.pass_rate,
+                skill_content=best.skill_content,
                 tip_used="DSPy GroundedProposer",
-                evals=results_to_eval_results(results),
+                evals=results_to_eval_results(best_results),
             )
+            if log:
+                # Full eval results are on disk; keep only verdicts in memory
+                log.round(round_result)
+                round_result = replace(
+                    round_result,
+                    evals=[replace(e, response=None, tool_calls=None) for e in round_result.evals],
+                )
             tune_result.add_round(round_result)
 
-            # Track for instruction proposal
-            instruction_history.append(
-                {
-                    "instruction": current_skill_content,
-                    "score": pass_rate / 100,  # Normalize to 0-1
-                }
-            )
-
             if callbacks.on_round_complete:
-                await callbacks.on_round_complete(round_num, pass_rate, results)
+                await callbacks.on_round_complete(round_num, best.pass_rate, best_results)
 
-            if pass_rate >= config.target_pass_rate:
+            if best.pass_rate >= config.target_pass_rate:
                 tune_result.finalize(success=True)
+                if log:
+                    log.finish(tune_result)
                 # Save final skill and notify
                 original_skill_file.write_text(tune_result.best_skill + "\n")
                 if callbacks.on_complete:
                     await callbacks.on_complete(original_skill_file)
                 return tune_result
 
-            # Generate new instruction using DSPy's proposal mechanism
+            if round_num == config.max_rounds:
+                break
+
+            # The best candidates seen so far (not just this round) parent the next
+            candidates = [*survivors, *(node for node, _ in evaluated if not node.rejected)]
+            candidates.sort(key=lambda n: n.pass_rate, reverse=True)
+            survivors = candidates[: config.beam_width]
+            for node in survivors:
+                node.survived = True
+
+            # Generate new instructions using DSPy's proposal mechanism
             if callbacks.on_improving:
                 await callbacks.on_improving("Improving skill...")
 
-            new_instruction = propose_instruction(
-                current_instruction=current_skill_content,
-                trainset=trainset,
-                failures=[r for r in results if not r["pass"]],
-                instruction_history=instruction_history,
+            parents = [survivors[i % len(survivors)] for i in range(config.candidates)]
+            proposals = await asyncio.gather(
+                *[
+                    asyncio.to_thread(
+                        functools.partial(
+                            propose_instruction,
+                            current_instruction=parent.skill_content,
+                            trainset=trainset,
+                            failures=failures[parent.id],
+                            instruction_history=instruction_history,
+                            variant=i // len(survivors),
+                        )
+                    )
+                    for i, parent in enumerate(parents)
+                ]
             )
-
-            current_skill_content = new_instruction
-            temp_skill_path.write_text(new_instruction + "\n")
+            pending = [(parent.id, new) for parent, new in zip(parents, proposals, strict=True)]
 
             if callbacks.on_improved:
-                await callbacks.on_improved(new_instruction, original_skill_file)
+                for new_instruction in proposals:
+                    await callbacks.on_improved(new_instruction, original_skill_file)
 
         tune_result.finalize(success=False)
+        if log:
+            log.finish(tune_result)
         # Save best skill and notify
         original_skill_file.write_text(tune_result.best_skill + "\n")
         if callbacks.on_complete:
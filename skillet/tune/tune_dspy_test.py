@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from skillet.tune.result import TuneCallbacks, TuneConfig
+from skillet.tune.result import TuneCallbacks, TuneConfig, TuneResult
 from skillet.tune.tune_dspy import tune_dspy
 
 # Common test data
@@ -62,6 +62,14 @@ def mock_propose_instruction():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def mock_score_memo():
+    """Mock ScoreMemo to keep the real cache directory untouched."""
+    with patch("skillet.tune.tune_dspy.ScoreMemo") as mock:
+        mock.return_value.history.return_value = []
+        yield mock.return_value
+
+
 @pytest.fixture
 def skill_file():
     """Create a temporary skill file for testing."""
@@ -276,3 +284,392 @@ def describe_tune_dspy():
         call_args = mock_run_tune_eval.call_args
         temp_path = call_args[0][1]
         assert ".claude" in str(temp_path)
+
+    @pytest.mark.asyncio
+    async def it_keys_the_iteration_cache_by_the_written_candidate(
+        skill_file, mock_run_tune_eval, mock_propose_instruction, tmp_path
+    ):
+        from skillet._internal.cache import hash_content
+
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+        mock_propose_instruction.return_value = "New instruction"
+
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=2),
+            skillet_dir=tmp_path,
+        )
+
+        task = {"eval_source": "test.yaml", "prompt": "test prompt", "iteration": 1}
+        skill_dirs = [
+            c.kwargs["iteration_cache"]._get_path(task).parent
+            for c in mock_run_tune_eval.call_args_list
+        ]
+        # Proposals are written with a final newline; the key covers those bytes
+        assert [d.name for d in skill_dirs] == [
+            hash_content("Original instruction"),
+            hash_content("New instruction\n"),
+        ]
+        assert all(d.is_relative_to(tmp_path / "cache") for d in skill_dirs)
+
+    @pytest.mark.asyncio
+    async def it_passes_skip_cache_through(skill_file, mock_run_tune_eval):
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(skip_cache=True),
+        )
+
+        assert mock_run_tune_eval.call_args.kwargs["skip_cache"] is True
+
+    @pytest.mark.asyncio
+    async def it_records_each_candidate_score(
+        skill_file, mock_run_tune_eval, mock_propose_instruction, mock_score_memo
+    ):
+        mock_run_tune_eval.side_effect = [(50.0, [FAIL_RESULT]), (100.0, [PASS_RESULT])]
+        mock_propose_instruction.return_value = "New instruction"
+
+        await tune_dspy(name="test-evals", skill_path=skill_file)
+
+        assert [c.args for c in mock_score_memo.put.call_args_list] == [
+            ("Original instruction", 50.0),
+            ("New instruction\n", 100.0),
+        ]
+
+    @pytest.mark.asyncio
+    async def it_shares_cache_entries_with_eval_for_a_skill_directory(mock_run_tune_eval, tmp_path):
+        from skillet._internal.cache import build_iteration_cache
+        from skillet.agent import Agent
+
+        skill_dir = tmp_path / "project" / ".claude" / "skills" / "demo"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("Original instruction")
+        (skill_dir / "scripts" / "run.sh").write_text("echo hi")
+
+        task = {"eval_source": "test.yaml", "prompt": "test prompt", "iteration": 1}
+        evaluated = build_iteration_cache(tmp_path / "cache", "test-evals", skill_dir, Agent.CLAUDE)
+        expected = evaluated._get_path(task)
+        copied: list[str] = []
+
+        async def run(_evals, path, *_args, **_kwargs):
+            copied.append((path / "scripts" / "run.sh").read_text())
+            return 100.0, [PASS_RESULT]
+
+        mock_run_tune_eval.side_effect = run
+        await tune_dspy(name="test-evals", skill_path=skill_dir, skillet_dir=tmp_path)
+
+        candidate = mock_run_tune_eval.call_args.args[1]
+        tuned = mock_run_tune_eval.call_args.kwargs["iteration_cache"]._get_path(task)
+        assert tuned == expected
+        assert candidate.parts[-3:] == (".claude", "skills", "demo")
+        assert copied == ["echo hi"]
+
+    @pytest.mark.asyncio
+    async def it_seeds_history_from_earlier_sessions(
+        skill_file, mock_run_tune_eval, mock_propose_instruction, mock_score_memo
+    ):
+        mock_score_memo.history.return_value = [
+            {"instruction": "Original instruction", "score": 0.5},
+            {"instruction": "Tried last week", "score": 0.25},
+        ]
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+
+        await tune_dspy(name="test-evals", skill_path=skill_file, config=TuneConfig(max_rounds=2))
+
+        history = mock_propose_instruction.call_args.kwargs["instruction_history"]
+        assert [h["instruction"] for h in history[:2]] == [
+            "Tried last week",
+            "Original instruction",
+        ]
+
+    @pytest.mark.asyncio
+    async def it_does_not_propose_after_the_last_round(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+
+        await tune_dspy(name="test-evals", skill_path=skill_file, config=TuneConfig(max_rounds=3))
+
+        assert mock_propose_instruction.call_count == 2
+
+
+def describe_round_log():
+    @pytest.mark.asyncio
+    async def it_streams_the_run_to_the_log(skill_file, mock_run_tune_eval, tmp_path):
+        fail = {**FAIL_RESULT, "eval_idx": 0, "iteration": 1}
+        mock_run_tune_eval.return_value = (0.0, [fail])
+        log_path = tmp_path / "run.jsonl"
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=2),
+            round_log=log_path,
+        )
+
+        loaded = TuneResult.load(log_path)
+        assert loaded.result == result.result
+        assert [n.id for n in loaded.search_tree] == [0, 1]
+        assert [e.response for r in loaded.rounds for e in r.evals] == [None, None]
+        responses = [e.response for r in TuneResult.stream_rounds(log_path) for e in r.evals]
+        assert responses == ["wrong", "wrong"]
+        assert result.round_log == str(log_path)
+
+    @pytest.mark.asyncio
+    async def it_keeps_only_verdicts_in_memory(skill_file, mock_run_tune_eval, tmp_path):
+        mock_run_tune_eval.return_value = (0.0, [{**FAIL_RESULT, "tool_calls": [{"name": "x"}]}])
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=1),
+            round_log=tmp_path / "run.jsonl",
+        )
+
+        (entry,) = result.rounds[0].evals
+        assert (entry.passed, entry.reasoning) == (False, "Bad")
+        assert entry.response is None
+        assert entry.tool_calls is None
+
+    @pytest.mark.asyncio
+    async def it_keeps_responses_in_memory_without_a_log(skill_file, mock_run_tune_eval):
+        mock_run_tune_eval.return_value = (0.0, [FAIL_RESULT])
+
+        result = await tune_dspy(
+            name="test-evals", skill_path=skill_file, config=TuneConfig(max_rounds=1)
+        )
+
+        assert result.rounds[0].evals[0].response == "wrong"
+        assert result.round_log is None
+
+
+def describe_beam_mode():
+    @pytest.mark.asyncio
+    async def it_evaluates_k_candidates_per_round(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+        mock_propose_instruction.side_effect = [f"candidate {i}" for i in range(6)]
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=3, candidates=3),
+        )
+
+        # Round 1 scores the original; rounds 2 and 3 score three proposals each
+        assert mock_run_tune_eval.call_count == 7
+        assert [n.round for n in result.search_tree] == [1, 2, 2, 2, 3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def it_gives_each_candidate_its_own_skill_dir(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+        mock_propose_instruction.side_effect = ["a", "b"]
+
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=2, candidates=2),
+        )
+
+        round_two = mock_run_tune_eval.call_args_list[1:]
+        paths = {c.args[1] for c in round_two}
+        assert len(paths) == 2
+        assert all(".claude" in str(p) for p in paths)
+        assert [c.kwargs["candidate"] for c in round_two] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def it_shares_one_concurrency_budget(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.return_value = (50.0, [FAIL_RESULT])
+        mock_propose_instruction.side_effect = ["a", "b"]
+
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=2, candidates=2),
+        )
+
+        semaphores = {id(c.kwargs["semaphore"]) for c in mock_run_tune_eval.call_args_list}
+        assert len(semaphores) == 1
+
+    @pytest.mark.asyncio
+    async def it_carries_the_best_survivors_forward(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        scores = {"Original instruction": 10.0, "weak": 20.0, "strong": 60.0}
+
+        async def run(_evals, path, *_args, **_kwargs):
+            return scores.get(path.read_text().strip(), 0.0), [FAIL_RESULT]
+
+        mock_run_tune_eval.side_effect = run
+        mock_propose_instruction.side_effect = ["weak", "strong", "x", "y"]
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=3, candidates=2, beam_width=1),
+        )
+
+        round_three_parents = [
+            c.kwargs["current_instruction"] for c in mock_propose_instruction.call_args_list[2:]
+        ]
+        assert round_three_parents == ["strong", "strong"]
+        tree = {n.skill_content: n for n in result.search_tree}
+        assert tree["strong"].survived is True
+        assert tree["weak"].survived is False
+        assert tree["x"].parent == tree["strong"].id
+        assert result.best_skill == "strong"
+
+    @pytest.mark.asyncio
+    async def it_records_the_round_best_as_the_round_result(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.side_effect = [
+            (10.0, [FAIL_RESULT]),
+            (30.0, [FAIL_RESULT]),
+            (70.0, [FAIL_RESULT]),
+        ]
+        mock_propose_instruction.side_effect = ["a", "b"]
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            config=TuneConfig(max_rounds=2, candidates=2),
+        )
+
+        assert [r.pass_rate for r in result.rounds] == [10.0, 70.0]
+        assert result.rounds[1].skill_content == "b"
+
+
+def describe_racing():
+    _EVALS = [
+        {"_source": f"{i}.yaml", "_content": f"c{i}", "prompt": f"p{i}", "expected": "e"}
+        for i in range(10)
+    ]
+
+    def _scorer(rates: dict[str, float]):
+        """run_tune_eval stand-in: every eval of a candidate passes with its rate."""
+
+        async def run(_evals, path, *_args, eval_indices=None, **_kwargs):
+            rate = rates[path.read_text().strip()]
+            indices = range(10) if eval_indices is None else eval_indices
+            results = [
+                {
+                    "eval_idx": i,
+                    "eval_source": f"{i}.yaml",
+                    "iteration": 1,
+                    "pass": i < rate * 10,
+                    "judgment": {"reasoning": ""},
+                    "response": "r",
+                    "prompt": f"p{i}",
+                    "expected": "e",
+                }
+                for i in indices
+            ]
+            return sum(r["pass"] for r in results) / len(results) * 100, results
+
+        return run
+
+    @pytest.mark.asyncio
+    async def it_rejects_hopeless_candidates_after_the_minibatch(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.side_effect = _scorer({"Original instruction": 1.0, "bad": 0.0})
+        mock_propose_instruction.return_value = "bad"
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            evals_list=_EVALS,
+            config=TuneConfig(max_rounds=2, minibatch=8, target_pass_rate=101.0),
+        )
+
+        # Original runs the full set; "bad" only its minibatch
+        minibatch = mock_run_tune_eval.call_args_list[1].kwargs["eval_indices"]
+        assert len(minibatch) == 8
+        assert mock_run_tune_eval.call_count == 2
+        bad = result.search_tree[1]
+        assert bad.rejected is True
+        assert bad.survived is False
+        assert result.best_skill == "Original instruction"
+
+    @pytest.mark.asyncio
+    async def it_keeps_minibatch_scores_out_of_the_proposer_history(
+        skill_file, mock_run_tune_eval, mock_propose_instruction, mock_score_memo
+    ):
+        mock_run_tune_eval.side_effect = _scorer({"Original instruction": 1.0, "bad": 0.0})
+        mock_propose_instruction.return_value = "bad"
+
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            evals_list=_EVALS,
+            config=TuneConfig(max_rounds=3, minibatch=8, target_pass_rate=101.0),
+        )
+
+        # Round 3's proposal sees round 2's rejected "bad" nowhere in its history
+        history = mock_propose_instruction.call_args.kwargs["instruction_history"]
+        assert [h["instruction"] for h in history] == ["Original instruction"]
+        assert [c.args[0] for c in mock_score_memo.put.call_args_list] == ["Original instruction"]
+
+    @pytest.mark.asyncio
+    async def it_promotes_plausible_candidates_to_the_remaining_evals(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.side_effect = _scorer({"Original instruction": 0.5, "good": 1.0})
+        mock_propose_instruction.return_value = "good"
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            evals_list=_EVALS,
+            config=TuneConfig(max_rounds=2, minibatch=4),
+        )
+
+        batch, rest = (c.kwargs["eval_indices"] for c in mock_run_tune_eval.call_args_list[1:])
+        assert sorted(batch + rest) == list(range(10))
+        good = result.search_tree[1]
+        assert good.rejected is False
+        assert good.pass_rate == 100.0
+        assert result.result.success is True
+
+    @pytest.mark.asyncio
+    async def it_halves_the_field_among_plausible_candidates(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        rates = {"Original instruction": 0.0, "a": 0.6, "b": 0.8, "c": 0.7, "d": 0.9}
+        mock_run_tune_eval.side_effect = _scorer(rates)
+        mock_propose_instruction.side_effect = ["a", "b", "c", "d"]
+
+        result = await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            evals_list=_EVALS,
+            config=TuneConfig(max_rounds=2, candidates=4, minibatch=5, target_pass_rate=101.0),
+        )
+
+        finished = {n.skill_content for n in result.search_tree if n.round == 2 and not n.rejected}
+        assert len(finished) == 2
+        # 1 original + 4 minibatch races + 2 promotions
+        assert mock_run_tune_eval.call_count == 7
+
+    @pytest.mark.asyncio
+    async def it_races_only_when_the_minibatch_is_smaller_than_the_suite(
+        skill_file, mock_run_tune_eval, mock_propose_instruction
+    ):
+        mock_run_tune_eval.side_effect = _scorer({"Original instruction": 0.5, "x": 0.5})
+        mock_propose_instruction.return_value = "x"
+
+        await tune_dspy(
+            name="test-evals",
+            skill_path=skill_file,
+            evals_list=_EVALS,
+            config=TuneConfig(max_rounds=2, minibatch=10),
+        )
+
+        assert all(c.kwargs["eval_indices"] is None for c in mock_run_tune_eval.call_args_list)
@@ -46,7 +46,7 @@ def describe_agent_flag():
         mock_claude_query.set_responses({"pass": True, "reasoning": "OK"})
 
         with patch(
-            "skillet.eval.evaluate.evaluate.build_iteration_cache",
+            "skillet.eval.evaluate.run_tasks.build_iteration_cache",
             wraps=build_iteration_cache,
         ) as spy:
             await evaluate(
@@ -117,15 +117,16 @@ def create_eval_file(path: Path, **overrides) -> None:
 class _FakeCachetta:
     """Total stand-in for cachetta.Cachetta in integration tests.
 
-    The real build_iteration_cache constructs one of these instead of a real
-    Cachetta, so skillet's cache wiring runs while cachetta does no disk I/O:
-    the decorator (``wrap``) just runs the wrapped function, and nothing is
-    read or written. Constructor kwargs (path, condition, duration) are
-    accepted and ignored.
+    The real build_iteration_cache and build_grade_cache construct one of
+    these instead of a real Cachetta, so skillet's cache wiring runs while
+    cachetta does no disk I/O: the decorator (``wrap``) just runs the wrapped
+    function, and nothing is read or written. ``path`` is kept so the grade
+    cache can be placed beside the response; the other constructor kwargs
+    (condition, duration) are accepted and ignored.
     """
 
-    def __init__(self, **_kwargs):
-        pass
+    def __init__(self, *, path=None, **_kwargs):
+        self.path = path
 
     def copy(self, **_kwargs) -> "_FakeCachetta":
         return self
@@ -138,13 +139,14 @@ class _FakeCachetta:
 def stub_cachetta():
     """Replace cachetta.Cachetta with a no-op double for integration tests.
 
-    The real build_iteration_cache still runs (path layout, condition, skill
-    hashing); only cachetta's caching is neutralized, so there is no disk I/O.
-    cachetta's own caching is covered by its test suite + e2e.
+    The real build_iteration_cache and build_grade_cache still run (path
+    layout, condition, skill hashing); only cachetta's caching is neutralized,
+    so there is no disk I/O. cachetta's own caching is covered by its test
+    suite + e2e.
     """
-    with patch(
-        "skillet._internal.cache.build_iteration_cache.Cachetta",
-        _FakeCachetta,
+    with (
+        patch("skillet._internal.cache.build_iteration_cache.Cachetta", _FakeCachetta),
+        patch("skillet._internal.cache.build_grade_cache.Cachetta", _FakeCachetta),
     ):
         yield
 